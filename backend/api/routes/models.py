@@ -54,6 +54,9 @@ class ServerStatus(BaseModel):
     uptime_seconds: float = Field(default=0, description="서버 가동 시간 (초)")
     active_positions: int = Field(default=0, description="활성 포지션 수")
     active_orders: int = Field(default=0, description="활성 주문 수")
+    order_latency: Optional[dict] = Field(
+        default=None, description="[user-032] 주문 지연 히스토그램 (브로커 연결 시)"
+    )
     timestamp: str = Field(..., description="조회 시각 (ISO8601)")
 
 
@@ -42,10 +42,20 @@ async def run_scanner(strategy_name: str = "seismograph"):
         # [11-002] Container에서 DataRepository 주입
         repo = container.data_repository()
 
-        # Scanner 생성 및 실행
-        scanner = Scanner(repo, watchlist_size=50)
+        # Scanner 생성 및 실행 ([user-048] Container 워커 풀, [user-049] ML 확률)
+        scanner = Scanner(
+            repo,
+            watchlist_size=50,
+            scoring_pool=container.scoring_pool(),
+            gainer_model=container.gainer_model(),
+        )
+        # [user-047] 증분 스캔 (바뀐 종목만 재계산, 결과는 전체 스캔과 동일)
         watchlist = await scanner.run_daily_scan(
-            min_price=2.0, max_price=20.0, min_volume=100_000, lookback_days=20
+            min_price=2.0,
+            max_price=20.0,
+            min_volume=100_000,
+            lookback_days=20,
+            incremental=True,
         )
 
         # Watchlist 저장 (병합)
@@ -30,11 +30,13 @@ async def get_status():
         - engine: running/stopped
         - ibkr: connected/disconnected
         - scheduler: active/inactive
+        - order_latency: 주문 queue_wait / submit→ack / ack→fill 지연 통계
     """
     from backend.server import app_state
 
     # IBKR 상태 확인
     ibkr_status = "disconnected"
+    order_latency = None
     if app_state.ibkr:
         try:
             ibkr_status = (
@@ -42,6 +44,10 @@ async def get_status():
             )
         except Exception:
             ibkr_status = "error"
+        try:
+            order_latency = app_state.ibkr.get_latency_stats()
+        except Exception:
+            pass
 
     # 스케줄러 상태 확인
     scheduler_status = "inactive"
@@ -73,6 +79,7 @@ async def get_status():
         uptime_seconds=get_uptime_seconds(),
         active_positions=active_positions,
         active_orders=active_orders,
+        order_latency=order_latency,
         timestamp=get_timestamp(),
     )
 
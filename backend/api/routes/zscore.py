@@ -6,9 +6,13 @@
 #     종목 Z-Score (zenV, zenP) 계산 API
 #
 # 📌 엔드포인트:
+#     GET /zscore/live/all - [user-046] 틱 구독 전 종목 장중 zenV/zenP
 #     GET /zscore/{ticker} - 종목 Z-Score 조회
 #
 # 📌 [11-002] DataRepository 마이그레이션 완료
+# 📌 [user-046] 장 전 통계 테이블(ZScoreStatsStore)에서 O(1) 조회,
+#               테이블에 없거나 직전 거래일 기준이 아닌 종목만 일봉 재조회로 계산
+# 📌 장중 zenV는 당일 거래량이 시드된 종목만 (미시드 종목은 zenV=None)
 # ═══════════════════════════════════════════════════════════════════════════
 
 from fastapi import APIRouter, HTTPException
@@ -20,6 +24,30 @@ from .common import get_timestamp
 router = APIRouter()
 
 
+def _live_projection(stats_store, ticker: str):
+    """IntradayStateEngine 스냅샷이 있으면 장중 zenV/zenP (없으면 None)"""
+    from backend.container import container
+
+    snapshot = container.intraday_state().snapshot(ticker)
+    return stats_store.project(snapshot) if snapshot is not None else None
+
+
+@router.get("/zscore/live/all", summary="틱 구독 전 종목 장중 Z-Score")
+async def get_live_zscores():
+    """
+    [user-046] 틱 스트림을 받는 모든 종목의 Time-Projected zenV/zenP
+
+    Returns:
+        dict: {count, results: {ticker: {zenV, zenP, elapsed_ratio, change_pct}}, timestamp}
+              (zenV는 당일 거래량 미시드 종목이면 None)
+    """
+    from backend.container import container
+
+    stats_store = container.zscore_stats()
+    results = stats_store.live(container.intraday_state().snapshot_all())
+    return {"count": len(results), "results": results, "timestamp": get_timestamp()}
+
+
 @router.get("/zscore/{ticker}", summary="종목 Z-Score 조회")
 async def get_zscore(ticker: str):
     """
@@ -37,6 +65,7 @@ async def get_zscore(ticker: str):
 
     Returns:
         dict: {ticker, zenV, zenP, timestamp}
+              + [user-046] live (장중 Time-Projected zenV/zenP, 틱 수신 종목만)
 
     Example:
         GET /api/zscore/AAPL
@@ -44,18 +73,36 @@ async def get_zscore(ticker: str):
     """
     from backend.container import container
     from backend.core.zscore_calculator import ZScoreCalculator
+    from backend.data.massive_loader import MassiveLoader
 
     logger.info(f"📊 Z-Score 조회 요청: {ticker}")
+    ticker = ticker.upper()
 
     try:
+        # [user-046] 장 전 통계 테이블 (일봉 재조회 없음)
+        # 종목 행이 직전 거래일 기준이 아니면 그 종목만 아래 재계산 경로 사용
+        # (원본 파일 mtime으로 전 종목을 무효화하지 않음 - 장중 gap-fill 쓰기 대비)
+        stats_store = container.zscore_stats()
+        row = stats_store.get(ticker, as_of=MassiveLoader.get_last_trading_day())
+        if row is not None:
+            return {
+                "ticker": ticker,
+                "zenV": row["zenV"],
+                "zenP": row["zenP"],
+                "data_available": True,
+                "stats_date": row["date"],
+                "live": _live_projection(stats_store, ticker),
+                "timestamp": get_timestamp(),
+            }
+
         # [11-002] DataRepository에서 일봉 데이터 조회 (auto_fill=True)
         repo = container.data_repository()
-        df = await repo.get_daily_bars(ticker.upper(), days=25, auto_fill=True)
+        df = await repo.get_daily_bars(ticker, days=25, auto_fill=True)
 
         if df.empty:
             logger.warning(f"⚠️ {ticker}: 일봉 데이터 없음")
             return {
-                "ticker": ticker.upper(),
+                "ticker": ticker,
                 "zenV": 0.0,
                 "zenP": 0.0,
                 "data_available": False,
@@ -70,10 +117,10 @@ async def get_zscore(ticker: str):
 
         # Z-Score 계산
         calculator = ZScoreCalculator(lookback=20)
-        result = calculator.calculate(ticker.upper(), bars_dict)
+        result = calculator.calculate(ticker, bars_dict)
 
         return {
-            "ticker": ticker.upper(),
+            "ticker": ticker,
             "zenV": result.zenV,
             "zenP": result.zenP,
             "data_available": True,
@@ -5,6 +5,8 @@
 #
 # 📦 포함 모듈:
 #   - ibkr_connector.py: Interactive Brokers 연동 (ib_insync)
+#   - latency.py: 주문 submit → ack → fill 지연 히스토그램
+#   - simulated_broker.py: IBKRConnector 호환 로컬 시뮬레이션 브로커
 #
 # 📌 주요 기능:
 #   - TWS/IB Gateway 연결
@@ -20,8 +22,12 @@ Sigma9 Broker Package
 현재는 Interactive Brokers (IBKR)만 지원합니다.
 """
 
-from .ibkr_connector import IBKRConnector
+from .ibkr_connector import IBCommandTimeout, IBKRConnector
+from .simulated_broker import SimBrokerConfig, SimulatedBroker
 
 __all__ = [
+    "IBCommandTimeout",
     "IBKRConnector",
+    "SimBrokerConfig",
+    "SimulatedBroker",
 ]
@@ -5,6 +5,12 @@
 #   Interactive Brokers Gateway에 연결하여 실시간 시장 데이터를 수신합니다.
 #   GUI가 멈추지 않도록 별도 스레드(QThread)에서 실행됩니다.
 #
+# 📌 [user-032] 명령 큐:
+#   - 모든 브로커 호출(placeOrder, cancelOrder, positions...)은 IB 이벤트 루프
+#     스레드에서만 실행 (call_soon_threadsafe + Future로 결과 반환)
+#   - 심볼별 Qualified Contract 캐시
+#   - 주문 submit → ack → fill 지연 히스토그램 (get_latency_stats)
+#
 # 📌 masterplan.md 2.1절 / development_steps.md Step 2.1 기준 구현
 # 📌 참조: docs/references/core/bridge.py (핵심 패턴만 채택)
 # ============================================================================
@@ -31,8 +37,11 @@ Example:
     connector.stop()
 """
 
+import asyncio
+import concurrent.futures
+import functools
 import os
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, List, Set, Tuple
 from dotenv import load_dotenv
 
 # ib_insync - IBKR API 래퍼
@@ -42,6 +51,8 @@ import time
 import threading
 from typing import Callable
 
+from .latency import OrderLatencyTracker
+
 # ═══════════════════════════════════════════════════════════════════════════
 # [02-003] PyQt6 의존성 제거
 # ═══════════════════════════════════════════════════════════════════════════
@@ -76,6 +87,58 @@ OnOrderErrorCallback = Callable[[str, str], None]
 OnPositionsUpdateCallback = Callable[[list], None]
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# [user-032] IB 루프 스레드 마샬링
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class IBCommandTimeout(RuntimeError):
+    """
+    IB 명령 상태 불명 (타임아웃 시점에 이미 IB 스레드에서 실행 중)
+
+    ELI5: 우편함에서 꺼내 처리하던 중이라 되돌릴 수 없습니다.
+          주문이 실제로 나갔을 수도 있으니 "실패"로 보면 안 됩니다.
+          늦게 도착한 결과는 로그로 남고, 주문은 order_placed 이벤트로 들어옵니다.
+
+    Attributes:
+        method: 명령 이름
+        future: 아직 끝나지 않은 명령 Future (늦은 결과 확인용)
+    """
+
+    def __init__(self, method: str, future: concurrent.futures.Future):
+        super().__init__(f"IB command {method} timed out while running (state unknown)")
+        self.method = method
+        self.future = future
+
+
+
+def _on_ib_loop(default=None):
+    """
+    메서드를 IB 이벤트 루프 스레드에서 실행하도록 감싸는 데코레이터
+
+    ELI5: ib_insync는 자기 스레드에서만 안전하게 다룰 수 있습니다.
+          다른 스레드(FastAPI, OrderManager)가 부르면 "주문서"를 IB 스레드의
+          우편함에 넣고, IB 스레드가 처리한 결과를 받아 돌려줍니다.
+
+    - IB 스레드에서 호출하면 바로 실행
+    - 연결 전이면 바로 실행 (메서드 본문의 연결 체크가 처리)
+    - 타임아웃 시 아직 실행 전이면 취소 후 default 반환
+    - 이미 실행 중이면 IBCommandTimeout (결과는 늦게 도착할 수 있음)
+
+    Args:
+        default: 실행 전 취소된 경우의 반환값
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            return self._call_on_loop(method, args, kwargs, default)
+
+        return wrapper
+
+    return decorator
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # IBKRConnector 클래스
 # ═══════════════════════════════════════════════════════════════════════════
@@ -139,6 +202,9 @@ class IBKRConnector:
     connector.start()
     """
 
+    # 다른 스레드에서 IB 명령 결과를 기다리는 최대 시간 (초)
+    COMMAND_TIMEOUT = 10.0
+
     def __init__(self) -> None:
         """
         커넥터 초기화
@@ -174,6 +240,18 @@ class IBKRConnector:
         # OCA 그룹 추적: oca_group_id -> [order_ids]
         self._oca_groups: Dict[str, List[int]] = {}
 
+        # --- [user-032] 명령 큐 / Contract 캐시 / 지연 추적 ---
+        # _loop: IB 스레드의 asyncio 루프 (명령은 call_soon_threadsafe로 전달)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        # 심볼 -> Qualified Stock Contract (conId 포함)
+        self._contracts: Dict[str, Stock] = {}
+        # 주문 submit → ack → fill 지연 히스토그램
+        self.latency = OrderLatencyTracker()
+        # 타임아웃 후에도 IB 스레드에서 실행 중인 명령 (늦은 결과 추적)
+        self._unsettled_commands: Set[concurrent.futures.Future] = set()
+
         # ═══════════════════════════════════════════════════════════════
         # [02-003] Callback 속성 초기화
         # ═══════════════════════════════════════════════════════════════
@@ -307,7 +385,11 @@ class IBKRConnector:
         try:
             # --- ib_insync용 이벤트 루프 시작 (필수!) ---
             # ib_insync는 내부적으로 asyncio 이벤트 루프가 필요함
-            # util.startLoop()는 현재 스레드에 이벤트 루프를 생성
+            # 이 스레드 전용 루프를 만들고, util.startLoop()로 중첩 실행 허용
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            self._loop_thread_id = threading.get_ident()
+            self._stop_event = asyncio.Event()
             util.startLoop()
 
             # --- IB 객체 생성 ---
@@ -331,6 +413,9 @@ class IBKRConnector:
                         timeout=10,
                     )
 
+                    # [user-032] 주문 상태 이벤트는 연결당 1회만 구독
+                    self.ib.orderStatusEvent += self._on_order_status
+
                     # 연결 성공!
                     self._is_connected = True
                     self._emit_connected(True)
@@ -339,6 +424,9 @@ class IBKRConnector:
                     # 초기 계좌 정보 조회
                     self._fetch_account_info()
 
+                    # [user-032] Watchlist Contract 미리 검증 (첫 주문 지연 제거)
+                    self._qualify_watchlist()
+
                     # 재시도 루프 탈출
                     break
 
@@ -356,11 +444,10 @@ class IBKRConnector:
                         # 마지막 시도도 실패
                         raise
 
-            # --- 이벤트 루프 유지 ---
-            # 연결이 유지되는 동안 IB 이벤트를 처리
-            # ib.sleep(0.1): 100ms마다 이벤트 체크 (CPU 부하 최소화)
-            while self._is_running and self.ib.isConnected():
-                self.ib.sleep(0.1)
+            # --- 이벤트 루프 유지 [user-032] ---
+            # 루프가 소켓/명령 도착 시 즉시 깨어남 (100ms 폴링 없음)
+            # 1초 타임아웃은 연결 끊김 확인용 (주문 경로와 무관)
+            self._loop.run_until_complete(self._serve_until_stopped())
 
         except Exception as e:
             # 연결 실패 또는 런타임 에러
@@ -371,6 +458,162 @@ class IBKRConnector:
         finally:
             # --- 정리 (항상 실행) ---
             self._disconnect()
+            self._loop_thread_id = None
+            if self._loop:
+                self._loop.close()
+                self._loop = None
+
+    async def _serve_until_stopped(self) -> None:
+        """stop() 또는 연결 끊김까지 IB 루프 유지"""
+        while self._is_running and self.ib.isConnected():
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=1.0)
+            except asyncio.TimeoutError:
+                pass
+
+    # ═══════════════════════════════════════════════════════════════════
+    # [user-032] 명령 큐 (다른 스레드 → IB 루프 스레드)
+    # ═══════════════════════════════════════════════════════════════════
+
+    def submit_command(self, fn: Callable, *args, **kwargs) -> concurrent.futures.Future:
+        """
+        IB 루프 스레드에서 fn(*args, **kwargs)를 실행하고 Future 반환
+
+        asyncio 코드에서는 asyncio.wrap_future()로 await 할 수 있습니다.
+
+        Example:
+            >>> fut = connector.submit_command(connector.place_market_order, "AAPL", 10)
+            >>> order_id = await asyncio.wrap_future(fut)
+        """
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            future.set_exception(RuntimeError("IB event loop not running"))
+            return future
+
+        enqueued = time.perf_counter()
+
+        def runner() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            self.latency.record("queue_wait", (time.perf_counter() - enqueued) * 1000)
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+        loop.call_soon_threadsafe(runner)
+        return future
+
+    def _call_on_loop(self, method: Callable, args: tuple, kwargs: dict, default):
+        """_on_ib_loop 데코레이터 구현 (동기 호출자용)"""
+        if (
+            self._loop is None
+            or not self._is_connected
+            or threading.get_ident() == self._loop_thread_id
+        ):
+            return method(self, *args, **kwargs)
+
+        future = self.submit_command(method, self, *args, **kwargs)
+        try:
+            return future.result(timeout=self.COMMAND_TIMEOUT)
+        except concurrent.futures.TimeoutError:
+            pass
+
+        name = method.__name__
+        if future.cancel():
+            # 아직 IB 스레드가 꺼내지 않음 → 실행되지 않음이 확정
+            self._emit_log_message(f"⏱️ IB 명령 타임아웃 (미실행 취소): {name}")
+            return default() if callable(default) else default
+
+        # 이미 실행 중 → 취소 불가, 결과가 늦게 도착하면 기록
+        self._unsettled_commands.add(future)
+        future.add_done_callback(lambda fut: self._on_late_command(name, fut))
+        self._emit_log_message(f"⚠️ IB 명령 타임아웃 (실행 중, 상태 불명): {name}")
+        raise IBCommandTimeout(name, future)
+
+    def _on_late_command(self, name: str, future: concurrent.futures.Future) -> None:
+        """타임아웃 이후 끝난 명령 결과 기록 (주문은 order_placed로 이미 반영됨)"""
+        self._unsettled_commands.discard(future)
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self._emit_log_message(f"❌ IB 명령 늦은 실패: {name} ({error})")
+        else:
+            self._emit_log_message(f"📬 IB 명령 늦은 완료: {name} → {future.result()}")
+
+    def _get_contract(self, symbol: str) -> Stock:
+        """
+        심볼 → Stock Contract (IB 루프 스레드 전용)
+
+        처음 요청 시 qualifyContracts로 conId를 채워 캐시합니다.
+        실패하면 비검증 Contract를 반환하고 다음 요청 때 다시 시도합니다.
+        """
+        contract = self._contracts.get(symbol)
+        if contract is not None:
+            return contract
+
+        contract = Stock(symbol, "SMART", "USD")
+        try:
+            if self.ib.qualifyContracts(contract):
+                self._contracts[symbol] = contract
+        except Exception as e:
+            self._emit_log_message(f"⚠️ Contract 검증 실패 ({symbol}): {e}")
+        return contract
+
+    @_on_ib_loop(default=0)
+    def qualify_symbols(self, symbols: List[str]) -> int:
+        """
+        심볼 Contract 미리 검증 (Watchlist 로드 시 호출하면 첫 주문 지연 제거)
+
+        Args:
+            symbols: 종목 심볼 목록
+
+        Returns:
+            int: 캐시된 Contract 수
+        """
+        if not self.ib or not self.ib.isConnected():
+            return 0
+
+        pending = [Stock(s, "SMART", "USD") for s in symbols if s not in self._contracts]
+        if pending:
+            try:
+                for contract in self.ib.qualifyContracts(*pending):
+                    self._contracts[contract.symbol] = contract
+            except Exception as e:
+                self._emit_log_message(f"⚠️ Contract 일괄 검증 실패: {e}")
+        return len(self._contracts)
+
+    def _qualify_watchlist(self) -> None:
+        """저장된 Watchlist 종목의 Contract를 연결 직후 캐시 (IB 루프 스레드)"""
+        try:
+            from backend.data.watchlist_store import load_watchlist
+
+            symbols = [item["ticker"] for item in load_watchlist() if item.get("ticker")]
+        except Exception as e:
+            self._emit_log_message(f"⚠️ Watchlist 로드 실패 (Contract 사전 검증 생략): {e}")
+            return
+        if symbols:
+            cached = self.qualify_symbols(symbols)
+            self._emit_log_message(f"📇 Contract 사전 검증: {cached}/{len(symbols)}개 캐시")
+
+    def _track_trade(self, trade: Trade) -> int:
+        """주문 추적 등록 + submit 시각 기록 (체결/취소는 orderStatusEvent로 처리)"""
+        order_id = trade.order.orderId
+        self._active_orders[order_id] = trade
+        self.latency.mark_submit(order_id)
+        return order_id
+
+    def get_latency_stats(self) -> dict:
+        """
+        주문 지연 히스토그램 통계
+
+        Returns:
+            dict: queue_wait / submit_to_ack / ack_to_fill / submit_to_fill
+                  구간별 {count, mean_ms, p50_ms, p90_ms, p99_ms, buckets}
+        """
+        return self.latency.get_stats()
 
     def _fetch_account_info(self) -> None:
         """
@@ -459,6 +702,10 @@ class IBKRConnector:
         self._is_running = False
         self._emit_log_message("⏹ 연결 중지 요청됨...")
 
+        # [user-032] 대기 중인 IB 루프 즉시 깨우기
+        if self._loop and self._stop_event and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._stop_event.set)
+
         # 스레드 종료 대기 (최대 5초)
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=5.0)
@@ -500,6 +747,7 @@ class IBKRConnector:
     # 주문 관리 (Step 3.1 OMS)
     # ═══════════════════════════════════════════════════════════════════
 
+    @_on_ib_loop()
     def place_market_order(
         self, symbol: str, qty: int, action: str = "BUY"
     ) -> Optional[int]:
@@ -522,22 +770,15 @@ class IBKRConnector:
             return None
 
         try:
-            # Stock 계약 생성
-            contract = Stock(symbol, "SMART", "USD")
+            # Stock 계약 (캐시)
+            contract = self._get_contract(symbol)
 
             # 시장가 주문 생성
             order = MarketOrder(action, qty)
 
             # 주문 배치
             trade = self.ib.placeOrder(contract, order)
-            order_id = trade.order.orderId
-
-            # 주문 추적에 추가
-            self._active_orders[order_id] = trade
-
-            # 체결 콜백 등록
-            trade.filledEvent += lambda t: self._on_order_filled(t)
-            trade.cancelledEvent += lambda t: self._on_order_cancelled(t)
+            order_id = self._track_trade(trade)
 
             # Signal 발생
             self._emit_order_placed(
@@ -561,6 +802,7 @@ class IBKRConnector:
             self._emit_order_error("", str(e))
             return None
 
+    @_on_ib_loop()
     def place_stop_order(
         self,
         symbol: str,
@@ -587,7 +829,7 @@ class IBKRConnector:
             return None
 
         try:
-            contract = Stock(symbol, "SMART", "USD")
+            contract = self._get_contract(symbol)
 
             # Stop 주문 생성
             order = StopOrder(action, qty, stop_price)
@@ -598,13 +840,7 @@ class IBKRConnector:
                 order.ocaType = 1  # Cancel on Fill
 
             trade = self.ib.placeOrder(contract, order)
-            order_id = trade.order.orderId
-
-            self._active_orders[order_id] = trade
-
-            # 콜백 등록
-            trade.filledEvent += lambda t: self._on_order_filled(t)
-            trade.cancelledEvent += lambda t: self._on_order_cancelled(t)
+            order_id = self._track_trade(trade)
 
             # OCA 그룹 추적
             if oca_group:
@@ -634,6 +870,7 @@ class IBKRConnector:
             self._emit_log_message(f"❌ Stop 주문 실패: {str(e)}")
             return None
 
+    @_on_ib_loop()
     def place_oca_group(
         self,
         symbol: str,
@@ -671,7 +908,7 @@ class IBKRConnector:
             # OCA 그룹 ID 생성
             oca_group = f"OCA_{symbol}_{int(time.time())}"
 
-            contract = Stock(symbol, "SMART", "USD")
+            contract = self._get_contract(symbol)
 
             # --- 1. Stop Loss 주문 ---
             stop_price = entry_price * (1 + stop_loss_pct / 100)
@@ -680,7 +917,7 @@ class IBKRConnector:
             stop_order.ocaType = 1  # Cancel on Fill
 
             stop_trade = self.ib.placeOrder(contract, stop_order)
-            self._active_orders[stop_trade.order.orderId] = stop_trade
+            self._track_trade(stop_trade)
 
             # --- 2. Profit Target (Limit) 주문 ---
             limit_price = entry_price * (1 + profit_target_pct / 100)
@@ -689,7 +926,7 @@ class IBKRConnector:
             limit_order.ocaType = 1
 
             limit_trade = self.ib.placeOrder(contract, limit_order)
-            self._active_orders[limit_trade.order.orderId] = limit_trade
+            self._track_trade(limit_trade)
 
             # OCA 그룹 추적
             self._oca_groups[oca_group] = [
@@ -697,10 +934,23 @@ class IBKRConnector:
                 limit_trade.order.orderId,
             ]
 
-            # 콜백 등록
-            for trade in [stop_trade, limit_trade]:
-                trade.filledEvent += lambda t: self._on_order_filled(t)
-                trade.cancelledEvent += lambda t: self._on_order_cancelled(t)
+            # [user-034] 자식 주문별 접수 알림 (OrderManager 장부가 OCA 멤버로 등록)
+            for trade, order_type, price_key, price in (
+                (stop_trade, "STP", "stop_price", stop_order.auxPrice),
+                (limit_trade, "LMT", "limit_price", limit_order.lmtPrice),
+            ):
+                self._emit_order_placed(
+                    {
+                        "order_id": trade.order.orderId,
+                        "symbol": symbol,
+                        "action": "SELL",
+                        "qty": qty,
+                        "order_type": order_type,
+                        price_key: price,
+                        "oca_group": oca_group,
+                        "status": "Submitted",
+                    }
+                )
 
             self._emit_log_message(
                 f"📦 OCA 그룹 배치: {symbol} | "
@@ -717,6 +967,7 @@ class IBKRConnector:
     # 신규 주문 타입 (10-001 리팩터링)
     # ═══════════════════════════════════════════════════════════════════
 
+    @_on_ib_loop()
     def place_limit_order(
         self,
         symbol: str,
@@ -748,7 +999,7 @@ class IBKRConnector:
             return None
 
         try:
-            contract = Stock(symbol, "SMART", "USD")
+            contract = self._get_contract(symbol)
             order = LimitOrder(action, qty, limit_price)
             order.tif = tif
 
@@ -757,13 +1008,7 @@ class IBKRConnector:
                 order.ocaType = 1  # Cancel on Fill
 
             trade = self.ib.placeOrder(contract, order)
-            order_id = trade.order.orderId
-
-            self._active_orders[order_id] = trade
-
-            # 콜백 등록
-            trade.filledEvent += lambda t: self._on_order_filled(t)
-            trade.cancelledEvent += lambda t: self._on_order_cancelled(t)
+            order_id = self._track_trade(trade)
 
             # OCA 그룹 추적
             if oca_group:
@@ -795,6 +1040,7 @@ class IBKRConnector:
             self._emit_log_message(f"❌ Limit 주문 실패: {str(e)}")
             return None
 
+    @_on_ib_loop()
     def place_stop_limit_order(
         self,
         symbol: str,
@@ -830,7 +1076,7 @@ class IBKRConnector:
             return None
 
         try:
-            contract = Stock(symbol, "SMART", "USD")
+            contract = self._get_contract(symbol)
 
             # Stop Limit 주문 수동 생성
             order = Order()
@@ -845,12 +1091,7 @@ class IBKRConnector:
                 order.ocaType = 1
 
             trade = self.ib.placeOrder(contract, order)
-            order_id = trade.order.orderId
-
-            self._active_orders[order_id] = trade
-
-            trade.filledEvent += lambda t: self._on_order_filled(t)
-            trade.cancelledEvent += lambda t: self._on_order_cancelled(t)
+            order_id = self._track_trade(trade)
 
             if oca_group:
                 if oca_group not in self._oca_groups:
@@ -881,6 +1122,7 @@ class IBKRConnector:
             self._emit_log_message(f"❌ Stop Limit 실패: {str(e)}")
             return None
 
+    @_on_ib_loop()
     def place_trailing_stop_order(
         self,
         symbol: str,
@@ -914,7 +1156,7 @@ class IBKRConnector:
             return None
 
         try:
-            contract = Stock(symbol, "SMART", "USD")
+            contract = self._get_contract(symbol)
 
             # TRAIL 주문 생성
             order = Order()
@@ -928,12 +1170,7 @@ class IBKRConnector:
                 order.ocaType = 1
 
             trade = self.ib.placeOrder(contract, order)
-            order_id = trade.order.orderId
-
-            self._active_orders[order_id] = trade
-
-            trade.filledEvent += lambda t: self._on_order_filled(t)
-            trade.cancelledEvent += lambda t: self._on_order_cancelled(t)
+            order_id = self._track_trade(trade)
 
             if oca_group:
                 if oca_group not in self._oca_groups:
@@ -963,6 +1200,7 @@ class IBKRConnector:
             self._emit_log_message(f"❌ Trailing Stop 실패: {str(e)}")
             return None
 
+    @_on_ib_loop()
     def place_trailing_stop_limit_order(
         self,
         symbol: str,
@@ -998,7 +1236,7 @@ class IBKRConnector:
             return None
 
         try:
-            contract = Stock(symbol, "SMART", "USD")
+            contract = self._get_contract(symbol)
 
             order = Order()
             order.action = action
@@ -1009,12 +1247,7 @@ class IBKRConnector:
             order.lmtPriceOffset = limit_offset  # Limit offset
 
             trade = self.ib.placeOrder(contract, order)
-            order_id = trade.order.orderId
-
-            self._active_orders[order_id] = trade
-
-            trade.filledEvent += lambda t: self._on_order_filled(t)
-            trade.cancelledEvent += lambda t: self._on_order_cancelled(t)
+            order_id = self._track_trade(trade)
 
             self._emit_order_placed(
                 {
@@ -1039,6 +1272,7 @@ class IBKRConnector:
             self._emit_log_message(f"❌ Trailing Stop Limit 실패: {str(e)}")
             return None
 
+    @_on_ib_loop()
     def place_moc_order(
         self,
         symbol: str,
@@ -1067,7 +1301,7 @@ class IBKRConnector:
             return None
 
         try:
-            contract = Stock(symbol, "SMART", "USD")
+            contract = self._get_contract(symbol)
 
             order = Order()
             order.action = action
@@ -1075,12 +1309,7 @@ class IBKRConnector:
             order.orderType = "MOC"
 
             trade = self.ib.placeOrder(contract, order)
-            order_id = trade.order.orderId
-
-            self._active_orders[order_id] = trade
-
-            trade.filledEvent += lambda t: self._on_order_filled(t)
-            trade.cancelledEvent += lambda t: self._on_order_cancelled(t)
+            order_id = self._track_trade(trade)
 
             self._emit_order_placed(
                 {
@@ -1102,6 +1331,7 @@ class IBKRConnector:
             self._emit_log_message(f"❌ MOC 주문 실패: {str(e)}")
             return None
 
+    @_on_ib_loop()
     def place_loc_order(
         self,
         symbol: str,
@@ -1129,7 +1359,7 @@ class IBKRConnector:
             return None
 
         try:
-            contract = Stock(symbol, "SMART", "USD")
+            contract = self._get_contract(symbol)
 
             order = Order()
             order.action = action
@@ -1138,12 +1368,7 @@ class IBKRConnector:
             order.lmtPrice = limit_price
 
             trade = self.ib.placeOrder(contract, order)
-            order_id = trade.order.orderId
-
-            self._active_orders[order_id] = trade
-
-            trade.filledEvent += lambda t: self._on_order_filled(t)
-            trade.cancelledEvent += lambda t: self._on_order_cancelled(t)
+            order_id = self._track_trade(trade)
 
             self._emit_order_placed(
                 {
@@ -1167,6 +1392,7 @@ class IBKRConnector:
             self._emit_log_message(f"❌ LOC 주문 실패: {str(e)}")
             return None
 
+    @_on_ib_loop()
     def place_bracket_order(
         self,
         symbol: str,
@@ -1206,7 +1432,7 @@ class IBKRConnector:
             return None
 
         try:
-            contract = Stock(symbol, "SMART", "USD")
+            contract = self._get_contract(symbol)
 
             # ib_insync 네이티브 bracketOrder 사용
             # 자동으로 OCA 그룹을 구성하고 Parent-Child 관계 설정
@@ -1221,12 +1447,7 @@ class IBKRConnector:
             order_ids = []
             for order in bracket:
                 trade = self.ib.placeOrder(contract, order)
-                order_id = trade.order.orderId
-                order_ids.append(order_id)
-
-                self._active_orders[order_id] = trade
-                trade.filledEvent += lambda t: self._on_order_filled(t)
-                trade.cancelledEvent += lambda t: self._on_order_cancelled(t)
+                order_ids.append(self._track_trade(trade))
 
             parent_id, tp_id, sl_id = order_ids
 
@@ -1256,6 +1477,7 @@ class IBKRConnector:
             self._emit_log_message(f"❌ Bracket 주문 실패: {str(e)}")
             return None
 
+    @_on_ib_loop(default=False)
     def cancel_order(self, order_id: int) -> bool:
         """
         주문 취소
@@ -1279,6 +1501,7 @@ class IBKRConnector:
             self._emit_log_message(f"❌ 주문 취소 실패: {str(e)}")
             return False
 
+    @_on_ib_loop(default=0)
     def cancel_all_orders(self) -> int:
         """
         모든 미체결 주문 취소
@@ -1298,6 +1521,7 @@ class IBKRConnector:
             self._emit_log_message(f"❌ 전체 취소 실패: {str(e)}")
             return 0
 
+    @_on_ib_loop(default=list)
     def get_positions(self) -> List[dict]:
         """
         현재 포지션 조회
@@ -1330,6 +1554,7 @@ class IBKRConnector:
             self._emit_log_message(f"⚠️ 포지션 조회 실패: {str(e)}")
             return []
 
+    @_on_ib_loop(default=list)
     def get_open_orders(self) -> List[dict]:
         """
         미체결 주문 조회
@@ -1366,8 +1591,33 @@ class IBKRConnector:
     # 주문 콜백 (내부용)
     # ═══════════════════════════════════════════════════════════════════
 
-    def _on_order_filled(self, trade: Trade) -> None:
-        """주문 체결 콜백"""
+    def _on_order_status(self, trade: Trade) -> None:
+        """
+        [user-032] 주문 상태 이벤트 (IB 연결당 1회 구독)
+
+        주문마다 람다를 붙이는 대신 전역 orderStatusEvent 하나로
+        접수(ack) / 체결 / 취소를 구분하고 지연을 기록합니다.
+        """
+        order_id = trade.order.orderId
+        status = trade.orderStatus.status
+
+        if status in ("PreSubmitted", "Submitted"):
+            self.latency.mark_ack(order_id)
+        elif status == "Filled":
+            if order_id in self._active_orders:
+                self.latency.mark_fill(order_id)
+                self._handle_order_filled(trade)
+        elif status in ("Cancelled", "ApiCancelled"):
+            if order_id in self._active_orders:
+                self.latency.forget(order_id)
+                self._handle_order_cancelled(trade)
+
+    def _handle_order_filled(self, trade: Trade) -> None:
+        """
+        주문 체결 처리
+
+        (외부 콜백 속성 _on_order_filled 와 이름이 겹쳐 가려지던 문제로 분리)
+        """
         try:
             order_id = trade.order.orderId
             symbol = trade.contract.symbol
@@ -1400,8 +1650,8 @@ class IBKRConnector:
         except Exception as e:
             self._emit_log_message(f"⚠️ 체결 콜백 오류: {str(e)}")
 
-    def _on_order_cancelled(self, trade: Trade) -> None:
-        """주문 취소 콜백"""
+    def _handle_order_cancelled(self, trade: Trade) -> None:
+        """주문 취소 처리"""
         try:
             order_id = trade.order.orderId
             symbol = trade.contract.symbol
@@ -0,0 +1,151 @@
+# ============================================================================
+# Order Latency Tracker - 주문 단계별 지연 히스토그램
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - 주문별 submit → ack → fill 타임스탬프 기록
+#   - 구간별 지연(ms)을 고정 버킷 히스토그램으로 집계 (메모리 O(버킷 수))
+#   - p50/p90/p99 근사치와 버킷 분포를 통계로 노출
+#
+# 📖 사용 예시:
+#   >>> tracker = OrderLatencyTracker()
+#   >>> tracker.mark_submit(101)
+#   >>> tracker.mark_ack(101)
+#   >>> tracker.mark_fill(101)
+#   >>> tracker.get_stats()["submit_to_fill"]["p50_ms"]
+#
+# 📌 [user-032] Broker Latency Tracking
+# ============================================================================
+
+import bisect
+import threading
+import time
+from typing import Dict, Optional
+
+
+# 버킷 상한 (ms) - 마지막 버킷은 그 이상 전부
+BUCKET_BOUNDS_MS = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+class LatencyHistogram:
+    """
+    고정 버킷 지연 히스토그램
+
+    ELI5: 지연 시간을 "1ms 이하", "2ms 이하", ... 상자에 하나씩 던져 넣고
+          상자별 개수만 셉니다. 값을 전부 저장하지 않아도 분포를 알 수 있습니다.
+    """
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = float("inf")
+        self.max_ms = 0.0
+
+    def record(self, ms: float) -> None:
+        """지연 1건 기록"""
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.min_ms = min(self.min_ms, ms)
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, q: float) -> float:
+        """
+        백분위 근사치 (해당 버킷 상한, 마지막 버킷은 관측 최대값)
+
+        Args:
+            q: 0~100
+        """
+        if not self.count:
+            return 0.0
+        target = self.count * q / 100
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= target and n:
+                bound = BUCKET_BOUNDS_MS[i] if i < len(BUCKET_BOUNDS_MS) else self.max_ms
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def to_dict(self) -> dict:
+        """통계 딕셔너리"""
+        labels = [f"<={b}" for b in BUCKET_BOUNDS_MS] + [f">{BUCKET_BOUNDS_MS[-1]}"]
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "min_ms": self.min_ms if self.count else 0.0,
+            "max_ms": self.max_ms,
+            "p50_ms": self.percentile(50),
+            "p90_ms": self.percentile(90),
+            "p99_ms": self.percentile(99),
+            "buckets": {label: n for label, n in zip(labels, self.counts) if n},
+        }
+
+
+class OrderLatencyTracker:
+    """
+    주문별 submit → ack → fill 지연 추적기
+
+    - submit: 주문 명령이 브로커 API로 전송된 시점
+    - ack: 브로커가 주문을 접수 (PreSubmitted/Submitted)
+    - fill: 전량 체결
+    - trigger_to_fill: Stop/Trailing 트리거 → 체결 (SimulatedBroker가 기록)
+
+    여러 스레드(API 호출 스레드, IB 이벤트 루프)에서 호출되므로 짧은 락 사용.
+    """
+
+    STAGES = ("queue_wait", "submit_to_ack", "ack_to_fill", "submit_to_fill", "trigger_to_fill")
+
+    def __init__(self, clock=time.perf_counter):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._submitted: Dict[int, float] = {}
+        self._acked: Dict[int, float] = {}
+        self._hist: Dict[str, LatencyHistogram] = {s: LatencyHistogram() for s in self.STAGES}
+
+    def record(self, stage: str, ms: float) -> None:
+        """임의 구간 지연 직접 기록 (예: queue_wait)"""
+        with self._lock:
+            self._hist[stage].record(ms)
+
+    def mark_submit(self, order_id: int, ts: Optional[float] = None) -> None:
+        with self._lock:
+            self._submitted[order_id] = ts if ts is not None else self._clock()
+
+    def mark_ack(self, order_id: int, ts: Optional[float] = None) -> None:
+        """최초 접수만 기록 (중복 상태 이벤트 무시)"""
+        now = ts if ts is not None else self._clock()
+        with self._lock:
+            submitted = self._submitted.get(order_id)
+            if submitted is None or order_id in self._acked:
+                return
+            self._acked[order_id] = now
+            self._hist["submit_to_ack"].record((now - submitted) * 1000)
+
+    def mark_fill(self, order_id: int, ts: Optional[float] = None) -> None:
+        now = ts if ts is not None else self._clock()
+        with self._lock:
+            submitted = self._submitted.pop(order_id, None)
+            acked = self._acked.pop(order_id, None)
+            if submitted is not None:
+                self._hist["submit_to_fill"].record((now - submitted) * 1000)
+            if acked is not None:
+                self._hist["ack_to_fill"].record((now - acked) * 1000)
+
+    def forget(self, order_id: int) -> None:
+        """취소/거부된 주문 추적 해제"""
+        with self._lock:
+            self._submitted.pop(order_id, None)
+            self._acked.pop(order_id, None)
+
+    def get_stats(self) -> dict:
+        """
+        구간별 히스토그램 통계
+
+        Returns:
+            dict: {stage: {count, mean_ms, p50_ms, p90_ms, p99_ms, buckets, ...}, in_flight}
+        """
+        with self._lock:
+            stats = {stage: hist.to_dict() for stage, hist in self._hist.items()}
+            stats["in_flight"] = len(self._submitted)
+        return stats
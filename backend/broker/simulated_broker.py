@@ -0,0 +1,911 @@
+# ============================================================================
+# Simulated Broker - IB Gateway 없이 주문 체결을 흉내내는 로컬 브로커
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - IBKRConnector와 같은 callback / 주문 API 제공 (drop-in 교체)
+#   - 가격 스트림(MockPriceFeed, 녹화 틱, TickDispatcher)으로 주문 매칭
+#   - 접수(ack) / 체결(fill) 지연, 부분 체결, 슬리피지 설정 가능
+#   - OrderManager / TrailingStopManager / DoubleTap / RiskManager.kill_switch를
+#     실제 브로커 없이 벤치마크 (scripts/benchmark_sim_broker.py)
+#
+# 📖 사용 예시:
+#   >>> broker = SimulatedBroker(SimBrokerConfig(ack_latency_ms=5, fill_latency_ms=20))
+#   >>> broker.process_tick("AAPL", 100.0, 500, ts=0.0)
+#   >>> order_id = broker.place_stop_order("AAPL", 10, 99.0)
+#   >>> broker.process_tick("AAPL", 98.9, 500, ts=0.1)   # 트리거
+#   >>> broker.advance(0.2)                               # 체결 지연 경과
+#
+# 📌 시간 모드:
+#   - 가상 시간 (기본): 틱/advance()의 ts가 시계 → 결정적, 테스트/리플레이용
+#   - 실시간: start() 호출 시 perf_counter 시계 + 백그라운드 펌프 스레드
+#
+# 📌 [user-033] Simulated Broker
+# ============================================================================
+
+import heapq
+import itertools
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .ibkr_connector import IBKRConnector
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 설정 / 주문 상태
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+@dataclass
+class SimBrokerConfig:
+    """
+    SimulatedBroker 설정값
+
+    Attributes:
+        ack_latency_ms: 주문 전송 → 브로커 접수까지 지연
+        fill_latency_ms: 체결 조건 충족 → 체결까지 지연
+        cancel_latency_ms: 취소 요청 → 취소 확정까지 지연
+        jitter_ms: 각 지연에 더할 균등분포 지터 (0 ~ jitter_ms)
+        participation: 틱 거래량 대비 1회 최대 체결 비율 (0 = 제한 없음 → 전량)
+        slippage_bps: 시장가성 체결 슬리피지 (bp, 불리한 방향)
+        seed: 지터 난수 시드 (재현성)
+    """
+
+    ack_latency_ms: float = 5.0
+    fill_latency_ms: float = 20.0
+    cancel_latency_ms: float = 5.0
+    jitter_ms: float = 0.0
+    participation: float = 0.0
+    slippage_bps: float = 0.0
+    seed: Optional[int] = None
+
+
+@dataclass
+class SimOrder:
+    """
+    시뮬레이터 내부 주문
+
+    status 흐름 (IB 상태명 그대로):
+        PendingSubmit → Submitted (부모 대기 중인 자식은 PreSubmitted)
+        → Filled / Cancelled (취소 요청 후 확정 전은 PendingCancel)
+    """
+
+    order_id: int
+    symbol: str
+    action: str
+    qty: int
+    order_type: str
+    submit_ts: float
+    limit_price: Optional[float] = None
+    stop_price: Optional[float] = None
+    trail_amount: Optional[float] = None
+    limit_offset: Optional[float] = None
+    oca_group: Optional[str] = None
+    parent_id: Optional[int] = None
+    tif: str = "DAY"
+    status: str = "PendingSubmit"
+    filled: int = 0
+    avg_fill_price: float = 0.0
+    triggered: bool = False
+    trigger_ts: Optional[float] = None
+    trail_ref: Optional[float] = None
+    fill_pending: bool = False
+
+    @property
+    def remaining(self) -> int:
+        return self.qty - self.filled
+
+    @property
+    def is_buy(self) -> bool:
+        return self.action == "BUY"
+
+
+# 체결 대기 가능한 상태 (취소 확정 전 체결은 실제 브로커와 동일하게 허용)
+_WORKING = ("PreSubmitted", "Submitted", "PendingCancel")
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# SimulatedBroker
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class SimulatedBroker(IBKRConnector):
+    """
+    IBKRConnector 호환 시뮬레이션 브로커
+
+    ELI5: 진짜 증권사 대신 "연습용 거래소"를 차립니다.
+          주문을 받으면 잠깐 뒤(ack 지연) 접수하고, 가격이 조건에 닿으면
+          또 잠깐 뒤(fill 지연) 체결해 줍니다. 체결 알림은 진짜 커넥터와
+          똑같은 callback으로 나가므로 OrderManager는 차이를 모릅니다.
+
+    지원 주문: MKT, LMT, STP, STP LMT, TRAIL, TRAIL LIMIT, MOC, LOC,
+              OCA 그룹, Bracket (부모 체결 후 자식 활성화)
+
+    이벤트(접수/체결/취소)는 (시각, 순번) 힙에 쌓이고, 틱이나 advance()가
+    시계를 앞으로 당길 때 시각순으로 처리됩니다. 심볼별 작업 주문 인덱스로
+    틱 1건당 해당 심볼 주문만 검사합니다.
+    """
+
+    # 실시간 모드 펌프 최대 대기 (초)
+    PUMP_IDLE_SECONDS = 0.05
+
+    def __init__(
+        self,
+        config: Optional[SimBrokerConfig] = None,
+        clock: Optional[Callable[[], float]] = None,
+    ) -> None:
+        """
+        Args:
+            config: 지연/체결 설정 (None이면 기본값)
+            clock: 시계 함수 (None이면 가상 시간 - 틱 ts 기준)
+        """
+        super().__init__()
+        self.config = config or SimBrokerConfig()
+        self._clock = clock
+        self._sim_time: Optional[float] = None
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.RLock()
+        self._wake = threading.Event()
+
+        self._ids = itertools.count(1)
+        self._seq = itertools.count()
+        self._events: List[Tuple[float, int, str, int]] = []
+        self._orders: Dict[int, SimOrder] = {}
+        # 심볼 -> {order_id: SimOrder} (작업 중 주문만)
+        self._working: Dict[str, Dict[int, SimOrder]] = {}
+        # 부모 order_id -> 자식 order_id 목록 (Bracket)
+        self._children: Dict[int, List[int]] = {}
+        # 심볼 -> (최근 가격, 최근 틱 거래량)
+        self._last: Dict[str, Tuple[float, float]] = {}
+        # 심볼 -> [수량, 평균단가]
+        self._positions: Dict[str, List[float]] = {}
+        self._realized_pnl = 0.0
+
+        # 실시간 펌프
+        self._feeds: list = []
+        self._tick_interval = 0.1
+
+        self._stats = {
+            "orders": 0,
+            "fills": 0,
+            "partial_fills": 0,
+            "cancels": 0,
+            "ticks": 0,
+        }
+
+        # 시뮬레이터는 항상 "연결됨"
+        self._is_connected = True
+
+    # ═══════════════════════════════════════════════════════════════════
+    # 시계 / 이벤트 큐
+    # ═══════════════════════════════════════════════════════════════════
+
+    def _now(self) -> float:
+        if self._clock is not None:
+            return self._clock()
+        return self._sim_time or 0.0
+
+    def _advance_to(self, ts: Optional[float]) -> float:
+        """가상 시계를 ts까지 전진 (뒤로 가지 않음)"""
+        if self._clock is not None or ts is None:
+            return self._now()
+        if self._sim_time is None:
+            self._rebase(ts)
+        elif ts > self._sim_time:
+            self._sim_time = ts
+        return self._sim_time
+
+    def _rebase(self, ts: float) -> None:
+        """
+        첫 시각 확정
+
+        첫 틱 전에 들어온 주문은 0초 기준으로 예약되어 있으므로,
+        녹화 틱의 Unix 시각으로 함께 옮겨 지연 통계가 왜곡되지 않게 합니다.
+        """
+        self._sim_time = ts
+        if self._events:
+            self._events = [(due + ts, seq, kind, oid) for due, seq, kind, oid in self._events]
+            heapq.heapify(self._events)
+            for order in self._orders.values():
+                order.submit_ts += ts
+
+    def _delay(self, ms: float) -> float:
+        if self.config.jitter_ms:
+            ms += self._rng.uniform(0, self.config.jitter_ms)
+        return ms / 1000
+
+    def _schedule(self, due: float, kind: str, order_id: int) -> None:
+        heapq.heappush(self._events, (due, next(self._seq), kind, order_id))
+        self._wake.set()
+
+    def _process_due(self, now: float) -> None:
+        """now 이전에 예약된 이벤트를 시각순으로 처리"""
+        while self._events and self._events[0][0] <= now:
+            due, _, kind, order_id = heapq.heappop(self._events)
+            order = self._orders.get(order_id)
+            if order is None:
+                continue
+            if kind == "ack":
+                self._on_ack(order, due)
+            elif kind == "fill":
+                self._on_fill_due(order, due)
+            elif kind == "cancel":
+                self._on_cancel_due(order, due)
+
+    # ═══════════════════════════════════════════════════════════════════
+    # 가격 입력
+    # ═══════════════════════════════════════════════════════════════════
+
+    def process_tick(
+        self, symbol: str, price: float, size: float = 0, ts: Optional[float] = None
+    ) -> None:
+        """
+        체결 틱 1건 반영 후 해당 심볼 주문 매칭
+
+        Args:
+            symbol: 종목 심볼
+            price: 체결가
+            size: 체결 수량 (participation 계산용)
+            ts: 틱 시각 (가상 시간 모드에서 시계로 사용, 초 단위)
+        """
+        with self._lock:
+            now = self._advance_to(ts)
+            # 이 틱 이전에 만기된 이벤트는 이전 가격으로 처리
+            self._process_due(now)
+            self._last[symbol] = (price, size)
+            self._stats["ticks"] += 1
+            working = self._working.get(symbol)
+            if working:
+                for order in list(working.values()):
+                    self._check_order(order, now)
+            # 지연 0 설정이면 같은 시각 이벤트 즉시 처리
+            self._process_due(now)
+
+    def on_tick(self, tick: dict) -> None:
+        """TickDispatcher 콜백 ({"ticker", "price", "size", "time"})"""
+        if tick.get("type") == "bar" or not tick.get("price"):
+            return
+        self.process_tick(
+            tick["ticker"], float(tick["price"]), tick.get("size") or 0, tick.get("time")
+        )
+
+    def attach(self, dispatcher) -> None:
+        """TickDispatcher 구독 (실시간 틱으로 매칭)"""
+        dispatcher.register("simulated_broker", self.on_tick)
+
+    def replay(self, ticks: Iterable[dict]) -> int:
+        """
+        녹화 틱 / MockPriceFeed 틱 재생
+
+        Args:
+            ticks: {"ticker", "price", "volume"|"size", "timestamp"|"time"} 목록
+                   (timestamp는 datetime 또는 Unix 초)
+
+        Returns:
+            int: 처리한 틱 수
+        """
+        count = 0
+        for tick in ticks:
+            ts = tick.get("time", tick.get("timestamp"))
+            if isinstance(ts, datetime):
+                ts = ts.timestamp()
+            size = tick.get("size", tick.get("volume", 0))
+            self.process_tick(tick["ticker"], float(tick["price"]), size, ts)
+            count += 1
+        return count
+
+    def advance(self, ts: Optional[float] = None) -> None:
+        """틱 없이 시계만 전진 (만기 이벤트 처리)"""
+        with self._lock:
+            self._process_due(self._advance_to(ts))
+
+    def settle_close(self, ts: Optional[float] = None) -> int:
+        """
+        장 마감 처리: MOC는 최근가로, LOC는 지정가 조건 충족 시 체결 (아니면 취소)
+
+        Returns:
+            int: 체결된 주문 수
+        """
+        filled = 0
+        with self._lock:
+            now = self._advance_to(ts)
+            self._process_due(now)
+            for order in list(self._orders.values()):
+                if order.order_type not in ("MOC", "LOC") or order.status not in _WORKING:
+                    continue
+                last = self._last.get(order.symbol)
+                if last and self._limit_ok(order, last[0]):
+                    self._execute_fill(order, now, qty=order.remaining)
+                    filled += 1
+                else:
+                    self._finalize_cancel(order)
+        return filled
+
+    # ═══════════════════════════════════════════════════════════════════
+    # 매칭 엔진 (내부)
+    # ═══════════════════════════════════════════════════════════════════
+
+    def _on_ack(self, order: SimOrder, due: float) -> None:
+        if order.status != "PendingSubmit":
+            return
+        parent = self._orders.get(order.parent_id) if order.parent_id else None
+        order.status = "PreSubmitted" if parent and parent.status != "Filled" else "Submitted"
+        self.latency.mark_submit(order.order_id, order.submit_ts)
+        self.latency.mark_ack(order.order_id, due)
+        if order.status == "Submitted":
+            self._check_order(order, due)
+
+    def _limit_ok(self, order: SimOrder, price: float) -> bool:
+        if order.limit_price is None:
+            return True
+        return price <= order.limit_price if order.is_buy else price >= order.limit_price
+
+    def _check_order(self, order: SimOrder, now: float) -> None:
+        """가격 조건 확인 → 충족 시 fill 지연 후 체결 예약"""
+        if order.status not in ("Submitted", "PendingCancel") or order.fill_pending:
+            return
+        if order.order_type in ("MOC", "LOC"):
+            return
+        last = self._last.get(order.symbol)
+        if last is None:
+            return
+        price = last[0]
+
+        if not order.triggered:
+            if order.order_type in ("TRAIL", "TRAIL LIMIT"):
+                # 고점(매도) / 저점(매수) 추적 → Stop 가격 갱신
+                if order.trail_ref is None:
+                    order.trail_ref = price
+                order.trail_ref = min(order.trail_ref, price) if order.is_buy else max(order.trail_ref, price)
+                order.stop_price = (
+                    order.trail_ref + order.trail_amount
+                    if order.is_buy
+                    else order.trail_ref - order.trail_amount
+                )
+            if order.stop_price is not None:
+                hit = price >= order.stop_price if order.is_buy else price <= order.stop_price
+                if not hit:
+                    return
+                order.triggered = True
+                order.trigger_ts = now
+                if order.order_type == "TRAIL LIMIT":
+                    offset = order.limit_offset or 0.0
+                    order.limit_price = (
+                        order.stop_price + offset if order.is_buy else order.stop_price - offset
+                    )
+            else:
+                order.triggered = True
+
+        if not self._limit_ok(order, price):
+            return
+        order.fill_pending = True
+        self._schedule(now + self._delay(self.config.fill_latency_ms), "fill", order.order_id)
+
+    def _on_fill_due(self, order: SimOrder, due: float) -> None:
+        order.fill_pending = False
+        if order.status not in ("Submitted", "PendingCancel"):
+            return
+        price = self._last[order.symbol][0]
+        if not self._limit_ok(order, price):
+            # 지연 동안 가격이 지정가를 벗어남 → 다음 틱에서 재확인
+            return
+        self._execute_fill(order, due)
+
+    def _execute_fill(self, order: SimOrder, now: float, qty: Optional[int] = None) -> None:
+        """체결 1회 반영 (부분 체결 포함)"""
+        price, size = self._last[order.symbol]
+        if qty is None:
+            qty = order.remaining
+            if self.config.participation > 0:
+                qty = min(qty, max(1, int(size * self.config.participation)))
+
+        if order.limit_price is None and self.config.slippage_bps:
+            slip = price * self.config.slippage_bps / 10_000
+            price = price + slip if order.is_buy else price - slip
+        elif order.limit_price is not None:
+            price = min(price, order.limit_price) if order.is_buy else max(price, order.limit_price)
+
+        first_fill = order.filled == 0
+        order.avg_fill_price = (order.avg_fill_price * order.filled + price * qty) / (order.filled + qty)
+        order.filled += qty
+        self._update_position(order.symbol, qty if order.is_buy else -qty, price)
+
+        if first_fill:
+            if order.trigger_ts is not None:
+                self.latency.record("trigger_to_fill", (now - order.trigger_ts) * 1000)
+            if order.oca_group:
+                self._cancel_oca_siblings(order)
+
+        if order.remaining > 0:
+            self._stats["partial_fills"] += 1
+            self._emit_log_message(
+                f"🧩 부분 체결: {order.symbol} {order.filled}/{order.qty} "
+                f"@ ${price:.2f} (ID: {order.order_id})"
+            )
+            return
+
+        order.status = "Filled"
+        self._stats["fills"] += 1
+        self._remove_working(order)
+        self.latency.mark_fill(order.order_id, now)
+
+        self._emit_order_filled(
+            {
+                "order_id": order.order_id,
+                "symbol": order.symbol,
+                "action": order.action,
+                "qty": order.qty,
+                "fill_price": order.avg_fill_price,
+                "status": "Filled",
+            }
+        )
+        self._emit_log_message(
+            f"✅ 체결: {order.symbol} @ ${order.avg_fill_price:.2f} (ID: {order.order_id})"
+        )
+        self.get_positions()
+
+        # Bracket 부모 체결 → 자식 활성화
+        for child_id in self._children.pop(order.order_id, []):
+            child = self._orders.get(child_id)
+            if child and child.status == "PreSubmitted":
+                child.status = "Submitted"
+                self._check_order(child, now)
+
+    def _update_position(self, symbol: str, signed_qty: int, price: float) -> None:
+        pos = self._positions.setdefault(symbol, [0, 0.0])
+        qty, avg = pos
+        new_qty = qty + signed_qty
+        if qty == 0 or (qty > 0) == (signed_qty > 0):
+            # 신규 / 추가 진입: 평균단가 갱신
+            pos[1] = (avg * abs(qty) + price * abs(signed_qty)) / abs(new_qty)
+        else:
+            # 청산: 실현 손익
+            closed = min(abs(qty), abs(signed_qty))
+            self._realized_pnl += (price - avg) * closed * (1 if qty > 0 else -1)
+            if new_qty == 0:
+                pos[1] = 0.0
+            elif (new_qty > 0) != (qty > 0):
+                pos[1] = price  # 방향 전환
+        pos[0] = new_qty
+
+    def _cancel_oca_siblings(self, order: SimOrder) -> None:
+        for sibling_id in self._oca_groups.get(order.oca_group, []):
+            sibling = self._orders.get(sibling_id)
+            if sibling_id != order.order_id and sibling and sibling.status in _WORKING + ("PendingSubmit",):
+                self._finalize_cancel(sibling)
+
+    def _on_cancel_due(self, order: SimOrder, due: float) -> None:
+        if order.status == "PendingCancel":
+            self._finalize_cancel(order)
+
+    def _finalize_cancel(self, order: SimOrder) -> None:
+        order.status = "Cancelled"
+        self._stats["cancels"] += 1
+        self._remove_working(order)
+        self.latency.forget(order.order_id)
+        self._emit_order_cancelled(
+            {"order_id": order.order_id, "symbol": order.symbol, "status": "Cancelled"}
+        )
+        self._emit_log_message(f"🚫 주문 취소됨: {order.symbol} (ID: {order.order_id})")
+        # 부모 취소 → 대기 중인 자식도 취소
+        for child_id in self._children.pop(order.order_id, []):
+            child = self._orders.get(child_id)
+            if child and child.status in _WORKING + ("PendingSubmit",):
+                self._finalize_cancel(child)
+
+    def _remove_working(self, order: SimOrder) -> None:
+        self._active_orders.pop(order.order_id, None)
+        working = self._working.get(order.symbol)
+        if working:
+            working.pop(order.order_id, None)
+
+    # ═══════════════════════════════════════════════════════════════════
+    # 주문 제출 (IBKRConnector 호환)
+    # ═══════════════════════════════════════════════════════════════════
+
+    def _submit(self, symbol: str, qty: int, action: str, order_type: str, **fields) -> SimOrder:
+        """주문 등록 + ack 예약 (체결은 절대 동기적으로 일어나지 않음)"""
+        now = self._now()
+        order = SimOrder(
+            order_id=next(self._ids),
+            symbol=symbol,
+            action=action,
+            qty=qty,
+            order_type=order_type,
+            submit_ts=now,
+            **fields,
+        )
+        self._orders[order.order_id] = order
+        self._active_orders[order.order_id] = order
+        self._working.setdefault(symbol, {})[order.order_id] = order
+        if order.oca_group:
+            self._oca_groups.setdefault(order.oca_group, []).append(order.order_id)
+        self._stats["orders"] += 1
+        self._schedule(now + self._delay(self.config.ack_latency_ms), "ack", order.order_id)
+        return order
+
+    def place_market_order(self, symbol: str, qty: int, action: str = "BUY") -> Optional[int]:
+        """시장가 주문"""
+        with self._lock:
+            order = self._submit(symbol, qty, action, "MKT")
+            self._emit_order_placed(
+                {
+                    "order_id": order.order_id,
+                    "symbol": symbol,
+                    "action": action,
+                    "qty": qty,
+                    "order_type": "MKT",
+                    "status": "Submitted",
+                }
+            )
+            self._emit_log_message(
+                f"📤 주문 접수: {action} {qty} {symbol} @ MKT (ID: {order.order_id})"
+            )
+            return order.order_id
+
+    def place_stop_order(
+        self,
+        symbol: str,
+        qty: int,
+        stop_price: float,
+        action: str = "SELL",
+        oca_group: Optional[str] = None,
+    ) -> Optional[int]:
+        """Stop 주문"""
+        with self._lock:
+            order = self._submit(
+                symbol, qty, action, "STP", stop_price=stop_price, oca_group=oca_group
+            )
+            self._emit_order_placed(
+                {
+                    "order_id": order.order_id,
+                    "symbol": symbol,
+                    "action": action,
+                    "qty": qty,
+                    "order_type": "STP",
+                    "stop_price": stop_price,
+                    "oca_group": oca_group,
+                    "status": "Submitted",
+                }
+            )
+            return order.order_id
+
+    def place_limit_order(
+        self,
+        symbol: str,
+        qty: int,
+        limit_price: float,
+        action: str = "BUY",
+        tif: str = "DAY",
+        oca_group: Optional[str] = None,
+    ) -> Optional[int]:
+        """지정가 주문"""
+        with self._lock:
+            order = self._submit(
+                symbol, qty, action, "LMT",
+                limit_price=limit_price, tif=tif, oca_group=oca_group,
+            )
+            self._emit_order_placed(
+                {
+                    "order_id": order.order_id,
+                    "symbol": symbol,
+                    "action": action,
+                    "qty": qty,
+                    "order_type": "LMT",
+                    "limit_price": limit_price,
+                    "tif": tif,
+                    "oca_group": oca_group,
+                    "status": "Submitted",
+                }
+            )
+            return order.order_id
+
+    def place_stop_limit_order(
+        self,
+        symbol: str,
+        qty: int,
+        stop_price: float,
+        limit_price: float,
+        action: str = "SELL",
+        oca_group: Optional[str] = None,
+    ) -> Optional[int]:
+        """Stop Limit 주문"""
+        with self._lock:
+            order = self._submit(
+                symbol, qty, action, "STP LMT",
+                stop_price=stop_price, limit_price=limit_price, oca_group=oca_group,
+            )
+            self._emit_order_placed(
+                {
+                    "order_id": order.order_id,
+                    "symbol": symbol,
+                    "action": action,
+                    "qty": qty,
+                    "order_type": "STP LMT",
+                    "stop_price": stop_price,
+                    "limit_price": limit_price,
+                    "oca_group": oca_group,
+                    "status": "Submitted",
+                }
+            )
+            return order.order_id
+
+    def place_trailing_stop_order(
+        self,
+        symbol: str,
+        qty: int,
+        trail_amount: float,
+        action: str = "SELL",
+        oca_group: Optional[str] = None,
+    ) -> Optional[int]:
+        """Trailing Stop 주문 (달러 단위 trail)"""
+        with self._lock:
+            order = self._submit(
+                symbol, qty, action, "TRAIL", trail_amount=trail_amount, oca_group=oca_group
+            )
+            self._emit_order_placed(
+                {
+                    "order_id": order.order_id,
+                    "symbol": symbol,
+                    "action": action,
+                    "qty": qty,
+                    "order_type": "TRAIL",
+                    "trail_amount": trail_amount,
+                    "oca_group": oca_group,
+                    "status": "Submitted",
+                }
+            )
+            return order.order_id
+
+    def place_trailing_stop_limit_order(
+        self,
+        symbol: str,
+        qty: int,
+        trail_amount: float,
+        limit_offset: float,
+        action: str = "SELL",
+    ) -> Optional[int]:
+        """Trailing Stop Limit 주문"""
+        with self._lock:
+            order = self._submit(
+                symbol, qty, action, "TRAIL LIMIT",
+                trail_amount=trail_amount, limit_offset=limit_offset,
+            )
+            self._emit_order_placed(
+                {
+                    "order_id": order.order_id,
+                    "symbol": symbol,
+                    "action": action,
+                    "qty": qty,
+                    "order_type": "TRAIL LIMIT",
+                    "trail_amount": trail_amount,
+                    "limit_offset": limit_offset,
+                    "status": "Submitted",
+                }
+            )
+            return order.order_id
+
+    def place_moc_order(self, symbol: str, qty: int, action: str = "SELL") -> Optional[int]:
+        """Market-on-Close 주문 (settle_close()에서 체결)"""
+        with self._lock:
+            order = self._submit(symbol, qty, action, "MOC")
+            self._emit_order_placed(
+                {
+                    "order_id": order.order_id,
+                    "symbol": symbol,
+                    "action": action,
+                    "qty": qty,
+                    "order_type": "MOC",
+                    "status": "Submitted",
+                }
+            )
+            return order.order_id
+
+    def place_loc_order(
+        self, symbol: str, qty: int, limit_price: float, action: str = "SELL"
+    ) -> Optional[int]:
+        """Limit-on-Close 주문 (settle_close()에서 체결)"""
+        with self._lock:
+            order = self._submit(symbol, qty, action, "LOC", limit_price=limit_price)
+            self._emit_order_placed(
+                {
+                    "order_id": order.order_id,
+                    "symbol": symbol,
+                    "action": action,
+                    "qty": qty,
+                    "order_type": "LOC",
+                    "limit_price": limit_price,
+                    "status": "Submitted",
+                }
+            )
+            return order.order_id
+
+    def place_oca_group(
+        self,
+        symbol: str,
+        qty: int,
+        entry_price: float,
+        stop_loss_pct: float = -2.0,
+        profit_target_pct: float = 8.0,
+    ) -> Optional[str]:
+        """Stop Loss + Profit Target OCA 그룹 (IBKRConnector와 동일한 가격 계산)"""
+        with self._lock:
+            oca_group = f"OCA_{symbol}_{next(self._seq)}"
+            stop_price = round(entry_price * (1 + stop_loss_pct / 100), 2)
+            limit_price = round(entry_price * (1 + profit_target_pct / 100), 2)
+            self._submit(symbol, qty, "SELL", "STP", stop_price=stop_price, oca_group=oca_group)
+            self._submit(symbol, qty, "SELL", "LMT", limit_price=limit_price, oca_group=oca_group)
+            self._emit_log_message(
+                f"📦 OCA 그룹 배치: {symbol} | Stop ${stop_price:.2f} / Target ${limit_price:.2f}"
+            )
+            return oca_group
+
+    def place_bracket_order(
+        self,
+        symbol: str,
+        qty: int,
+        entry_price: float,
+        take_profit_price: float,
+        stop_loss_price: float,
+        action: str = "BUY",
+    ) -> Optional[Tuple[int, int, int]]:
+        """Bracket 주문: 지정가 진입 + (TP 지정가 / SL Stop) OCA 자식"""
+        with self._lock:
+            exit_action = "SELL" if action == "BUY" else "BUY"
+            parent = self._submit(symbol, qty, action, "LMT", limit_price=entry_price)
+            oca_group = f"BRACKET_{parent.order_id}"
+            tp = self._submit(
+                symbol, qty, exit_action, "LMT",
+                limit_price=take_profit_price, oca_group=oca_group, parent_id=parent.order_id,
+            )
+            sl = self._submit(
+                symbol, qty, exit_action, "STP",
+                stop_price=stop_loss_price, oca_group=oca_group, parent_id=parent.order_id,
+            )
+            self._children[parent.order_id] = [tp.order_id, sl.order_id]
+            self._emit_order_placed(
+                {
+                    "order_id": parent.order_id,
+                    "symbol": symbol,
+                    "action": action,
+                    "qty": qty,
+                    "order_type": "BRACKET",
+                    "entry_price": entry_price,
+                    "take_profit_price": take_profit_price,
+                    "stop_loss_price": stop_loss_price,
+                    "child_orders": [tp.order_id, sl.order_id],
+                    "status": "Submitted",
+                }
+            )
+            return (parent.order_id, tp.order_id, sl.order_id)
+
+    def cancel_order(self, order_id: int) -> bool:
+        """주문 취소 요청 (cancel_latency 후 확정, 그 사이 체결 가능)"""
+        with self._lock:
+            order = self._orders.get(order_id)
+            if order is None or order.status not in _WORKING + ("PendingSubmit",):
+                self._emit_log_message(f"⚠️ 주문 ID {order_id}를 찾을 수 없음")
+                return False
+            order.status = "PendingCancel"
+            self._schedule(
+                self._now() + self._delay(self.config.cancel_latency_ms), "cancel", order_id
+            )
+            return True
+
+    def cancel_all_orders(self) -> int:
+        """모든 작업 중 주문 취소 요청"""
+        with self._lock:
+            order_ids = list(self._active_orders)
+            for order_id in order_ids:
+                self.cancel_order(order_id)
+            self._emit_log_message(f"🚫 전체 주문 취소 요청: {len(order_ids)}개")
+            return len(order_ids)
+
+    def get_positions(self) -> List[dict]:
+        """현재 포지션 (IBKRConnector와 같은 형식)"""
+        with self._lock:
+            result = [
+                {"symbol": symbol, "qty": pos[0], "avg_price": pos[1], "contract": None}
+                for symbol, pos in self._positions.items()
+                if pos[0]
+            ]
+        self._emit_positions_update(result)
+        return result
+
+    def get_open_orders(self) -> List[dict]:
+        """미체결 주문"""
+        with self._lock:
+            return [
+                {
+                    "order_id": o.order_id,
+                    "symbol": o.symbol,
+                    "action": o.action,
+                    "qty": o.qty,
+                    "order_type": o.order_type,
+                    "status": o.status,
+                }
+                for o in self._active_orders.values()
+            ]
+
+    def qualify_symbols(self, symbols: List[str]) -> int:
+        """시뮬레이터는 모든 심볼이 유효"""
+        return len(symbols)
+
+    def get_latency_stats(self) -> dict:
+        """주문 지연 히스토그램 통계 (IBKRConnector와 같은 형식)"""
+        return self.latency.get_stats()
+
+    def get_order(self, order_id: int) -> Optional[SimOrder]:
+        """내부 주문 상태 조회 (테스트/벤치마크용)"""
+        return self._orders.get(order_id)
+
+    def get_stats(self) -> dict:
+        """주문/체결 카운터 + 실현 손익 + 지연 히스토그램"""
+        with self._lock:
+            return {
+                **self._stats,
+                "working": len(self._active_orders),
+                "pending_events": len(self._events),
+                "realized_pnl": self._realized_pnl,
+                "latency": self.latency.get_stats(),
+            }
+
+    # ═══════════════════════════════════════════════════════════════════
+    # 실시간 모드 (백그라운드 펌프)
+    # ═══════════════════════════════════════════════════════════════════
+
+    def add_feed(self, feed, tick_interval: float = 0.1) -> None:
+        """
+        실시간 모드에서 틱을 생성할 MockPriceFeed 추가
+
+        Args:
+            feed: generate_tick()을 가진 객체 (MockPriceFeed)
+            tick_interval: 틱 생성 간격 (초)
+        """
+        self._feeds.append(feed)
+        self._tick_interval = tick_interval
+
+    def start(self) -> None:
+        """실시간 시계로 전환하고 이벤트 펌프 스레드 시작"""
+        if self._thread and self._thread.is_alive():
+            return
+        if self._clock is None:
+            self._clock = time.perf_counter
+        self._is_running = True
+        self._thread = threading.Thread(target=self._pump, daemon=True, name="sim-broker")
+        self._thread.start()
+        self._emit_connected(True)
+        self._emit_log_message("🧪 SimulatedBroker 시작 (실시간 모드)")
+
+    def stop(self) -> None:
+        """펌프 스레드 종료"""
+        self._is_running = False
+        self._wake.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=5.0)
+
+    def _pump(self) -> None:
+        next_tick = self._now()
+        while self._is_running:
+            now = self._now()
+            if self._feeds and now >= next_tick:
+                for feed in self._feeds:
+                    tick = feed.generate_tick()
+                    self.process_tick(tick["ticker"], tick["price"], tick["volume"])
+                next_tick = now + self._tick_interval
+            else:
+                self.advance()
+
+            # 대기 시간 계산 전에 clear → 그 사이 예약된 이벤트도 깨움 보장
+            self._wake.clear()
+            with self._lock:
+                wait = self.PUMP_IDLE_SECONDS
+                if self._events:
+                    wait = min(wait, self._events[0][0] - self._now())
+            if self._feeds:
+                wait = min(wait, next_tick - self._now())
+            if wait > 0:
+                self._wake.wait(wait)
@@ -196,6 +196,23 @@ class Container(containers.DeclarativeContainer):
 
     tick_dispatcher = providers.Singleton(_create_tick_dispatcher)
 
+    # ───────────────────────────────────────────────────────────────────────
+    # [user-031] IntradayStateEngine: 종목별 장중 상태 (Singleton)
+    # ───────────────────────────────────────────────────────────────────────
+    @staticmethod
+    def _create_intraday_state():
+        """
+        IntradayStateEngine 생성 팩토리
+
+        📌 [user-031] TickDispatcher에 attach()하여 틱마다 VWAP/HOD/ATR/RVOL 갱신
+        📌 DoubleTap, TrailingStop, IgnitionMonitor가 같은 상태를 읽음
+        """
+        from backend.core.intraday_state import IntradayStateEngine
+
+        return IntradayStateEngine()
+
+    intraday_state = providers.Singleton(_create_intraday_state)
+
     # ───────────────────────────────────────────────────────────────────────
     # [02-002] SubscriptionManager: Watchlist ↔ Massive 구독 동기화 (Singleton)
     # ───────────────────────────────────────────────────────────────────────
@@ -219,11 +236,29 @@ class Container(containers.DeclarativeContainer):
     # ───────────────────────────────────────────────────────────────────────
     # [02-002] TickBroadcaster: Massive → GUI WebSocket Bridge (Callable)
     # ───────────────────────────────────────────────────────────────────────
+    @staticmethod
+    def _create_event_sequencer(buffer_ms: int = 100, max_pending: Optional[int] = None):
+        """
+        EventSequencer 생성 팩토리
+
+        📌 이벤트 순서 보장
+        📌 [user-038] TickBroadcaster가 config.sequencer 값으로 호출
+        """
+        from backend.core.event_sequencer import EventSequencer
+
+        return EventSequencer(buffer_ms=buffer_ms, max_pending=max_pending)
+
+    # EventSequencer: 이벤트 순서 보장 (Factory - 상태 있음)
+    event_sequencer = providers.Factory(_create_event_sequencer)
+
     @staticmethod
     def _create_tick_broadcaster(
         massive_ws: Any,
         ws_manager: Any,
         tick_dispatcher: Any,
+        sequencer_factory: Any = None,
+        sequence_buffer_ms: Optional[int] = None,
+        sequence_max_pending: Optional[int] = None,
     ):
         """
         TickBroadcaster 생성 팩토리
@@ -231,14 +266,23 @@ class Container(containers.DeclarativeContainer):
         📌 [02-002] 서버 lifespan에서 1회 호출하여 생성
         📌 Callable Provider: 호출 시마다 새 인스턴스 (서버당 1개)
         📌 loop는 생성 시 None, set_event_loop()로 나중에 설정
+        📌 [user-038] config.sequencer.buffer_ms > 0 이면 event_sequencer로 event_time 순서 보장
         """
         from backend.core.tick_broadcaster import TickBroadcaster
 
+        sequencer = None
+        if sequencer_factory is not None and (sequence_buffer_ms or 0) > 0:
+            sequencer = sequencer_factory(
+                buffer_ms=sequence_buffer_ms,
+                max_pending=sequence_max_pending or None,
+            )
+
         return TickBroadcaster(
             massive_ws=massive_ws,
             ws_manager=ws_manager,
             loop=None,  # 서버 시작 후 set_event_loop() 호출
             tick_dispatcher=tick_dispatcher,
+            sequencer=sequencer,
         )
 
     tick_broadcaster = providers.Callable(
@@ -246,6 +290,9 @@ class Container(containers.DeclarativeContainer):
         massive_ws=massive_ws,
         ws_manager=ws_manager,
         tick_dispatcher=tick_dispatcher,
+        sequencer_factory=event_sequencer.provider,
+        sequence_buffer_ms=config.sequencer.buffer_ms,
+        sequence_max_pending=config.sequencer.max_pending,
     )
 
     # ───────────────────────────────────────────────────────────────────────
@@ -266,6 +313,28 @@ class Container(containers.DeclarativeContainer):
 
     parquet_manager = providers.Singleton(_create_parquet_manager)
 
+    # ───────────────────────────────────────────────────────────────────────
+    # [user-046] ZScoreStatsStore: 장 전 Z-Score 통계 테이블 (Singleton)
+    # ───────────────────────────────────────────────────────────────────────
+    @staticmethod
+    def _create_zscore_stats(parquet_manager: Any):
+        """
+        ZScoreStatsStore 생성 팩토리
+
+        📌 원본 일봉 = ParquetManager.daily_path, 테이블은 같은 base_dir 아래 zscore/
+        """
+        from backend.data.zscore_stats import ZScoreStatsStore
+
+        return ZScoreStatsStore(
+            path=parquet_manager.base_dir / "zscore" / "daily_stats.parquet",
+            source=parquet_manager.daily_path,
+        )
+
+    zscore_stats = providers.Singleton(
+        _create_zscore_stats,
+        parquet_manager=parquet_manager,
+    )
+
     # ───────────────────────────────────────────────────────────────────────
     # [11-002] DataRepository: 통합 데이터 접근 레이어 (Singleton)
     # ───────────────────────────────────────────────────────────────────────
@@ -417,6 +486,63 @@ class Container(containers.DeclarativeContainer):
 
     trading_context = providers.Singleton(_create_trading_context)
 
+    # ───────────────────────────────────────────────────────────────────────
+    # [user-048] ScoringPool: Daily Scan 워커 풀 (Singleton, 지연 시작)
+    # ───────────────────────────────────────────────────────────────────────
+    @staticmethod
+    def _create_scoring_pool(workers: Optional[int] = None, chunksize: Optional[int] = None):
+        """
+        ScoringPool 생성 팩토리
+
+        📌 워커는 첫 스캔 때 시작되어 서버 종료까지 유지
+        📌 종료: backend/startup/shutdown.py
+        """
+        from backend.core.scanner import _init_scoring_worker
+        from backend.core.scoring_pool import ScoringPool
+
+        return ScoringPool(
+            max_workers=workers,
+            chunksize=chunksize,
+            initializer=_init_scoring_worker,
+        )
+
+    scoring_pool = providers.Singleton(
+        _create_scoring_pool,
+        workers=config.scanner.workers,
+        chunksize=config.scanner.chunksize,
+    )
+
+    # ───────────────────────────────────────────────────────────────────────
+    # [user-049] GainerModel: R-4 XGBoost Daygainer 분류기 서빙 (Singleton)
+    # ───────────────────────────────────────────────────────────────────────
+    @staticmethod
+    def _create_gainer_model(
+        model_path: Optional[str] = None,
+        latency_budget_ms: Optional[float] = None,
+    ):
+        """
+        GainerModel 생성 팩토리
+
+        📌 부스터는 첫 사용 시 1회 로드 (xgboost/모델 파일 없으면 비활성)
+        📌 Scanner(배치)와 RealtimeScanner(단건)가 확률 캐시를 공유
+        """
+        from backend.core.gainer_model import (
+            DEFAULT_LATENCY_BUDGET_MS,
+            DEFAULT_MODEL_PATH,
+            GainerModel,
+        )
+
+        return GainerModel(
+            model_path=model_path or DEFAULT_MODEL_PATH,
+            latency_budget_ms=latency_budget_ms or DEFAULT_LATENCY_BUDGET_MS,
+        )
+
+    gainer_model = providers.Singleton(
+        _create_gainer_model,
+        model_path=config.scanner.model_path,
+        latency_budget_ms=config.scanner.model_latency_ms,
+    )
+
     @staticmethod
     def _create_realtime_scanner(
         massive_client: Any,
@@ -424,6 +550,7 @@ class Container(containers.DeclarativeContainer):
         data_repository: Any,  # [11-002] DataRepository 주입
         scoring_strategy: Any,
         poll_interval: float = 1.0,
+        gainer_model: Any = None,
     ):
         """
         RealtimeScanner 생성 팩토리
@@ -440,6 +567,7 @@ class Container(containers.DeclarativeContainer):
             ignition_monitor=None,  # 순환 참조 방지: 나중에 설정
             poll_interval=poll_interval,
             scoring_strategy=scoring_strategy,
+            gainer_model=gainer_model,
         )
 
     # RealtimeScanner: 실시간 스캐너 (Singleton)
@@ -449,17 +577,22 @@ class Container(containers.DeclarativeContainer):
         ws_manager=ws_manager,
         data_repository=data_repository,  # [11-002] DataRepository 주입
         scoring_strategy=scoring_strategy,
+        gainer_model=gainer_model,  # [user-049]
     )
 
     @staticmethod
     def _create_ignition_monitor(
-        strategy: Any, ws_manager: Any, poll_interval: float = 1.0
+        strategy: Any,
+        ws_manager: Any,
+        poll_interval: float = 1.0,
+        state_engine: Any = None,
     ):
         """
         IgnitionMonitor 생성 팩토리
 
         📌 SeismographStrategy와 WebSocket Manager 주입
         📌 Singleton 패턴 제거
+        📌 [user-031] 틱 스트림 상태가 있으면 REST 조회 대신 사용
         """
         from backend.core.ignition_monitor import IgnitionMonitor
 
@@ -467,6 +600,7 @@ class Container(containers.DeclarativeContainer):
             strategy=strategy,
             ws_manager=ws_manager,
             poll_interval=poll_interval,
+            state_engine=state_engine,
         )
 
     # IgnitionMonitor: Ignition Score 모니터 (Singleton)
@@ -475,6 +609,7 @@ class Container(containers.DeclarativeContainer):
         strategy=scoring_strategy,
         ws_manager=ws_manager,
         poll_interval=config.ignition.poll_interval.as_float(),
+        state_engine=intraday_state,
     )
 
     # ═══════════════════════════════════════════════════════════════════════
@@ -487,6 +622,7 @@ class Container(containers.DeclarativeContainer):
         AuditLogger 생성 팩토리
 
         📌 의사결정 감사 로그 기록
+        📌 [user-036] 비동기 writer 스레드 + gzip 세그먼트 (durability="batch")
         """
         from backend.core.audit_logger import AuditLogger
 
@@ -496,32 +632,28 @@ class Container(containers.DeclarativeContainer):
     audit_logger = providers.Singleton(_create_audit_logger)
 
     @staticmethod
-    def _create_event_deduplicator(window_seconds: int = 60):
+    def _create_event_deduplicator(
+        window_seconds: Optional[int] = None, max_entries: Optional[int] = None
+    ):
         """
         EventDeduplicator 생성 팩토리
 
         📌 이벤트 중복 제거
+        📌 [user-037] max_entries (config.dedup) 초과분은 Bloom 계층으로 이동 (0/None = 무제한)
         """
         from backend.core.deduplicator import EventDeduplicator
 
-        return EventDeduplicator(window_seconds=window_seconds)
+        return EventDeduplicator(
+            window_seconds=window_seconds or 60,
+            max_entries=max_entries or None,
+        )
 
     # EventDeduplicator: 이벤트 중복 제거 (Factory - 상태 있음)
-    event_deduplicator = providers.Factory(_create_event_deduplicator)
-
-    @staticmethod
-    def _create_event_sequencer(buffer_ms: int = 100):
-        """
-        EventSequencer 생성 팩토리
-
-        📌 이벤트 순서 보장
-        """
-        from backend.core.event_sequencer import EventSequencer
-
-        return EventSequencer(buffer_ms=buffer_ms)
-
-    # EventSequencer: 이벤트 순서 보장 (Factory - 상태 있음)
-    event_sequencer = providers.Factory(_create_event_sequencer)
+    event_deduplicator = providers.Factory(
+        _create_event_deduplicator,
+        window_seconds=config.dedup.window_seconds,
+        max_entries=config.dedup.max_entries,
+    )
 
     # ═══════════════════════════════════════════════════════════════════════════
     # Broker Layer
@@ -533,19 +665,34 @@ class Container(containers.DeclarativeContainer):
     # ═══════════════════════════════════════════════════════════════════════════
 
     @staticmethod
-    def _create_ibkr_connector():
+    def _create_ibkr_connector(tick_dispatcher: Any = None):
         """
         IBKRConnector 생성 팩토리
 
         📌 IB Gateway/TWS 연결 관리
         📌 QThread 기반이지만 Container에서 생명주기 관리
+        📌 [user-033] BROKER_MODE=sim 이면 SimulatedBroker (같은 API)
+           → 생성 시 TickDispatcher에 구독 (실시간 틱으로 주문 매칭)
         """
+        import os
+
+        if os.getenv("BROKER_MODE", "").lower() == "sim":
+            from backend.broker.simulated_broker import SimulatedBroker
+
+            broker = SimulatedBroker()
+            if tick_dispatcher is not None:
+                broker.attach(tick_dispatcher)
+            return broker
+
         from backend.broker.ibkr_connector import IBKRConnector
 
         return IBKRConnector()
 
     # IBKRConnector: IBKR 브로커 연결 (Singleton)
-    ibkr_connector = providers.Singleton(_create_ibkr_connector)
+    ibkr_connector = providers.Singleton(
+        _create_ibkr_connector,
+        tick_dispatcher=tick_dispatcher,
+    )
 
     @staticmethod
     def _create_order_manager(connector):
@@ -565,47 +712,57 @@ class Container(containers.DeclarativeContainer):
     )
 
     @staticmethod
-    def _create_risk_manager(connector):
+    def _create_risk_manager(connector, order_manager):
         """
         RiskManager 생성 팩토리
 
         📌 Kelly Criterion 포지션 사이징
         📌 Kill Switch 기능
+        📌 [user-035] 증분 리스크 장부 스냅샷 (재시작 시 일/주 손익, Kill 상태 복원)
+        📌 [user-035] 브로커 포지션은 OrderManager가 중계 (커넥터 callback 슬롯 1개)
         """
         from backend.core.risk_manager import RiskManager
 
-        return RiskManager(connector=connector)
+        manager = RiskManager(connector=connector, snapshot_path="data/risk_ledger.json")
+        order_manager.add_positions_listener(manager.on_positions_update)
+        return manager
 
     # RiskManager: 리스크 관리 (Singleton)
     risk_manager = providers.Singleton(
         _create_risk_manager,
         connector=ibkr_connector,
+        order_manager=order_manager,
     )
 
     @staticmethod
-    def _create_trailing_stop_manager(connector):
+    def _create_trailing_stop_manager(connector, state_engine=None):
         """
         TrailingStopManager 생성 팩토리
 
         📌 IBKR 네이티브 Trailing Stop 주문 관리
+        📌 [user-031] ATR 미지정 시 IntradayStateEngine의 1분봉 ATR 사용
         """
         from backend.core.trailing_stop import TrailingStopManager
 
-        return TrailingStopManager(connector=connector)
+        return TrailingStopManager(connector=connector, state_engine=state_engine)
 
     # TrailingStopManager: Trailing Stop 관리 (Singleton)
     trailing_stop_manager = providers.Singleton(
         _create_trailing_stop_manager,
         connector=ibkr_connector,
+        state_engine=intraday_state,
     )
 
     @staticmethod
-    def _create_double_tap_manager(connector, order_manager, trailing_manager):
+    def _create_double_tap_manager(
+        connector, order_manager, trailing_manager, state_engine=None
+    ):
         """
         DoubleTapManager 생성 팩토리
 
         📌 1차 청산 후 재진입 로직
         📌 Cooldown + HOD 돌파 조건 모니터링
+        📌 [user-031] VWAP/HOD는 IntradayStateEngine 스냅샷에서 읽음
         """
         from backend.core.double_tap import DoubleTapManager
 
@@ -613,6 +770,7 @@ class Container(containers.DeclarativeContainer):
             connector=connector,
             order_manager=order_manager,
             trailing_manager=trailing_manager,
+            state_engine=state_engine,
         )
 
     # DoubleTapManager: 재진입 관리 (Singleton)
@@ -621,6 +779,7 @@ class Container(containers.DeclarativeContainer):
         connector=ibkr_connector,
         order_manager=order_manager,
         trailing_manager=trailing_stop_manager,
+        state_engine=intraday_state,
     )
 
 
@@ -4,16 +4,20 @@
 # 📌 이 파일의 역할:
 #   - 트레이딩 의사결정의 완전한 재현성(Reproducibility) 보장
 #   - 입력 데이터 스냅샷, 신호, 결정, 파라미터 버전 기록
-#   - 일별 JSONL 파일로 저장
+#   - 일별 디렉토리 아래 크기/시간 단위 세그먼트(JSONL, 선택적 gzip)로 저장
+#   - [user-036] 비동기 배치 기록 + 블록 인덱스 기반 재생(AuditReader)
 #
 # 📖 사용 예시:
-#   >>> from backend.core.audit_logger import AuditLogger
+#   >>> from backend.core.audit_logger import AuditLogger, AuditReader
 #   >>> logger = AuditLogger()
 #   >>> logger.log_decision(
 #   ...     ticker="AAPL",
 #   ...     decision="BUY",
 #   ...     context={"ignition_score": 85, "price": 150.25}
 #   ... )
+#   >>> logger.flush()
+#   >>> for record in AuditReader("data/audit").replay("AAPL", start, end):
+#   ...     print(record["decision"])
 #
 # 📖 리팩터링 [08-001] Phase 5:
 #   - 신규 파일 생성
@@ -23,16 +27,44 @@
 Audit Logger
 
 트레이딩 의사결정을 JSONL 형식으로 기록하여 완전한 재현성을 보장합니다.
+
+저장 구조 ([user-036]):
+    data/audit/2026-01-08/decisions.0001.jsonl.gz   ← 세그먼트 (블록 = gzip member)
+    data/audit/2026-01-08/decisions.0001.idx        ← 블록 인덱스 (JSONL)
+
+    일별 디렉토리 = 레코드의 event_time 날짜 (로컬 시간, 백테스트도 이벤트 날짜로 분리)
+    → AuditReader는 기간 밖 날짜 디렉토리의 인덱스를 열지 않습니다.
+
+    인덱스 한 줄 = 블록 하나:
+        {"off": 바이트 오프셋, "len": 길이, "n": 레코드 수,
+         "t0": 최소 event_time(epoch), "t1": 최대, "tickers": [...]}
+
+    기존 단일 파일(decisions.jsonl)도 AuditReader가 그대로 읽습니다.
 """
 
+import atexit
+import gzip
 import json
-from datetime import datetime
+import os
+import queue
+import threading
+import time
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 from loguru import logger
 
 
+# 기록 보장 수준
+#   - "batch": 배치마다 flush (OS 버퍼까지, 기본)
+#   - "fsync": 배치마다 flush + fsync (전원 장애 대비)
+#   - "sync":  writer 스레드 없이 호출 스레드에서 즉시 기록 (백테스트/테스트용)
+DURABILITY_MODES = ("batch", "fsync", "sync")
+
+_STOP = object()
+
+
 class AuditLogger:
     """
     의사결정 감사 로거
@@ -44,6 +76,10 @@ class AuditLogger:
     마치 비행기의 "블랙박스"처럼, 나중에 문제가 생기면
     어떤 정보로 어떤 결정을 내렸는지 완벽하게 재현할 수 있습니다.
 
+    [user-036] 기록은 "우체통"(큐)에 넣기만 하고 바로 돌아옵니다.
+    뒤에서 집배원(writer 스레드)이 모아서 한 번에 파일에 씁니다.
+    그래서 Ignition이 몰려도 매매 로직이 디스크를 기다리지 않습니다.
+
     기록 내용:
       - 언제: event_time (거래소 시간)
       - 무엇을: ticker + decision (매수/매도/홀드)
@@ -52,6 +88,7 @@ class AuditLogger:
 
     Attributes:
         log_dir: 로그 저장 디렉토리 (기본: data/audit)
+        durability: 기록 보장 수준 ("batch" | "fsync" | "sync")
 
     Example:
         >>> logger = AuditLogger()
@@ -70,6 +107,11 @@ class AuditLogger:
         self,
         log_dir: str = "data/audit",
         strategy_version: str = "2.0.0",
+        durability: str = "batch",
+        compress: bool = True,
+        max_batch: int = 1000,
+        segment_max_bytes: int = 64 * 1024 * 1024,
+        segment_max_seconds: float = 3600.0,
     ):
         """
         AuditLogger 초기화
@@ -77,49 +119,55 @@ class AuditLogger:
         Args:
             log_dir: 로그 저장 디렉토리
             strategy_version: 전략 버전 (로그에 기록)
+            durability: 기록 보장 수준 (DURABILITY_MODES 참고)
+            compress: 블록 gzip 압축 여부
+            max_batch: 한 블록에 묶을 최대 레코드 수
+            segment_max_bytes: 세그먼트 최대 크기 (넘으면 새 세그먼트)
+            segment_max_seconds: 세그먼트 최대 유지 시간
         """
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"durability must be one of {DURABILITY_MODES}: {durability}")
+
         self.log_dir = Path(log_dir)
         self.strategy_version = strategy_version
+        self.durability = durability
+        self.compress = compress
+        self.max_batch = max_batch
+        self.segment_max_bytes = segment_max_bytes
+        self.segment_max_seconds = segment_max_seconds
+
+        # 현재 세그먼트 (writer 스레드 전용)
         self._current_date: Optional[str] = None
+        self._day_start: float = 0.0
+        self._day_end: float = 0.0
         self._file_handle = None
+        self._index_handle = None
+        self._segment_opened: float = 0.0
+        self._write_lock = threading.Lock()
+
+        # 통계
+        self._written = 0
+        self._blocks = 0
+        self._errors = 0
 
         # 디렉토리 생성
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
-        logger.info(f"📝 AuditLogger initialized: {self.log_dir}")
-
-    def _get_log_file_path(self, date_str: str) -> Path:
-        """
-        일별 로그 파일 경로 반환
-
-        Args:
-            date_str: YYYY-MM-DD 형식 날짜
+        # 큐 + writer 스레드 (sync 모드는 호출 스레드에서 직접 기록)
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        if durability != "sync":
+            self._thread = threading.Thread(
+                target=self._writer_loop, daemon=True, name="audit-writer"
+            )
+            self._thread.start()
+            atexit.register(self.close)
 
-        Returns:
-            Path: 로그 파일 경로 (예: data/audit/2026-01-08/decisions.jsonl)
-        """
-        date_dir = self.log_dir / date_str
-        date_dir.mkdir(parents=True, exist_ok=True)
-        return date_dir / "decisions.jsonl"
+        logger.info(f"📝 AuditLogger initialized: {self.log_dir} ({durability})")
 
-    def _ensure_file_handle(self) -> None:
-        """
-        현재 날짜의 로그 파일 핸들 확보
-
-        날짜가 바뀌면 새 파일을 생성합니다.
-        """
-        today = datetime.now().strftime("%Y-%m-%d")
-
-        if self._current_date != today:
-            # 기존 파일 닫기
-            if self._file_handle:
-                self._file_handle.close()
-
-            # 새 파일 열기
-            log_path = self._get_log_file_path(today)
-            self._file_handle = open(log_path, "a", encoding="utf-8")
-            self._current_date = today
-            logger.debug(f"📝 Opened audit log: {log_path}")
+    # ═══════════════════════════════════════════════════════════════════════
+    # 기록 (호출 스레드)
+    # ═══════════════════════════════════════════════════════════════════════
 
     def log_decision(
         self,
@@ -139,6 +187,10 @@ class AuditLogger:
         "이 종목에 대해 이런 결정을 내렸어요" 라고 기록합니다.
         나중에 왜 그랬는지 정확히 알 수 있도록 모든 정보를 저장해요.
 
+        context는 호출 시점에 얕은 복사/변환되므로, 호출 후 원본 dict를
+        수정해도 기록에는 영향이 없습니다. JSON 직렬화와 파일 쓰기는
+        writer 스레드가 합니다.
+
         Args:
             ticker: 종목 코드 (예: "AAPL")
             decision: 결정 유형 ("BUY", "SELL", "HOLD", "FILTER_REJECTED")
@@ -155,32 +207,20 @@ class AuditLogger:
             ...     signals={"volume_burst": 0.95}
             ... )
         """
-        self._ensure_file_handle()
-
-        now = datetime.now()
-
-        record = {
-            # 시간 정보
-            "event_time": (event_time or now).isoformat(),
-            "log_time": now.isoformat(),
-            # 의사결정 정보
-            "ticker": ticker,
-            "decision": decision,
-            "context": self._serialize_context(context),
-            # 시그널 정보
-            "signals": signals or {},
-            # 버전 정보
-            "strategy_version": self.strategy_version,
-            "config_snapshot": config_snapshot,
-        }
-
-        # JSONL 형식으로 기록
-        try:
-            line = json.dumps(record, ensure_ascii=False, default=str)
-            self._file_handle.write(line + "\n")
-            self._file_handle.flush()  # 즉시 디스크에 쓰기
-        except Exception as e:
-            logger.error(f"❌ Audit log write failed: {e}")
+        item = (
+            time.time(),
+            event_time,
+            ticker,
+            decision,
+            self._serialize_context(context),
+            dict(signals) if signals else {},
+            config_snapshot,
+        )
+        if self._thread is None:
+            with self._write_lock:
+                self._write_batch([item])
+        else:
+            self._queue.put(item)
 
     def _serialize_context(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -233,12 +273,196 @@ class AuditLogger:
             event_time=event_time,
         )
 
-    def close(self) -> None:
-        """로그 파일 종료"""
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        지금까지 큐에 넣은 기록이 파일에 쓰일 때까지 대기
+
+        Returns:
+            bool: 제한 시간 안에 완료되었는지
+        """
+        if self._thread is None or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """기록 통계 (대기 중 레코드 수, 기록 수, 블록 수, 오류 수)"""
+        return {
+            "pending": self._queue.qsize(),
+            "written": self._written,
+            "blocks": self._blocks,
+            "errors": self._errors,
+            "durability": self.durability,
+        }
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # Writer 스레드
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def _writer_loop(self) -> None:
+        """
+        전담 쓰기 루프
+
+        첫 레코드를 기다린 뒤 큐에 쌓인 만큼(최대 max_batch) 한 번에 꺼내
+        블록 하나로 기록합니다. 한가할 때는 1건씩, 몰릴 때는 큰 블록으로
+        자연스럽게 배치됩니다.
+        """
+        while True:
+            item = self._queue.get()
+            batch: List[tuple] = []
+            markers: List[threading.Event] = []
+            stop = False
+
+            while True:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    markers.append(item)
+                else:
+                    batch.append(item)
+                if stop or len(batch) >= self.max_batch:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch:
+                with self._write_lock:
+                    self._write_batch(batch)
+            for marker in markers:
+                marker.set()
+            if stop:
+                return
+
+    def _write_batch(self, batch: List[tuple]) -> None:
+        """배치를 event_time 날짜별로 나눠 블록 단위로 기록"""
+        start = 0
+        for i, item in enumerate(batch):
+            ts = _event_ts(item)
+            if not (self._day_start <= ts < self._day_end):
+                if i > start:
+                    self._write_block(batch[start:i])
+                    start = i
+                self._roll_day(ts)
+        self._write_block(batch[start:])
+
+    def _roll_day(self, ts: float) -> None:
+        """날짜가 바뀌면 해당 일별 디렉토리로 (strftime은 날짜 전환 시 한 번)"""
+        day = datetime.fromtimestamp(ts).date()
+        self._current_date = day.strftime("%Y-%m-%d")
+        self._day_start = datetime.combine(day, datetime.min.time()).timestamp()
+        self._day_end = datetime.combine(day + timedelta(days=1), datetime.min.time()).timestamp()
+        self._close_segment()
+
+    def _write_block(self, batch: List[tuple]) -> None:
+        """레코드 묶음 → 블록 1개 + 인덱스 1줄"""
+        if not batch:
+            return
+        try:
+            lines = []
+            tickers = set()
+            t0 = t1 = None
+            for log_ts, event_time, ticker, decision, context, signals, config in batch:
+                log_dt = datetime.fromtimestamp(log_ts)
+                event_dt = event_time or log_dt
+                record = {
+                    # 시간 정보
+                    "event_time": event_dt.isoformat(),
+                    "log_time": log_dt.isoformat(),
+                    # 의사결정 정보
+                    "ticker": ticker,
+                    "decision": decision,
+                    "context": context,
+                    # 시그널 정보
+                    "signals": signals,
+                    # 버전 정보
+                    "strategy_version": self.strategy_version,
+                    "config_snapshot": config,
+                }
+                lines.append(json.dumps(record, ensure_ascii=False, default=str))
+                tickers.add(ticker)
+                ts = _epoch(event_dt)
+                t0 = ts if t0 is None else min(t0, ts)
+                t1 = ts if t1 is None else max(t1, ts)
+
+            payload = ("\n".join(lines) + "\n").encode("utf-8")
+            if self.compress:
+                payload = gzip.compress(payload, compresslevel=6)
+
+            self._ensure_segment()
+            offset = self._file_handle.tell()
+            self._file_handle.write(payload)
+            self._index_handle.write(
+                json.dumps(
+                    {
+                        "off": offset,
+                        "len": len(payload),
+                        "n": len(batch),
+                        "t0": t0,
+                        "t1": t1,
+                        "tickers": sorted(tickers),
+                    }
+                )
+                + "\n"
+            )
+            self._file_handle.flush()
+            self._index_handle.flush()
+            if self.durability == "fsync":
+                os.fsync(self._file_handle.fileno())
+                os.fsync(self._index_handle.fileno())
+
+            self._written += len(batch)
+            self._blocks += 1
+        except Exception as e:
+            self._errors += 1
+            logger.error(f"❌ Audit log write failed: {e}")
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # 세그먼트
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def _ensure_segment(self) -> None:
+        """현재 세그먼트 확보 (크기/시간 한도 초과 시 새 세그먼트)"""
+        if self._file_handle is not None:
+            if (
+                self._file_handle.tell() < self.segment_max_bytes
+                and time.monotonic() - self._segment_opened < self.segment_max_seconds
+            ):
+                return
+            self._close_segment()
+
+        date_dir = self.log_dir / self._current_date
+        date_dir.mkdir(parents=True, exist_ok=True)
+        seq = _next_segment_seq(date_dir)
+        suffix = ".jsonl.gz" if self.compress else ".jsonl"
+        data_path = date_dir / f"decisions.{seq:04d}{suffix}"
+
+        self._file_handle = open(data_path, "ab")
+        self._index_handle = open(date_dir / f"decisions.{seq:04d}.idx", "a", encoding="utf-8")
+        self._segment_opened = time.monotonic()
+        logger.debug(f"📝 Opened audit segment: {data_path}")
+
+    def _close_segment(self) -> None:
         if self._file_handle:
             self._file_handle.close()
+            self._index_handle.close()
             self._file_handle = None
-            logger.info("📝 AuditLogger closed")
+            self._index_handle = None
+
+    def close(self) -> None:
+        """남은 기록을 모두 쓰고 로그 파일 종료"""
+        if self._thread is not None:
+            if self._thread.is_alive():
+                self._queue.put(_STOP)
+                self._thread.join(timeout=5.0)
+            self._thread = None
+            atexit.unregister(self.close)
+        with self._write_lock:
+            if self._file_handle:
+                self._close_segment()
+                logger.info("📝 AuditLogger closed")
 
     def __enter__(self):
         """Context manager 진입"""
@@ -250,4 +474,162 @@ class AuditLogger:
         return False
 
 
-__all__ = ["AuditLogger"]
+# ═══════════════════════════════════════════════════════════════════════════
+# [user-036] 인덱스 기반 재생
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class AuditReader:
+    """
+    감사 로그 재생기
+
+    ELI5: 책 뒤의 "찾아보기"처럼 블록 인덱스에서 종목/시간이 맞는 블록만
+          골라 그 위치로 바로 가서 읽습니다. 하루치를 처음부터 다 읽지 않아요.
+
+    Example:
+        >>> reader = AuditReader("data/audit")
+        >>> records = list(reader.replay("AAPL", start=datetime(2026, 1, 8, 9, 30)))
+    """
+
+    def __init__(self, log_dir: Union[str, Path] = "data/audit"):
+        self.log_dir = Path(log_dir)
+
+    def replay(
+        self,
+        ticker: Optional[str] = None,
+        start: Optional[Union[datetime, float]] = None,
+        end: Optional[Union[datetime, float]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        조건에 맞는 의사결정 레코드를 기록 순서대로 반환
+
+        Args:
+            ticker: 종목 코드 (None이면 전체)
+            start: 시작 event_time (포함, datetime 또는 epoch)
+            end: 종료 event_time (포함)
+
+        Yields:
+            dict: log_decision()이 기록한 레코드
+        """
+        t_start = _epoch(start) if start is not None else None
+        t_end = _epoch(end) if end is not None else None
+
+        # 디렉토리는 event_time 날짜 기준 → 기간 밖 날짜는 인덱스도 열지 않음
+        # (블록 단위는 인덱스의 t0/t1로 한 번 더 거름)
+        for day_dir in self._day_dirs(start, end):
+            legacy = day_dir / "decisions.jsonl"
+            if legacy.exists():
+                yield from self._scan_legacy(legacy, ticker, t_start, t_end)
+
+            for index_path in sorted(day_dir.glob("decisions.*.idx")):
+                data_path = _data_path_for(index_path)
+                if data_path is None:
+                    continue
+                yield from self._scan_segment(
+                    index_path, data_path, ticker, t_start, t_end
+                )
+
+    def _day_dirs(self, start, end) -> List[Path]:
+        """기간과 겹치는 일별 디렉토리 (자정 전후 기록을 고려해 ±1일)"""
+        if not self.log_dir.exists():
+            return []
+        lo = _as_date(start) - timedelta(days=1) if start is not None else None
+        hi = _as_date(end) + timedelta(days=1) if end is not None else None
+        result = []
+        for path in sorted(p for p in self.log_dir.iterdir() if p.is_dir()):
+            try:
+                d = datetime.strptime(path.name, "%Y-%m-%d").date()
+            except ValueError:
+                continue
+            if (lo is None or d >= lo) and (hi is None or d <= hi):
+                result.append(path)
+        return result
+
+    def _scan_segment(self, index_path, data_path, ticker, t_start, t_end):
+        compressed = data_path.suffix == ".gz"
+        with open(index_path, encoding="utf-8") as idx, open(data_path, "rb") as f:
+            for line in idx:
+                try:
+                    block = json.loads(line)
+                except ValueError:
+                    continue  # 기록 중 잘린 마지막 줄
+                if ticker is not None and ticker not in block["tickers"]:
+                    continue
+                if t_start is not None and block["t1"] < t_start:
+                    continue
+                if t_end is not None and block["t0"] > t_end:
+                    continue
+
+                f.seek(block["off"])
+                payload = f.read(block["len"])
+                if compressed:
+                    payload = gzip.decompress(payload)
+                for raw in payload.decode("utf-8").splitlines():
+                    record = json.loads(raw)
+                    if _matches(record, ticker, t_start, t_end):
+                        yield record
+
+    def _scan_legacy(self, path, ticker, t_start, t_end):
+        """[user-036] 이전 형식(decisions.jsonl) 전체 스캔"""
+        with open(path, encoding="utf-8") as f:
+            for raw in f:
+                try:
+                    record = json.loads(raw)
+                except ValueError:
+                    continue
+                if _matches(record, ticker, t_start, t_end):
+                    yield record
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 내부 헬퍼
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _epoch(value: Union[datetime, float, int]) -> float:
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
+
+
+def _event_ts(item: tuple) -> float:
+    """큐 항목 (log_ts, event_time, ...) → event_time epoch (없으면 기록 시각)"""
+    return item[1].timestamp() if item[1] is not None else item[0]
+
+
+def _as_date(value: Union[datetime, float, int]) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    return datetime.fromtimestamp(value).date()
+
+
+def _matches(record: Dict[str, Any], ticker, t_start, t_end) -> bool:
+    if ticker is not None and record.get("ticker") != ticker:
+        return False
+    if t_start is None and t_end is None:
+        return True
+    ts = _epoch(datetime.fromisoformat(record["event_time"]))
+    return (t_start is None or ts >= t_start) and (t_end is None or ts <= t_end)
+
+
+def _next_segment_seq(date_dir: Path) -> int:
+    """같은 날 재시작 시 기존 세그먼트에 이어 쓰지 않고 다음 번호 사용"""
+    seqs = []
+    for path in date_dir.glob("decisions.*.idx"):
+        try:
+            seqs.append(int(path.name.split(".")[1]))
+        except (IndexError, ValueError):
+            continue
+    return max(seqs, default=0) + 1
+
+
+def _data_path_for(index_path: Path) -> Optional[Path]:
+    stem = index_path.name[: -len(".idx")]
+    for suffix in (".jsonl.gz", ".jsonl"):
+        candidate = index_path.with_name(stem + suffix)
+        if candidate.exists():
+            return candidate
+    return None
+
+
+__all__ = ["AuditLogger", "AuditReader", "DURABILITY_MODES"]
@@ -89,6 +89,32 @@ class StrategyConfig:
     hot_reload: bool = True
 
 
+@dataclass
+class ScannerConfig:
+    """[user-048] Daily Scan 스코어링 워커 풀 설정 / [user-049] ML 서빙 설정"""
+
+    workers: int = 0  # 0 = CPU 코어 수
+    chunksize: int = 0  # 0 = 자동 (워커당 약 4청크)
+    model_path: str = "scripts/xgb_scanner.json"  # GainerModel 부스터
+    model_latency_ms: float = 5.0  # 신규 급등주 1건 추론 예산
+
+
+@dataclass
+class DedupConfig:
+    """[user-037] 이벤트 중복 제거 설정"""
+
+    window_seconds: int = 60
+    max_entries: int = 200_000  # 정확 계층 상한 (0 = 무제한), 초과분은 Bloom 계층
+
+
+@dataclass
+class SequencerConfig:
+    """[user-038] 틱 event_time 재정렬 설정"""
+
+    buffer_ms: int = 0  # 0 = 재정렬 없이 즉시 배포 (TICK_SEQUENCE_BUFFER_MS로 오버라이드)
+    max_pending: int = 100_000  # 대기열 상한 (초과 시 가장 이른 틱부터 강제 방출)
+
+
 @dataclass
 class RiskConfig:
     """리스크 관리 설정"""
@@ -112,6 +138,8 @@ class SchedulerConfig:
     market_open_offset_minutes: int = 15
     daily_data_update: bool = True
     data_update_time: str = "16:30"
+    premarket_zscore: bool = True  # [user-046] 장 전 Z-Score 통계 테이블 생성
+    premarket_zscore_time: str = "08:00"
 
 
 @dataclass
@@ -166,6 +194,9 @@ class ServerConfig:
     market_data: MarketDataConfig = field(default_factory=MarketDataConfig)
     massive: MassiveConfig = field(default_factory=MassiveConfig)
     strategy: StrategyConfig = field(default_factory=StrategyConfig)
+    scanner: ScannerConfig = field(default_factory=ScannerConfig)
+    dedup: DedupConfig = field(default_factory=DedupConfig)
+    sequencer: SequencerConfig = field(default_factory=SequencerConfig)
     risk: RiskConfig = field(default_factory=RiskConfig)
     scheduler: SchedulerConfig = field(default_factory=SchedulerConfig)
     logging: LoggingConfig = field(default_factory=LoggingConfig)
@@ -304,6 +335,7 @@ def load_server_config(config_path: Optional[str] = None) -> ServerConfig:
         - SIGMA9_SERVER_PORT
         - SIGMA9_IBKR_HOST
         - SIGMA9_IBKR_PORT
+        - TICK_SEQUENCE_BUFFER_MS (sequencer.buffer_ms)
 
     Args:
         config_path: 설정 파일 경로 (기본: backend/config/server_config.yaml)
@@ -328,6 +360,8 @@ def load_server_config(config_path: Optional[str] = None) -> ServerConfig:
         data.setdefault("ibkr", {})["host"] = os.getenv("SIGMA9_IBKR_HOST")
     if os.getenv("SIGMA9_IBKR_PORT"):
         data.setdefault("ibkr", {})["port"] = int(os.getenv("SIGMA9_IBKR_PORT"))
+    if os.getenv("TICK_SEQUENCE_BUFFER_MS"):
+        data.setdefault("sequencer", {})["buffer_ms"] = int(os.getenv("TICK_SEQUENCE_BUFFER_MS"))
 
     # 데이터클래스로 변환
     config = ServerConfig()
@@ -339,6 +373,9 @@ def load_server_config(config_path: Optional[str] = None) -> ServerConfig:
         "market_data",
         "massive",
         "strategy",
+        "scanner",
+        "dedup",
+        "sequencer",
         "risk",
         "scheduler",
         "logging",
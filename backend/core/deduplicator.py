@@ -4,6 +4,8 @@
 # 📌 이 파일의 역할:
 #   - 실시간 이벤트 스트림에서 중복 이벤트 제거
 #   - event_id 기반 시간 윈도우 중복 검사
+#   - [user-037] 시간 버킷 휠로 만료 처리 (전체 dict 스캔 제거)
+#     + 선택적 메모리 상한 (초과분은 Bloom filter 근사 계층으로)
 #
 # 📖 사용 예시:
 #   >>> from backend.core.deduplicator import EventDeduplicator
@@ -19,14 +21,60 @@
 Event Deduplicator
 
 실시간 이벤트 스트림에서 중복 이벤트를 제거합니다.
+
+[user-037] 만료 구조:
+    시간을 window / wheel_slots 폭의 버킷으로 나누고, 각 버킷에 그 구간에
+    등록된 event_id를 모아둡니다. 시계가 앞으로 가면 윈도우를 벗어난 버킷만
+    통째로 꺼내 정리하므로 등록/조회 O(1), 정리는 만료된 개수만큼만 듭니다.
+
+    max_entries를 주면 정확 계층(dict)이 상한을 넘을 때 가장 오래된 버킷을
+    Bloom filter로 옮깁니다. Bloom 계층은 오탐(중복 아닌데 중복 판정)만 있고
+    미탐은 없습니다 (확률 = bloom_fp_rate).
 """
 
+import math
 import time
-from typing import Dict, Optional
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
 
 from loguru import logger
 
 
+class _BloomFilter:
+    """
+    고정 크기 Bloom filter (double hashing)
+
+    ELI5: 도장 찍는 종이. 이벤트마다 k군데 도장을 찍어두고, 나중에 k군데가
+          전부 찍혀 있으면 "본 적 있는 것 같다"고 답합니다.
+    """
+
+    __slots__ = ("m", "k", "bits", "count")
+
+    def __init__(self, capacity: int, fp_rate: float):
+        capacity = max(1, capacity)
+        self.m = max(64, int(-capacity * math.log(fp_rate) / (math.log(2) ** 2)))
+        self.k = max(1, round(self.m / capacity * math.log(2)))
+        self.bits = bytearray((self.m + 7) // 8)
+        self.count = 0
+
+    def add(self, key: str) -> None:
+        h = hash(key)
+        h1, h2, m, bits = h & 0xFFFFFFFF, (h >> 32) | 1, self.m, self.bits
+        for i in range(self.k):
+            pos = (h1 + i * h2) % m
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        h = hash(key)
+        h1, h2, m, bits = h & 0xFFFFFFFF, (h >> 32) | 1, self.m, self.bits
+        for i in range(self.k):
+            pos = (h1 + i * h2) % m
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+
 class EventDeduplicator:
     """
     이벤트 중복 제거기
@@ -41,8 +89,13 @@ class EventDeduplicator:
 
     시간 윈도우(기본 60초)가 지나면 같은 event_id도 새 이벤트로 처리해요.
 
+    [user-037] 본 이벤트를 "시간대별 서랍"(버킷)에 나눠 넣어 두고,
+    오래된 서랍은 통째로 비웁니다. 전체를 뒤지는 대청소가 없어서
+    초당 수만 건이 들어와도 중간에 멈칫하지 않아요.
+
     Attributes:
         window_seconds: 중복 검사 시간 윈도우 (초)
+        max_entries: 정확 계층 최대 항목 수 (None이면 무제한)
 
     Example:
         >>> dedup = EventDeduplicator(window_seconds=60)
@@ -51,18 +104,52 @@ class EventDeduplicator:
         >>> dedup.is_duplicate("tick_456")  # False (다른 이벤트)
     """
 
-    def __init__(self, window_seconds: int = 60):
+    def __init__(
+        self,
+        window_seconds: int = 60,
+        wheel_slots: int = 64,
+        max_entries: Optional[int] = None,
+        bloom_capacity: Optional[int] = None,
+        bloom_fp_rate: float = 0.001,
+    ):
         """
         EventDeduplicator 초기화
 
         Args:
             window_seconds: 중복 검사 시간 윈도우 (초)
+            wheel_slots: 윈도우를 나눌 버킷 수 (클수록 만료가 정밀, 버킷 오버헤드 증가)
+            max_entries: 정확 계층 최대 항목 수. 초과 시 오래된 버킷을 Bloom 계층으로 이동
+            bloom_capacity: Bloom 세대당 용량 (기본 max_entries × 10).
+                            세대가 가득 차면 윈도우 전이라도 교체 → 오탐률 유지, 대신
+                            가장 오래된 세대의 중복은 놓칠 수 있음 (bloom_overflows)
+            bloom_fp_rate: Bloom 계층 오탐률
         """
         self.window_seconds = window_seconds
-        # event_id -> last_seen_timestamp
+        self.max_entries = max_entries
+        self.bloom_capacity = bloom_capacity or (max_entries or 0) * 10
+        self.bloom_fp_rate = bloom_fp_rate
+
+        # event_id -> last_seen_timestamp (정확 계층)
         self._seen: Dict[str, float] = {}
-        self._last_cleanup: float = time.time()
-        self._cleanup_interval: float = window_seconds * 2  # 2배 윈도우마다 정리
+
+        # 시간 버킷 휠: [bucket_end, [event_id, ...]] (오래된 것 → 최신)
+        self._bucket_width: float = max(window_seconds / wheel_slots, 1e-3)
+        self._buckets: Deque[List[Any]] = deque()
+        self._current_ids: List[str] = []
+        self._current_end: float = float("-inf")
+        # 가장 오래된 버킷이 만료되는 시각 (이 시각 전에는 정리할 것이 없음)
+        self._next_expiry: float = float("inf")
+
+        # Bloom 계층 (현재 세대 / 이전 세대)
+        self._bloom: Optional[_BloomFilter] = None
+        self._bloom_prev: Optional[_BloomFilter] = None
+        self._bloom_started: float = 0.0
+
+        # 통계
+        self._expired = 0
+        self._spilled = 0
+        self._approx_hits = 0
+        self._bloom_overflows = 0
 
         logger.debug(f"EventDeduplicator initialized: window={window_seconds}s")
 
@@ -86,40 +173,28 @@ class EventDeduplicator:
         """
         now = event_time or time.time()
 
-        # 주기적 정리
-        if now - self._last_cleanup > self._cleanup_interval:
-            self._cleanup(now)
+        # 만료 버킷 정리 (만료된 것이 없으면 비교 한 번)
+        if now > self._next_expiry:
+            self._expire(now)
+
+        # 중복 검사 (정확 계층)
+        last_seen = self._seen.get(event_id)
+        if last_seen is not None and now - last_seen <= self.window_seconds:
+            return True  # 중복!
 
-        # 중복 검사
-        if event_id in self._seen:
-            last_seen = self._seen[event_id]
-            if now - last_seen <= self.window_seconds:
-                return True  # 중복!
+        # 중복 검사 (근사 계층)
+        if (
+            last_seen is None
+            and (self._bloom is not None or self._bloom_prev is not None)
+            and self._in_bloom(event_id, now)
+        ):
+            self._approx_hits += 1
+            return True
 
         # 신규 이벤트 등록
-        self._seen[event_id] = now
+        self._insert(event_id, now)
         return False
 
-    def _cleanup(self, now: float) -> None:
-        """
-        만료된 이벤트 정리
-
-        메모리 누수 방지를 위해 윈도우가 지난 이벤트 제거
-        """
-        expired = [
-            event_id
-            for event_id, last_seen in self._seen.items()
-            if now - last_seen > self.window_seconds
-        ]
-
-        for event_id in expired:
-            del self._seen[event_id]
-
-        self._last_cleanup = now
-
-        if expired:
-            logger.debug(f"EventDeduplicator cleanup: {len(expired)} events expired")
-
     def mark_seen(self, event_id: str, event_time: Optional[float] = None) -> None:
         """
         이벤트를 "본 것으로" 표시 (중복 검사 없이)
@@ -128,18 +203,140 @@ class EventDeduplicator:
             event_id: 이벤트 고유 ID
             event_time: 이벤트 시간
         """
-        self._seen[event_id] = event_time or time.time()
+        self._insert(event_id, event_time or time.time())
 
     def clear(self) -> None:
         """모든 기록 초기화"""
         self._seen.clear()
-        self._last_cleanup = time.time()
+        self._buckets.clear()
+        self._current_ids = []
+        self._current_end = float("-inf")
+        self._next_expiry = float("inf")
+        self._bloom = None
+        self._bloom_prev = None
+        self._bloom_started = 0.0
 
     @property
     def size(self) -> int:
-        """현재 추적 중인 이벤트 수"""
+        """현재 추적 중인 이벤트 수 (정확 계층)"""
         return len(self._seen)
 
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        상태 통계
+
+        Returns:
+            dict: 정확 계층 크기, 버킷 수, 만료/이동 누계, Bloom 계층 항목 수와 근사 판정 수
+        """
+        bloom_count = sum(b.count for b in (self._bloom, self._bloom_prev) if b is not None)
+        return {
+            "size": len(self._seen),
+            "buckets": len(self._buckets),
+            "expired": self._expired,
+            "spilled": self._spilled,
+            "bloom_entries": bloom_count,
+            "approx_hits": self._approx_hits,
+            "bloom_overflows": self._bloom_overflows,
+        }
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # 버킷 휠
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def _insert(self, event_id: str, now: float) -> None:
+        self._seen[event_id] = now
+
+        if now < self._current_end:
+            # 같은 버킷 (또는 과거 시각 이벤트 → 최신 버킷에 보관, 만료만 늦어짐)
+            self._current_ids.append(event_id)
+        else:
+            width = self._bucket_width
+            self._current_end = (now // width + 1) * width
+            self._current_ids = [event_id]
+            self._buckets.append([self._current_end, self._current_ids])
+            if len(self._buckets) == 1:
+                self._next_expiry = self._current_end + self.window_seconds
+
+        if self.max_entries is not None and len(self._seen) > self.max_entries:
+            self._spill(now)
+
+    def _pop_bucket(self) -> List[Any]:
+        bucket = self._buckets.popleft()
+        if self._buckets:
+            self._next_expiry = self._buckets[0][0] + self.window_seconds
+        else:
+            self._next_expiry = float("inf")
+            self._current_end = float("-inf")
+        return bucket
+
+    def _expire(self, now: float) -> None:
+        """
+        만료 버킷 정리
+
+        버킷을 통째로 꺼내되, 그 사이 다시 등록된 event_id(last_seen이 갱신됨)는 남깁니다.
+        """
+        cutoff = now - self.window_seconds
+        seen = self._seen
+        expired = 0
+
+        while now > self._next_expiry:
+            _, ids = self._pop_bucket()
+            for event_id in ids:
+                last_seen = seen.get(event_id)
+                if last_seen is not None and last_seen < cutoff:
+                    del seen[event_id]
+                    expired += 1
+
+        self._expired += expired
+        if expired:
+            logger.trace(f"EventDeduplicator cleanup: {expired} events expired")
+
+    def _spill(self, now: float) -> None:
+        """메모리 상한 초과 → 가장 오래된 버킷부터 Bloom 계층으로 이동"""
+        self._rotate_bloom(now)
+        if self._bloom is not None and self._bloom.count >= self.bloom_capacity:
+            self._bloom_overflows += 1
+            self._bloom_prev = self._bloom
+            self._bloom = None
+        if self._bloom is None:
+            self._bloom = _BloomFilter(self.bloom_capacity, self.bloom_fp_rate)
+            self._bloom_started = now
+
+        seen = self._seen
+        bloom = self._bloom
+        # 가장 최신 버킷은 남김 (방금 등록한 이벤트는 정확 계층에)
+        while len(seen) > self.max_entries and len(self._buckets) > 1:
+            bucket_end, ids = self._pop_bucket()
+            for event_id in ids:
+                last_seen = seen.get(event_id)
+                if last_seen is not None and last_seen < bucket_end:
+                    del seen[event_id]
+                    bloom.add(event_id)
+                    self._spilled += 1
+
+    def _rotate_bloom(self, now: float) -> None:
+        """
+        Bloom 세대 교체
+
+        세대마다 윈도우 길이만큼 유지: 현재 세대 → 이전 세대 → 폐기.
+        이동된 항목은 최소 윈도우 동안 조회되므로 미탐이 없습니다.
+        """
+        elapsed = now - self._bloom_started
+        if elapsed > self.window_seconds:
+            # 현재 세대의 이동은 모두 [started, started + window] 안에서 일어남
+            # → 2윈도우가 지났으면 이전 세대로 둘 필요도 없음
+            self._bloom_prev = self._bloom if elapsed <= 2 * self.window_seconds else None
+            self._bloom = None
+            self._bloom_started = now
+
+    def _in_bloom(self, event_id: str, now: float) -> bool:
+        self._rotate_bloom(now)
+        if self._bloom is None and self._bloom_prev is None:
+            return False
+        return (self._bloom is not None and event_id in self._bloom) or (
+            self._bloom_prev is not None and event_id in self._bloom_prev
+        )
+
     @staticmethod
     def make_event_id(ticker: str, event_type: str, timestamp_ms: int) -> str:
         """
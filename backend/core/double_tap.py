@@ -26,6 +26,8 @@ from enum import Enum, auto
 
 from loguru import logger
 
+from backend.core.trailing_stop import ATR_PROXY_PCT
+
 
 class DoubleTapState(Enum):
     """Double Tap 상태"""
@@ -121,6 +123,7 @@ class DoubleTapManager:
         connector=None,
         order_manager=None,
         trailing_manager=None,
+        state_engine=None,
     ):
         """
         초기화
@@ -129,10 +132,12 @@ class DoubleTapManager:
             connector: IBKRConnector
             order_manager: OrderManager
             trailing_manager: TrailingStopManager
+            state_engine: IntradayStateEngine (있으면 VWAP/HOD/ATR을 직접 읽음)
         """
         self.connector = connector
         self.order_manager = order_manager
         self.trailing_manager = trailing_manager
+        self.state_engine = state_engine
 
         # Double Tap 추적
         self._entries: Dict[str, DoubleTapEntry] = {}
@@ -195,6 +200,9 @@ class DoubleTapManager:
         """
         시장 데이터 업데이트
 
+        state_engine이 있으면 check_reentry()가 스냅샷에서 직접 읽으므로
+        호출하지 않아도 됩니다 (외부 데이터로 덮어쓸 때만 사용).
+
         Args:
             symbol: 종목 심볼
             current_price: 현재 가격
@@ -213,6 +221,15 @@ class DoubleTapManager:
             entry.state = DoubleTapState.WATCHING
             logger.info(f"🎯 Cooldown 완료: {symbol} → 조건 감시 시작")
 
+    def _sync_from_state(self, entry: DoubleTapEntry) -> None:
+        """IntradayStateEngine 스냅샷으로 VWAP/HOD 갱신 (엔진 없으면 무시)"""
+        if not self.state_engine:
+            return
+        snap = self.state_engine.snapshot(entry.symbol)
+        if snap is None:
+            return
+        self.update_market_data(entry.symbol, snap.last, vwap=snap.vwap, hod=snap.hod)
+
     # ═══════════════════════════════════════════════════════════════════
     # 재진입 조건 체크
     # ═══════════════════════════════════════════════════════════════════
@@ -242,6 +259,9 @@ class DoubleTapManager:
 
         entry = self._entries[symbol]
 
+        # [user-031] 장중 상태 엔진의 VWAP/HOD 반영 (Cooldown → WATCHING 전환 포함)
+        self._sync_from_state(entry)
+
         # 상태 체크
         if entry.state != DoubleTapState.WATCHING:
             return False
@@ -317,14 +337,15 @@ class DoubleTapManager:
                 entry.second_entry_price = entry_price
                 entry.state = DoubleTapState.ENTERED
 
-                # Trailing Stop 설정 (1.0%)
+                # Trailing Stop 설정 (장중 ATR, 봉 수 부족/없으면 1.0% 프록시)
                 if self.trailing_manager:
+                    snap = self.state_engine.snapshot(symbol) if self.state_engine else None
+                    atr = snap.atr if snap and snap.atr > 0 else entry_price * ATR_PROXY_PCT
                     self.trailing_manager.create_trailing(
                         symbol=symbol,
                         qty=qty,
                         entry_price=entry_price,
-                        atr=entry_price * 0.01,  # 1% as ATR proxy
-                        activation_pct=0.1,  # 즉시 활성화
+                        atr=atr,
                     )
 
         return order_id
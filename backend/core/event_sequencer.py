@@ -4,6 +4,8 @@
 # 📌 이 파일의 역할:
 #   - 비순차적으로 도착한 이벤트를 event_time 기준으로 재정렬
 #   - 버퍼링 후 정렬된 순서로 방출
+#   - [user-038] 배치 입력(push_batch), 타이머 기반 워터마크 방출(start/poll),
+#     재정렬 깊이 / 지각 / 대기 시간 히스토그램, 대기열 상한(backpressure)
 #
 # 📖 사용 예시:
 #   >>> from backend.core.event_sequencer import EventSequencer
@@ -11,6 +13,10 @@
 #   >>> for ordered_event in sequencer.push(event):
 #   ...     process_event(ordered_event)
 #
+#   # 타이머 모드: 조용한 구간에도 buffer_ms 뒤에 꼬리 이벤트가 나옴
+#   >>> sequencer.start(lambda batch: [process_event(e) for e in batch])
+#   >>> sequencer.push_batch([(tick, tick["time_ms"]) for tick in frame])
+#
 # 📖 리팩터링 [08-001] Phase 4:
 #   - 신규 파일 생성
 # ============================================================================
@@ -19,17 +25,27 @@
 Event Sequencer
 
 비순차적으로 도착한 이벤트를 event_time 기준으로 재정렬합니다.
+
+방출 규칙:
+    수신 후 buffer_ms보다 오래 기다린 이벤트부터 event_time 순으로 방출.
+    같은 ms에 들어온 묶음(한 프레임)은 다음 ms에 함께 정렬되어 나옵니다.
+
+[user-038] 힙에는 (event_time_ms, seq, receive_time_ms, data) 튜플만 두고
+SequencedEvent는 방출 시점에만 만듭니다.
 """
 
+import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Iterator, List, Optional
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
 from heapq import heappush, heappop
 
 from loguru import logger
 
+from backend.broker.latency import LatencyHistogram
 
-@dataclass
+
+@dataclass(slots=True)
 class SequencedEvent:
     """
     순서 보장용 이벤트 래퍼
@@ -38,11 +54,13 @@ class SequencedEvent:
         event_time_ms: 이벤트 발생 시간 (Unix ms)
         receive_time_ms: 수신 시간 (Unix ms)
         data: 원본 이벤트 데이터
+        late: [user-038] 이미 방출된 event_time보다 늦게 도착한 이벤트
     """
 
     event_time_ms: int
     receive_time_ms: int
     data: Any
+    late: bool = False
 
     def __lt__(self, other: "SequencedEvent") -> bool:
         """우선순위 큐 정렬용 (event_time 기준 오름차순)"""
@@ -64,8 +82,12 @@ class EventSequencer:
     실시간 트레이딩에서는 이벤트 순서가 매우 중요해요!
     잘못된 순서로 처리하면 잘못된 결정을 내릴 수 있거든요.
 
+    [user-038] 새 이벤트가 와야만 줄이 움직이던 문제를 막으려고
+    타이머(start)가 주기적으로 "시간 다 된 사람 나오세요"를 외칩니다.
+
     Attributes:
         buffer_ms: 버퍼링 시간 (밀리초). 이 시간 동안 기다렸다가 정렬.
+        max_pending: 대기열 상한. 넘으면 가장 이른 이벤트부터 강제 방출 (None이면 무제한)
 
     Example:
         >>> sequencer = EventSequencer(buffer_ms=100)
@@ -78,18 +100,46 @@ class EventSequencer:
         ...     print(e.event_time_ms)  # 100, 200 순서로 출력!
     """
 
-    def __init__(self, buffer_ms: int = 100):
+    def __init__(self, buffer_ms: int = 100, max_pending: Optional[int] = None):
         """
         EventSequencer 초기화
 
         Args:
             buffer_ms: 버퍼링 시간 (밀리초). 이 시간만큼 기다린 후 방출.
+            max_pending: 대기열 상한 (backpressure). None이면 무제한.
         """
         self.buffer_ms = buffer_ms
-        self._heap: List[SequencedEvent] = []  # 우선순위 큐 (min-heap)
+        self.max_pending = max_pending
+
+        # 우선순위 큐 (min-heap): (event_time_ms, seq, receive_time_ms, data)
+        self._heap: List[Tuple[int, int, int, Any]] = []
+        self._seq = 0
+        self._lock = threading.Lock()
+
+        # 워터마크: 마지막으로 방출한 event_time / 지금까지 본 최대 event_time
+        self._emitted_ms: Optional[int] = None
+        self._max_event_ms: Optional[int] = None
+
+        # 통계
+        self._reorder = LatencyHistogram()  # 순서 역전 거리 (max_event_ms - event_time)
+        self._lateness = LatencyHistogram()  # 지각 (이미 방출된 event_time - event_time)
+        self._hold = LatencyHistogram()  # 버퍼 대기 시간 (방출 - 수신)
+        self._pushed = 0
+        self._emitted = 0
+        self._forced = 0
+        self._max_depth = 0
+
+        # 타이머 모드
+        self._on_emit: Optional[Callable[[List[SequencedEvent]], None]] = None
+        self._timer: Optional[threading.Thread] = None
+        self._stop = threading.Event()
 
         logger.debug(f"EventSequencer initialized: buffer={buffer_ms}ms")
 
+    # ═══════════════════════════════════════════════════════════════════════
+    # 입력
+    # ═══════════════════════════════════════════════════════════════════════
+
     def push(
         self, event_data: Any, event_time_ms: int, receive_time_ms: Optional[int] = None
     ) -> Iterator[SequencedEvent]:
@@ -109,19 +159,103 @@ class EventSequencer:
         Yields:
             SequencedEvent: 버퍼링이 완료된 이벤트 (시간순)
         """
+        return iter(self.push_batch(((event_data, event_time_ms),), receive_time_ms))
+
+    def push_batch(
+        self,
+        events: Iterable[Tuple[Any, int]],
+        receive_time_ms: Optional[int] = None,
+    ) -> List[SequencedEvent]:
+        """
+        [user-038] 이벤트 묶음 추가 (Massive 배열 프레임 1개 = 호출 1번)
+
+        Args:
+            events: (event_data, event_time_ms) 반복자
+            receive_time_ms: 묶음 수신 시간 (Unix ms). None이면 현재 시간.
+
+        Returns:
+            list: 방출된 이벤트 (시간순). 타이머 모드(start)면 on_emit으로 전달하고 빈 리스트.
+        """
         now_ms = receive_time_ms or int(time.time() * 1000)
 
-        # 새 이벤트를 힙에 추가
-        event = SequencedEvent(
-            event_time_ms=event_time_ms, receive_time_ms=now_ms, data=event_data
-        )
-        heappush(self._heap, event)
+        with self._lock:
+            heap = self._heap
+            seq = self._seq
+            max_event = self._max_event_ms
+            emitted = self._emitted_ms
+            count = 0
+            for event_data, event_time_ms in events:
+                if max_event is None or event_time_ms > max_event:
+                    max_event = event_time_ms
+                elif event_time_ms < max_event:
+                    self._reorder.record(max_event - event_time_ms)
+                    if emitted is not None and event_time_ms < emitted:
+                        self._lateness.record(emitted - event_time_ms)
+                seq += 1
+                count += 1
+                heappush(heap, (event_time_ms, seq, now_ms, event_data))
+
+            self._seq = seq
+            self._max_event_ms = max_event
+            self._pushed += count
+            if len(heap) > self._max_depth:
+                self._max_depth = len(heap)
+
+            ready = self._drain(now_ms)
+            if self._on_emit is not None:
+                if ready:
+                    self._on_emit(ready)
+                return []
+            return ready
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # 방출
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def poll(self, now_ms: Optional[int] = None) -> List[SequencedEvent]:
+        """
+        [user-038] 새 입력 없이 대기 시간이 지난 이벤트 방출 (워터마크 진행)
 
-        # 버퍼링 시간이 지난 이벤트 방출
-        deadline = now_ms - self.buffer_ms
+        Args:
+            now_ms: 현재 시간 (Unix ms). None이면 현재 시간.
 
-        while self._heap and self._heap[0].receive_time_ms <= deadline:
-            yield heappop(self._heap)
+        Returns:
+            list: 방출된 이벤트 (시간순). 타이머 모드면 on_emit으로 전달하고 빈 리스트.
+        """
+        now_ms = now_ms or int(time.time() * 1000)
+        with self._lock:
+            ready = self._drain(now_ms)
+            if self._on_emit is not None:
+                if ready:
+                    self._on_emit(ready)
+                return []
+            return ready
+
+    def _drain(self, now_ms: int) -> List[SequencedEvent]:
+        """대기 시간이 지난 이벤트 + 상한 초과분을 꺼냄 (lock 보유 상태에서 호출)"""
+        heap = self._heap
+        if not heap:
+            return []
+
+        deadline = now_ms - self.buffer_ms
+        out: List[SequencedEvent] = []
+        while heap and heap[0][2] < deadline:
+            out.append(self._make(heappop(heap), now_ms))
+
+        if self.max_pending is not None:
+            while len(heap) > self.max_pending:
+                out.append(self._make(heappop(heap), now_ms))
+                self._forced += 1
+        return out
+
+    def _make(self, entry: Tuple[int, int, int, Any], now_ms: int) -> SequencedEvent:
+        event_time_ms, _, receive_ms, data = entry
+        late = self._emitted_ms is not None and event_time_ms < self._emitted_ms
+        if not late:
+            self._emitted_ms = event_time_ms
+        self._emitted += 1
+        self._hold.record(now_ms - receive_ms)
+        return SequencedEvent(event_time_ms, receive_ms, data, late)
 
     def flush(self) -> Iterator[SequencedEvent]:
         """
@@ -132,18 +266,74 @@ class EventSequencer:
         Yields:
             SequencedEvent: 버퍼에 남은 모든 이벤트 (시간순)
         """
-        while self._heap:
-            yield heappop(self._heap)
+        now_ms = int(time.time() * 1000)
+        with self._lock:
+            out = [self._make(heappop(self._heap), now_ms) for _ in range(len(self._heap))]
+        return iter(out)
 
     def clear(self) -> None:
         """버퍼 초기화"""
-        self._heap.clear()
+        with self._lock:
+            self._heap.clear()
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # [user-038] 타이머 모드
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def start(
+        self,
+        on_emit: Callable[[List[SequencedEvent]], None],
+        interval_ms: Optional[float] = None,
+    ) -> None:
+        """
+        타이머 기반 방출 시작
+
+        push/poll/타이머 어디서 방출되든 on_emit은 lock 안에서 순서대로 호출되므로
+        소비자는 한 번에 한 묶음만, event_time 순서로 받습니다.
+
+        Args:
+            on_emit: 방출 묶음 콜백 (list[SequencedEvent])
+            interval_ms: 타이머 주기 (기본: buffer_ms / 4, 최소 1ms)
+                         → 꼬리 지연 상한 ≈ buffer_ms + interval_ms
+        """
+        if self._timer is not None:
+            return
+        self._on_emit = on_emit
+        interval = (interval_ms or max(self.buffer_ms / 4, 1)) / 1000
+        self._stop.clear()
+
+        def run():
+            while not self._stop.wait(interval):
+                try:
+                    self.poll()
+                except Exception as e:
+                    logger.warning(f"EventSequencer timer emit error: {e}")
+
+        self._timer = threading.Thread(target=run, daemon=True, name="event-sequencer")
+        self._timer.start()
+
+    def stop(self) -> None:
+        """타이머 중지 (남은 이벤트는 flush()로 회수)"""
+        self._stop.set()
+        if self._timer is not None:
+            self._timer.join(timeout=1.0)
+            self._timer = None
+        self._on_emit = None
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # 상태 / 통계
+    # ═══════════════════════════════════════════════════════════════════════
 
     @property
     def pending_count(self) -> int:
         """버퍼에 대기 중인 이벤트 수"""
         return len(self._heap)
 
+    @property
+    def watermark_ms(self) -> Optional[int]:
+        """마지막으로 방출한 event_time (이보다 이른 이벤트는 지각)"""
+        return self._emitted_ms
+
     @property
     def oldest_event_age_ms(self) -> Optional[int]:
         """
@@ -152,12 +342,34 @@ class EventSequencer:
         Returns:
             int: 대기 시간 (ms), 버퍼 비어있으면 None
         """
-        if not self._heap:
-            return None
+        with self._lock:
+            if not self._heap:
+                return None
+            oldest_receive = min(entry[2] for entry in self._heap)
 
         now_ms = int(time.time() * 1000)
-        oldest = self._heap[0]
-        return now_ms - oldest.receive_time_ms
+        return now_ms - oldest_receive
+
+    def get_stats(self) -> dict:
+        """
+        [user-038] 순서 보장 통계
+
+        Returns:
+            dict: pushed / emitted / pending / max_depth / forced(상한 초과 강제 방출),
+                  reorder_ms / lateness_ms / hold_ms 히스토그램
+        """
+        with self._lock:
+            return {
+                "pushed": self._pushed,
+                "emitted": self._emitted,
+                "pending": len(self._heap),
+                "max_depth": self._max_depth,
+                "forced": self._forced,
+                "watermark_ms": self._emitted_ms,
+                "reorder_ms": self._reorder.to_dict(),
+                "lateness_ms": self._lateness.to_dict(),
+                "hold_ms": self._hold.to_dict(),
+            }
 
 
 __all__ = ["EventSequencer", "SequencedEvent"]
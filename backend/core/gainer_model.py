@@ -0,0 +1,302 @@
+# ============================================================================
+# Gainer Model - R-4 XGBoost Daygainer 분류기 서빙 (user-049)
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - scripts/train_xgboost.py가 저장한 스캐너용 부스터를 한 번만 로드
+#   - 후보 전 종목의 D-1 피처를 일봉에서 벡터로 계산 → predict 1회로 확률 산출
+#   - 종목별 확률 캐시 (RealtimeScanner 신규 급등주는 대부분 조회만으로 끝)
+#   - 단건 추론 지연시간 예산 (기본 5ms) 초과 시 경고 + 통계 기록
+#
+# 📖 사용 예시:
+#   >>> model = GainerModel("scripts/xgb_scanner.json")
+#   >>> probs = model.refresh(data_repository, tickers=candidates)  # 배치
+#   >>> probs["AAPL"]
+#   0.1834
+#   >>> model.predict_ticker("SMXT", bars_df)  # 단건 (캐시 없으면 계산)
+#
+# 📌 피처 계산은 backend/data/feature_store.py (학습 D-1 피처와 같은 식)
+# 📌 xgboost 미설치 또는 모델 파일 없음 → available=False, 빈 결과 (스캔은 계속)
+# ============================================================================
+
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from backend.data.feature_store import (
+    FEATURE_COLUMNS,
+    MIN_HISTORY,
+    compute_latest_features,
+    compute_point_in_time_features,
+)
+
+if TYPE_CHECKING:
+    from backend.data.data_repository import DataRepository
+
+
+DEFAULT_MODEL_PATH = "scripts/xgb_scanner.json"
+
+# train_xgboost.prepare_features()의 결측/무한값 대체값 (학습과 동일해야 함)
+MISSING_VALUE = -999.0
+
+# 피처 계산에 필요한 최대 이력 (52주 고점 = 252 거래일)
+FEATURE_HISTORY_BARS = 252
+
+# 신규 급등주 1건 추론 (피처 + predict) 지연시간 예산
+DEFAULT_LATENCY_BUDGET_MS = 5.0
+
+
+class GainerModel:
+    """
+    Daygainer 확률 서빙
+
+    ELI5: 학습된 모델을 서버 시작 후 한 번만 꺼내 두고,
+          스캔 때는 후보 전체를 한 줄로 세워 한 번에 점수를 매깁니다.
+          실시간 급등주는 미리 매긴 점수를 찾아보기만 합니다.
+
+    Attributes:
+        model_path: 부스터 파일 (XGBoost JSON)
+        latency_budget_ms: 단건 추론 예산 (ms)
+        feature_names: 부스터 입력 피처 순서
+        as_of: 캐시된 확률의 기준 거래일
+    """
+
+    def __init__(
+        self,
+        model_path: Union[str, Path] = DEFAULT_MODEL_PATH,
+        latency_budget_ms: float = DEFAULT_LATENCY_BUDGET_MS,
+        booster: Optional[Any] = None,
+    ):
+        """
+        Args:
+            model_path: 부스터 파일 경로
+            latency_budget_ms: 단건 추론 예산 (ms)
+            booster: 이미 로드된 부스터 (테스트/재사용, inplace_predict 필요)
+        """
+        self.model_path = Path(model_path)
+        self.latency_budget_ms = latency_budget_ms
+
+        self._booster = None
+        self._load_attempted = False
+        self.feature_names: list[str] = []
+        if booster is not None:
+            self._set_booster(booster)
+
+        self._probs: dict[str, float] = {}
+        self.as_of: Optional[pd.Timestamp] = None
+        self._lock = threading.Lock()
+
+        # 통계
+        self.batches = 0
+        self.batch_rows = 0
+        self.last_batch_ms = 0.0
+        self.single_calls = 0
+        self.cache_hits = 0
+        self.over_budget = 0
+        self.last_single_ms = 0.0
+        self.max_single_ms = 0.0
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # 로드
+    # ═══════════════════════════════════════════════════════════════════════
+
+    @property
+    def available(self) -> bool:
+        return self._booster is not None
+
+    def load(self) -> bool:
+        """
+        부스터 로드 (최초 1회만 시도, 실패해도 예외 없이 False)
+
+        Returns:
+            bool: 사용 가능 여부
+        """
+        if self._booster is not None or self._load_attempted:
+            return self._booster is not None
+        self._load_attempted = True
+
+        if not self.model_path.exists():
+            logger.warning(f"⚠️ GainerModel 파일 없음: {self.model_path} (ML 단계 생략)")
+            return False
+        try:
+            import xgboost as xgb
+        except ImportError:
+            logger.warning("⚠️ xgboost 미설치 - GainerModel 비활성화 (pip install xgboost)")
+            return False
+
+        try:
+            booster = xgb.Booster()
+            booster.load_model(str(self.model_path))
+        except Exception as e:
+            logger.warning(f"⚠️ GainerModel 로드 실패: {e}")
+            return False
+
+        self._set_booster(booster)
+        logger.info(
+            f"🤖 GainerModel 로드: {self.model_path} ({len(self.feature_names)}개 피처)"
+        )
+        return True
+
+    def _set_booster(self, booster: Any) -> None:
+        names = getattr(booster, "feature_names", None)
+        if not names:
+            # 이름 없이 저장된 부스터 → 학습 시 D-1 피처 순서로 간주
+            names = FEATURE_COLUMNS[: booster.num_features()]
+        self._booster = booster
+        self.feature_names = list(names)
+
+        unknown = [n for n in self.feature_names if n not in FEATURE_COLUMNS]
+        if unknown:
+            logger.warning(
+                f"⚠️ GainerModel: 일봉으로 계산 불가 피처 {len(unknown)}개 → {MISSING_VALUE} 입력 "
+                f"({', '.join(unknown[:5])}{' ...' if len(unknown) > 5 else ''})"
+            )
+
+        # 첫 predict의 초기화 비용을 로드 시점에 치름 (첫 급등주 지연 방지)
+        self._predict(np.full((1, len(self.feature_names)), MISSING_VALUE, dtype=np.float32))
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # 추론
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def _predict(self, matrix: np.ndarray) -> np.ndarray:
+        return np.asarray(self._booster.inplace_predict(matrix), dtype="float64").reshape(-1)
+
+    def _matrix(self, features: pd.DataFrame) -> np.ndarray:
+        """피처 DataFrame → 부스터 입력 행렬 (없는 컬럼/NaN/inf = MISSING_VALUE)"""
+        matrix = features.reindex(columns=self.feature_names).to_numpy(dtype=np.float32)
+        matrix[~np.isfinite(matrix)] = MISSING_VALUE
+        return matrix
+
+    def predict_frame(self, daily_df: pd.DataFrame) -> dict[str, float]:
+        """
+        일봉 DataFrame의 모든 종목을 predict 1회로 채점 (종목별 마지막 거래일 기준)
+
+        Args:
+            daily_df: ticker, date, open, high, low, close, volume 일봉
+
+        Returns:
+            dict[str, float]: 티커 → Daygainer 확률 (모델 없으면 빈 dict)
+        """
+        if daily_df.empty or not self.load():
+            return {}
+
+        start = time.perf_counter()
+        features = compute_point_in_time_features(daily_df)
+        latest = features.groupby("ticker", sort=False).tail(1)
+        latest = latest[latest["n_obs"] >= MIN_HISTORY]
+        if latest.empty:
+            return {}
+
+        probs = dict(zip(latest["ticker"], self._predict(self._matrix(latest)).tolist()))
+        as_of = features["date"].max()
+        with self._lock:
+            # 새 거래일 기준이면 이전 캐시는 폐기 (전일 피처로 매긴 확률)
+            if self.as_of is None or as_of > self.as_of:
+                self._probs = {}
+                self.as_of = as_of
+            self._probs.update(probs)
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.batches += 1
+        self.batch_rows += len(probs)
+        self.last_batch_ms = elapsed_ms
+        logger.info(
+            f"🤖 ML 배치 추론: {len(probs):,}개 종목 ({elapsed_ms:.1f}ms, 기준일 {as_of.date()})"
+        )
+        return probs
+
+    def refresh(
+        self,
+        repo: "DataRepository",
+        tickers: Optional[list[str]] = None,
+    ) -> dict[str, float]:
+        """
+        저장된 일봉 최근 FEATURE_HISTORY_BARS 거래일을 읽어 배치 채점 (캐시 갱신)
+
+        Args:
+            repo: DataRepository
+            tickers: 채점할 티커 목록 (None이면 전 종목)
+
+        Returns:
+            dict[str, float]: 티커 → 확률
+        """
+        if not self.load():
+            return {}
+        dates = repo.get_daily_dates()
+        if not dates:
+            return {}
+        start = dates[max(0, len(dates) - FEATURE_HISTORY_BARS)]
+        return self.predict_frame(repo.get_daily_frame_since(start, tickers=tickers))
+
+    def cached(self, ticker: str) -> bool:
+        return ticker in self._probs
+
+    def predict_ticker(
+        self, ticker: str, bars: Optional[pd.DataFrame] = None
+    ) -> Optional[float]:
+        """
+        단건 추론 (캐시 우선, 없으면 bars로 마지막 행 피처만 계산)
+
+        지연시간은 예산과 비교해 통계에 기록 (초과 시 경고)
+
+        Args:
+            ticker: 종목 심볼
+            bars: 캐시에 없을 때 사용할 일봉 (날짜 오름차순)
+
+        Returns:
+            확률, 모델/데이터가 없으면 None
+        """
+        start = time.perf_counter()
+        prob = self._probs.get(ticker)
+        if prob is not None:
+            self.cache_hits += 1
+        elif bars is not None and self.load():
+            features = compute_latest_features(bars)
+            if features is not None:
+                row = np.array(
+                    [[features.get(name, np.nan) for name in self.feature_names]],
+                    dtype=np.float32,
+                )
+                row[~np.isfinite(row)] = MISSING_VALUE
+                prob = float(self._predict(row)[0])
+                with self._lock:
+                    self._probs[ticker] = prob
+
+        self._record_single(ticker, (time.perf_counter() - start) * 1000)
+        return prob
+
+    def _record_single(self, ticker: str, elapsed_ms: float) -> None:
+        self.single_calls += 1
+        self.last_single_ms = elapsed_ms
+        self.max_single_ms = max(self.max_single_ms, elapsed_ms)
+        if elapsed_ms > self.latency_budget_ms:
+            self.over_budget += 1
+            logger.warning(
+                f"⏱️ {ticker} ML 추론 {elapsed_ms:.2f}ms > 예산 {self.latency_budget_ms:.1f}ms"
+            )
+
+    def get_stats(self) -> dict:
+        return {
+            "available": self.available,
+            "model_path": str(self.model_path),
+            "features": len(self.feature_names),
+            "as_of": str(self.as_of.date()) if self.as_of is not None else None,
+            "cached": len(self._probs),
+            "batches": self.batches,
+            "batch_rows": self.batch_rows,
+            "last_batch_ms": round(self.last_batch_ms, 2),
+            "single_calls": self.single_calls,
+            "cache_hits": self.cache_hits,
+            "over_budget": self.over_budget,
+            "latency_budget_ms": self.latency_budget_ms,
+            "last_single_ms": round(self.last_single_ms, 3),
+            "max_single_ms": round(self.max_single_ms, 3),
+        }
+
+
+__all__ = ["GainerModel", "FEATURE_HISTORY_BARS"]
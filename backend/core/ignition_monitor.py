@@ -51,7 +51,16 @@ class IgnitionMonitor:
         poll_interval: 폴링 간격 (초)
     """
 
-    def __init__(self, strategy: Any, ws_manager: Any, poll_interval: float = 1.0):
+    # [user-031] 이 시간(초) 안에 틱을 받은 종목은 REST 대신 장중 상태 사용
+    STATE_FRESH_SECONDS = 5.0
+
+    def __init__(
+        self,
+        strategy: Any,
+        ws_manager: Any,
+        poll_interval: float = 1.0,
+        state_engine: Any = None,
+    ):
         """
         IgnitionMonitor 초기화
 
@@ -59,10 +68,12 @@ class IgnitionMonitor:
             strategy: SeismographStrategy 인스턴스
             ws_manager: WebSocket ConnectionManager 인스턴스
             poll_interval: 폴링 간격 (초, 기본값: 1.0)
+            state_engine: IntradayStateEngine (선택, 틱 기반 현재가/거래량)
         """
         self.strategy = strategy
         self.ws_manager = ws_manager
         self.poll_interval = poll_interval
+        self.state_engine = state_engine
 
         self.watchlist_tickers: List[str] = []
         self.watchlist_data: Dict[str, Dict[str, Any]] = {}  # ticker -> watchlist item
@@ -70,6 +81,8 @@ class IgnitionMonitor:
         self.last_prices: Dict[str, float] = {}  # ticker -> last price
         self.running: bool = False
         self._poll_task: Optional[asyncio.Task] = None
+        # [user-031] REST 당일 거래량으로 시드한 종목 (틱 거래량은 구독 이후분만 있음)
+        self._volume_seeded: set = set()
 
         # Massive API 설정
         self._api_key = os.getenv("MASSIVE_API_KEY", "")
@@ -111,9 +124,19 @@ class IgnitionMonitor:
         # [13-002 FIX] load_watchlist_context 삭제 - watchlist_data에서 직접 처리
         # (Dead Code 분석 결과: _watchlist_context를 읽는 코드가 없음)
 
+        # [user-031] 장중 상태 엔진에 전일 종가 / 평균 거래량 등록 (변동률, RVOL)
+        if self.state_engine:
+            for ticker, item in self.watchlist_data.items():
+                self.state_engine.set_reference(
+                    ticker,
+                    prev_close=item.get("last_close"),
+                    avg_volume=item.get("avg_volume"),
+                )
+
         # Score 캐시 초기화
         self.scores = {ticker: 0.0 for ticker in self.watchlist_tickers}
         self.last_prices = {}
+        self._volume_seeded = set()
 
         self.running = True
 
@@ -190,8 +213,13 @@ class IgnitionMonitor:
         if not self.watchlist_tickers:
             return
 
-        # 배치로 현재가 조회 (API 효율성)
-        quotes = await self._fetch_quotes(client, self.watchlist_tickers)
+        # [user-031] 최근 틱이 있는 종목은 장중 상태에서, 나머지만 REST 배치 조회
+        quotes = self._quotes_from_state()
+        stale = [t for t in self.watchlist_tickers if t not in quotes]
+        if stale:
+            fetched = await self._fetch_quotes(client, stale)
+            quotes.update(fetched)
+            self._seed_day_volume(fetched)
 
         for ticker in self.watchlist_tickers:
             try:
@@ -310,6 +338,43 @@ class IgnitionMonitor:
             except Exception as e:
                 logger.debug(f"⚡ {ticker} Score 계산 실패: {e}")
 
+    def _quotes_from_state(self) -> Dict[str, Dict[str, Any]]:
+        """
+        IntradayStateEngine 스냅샷 → quote 형식 (최근 틱이 있는 종목만)
+
+        Returns:
+            Dict[str, Dict]: ticker -> {price, volume, bid, ask}
+        """
+        if not self.state_engine:
+            return {}
+
+        now = datetime.now().timestamp()
+        quotes = {}
+        for ticker in self.watchlist_tickers:
+            # 당일 거래량 시드 전에는 틱 거래량이 구독 이후분뿐 → REST 1회 경유
+            if ticker not in self._volume_seeded:
+                continue
+            snap = self.state_engine.snapshot(ticker)
+            if snap is None or now - snap.last_ts > self.STATE_FRESH_SECONDS:
+                continue
+            quotes[ticker] = {
+                "price": snap.last,
+                "volume": snap.volume,
+                "bid": 0,
+                "ask": 0,
+            }
+        return quotes
+
+    def _seed_day_volume(self, quotes: Dict[str, Dict[str, Any]]) -> None:
+        """REST 스냅샷의 당일 거래량을 장중 상태 엔진에 시드 (종목당 1회)"""
+        if not self.state_engine:
+            return
+        for ticker, quote in quotes.items():
+            volume = quote.get("volume") or 0
+            if volume > 0 and ticker not in self._volume_seeded:
+                self.state_engine.seed_day_volume(ticker, volume)
+                self._volume_seeded.add(ticker)
+
     async def _fetch_quotes(
         self, client, tickers: List[str]
     ) -> Dict[str, Dict[str, Any]]:
@@ -0,0 +1,446 @@
+# ============================================================================
+# Intraday State Engine - 종목별 실시간 장중 상태 (틱 스트림 기반)
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - TickDispatcher에 구독하여 틱마다 종목별 장중 상태를 O(1)로 갱신
+#   - 세션 VWAP, HOD/LOD, 1분봉 ATR(Wilder), RVOL, 마지막 가격
+#   - DoubleTap 재진입 / Trailing Stop ATR / Ignition 변동률이 같은 상태를 공유
+#
+# 📂 저장 구조:
+#   - 종목마다 슬롯 1개 (numpy float64 행) → dict 대신 배열 열로 필드 접근
+#   - 슬롯별 버전 카운터 (Seqlock) → 락 없이 일관된 스냅샷 읽기
+#   - (배열, 버전) 튜플 1개로 공개 → 확장 시 한 번의 대입으로 교체
+#
+# 📖 사용 예시:
+#   >>> engine = IntradayStateEngine()
+#   >>> engine.attach(tick_dispatcher)          # 다른 구독자보다 먼저 등록
+#   >>> engine.set_reference("AAPL", prev_close=150.0, avg_volume=5_000_000)
+#   >>> snap = engine.snapshot("AAPL")
+#   >>> snap.vwap, snap.hod, snap.atr, snap.rvol
+#
+# 📌 [user-031] Streaming Intraday State
+# ============================================================================
+
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, NamedTuple, Optional
+from zoneinfo import ZoneInfo
+
+import numpy as np
+from loguru import logger
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 상수 / 슬롯 레이아웃
+# ═══════════════════════════════════════════════════════════════════════════
+
+MARKET_TZ = ZoneInfo("America/New_York")
+
+# 정규장 길이 (분) - RVOL 시간 보정용
+REGULAR_SESSION_MINUTES = 390
+# RVOL 분모 하한 (개장 직후/프리마켓 과대 추정 방지)
+RVOL_MIN_ELAPSED_MINUTES = 30
+
+# 슬롯 열 인덱스 (ELI5: 한 종목 = 한 줄, 각 값은 정해진 칸에 저장)
+LAST = 0
+LAST_TS = 1
+OPEN = 2
+HOD = 3
+LOD = 4
+CUM_VOL = 5
+CUM_PV = 6  # Σ(price × size) → VWAP = CUM_PV / CUM_VOL
+PREV_CLOSE = 7
+AVG_VOLUME = 8
+ATR = 9
+ATR_BARS = 10  # ATR에 반영된 완성 봉 수
+BAR_MINUTE = 11  # 진행 중인 1분봉 시작 (Unix 분)
+BAR_HIGH = 12
+BAR_LOW = 13
+BAR_CLOSE = 14
+PREV_BAR_CLOSE = 15  # 직전 완성 봉 종가 (True Range용)
+TICKS = 16
+SESSION_END = 17  # 현재 세션 종료 (다음 자정 ET, Unix 초)
+VOL_BASE = 18  # 구독 이전 당일 거래량 (REST 스냅샷으로 시드)
+VOL_SEEDED = 19  # 당일 거래량 시드 여부 (1 = volume이 당일 전체 거래량)
+N_FIELDS = 20
+
+
+class IntradaySnapshot(NamedTuple):
+    """
+    종목별 장중 상태 스냅샷 (읽기 전용)
+
+    Attributes:
+        ticker: 종목 심볼
+        last: 마지막 체결가
+        last_ts: 마지막 체결 시각 (Unix 초)
+        open: 세션 첫 체결가
+        hod / lod: 당일 고가 / 저가
+        vwap: 세션 VWAP
+        volume: 당일 누적 거래량 (시드된 구독 이전 거래량 포함)
+        atr: 1분봉 ATR (Wilder, 완성 봉이 min_atr_bars 미만이면 0)
+        rvol: 시간 보정 상대 거래량 (평균 거래량 미설정 시 0)
+        change_pct: 전일 종가 대비 변동률 (%) (전일 종가 미설정 시 0)
+        ticks: 세션 누적 틱 수
+        volume_seeded: 이번 세션에 당일 거래량이 시드됐는지
+                       (False면 volume은 구독 이후 틱 거래량뿐)
+    """
+
+    ticker: str
+    last: float
+    last_ts: float
+    open: float
+    hod: float
+    lod: float
+    vwap: float
+    volume: float
+    atr: float
+    rvol: float
+    change_pct: float
+    ticks: int
+    volume_seeded: bool = False
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# IntradayStateEngine 클래스
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class IntradayStateEngine:
+    """
+    틱 스트림 기반 종목별 장중 상태 엔진
+
+    ELI5: 종목마다 "오늘의 성적표" 한 줄을 갖고 있다가, 틱이 올 때마다
+          그 줄의 숫자 몇 개만 고칩니다. 필요한 쪽은 성적표를 복사해 읽기만 하면 되고,
+          매번 처음부터 다시 계산하지 않습니다.
+
+    - 쓰기: TickDispatcher 스레드 (Massive WebSocket 콜백)에서 on_tick()
+            (set_reference와의 경합만 짧은 쓰기 락으로 직렬화)
+    - 읽기: 이벤트 루프/전략에서 snapshot() → 락 없이 버전 카운터로 찢어진 읽기 방지
+
+    Attributes:
+        atr_period: ATR 기간 (1분봉 개수)
+        min_atr_bars: ATR을 공개하기 위한 최소 완성 봉 수 (미만이면 atr=0)
+        _slots: 종목 → 슬롯 인덱스
+        _store: ((capacity, N_FIELDS) float64 배열, 슬롯별 Seqlock 버전) 튜플
+                (버전 홀수 = 쓰기 중)
+    """
+
+    SUBSCRIBER_NAME = "intraday_state"
+
+    def __init__(
+        self,
+        atr_period: int = 14,
+        initial_capacity: int = 256,
+        min_atr_bars: Optional[int] = None,
+    ):
+        """
+        IntradayStateEngine 초기화
+
+        Args:
+            atr_period: ATR 기간 (1분봉 개수, 기본 14)
+            initial_capacity: 초기 슬롯 수 (부족하면 2배씩 증가)
+            min_atr_bars: ATR 공개 최소 봉 수 (기본: atr_period)
+                          장 초반 봉 1~2개의 범위를 ATR로 쓰면 스탑이 과도하게 좁아짐
+        """
+        self.atr_period = atr_period
+        self.min_atr_bars = atr_period if min_atr_bars is None else min_atr_bars
+
+        self._slots: Dict[str, int] = {}
+        self._store: tuple[np.ndarray, np.ndarray] = (
+            np.zeros((initial_capacity, N_FIELDS), dtype=np.float64),
+            np.zeros(initial_capacity, dtype=np.int64),
+        )
+        self._write_lock = threading.Lock()
+
+        # 세션 경계 캐시 (모든 종목이 공유): (day_start, day_end, regular_open)
+        self._session_cache: Optional[tuple[float, float, float]] = None
+
+        self._tick_count = 0
+
+        logger.debug(f"📐 IntradayStateEngine 초기화 (ATR {atr_period} x 1m)")
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # 등록 / 기준값
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def attach(self, dispatcher) -> None:
+        """
+        TickDispatcher에 구독자로 등록
+
+        구독자는 등록 순서대로 호출되므로, 상태를 읽는 다른 구독자보다
+        먼저 등록해야 같은 틱에서 갱신된 상태를 볼 수 있습니다.
+        """
+        dispatcher.register(self.SUBSCRIBER_NAME, self.on_tick)
+
+    def set_reference(
+        self,
+        ticker: str,
+        prev_close: Optional[float] = None,
+        avg_volume: Optional[float] = None,
+    ) -> None:
+        """
+        전일 종가 / 평균 거래량 설정 (변동률, RVOL 계산용)
+
+        Args:
+            ticker: 종목 심볼
+            prev_close: 전일 종가
+            avg_volume: 평균 일 거래량 (예: 20일 평균)
+        """
+        with self._write_lock:
+            row = self._slot(ticker)
+            data, version = self._store
+            version[row] += 1
+            if prev_close:
+                data[row, PREV_CLOSE] = prev_close
+            if avg_volume:
+                data[row, AVG_VOLUME] = avg_volume
+            version[row] += 1
+
+    def seed_day_volume(self, ticker: str, day_volume: float) -> None:
+        """
+        당일 누적 거래량 시드 (REST 스냅샷의 day volume)
+
+        ELI5: 구독 전에 이미 거래된 양은 틱으로 들어오지 않으므로,
+              REST가 알려준 당일 거래량에서 지금까지 받은 틱 거래량을 뺀 만큼을
+              "구독 전 거래량"으로 더해 둡니다. (VWAP은 틱만으로 계산)
+
+        Args:
+            ticker: 종목 심볼
+            day_volume: 당일 누적 거래량 (REST 스냅샷 기준)
+        """
+        if not day_volume or day_volume <= 0:
+            return
+        with self._write_lock:
+            row = self._slot(ticker)
+            data, version = self._store
+            d = data[row]
+            version[row] += 1
+            # 틱 전 시드 → 세션을 지금 기준으로 열어 둠 (첫 틱의 세션 전환이 시드를 지우지 않도록)
+            now = datetime.now().timestamp()
+            if d[TICKS] == 0 and now >= d[SESSION_END]:
+                self._reset_session(d, now)
+            d[VOL_BASE] = max(float(day_volume) - d[CUM_VOL], 0.0)
+            d[VOL_SEEDED] = 1.0
+            version[row] += 1
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # 틱 처리 (쓰기)
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def on_tick(self, tick: dict) -> None:
+        """
+        TickDispatcher 콜백
+
+        Args:
+            tick: {"ticker": str, "price": float, "size": int, "time": float}
+                  (bar 타입 메시지는 무시)
+        """
+        if tick.get("type") == "bar":
+            return
+        price = tick.get("price")
+        if not price or price <= 0:
+            return
+        self.update(tick["ticker"], float(price), float(tick.get("size") or 0), tick.get("time"))
+
+    def update(self, ticker: str, price: float, size: float, ts: Optional[float] = None) -> None:
+        """
+        체결 1건 반영 (O(1))
+
+        Args:
+            ticker: 종목 심볼
+            price: 체결가
+            size: 체결 수량
+            ts: 체결 시각 (Unix 초, 기본: 현재)
+        """
+        ts = float(ts) if ts else datetime.now().timestamp()
+        with self._write_lock:
+            row = self._slot(ticker)
+            data, version = self._store
+            d = data[row]
+
+            version[row] += 1
+
+            # 세션 전환 (ET 자정) → 당일 누적값 리셋, ATR/기준값은 유지
+            if ts >= d[SESSION_END]:
+                self._reset_session(d, ts)
+
+            if d[TICKS] == 0:
+                d[OPEN] = d[HOD] = d[LOD] = price
+            elif price > d[HOD]:
+                d[HOD] = price
+            elif price < d[LOD]:
+                d[LOD] = price
+
+            d[LAST] = price
+            d[LAST_TS] = ts
+            d[CUM_VOL] += size
+            d[CUM_PV] += price * size
+            d[TICKS] += 1
+
+            # 1분봉 누적 → 봉이 바뀌면 직전 봉으로 ATR 갱신
+            minute = ts // 60
+            if minute != d[BAR_MINUTE]:
+                if d[BAR_MINUTE] > 0:
+                    self._close_bar(d)
+                d[BAR_MINUTE] = minute
+                d[BAR_HIGH] = d[BAR_LOW] = d[BAR_CLOSE] = price
+            else:
+                if price > d[BAR_HIGH]:
+                    d[BAR_HIGH] = price
+                elif price < d[BAR_LOW]:
+                    d[BAR_LOW] = price
+                d[BAR_CLOSE] = price
+
+            version[row] += 1
+            self._tick_count += 1
+
+    def _close_bar(self, d: np.ndarray) -> None:
+        """완성된 1분봉의 True Range로 ATR 갱신 (Wilder 평활)"""
+        high, low, prev_close = d[BAR_HIGH], d[BAR_LOW], d[PREV_BAR_CLOSE]
+        tr = high - low
+        if prev_close > 0:
+            tr = max(tr, abs(high - prev_close), abs(low - prev_close))
+
+        # 처음 period개 봉은 단순 평균, 이후 Wilder: ATR += (TR - ATR) / period
+        d[ATR_BARS] += 1
+        d[ATR] += (tr - d[ATR]) / min(d[ATR_BARS], self.atr_period)
+        d[PREV_BAR_CLOSE] = d[BAR_CLOSE]
+
+    def _reset_session(self, d: np.ndarray, ts: float) -> None:
+        day_end, _ = self._session_bounds(ts)
+        for col in (OPEN, HOD, LOD, CUM_VOL, CUM_PV, TICKS, VOL_BASE, VOL_SEEDED):
+            d[col] = 0.0
+        # 다음 세션으로 넘어가면 직전 세션 마지막 가격을 전일 종가로 이월
+        if d[LAST] > 0 and d[SESSION_END] > 0:
+            d[PREV_CLOSE] = d[LAST]
+        d[SESSION_END] = day_end
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # 스냅샷 (읽기)
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def snapshot(self, ticker: str) -> Optional[IntradaySnapshot]:
+        """
+        종목 상태 스냅샷 (락 없음)
+
+        ELI5: 읽기 전후로 버전 번호를 확인해서, 읽는 도중 값이 바뀌었으면
+              다시 읽습니다. 그래서 VWAP과 HOD가 서로 다른 틱의 값이 섞이지 않습니다.
+
+        Args:
+            ticker: 종목 심볼
+
+        Returns:
+            IntradaySnapshot | None: 틱을 받은 적 없으면 None
+        """
+        row = self._slots.get(ticker)
+        if row is None:
+            return None
+
+        while True:
+            store = self._store
+            data, version = store
+            before = version[row]
+            if before % 2:
+                continue  # 쓰기 중
+            values = data[row].copy()
+            if version[row] == before and store is self._store:
+                break
+
+        if values[TICKS] == 0:
+            return None
+        return self._to_snapshot(ticker, values)
+
+    def snapshot_all(self) -> Dict[str, IntradaySnapshot]:
+        """틱을 받은 모든 종목의 스냅샷"""
+        result = {}
+        for ticker in list(self._slots):
+            snap = self.snapshot(ticker)
+            if snap is not None:
+                result[ticker] = snap
+        return result
+
+    def _to_snapshot(self, ticker: str, v: np.ndarray) -> IntradaySnapshot:
+        vwap = v[CUM_PV] / v[CUM_VOL] if v[CUM_VOL] > 0 else v[LAST]
+        day_volume = v[CUM_VOL] + v[VOL_BASE]
+
+        rvol = 0.0
+        if v[AVG_VOLUME] > 0:
+            _, regular_open = self._session_bounds(v[LAST_TS])
+            elapsed = (v[LAST_TS] - regular_open) / 60
+            elapsed = min(max(elapsed, RVOL_MIN_ELAPSED_MINUTES), REGULAR_SESSION_MINUTES)
+            rvol = day_volume / (v[AVG_VOLUME] * elapsed / REGULAR_SESSION_MINUTES)
+
+        change_pct = 0.0
+        if v[PREV_CLOSE] > 0:
+            change_pct = (v[LAST] - v[PREV_CLOSE]) / v[PREV_CLOSE] * 100
+
+        return IntradaySnapshot(
+            ticker=ticker,
+            last=float(v[LAST]),
+            last_ts=float(v[LAST_TS]),
+            open=float(v[OPEN]),
+            hod=float(v[HOD]),
+            lod=float(v[LOD]),
+            vwap=float(vwap),
+            volume=float(day_volume),
+            atr=float(v[ATR]) if v[ATR_BARS] >= self.min_atr_bars else 0.0,
+            rvol=float(rvol),
+            change_pct=float(change_pct),
+            ticks=int(v[TICKS]),
+            volume_seeded=bool(v[VOL_SEEDED]),
+        )
+
+    def get_stats(self) -> dict:
+        """
+        엔진 통계
+
+        Returns:
+            dict: tickers, capacity, ticks
+        """
+        return {
+            "tickers": len(self._slots),
+            "capacity": len(self._store[0]),
+            "ticks": self._tick_count,
+        }
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # 내부 헬퍼
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def _slot(self, ticker: str) -> int:
+        """종목 슬롯 인덱스 (없으면 할당, 용량 부족 시 2배 확장)"""
+        row = self._slots.get(ticker)
+        if row is not None:
+            return row
+
+        row = len(self._slots)
+        old_data, old_version = self._store
+        if row >= len(old_data):
+            # 새 (배열, 버전)을 완성한 뒤 튜플 1개로 교체
+            # → 읽는 쪽은 이전/새 쌍 중 하나만 보며, 배열과 버전이 섞이지 않음
+            data = np.zeros((len(old_data) * 2, N_FIELDS), dtype=np.float64)
+            data[:row] = old_data
+            version = np.zeros(len(data), dtype=np.int64)
+            version[:row] = old_version
+            self._store = (data, version)
+        self._slots[ticker] = row
+        return row
+
+    def _session_bounds(self, ts: float) -> tuple[float, float]:
+        """
+        ts가 속한 ET 세션의 (다음 자정, 정규장 09:30) Unix 초
+
+        같은 날 틱은 캐시를 사용하므로 타임존 계산은 하루 1회입니다.
+        """
+        cached = self._session_cache
+        if cached and cached[0] <= ts < cached[1]:
+            return cached[1], cached[2]
+
+        local = datetime.fromtimestamp(ts, MARKET_TZ)
+        midnight = local.replace(hour=0, minute=0, second=0, microsecond=0)
+        # zoneinfo 벽시계 연산 → DST 전환일에도 정확한 자정/개장 시각
+        day_end = (midnight + timedelta(days=1)).timestamp()
+        regular_open = midnight.replace(hour=9, minute=30).timestamp()
+
+        self._session_cache = (midnight.timestamp(), day_end, regular_open)
+        return day_end, regular_open
@@ -7,6 +7,10 @@
 #   - OCA 그룹 관리
 #   - 거래 로그 기록
 #
+# 📌 [user-034] 인덱스 주문 장부:
+#   - OrderBook: order_id / 심볼별 미체결 / OCA 그룹 인덱스 → 체결 처리 O(1)
+#   - 종료된 주문은 최근 N개만 유지, 거래 로그는 고정 크기 링 버퍼
+#
 # 📖 사용 예시:
 #   >>> from backend.core.order_manager import OrderManager
 #   >>> manager = OrderManager(connector)
@@ -20,10 +24,12 @@ Order Manager Module
 주문 상태 관리 및 Signal 기반 주문 실행을 담당합니다.
 """
 
+import itertools
+from collections import deque
 from enum import Enum, auto
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Dict, List, Any
+from typing import Callable, Optional, Dict, List, Any, Set
 
 from loguru import logger
 
@@ -128,6 +134,145 @@ class Position:
         return ((self.current_price - self.avg_price) / self.avg_price) * 100
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# [user-034] 주문 장부 / 거래 로그 링
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class OrderBook:
+    """
+    인덱스 주문 장부
+
+    ELI5: 주문 서류를 한 상자에 몰아넣고 매번 뒤지는 대신,
+          "주문번호별", "종목별 미체결", "OCA 묶음별" 색인 카드를 함께 둡니다.
+          체결 알림이 오면 색인으로 바로 찾아 O(1)에 처리합니다.
+
+    - orders: order_id -> OrderRecord (미체결 전부 + 종료된 최근 max_closed개)
+    - 종료(체결/취소) 주문은 max_closed를 넘으면 오래된 것부터 제거 → 하루 종일 메모리 고정
+    """
+
+    def __init__(self, max_closed: int = 5000):
+        self.orders: Dict[int, OrderRecord] = {}
+        self.max_closed = max_closed
+        # 심볼 -> {order_id: OrderRecord} (미체결만)
+        self._open_by_symbol: Dict[str, Dict[int, OrderRecord]] = {}
+        # OCA 그룹 -> {order_id}
+        self._oca: Dict[str, Set[int]] = {}
+        # 종료 순서 (오래된 것부터 제거)
+        self._closed: deque = deque()
+
+    def __len__(self) -> int:
+        return len(self.orders)
+
+    def __contains__(self, order_id: int) -> bool:
+        return order_id in self.orders
+
+    def add(self, record: OrderRecord) -> None:
+        """주문 등록 (미체결 인덱스 + OCA 인덱스)"""
+        self.orders[record.order_id] = record
+        self._open_by_symbol.setdefault(record.symbol, {})[record.order_id] = record
+        if record.oca_group:
+            self.link_oca(record.oca_group, record.order_id)
+
+    def get(self, order_id: int) -> Optional[OrderRecord]:
+        return self.orders.get(order_id)
+
+    def close(self, order_id: int, status: OrderStatus) -> Optional[OrderRecord]:
+        """
+        주문 종료 (체결/취소/거부)
+
+        미체결 인덱스에서 빼고 종료 큐에 넣습니다. 이미 종료된 주문이면 상태만 갱신.
+        """
+        record = self.orders.get(order_id)
+        if record is None:
+            return None
+        record.status = status
+        open_orders = self._open_by_symbol.get(record.symbol)
+        if open_orders and open_orders.pop(order_id, None) is not None:
+            if not open_orders:
+                del self._open_by_symbol[record.symbol]
+            self._closed.append(order_id)
+            self._evict()
+        return record
+
+    def _evict(self) -> None:
+        while len(self._closed) > self.max_closed:
+            old_id = self._closed.popleft()
+            record = self.orders.pop(old_id, None)
+            if record and record.oca_group:
+                members = self._oca.get(record.oca_group)
+                if members is not None:
+                    members.discard(old_id)
+                    if not members:
+                        del self._oca[record.oca_group]
+
+    def open_orders(self, symbol: Optional[str] = None) -> List[OrderRecord]:
+        """미체결 주문 (심볼 지정 시 해당 심볼만)"""
+        if symbol is not None:
+            return list(self._open_by_symbol.get(symbol, {}).values())
+        return [r for by_id in self._open_by_symbol.values() for r in by_id.values()]
+
+    def link_oca(self, group: str, order_id: Optional[int] = None) -> None:
+        """OCA 그룹 등록 (order_id가 있으면 멤버로 추가)"""
+        members = self._oca.setdefault(group, set())
+        if order_id is not None:
+            members.add(order_id)
+
+    def oca_orders(self, group: str) -> List[OrderRecord]:
+        """OCA 그룹 멤버 주문"""
+        return [self.orders[i] for i in self._oca.get(group, ()) if i in self.orders]
+
+    @property
+    def oca_groups(self) -> List[str]:
+        return list(self._oca)
+
+
+class TradeLog:
+    """
+    고정 크기 거래 로그 링 버퍼
+
+    항목은 추가 시점에 한 번만 직렬화(JSON 호환 dict)되고 seq 번호를 받습니다.
+    get_since(seq)로 마지막으로 본 이후 항목만 가져갈 수 있습니다.
+    """
+
+    def __init__(self, maxlen: int = 10_000):
+        self._entries: deque = deque(maxlen=maxlen)
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        return self._entries[index]
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    @property
+    def last_seq(self) -> int:
+        return self._seq
+
+    @property
+    def dropped(self) -> int:
+        """링에서 밀려난 항목 수"""
+        return self._seq - len(self._entries)
+
+    def append(self, entry: Dict[str, Any]) -> int:
+        self._seq += 1
+        entry["seq"] = self._seq
+        self._entries.append(entry)
+        return self._seq
+
+    def get_since(self, seq: int = 0) -> List[Dict[str, Any]]:
+        """seq 이후 항목 (오래된 순, O(새 항목 수))"""
+        count = min(self._seq - seq, len(self._entries))
+        if count <= 0:
+            return []
+        newest = list(itertools.islice(reversed(self._entries), count))
+        newest.reverse()
+        return newest
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # OrderManager 클래스
 # ═══════════════════════════════════════════════════════════════════════════
@@ -157,26 +302,34 @@ class OrderManager:
         >>> oca_id = manager.execute_oca_exit(order_id, entry_price)
     """
 
-    def __init__(self, connector=None):
+    def __init__(
+        self,
+        connector=None,
+        max_closed_orders: int = 5000,
+        trade_log_size: int = 10_000,
+    ):
         """
         OrderManager 초기화
 
         Args:
             connector: IBKRConnector 인스턴스 (None이면 Mock 모드)
+            max_closed_orders: 보관할 종료(체결/취소) 주문 수
+            trade_log_size: 거래 로그 링 크기
         """
         self.connector = connector
 
-        # 주문 추적
-        self._orders: Dict[int, OrderRecord] = {}
+        # 주문 추적 (order_id / 심볼 / OCA 인덱스)
+        self._book = OrderBook(max_closed=max_closed_orders)
+        self._orders: Dict[int, OrderRecord] = self._book.orders
 
         # 포지션 추적
         self._positions: Dict[str, Position] = {}
+        # [user-035] 브로커 포지션 갱신을 전달받을 구독자 (예: RiskManager)
+        # (커넥터의 positions callback은 1개 슬롯이므로 OrderManager가 중계)
+        self._position_listeners: List[Callable[[list], None]] = []
 
-        # OCA 그룹 추적
-        self._oca_groups: Dict[str, List[int]] = {}
-
-        # 거래 로그
-        self._trade_log: List[Dict[str, Any]] = []
+        # 거래 로그 (고정 크기 링)
+        self._trade_log = TradeLog(maxlen=trade_log_size)
 
         # 콜백 연결
         if connector:
@@ -185,10 +338,22 @@ class OrderManager:
         logger.debug("📋 OrderManager 초기화 완료")
 
     def _connect_signals(self) -> None:
-        """IBKRConnector Signal 연결"""
+        """
+        IBKRConnector Signal 연결
+
+        [user-033] Signal 속성이 없는 커넥터(IBKRConnector / SimulatedBroker의
+        callback API)는 set_on_* 로 등록합니다.
+        """
         if not self.connector:
             return
 
+        if not hasattr(self.connector, "order_placed"):
+            self.connector.set_on_order_placed(self._on_order_placed)
+            self.connector.set_on_order_filled(self._on_order_filled)
+            self.connector.set_on_order_cancelled(self._on_order_cancelled)
+            self.connector.set_on_positions_update(self._on_positions_update)
+            return
+
         self.connector.order_placed.connect(self._on_order_placed)
         self.connector.order_filled.connect(self._on_order_filled)
         self.connector.order_cancelled.connect(self._on_order_cancelled)
@@ -235,7 +400,7 @@ class OrderManager:
                 status=OrderStatus.PENDING,
                 signal_id=signal_id,
             )
-            self._orders[order_id] = record
+            self._book.add(record)
 
             logger.info(f"📤 진입 주문 실행: {action} {qty} {symbol} (ID: {order_id})")
 
@@ -276,8 +441,8 @@ class OrderManager:
             profit_target_pct=profit_target_pct,
         )
 
+        # 자식 주문은 커넥터의 order_placed(oca_group 포함)로 장부에 등록됨
         if oca_id:
-            self._oca_groups[oca_id] = []
             logger.info(f"📦 OCA 그룹 배치: {symbol} (ID: {oca_id})")
 
         return oca_id
@@ -290,9 +455,15 @@ class OrderManager:
         """주문 조회"""
         return self._orders.get(order_id)
 
-    def get_pending_orders(self) -> List[OrderRecord]:
-        """미체결 주문 목록"""
-        return [o for o in self._orders.values() if o.status == OrderStatus.PENDING]
+    def get_pending_orders(self, symbol: Optional[str] = None) -> List[OrderRecord]:
+        """미체결 주문 목록 (심볼 지정 시 해당 심볼만)"""
+        return [
+            o for o in self._book.open_orders(symbol) if o.status == OrderStatus.PENDING
+        ]
+
+    def get_oca_orders(self, oca_group: str) -> List[OrderRecord]:
+        """OCA 그룹에 속한 주문 목록"""
+        return self._book.oca_orders(oca_group)
 
     def get_position(self, symbol: str) -> Optional[Position]:
         """포지션 조회"""
@@ -302,9 +473,14 @@ class OrderManager:
         """모든 포지션 목록"""
         return list(self._positions.values())
 
-    def get_trade_log(self) -> List[Dict[str, Any]]:
-        """거래 로그 조회"""
-        return self._trade_log
+    def get_trade_log(self, since_seq: int = 0) -> List[Dict[str, Any]]:
+        """
+        거래 로그 조회
+
+        Args:
+            since_seq: 이 seq 이후 항목만 (0이면 링에 남은 전체)
+        """
+        return self._trade_log.get_since(since_seq)
 
     # ═══════════════════════════════════════════════════════════════════
     # 취소
@@ -331,7 +507,7 @@ class OrderManager:
     def _on_order_placed(self, data: dict) -> None:
         """주문 접수 콜백"""
         order_id = data.get("order_id")
-        if order_id and order_id not in self._orders:
+        if order_id and order_id not in self._book:
             record = OrderRecord(
                 order_id=order_id,
                 symbol=data.get("symbol", ""),
@@ -339,15 +515,17 @@ class OrderManager:
                 qty=data.get("qty", 0),
                 order_type=OrderType.MARKET,
                 status=OrderStatus.PENDING,
+                limit_price=data.get("limit_price"),
+                stop_price=data.get("stop_price"),
+                oca_group=data.get("oca_group"),
             )
-            self._orders[order_id] = record
+            self._book.add(record)
 
     def _on_order_filled(self, data: dict) -> None:
         """주문 체결 콜백"""
         order_id = data.get("order_id")
-        if order_id in self._orders:
-            record = self._orders[order_id]
-            record.status = OrderStatus.FILLED
+        record = self._book.close(order_id, OrderStatus.FILLED)
+        if record:
             record.fill_price = data.get("fill_price", 0)
             record.filled_at = datetime.now()
 
@@ -369,13 +547,21 @@ class OrderManager:
     def _on_order_cancelled(self, data: dict) -> None:
         """주문 취소 콜백"""
         order_id = data.get("order_id")
-        if order_id in self._orders:
-            record = self._orders[order_id]
-            record.status = OrderStatus.CANCELLED
+        record = self._book.close(order_id, OrderStatus.CANCELLED)
+        if record:
             record.cancelled_at = datetime.now()
 
             logger.info(f"🚫 취소 기록: {record.symbol}")
 
+    def add_positions_listener(self, callback: Callable[[list], None]) -> None:
+        """
+        브로커 포지션 갱신 구독 (커넥터 → OrderManager → 구독자 순서로 전달)
+
+        Args:
+            callback: positions 목록을 받는 함수 (예: RiskManager.on_positions_update)
+        """
+        self._position_listeners.append(callback)
+
     def _on_positions_update(self, positions: list) -> None:
         """포지션 업데이트 콜백"""
         for pos in positions:
@@ -386,3 +572,9 @@ class OrderManager:
                     qty=pos.get("qty", 0),
                     avg_price=pos.get("avg_price", 0),
                 )
+
+        for listener in self._position_listeners:
+            try:
+                listener(positions)
+            except Exception as e:
+                logger.error(f"❌ 포지션 구독자 오류: {e}")
@@ -34,9 +34,11 @@ from datetime import datetime
 from typing import Set, List, Dict, Any, Optional, TYPE_CHECKING
 from loguru import logger
 
+from backend.core.gainer_model import FEATURE_HISTORY_BARS
 from backend.core.ticker_filter import TickerFilter, get_ticker_filter
 
 if TYPE_CHECKING:
+    from backend.core.gainer_model import GainerModel
     from backend.core.interfaces.scoring import ScoringStrategy
     from backend.data.data_repository import DataRepository
 
@@ -77,6 +79,7 @@ class RealtimeScanner:
         poll_interval: float = 1.0,
         scoring_strategy: Optional["ScoringStrategy"] = None,
         ticker_filter: Optional[TickerFilter] = None,  # [12-001] Warrant/Preferred 제외
+        gainer_model: Optional["GainerModel"] = None,  # [user-049] ML 확률
     ):
         """
         RealtimeScanner 초기화
@@ -87,6 +90,7 @@ class RealtimeScanner:
             data_repository: DataRepository 인스턴스 ([11-002] score_v3 계산용)
             ignition_monitor: IgnitionMonitor 인스턴스 (Optional)
             poll_interval: 폴링 간격 (초, 기본값: 1.0)
+            gainer_model: [user-049] Daygainer 분류기 (신규 급등주 ml_prob 계산)
         """
         self.massive_client = massive_client
         self.ws_manager = ws_manager
@@ -99,10 +103,14 @@ class RealtimeScanner:
         if scoring_strategy:
             logger.info("📊 ScoringStrategy 주입 완료 (score_v3 계산 활성화)")
 
+        # [user-049] ML 확률 (Container 공유 캐시, 시작 시 전 종목 배치 추론)
+        self.gainer_model = gainer_model
+        self._prime_task: Optional[asyncio.Task] = None
+
         # [12-001] TickerFilter 초기화 (Warrant/Preferred/Rights/Units 제외)
         self.ticker_filter = ticker_filter or get_ticker_filter()
         logger.info(
-            f"🔧 TickerFilter 활성화: {len(self.ticker_filter._patterns)}개 패턴"
+            f"🔧 TickerFilter 활성화: {len(self.ticker_filter.patterns)}개 패턴"
         )
 
         # 내부 상태
@@ -165,6 +173,8 @@ class RealtimeScanner:
         self._recalc_task = asyncio.create_task(
             self._periodic_score_recalculation()
         )  # [Phase 9]
+        if self.gainer_model is not None and self.repo is not None:
+            self._prime_task = asyncio.create_task(self._prime_gainer_model())
 
         logger.info(
             "🚀 RealtimeScanner 시작: 1초 폴링 + 브로드캐스트 + 1시간 자동 재계산 활성화"
@@ -204,6 +214,15 @@ class RealtimeScanner:
                 pass
             self._recalc_task = None
 
+        # [user-049] ML 확률 캐시 준비 태스크 중지
+        if self._prime_task:
+            self._prime_task.cancel()
+            try:
+                await self._prime_task
+            except asyncio.CancelledError:
+                pass
+            self._prime_task = None
+
         logger.info(
             f"🛑 RealtimeScanner 중지: {self._poll_count}회 폴링, {self._new_ticker_count}개 신규 종목 탐지"
         )
@@ -218,6 +237,7 @@ class RealtimeScanner:
             "last_poll_time": self._last_poll_time.isoformat()
             if self._last_poll_time
             else None,
+            "ml": self.gainer_model.get_stats() if self.gainer_model else None,
         }
 
     def get_known_tickers(self) -> List[str]:
@@ -297,6 +317,41 @@ class RealtimeScanner:
         except Exception as e:
             logger.warning(f"⚠️ Gainers 폴링 실패: {e}")
 
+    async def _prime_gainer_model(self) -> None:
+        """
+        [user-049] 전 종목 ML 확률 배치 계산 (워커 스레드, 폴링 루프 비차단)
+
+        ELI5: 급등주가 나타날 때마다 계산하지 않도록, 장 시작 전에
+              모든 종목 점수를 한 번에 매겨 둡니다.
+        """
+        try:
+            probs = await asyncio.to_thread(self.gainer_model.refresh, self.repo)
+            if probs:
+                logger.info(f"🤖 ML 확률 캐시 준비: {len(probs):,}개 종목")
+        except Exception as e:
+            logger.warning(f"⚠️ ML 확률 캐시 준비 실패: {e}")
+
+    async def _predict_gainer(self, ticker: str) -> Optional[float]:
+        """
+        [user-049] 신규 급등주 ML 확률 (캐시 조회, 없으면 1종목 피처 계산)
+
+        📌 예산(기본 5ms)은 추론 자체(피처 + predict)에만 적용,
+           캐시 미스 시 일봉 조회 I/O는 제외
+        """
+        model = self.gainer_model
+        try:
+            bars = None
+            if not model.cached(ticker) and self.repo and model.load():
+                df = await self.repo.get_daily_bars(
+                    ticker, days=FEATURE_HISTORY_BARS, auto_fill=False
+                )
+                if not df.empty:
+                    bars = df.sort_values("date")
+            return model.predict_ticker(ticker, bars)
+        except Exception as e:
+            logger.warning(f"⚠️ {ticker} ML 추론 실패: {e}")
+            return None
+
     async def _handle_new_gainer(self, item: Dict[str, Any]) -> None:
         """
         신규 급등 종목 처리
@@ -367,6 +422,11 @@ class RealtimeScanner:
             except Exception as e:
                 logger.warning(f"⚠️ {ticker} score 계산 실패: {e}")
 
+        # [user-049] Daygainer 확률 (캐시 조회 또는 단건 추론)
+        ml_prob = None
+        if self.gainer_model is not None:
+            ml_prob = await self._predict_gainer(ticker)
+
         # 1. Watchlist 항목 생성 (score_v3 포함)
         watchlist_item = {
             "ticker": ticker,
@@ -385,6 +445,7 @@ class RealtimeScanner:
             "signals": signals,
             "can_trade": can_trade,
             "intensities": intensities,  # [02-001c] 신호 강도
+            "ml_prob": round(ml_prob, 4) if ml_prob is not None else None,  # [user-049]
         }
 
         # [Issue 6.2 Fix] 기존 Watchlist와 병합 (덮어쓰기 대신)
@@ -607,6 +668,13 @@ class RealtimeScanner:
         success, failed, skipped = 0, 0, 0
         logger.info(f"🔄 Score V3 재계산 시작: {len(watchlist)}개 종목")
 
+        # [user-026] 누락 일봉을 배치 1회로 먼저 보충 (종목마다 API 호출하지 않음)
+        tickers = [item["ticker"] for item in watchlist if item.get("ticker")]
+        try:
+            await self.repo.fill_daily_gaps_bulk(tickers, days=20)
+        except Exception as e:
+            logger.warning(f"⚠️ 일봉 벌크 Gap Fill 실패: {e}")
+
         for item in watchlist:
             ticker = item.get("ticker")
             if not ticker:
@@ -614,8 +682,8 @@ class RealtimeScanner:
                 continue
 
             try:
-                # [11-002] DataRepository에서 일봉 조회
-                df = await self.repo.get_daily_bars(ticker, days=20, auto_fill=True)
+                # [11-002] DataRepository에서 일봉 조회 ([user-026] 위에서 벌크 보충 완료)
+                df = await self.repo.get_daily_bars(ticker, days=20, auto_fill=False)
 
                 if not df.empty and len(df) >= 5:
                     data = df.sort_values("date").to_dict("records")
@@ -5,6 +5,8 @@
 #   - 포지션 사이징 (Kelly Criterion / 고정 비율)
 #   - 일일/주간 손실 한도 체크
 #   - Kill Switch (긴급 청산)
+#   - [user-035] 증분 리스크 장부 (일/주 손익, Kelly 통계, 종목별 노출)
+#     → 진입 전 체크 O(1), JSON 스냅샷으로 재시작 시 복원
 #
 # 📖 사용 예시:
 #   >>> from backend.core.risk_manager import RiskManager
@@ -25,9 +27,12 @@ Features:
     - Kill Switch (긴급 전량 청산)
 """
 
+import json
+import os
 from datetime import datetime, date, timedelta
+from pathlib import Path
 from typing import Optional, Dict, List, Any
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 
 from loguru import logger
 
@@ -53,6 +58,200 @@ class DailyPnL:
         return self.realized_pnl + self.unrealized_pnl
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# [user-035] 증분 리스크 장부
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class RiskLedger:
+    """
+    증분 리스크 장부
+
+    ELI5: 매번 거래 기록 전체를 다시 더하는 대신, 계산기 화면에
+          "오늘 합계", "이번 주 합계", "승/패 횟수와 합"을 띄워 두고
+          거래나 가격이 바뀔 때마다 그 차이만 더하고 뺍니다.
+
+    - record_trade(): 일/주 실현 손익 + Kelly 통계 갱신
+    - update_position() / mark(): 종목별 미실현 손익 + 총 노출 갱신
+    - 날짜/주가 바뀌면 _roll()이 당일/주간 누계를 새로 시작
+    - to_dict() / from_dict(): JSON 스냅샷
+    """
+
+    # 보관할 일별 기록 (일)
+    KEEP_DAYS = 35
+
+    def __init__(self):
+        self.daily: Dict[str, DailyPnL] = {}
+        self.day: Optional[str] = None
+        self.week_start: Optional[str] = None
+        self.weekly_realized = 0.0
+
+        # Kelly 통계 (누적)
+        self.wins = 0
+        self.win_sum = 0.0
+        self.losses = 0
+        self.loss_sum = 0.0
+
+        # 종목 -> [수량, 평균단가, 최근가]
+        self.positions: Dict[str, List[float]] = {}
+        self.positions_known = False
+        self.unrealized = 0.0
+        self.gross_exposure = 0.0
+
+    @property
+    def trade_count(self) -> int:
+        return self.wins + self.losses
+
+    @property
+    def today(self) -> DailyPnL:
+        """당일 기록 (날짜가 바뀌었으면 새로 시작)"""
+        self._roll(date.today())
+        return self.daily[self.day]
+
+    def _roll(self, today: date) -> None:
+        day = today.strftime("%Y-%m-%d")
+        if day == self.day:
+            return
+        self.day = day
+        if day not in self.daily:
+            self.daily[day] = DailyPnL(date=day, unrealized_pnl=self.unrealized)
+
+        week_start = (today - timedelta(days=today.weekday())).strftime("%Y-%m-%d")
+        if week_start != self.week_start:
+            self.week_start = week_start
+            self.weekly_realized = sum(
+                d.realized_pnl for k, d in self.daily.items() if k >= week_start
+            )
+
+        cutoff = (today - timedelta(days=self.KEEP_DAYS)).strftime("%Y-%m-%d")
+        for old in [k for k in self.daily if k < cutoff]:
+            del self.daily[old]
+
+    def record_trade(self, pnl: float, pnl_pct: float) -> None:
+        """청산 거래 1건 반영 (O(1))"""
+        self.record_realized(pnl)
+        self.add_kelly_sample(pnl_pct)
+
+    def record_realized(self, pnl: float) -> None:
+        """일/주 실현 손익만 반영 (Kelly 통계는 add_kelly_sample)"""
+        daily = self.today
+        daily.realized_pnl += pnl
+        daily.trade_count += 1
+        self.weekly_realized += pnl
+
+    def add_kelly_sample(self, pnl_pct: float) -> None:
+        if pnl_pct > 0:
+            self.wins += 1
+            self.win_sum += pnl_pct
+        else:
+            self.losses += 1
+            self.loss_sum += pnl_pct
+
+    def kelly(self, fraction: float) -> Optional[float]:
+        """
+        Fractional Kelly 비율 (0 ~ 0.25)
+
+        Returns:
+            None: 승/패 중 한쪽이 없거나 평균 손실이 0 (기본 비율 사용)
+        """
+        if not self.wins or not self.losses:
+            return None
+        avg_win = self.win_sum / self.wins
+        avg_loss = abs(self.loss_sum / self.losses)
+        if avg_loss == 0:
+            return None
+        b = avg_win / avg_loss
+        p = self.wins / self.trade_count
+        kelly = (b * p - (1 - p)) / b
+        return max(0.0, min(kelly * fraction, 0.25))
+
+    # ─────────────────────────────────────────────────────────────────
+    # 포지션 / 시세
+    # ─────────────────────────────────────────────────────────────────
+
+    def _apply(self, pos: List[float], sign: int) -> None:
+        qty, avg, last = pos
+        self.unrealized += sign * qty * (last - avg)
+        self.gross_exposure += sign * abs(qty * last)
+
+    def update_position(
+        self, symbol: str, qty: float, avg_price: float, last_price: Optional[float] = None
+    ) -> None:
+        """종목 포지션 설정 (qty=0이면 제거)"""
+        old = self.positions.pop(symbol, None)
+        if old:
+            self._apply(old, -1)
+            last_price = last_price or old[2]
+        if qty:
+            pos = [qty, avg_price, last_price or avg_price]
+            self.positions[symbol] = pos
+            self._apply(pos, 1)
+        self.today.unrealized_pnl = self.unrealized
+
+    def mark(self, symbol: str, price: float) -> None:
+        """시세 반영 (보유 종목만, O(1))"""
+        pos = self.positions.get(symbol)
+        if pos is None or price <= 0:
+            return
+        qty, _, last = pos
+        self.unrealized += qty * (price - last)
+        self.gross_exposure += abs(qty * price) - abs(qty * last)
+        pos[2] = price
+        if self.day in self.daily:
+            self.daily[self.day].unrealized_pnl = self.unrealized
+
+    def exposure(self, symbol: str) -> float:
+        """종목 노출 (|수량 × 최근가|)"""
+        pos = self.positions.get(symbol)
+        return abs(pos[0] * pos[2]) if pos else 0.0
+
+    # ─────────────────────────────────────────────────────────────────
+    # 스냅샷
+    # ─────────────────────────────────────────────────────────────────
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "daily": {k: asdict(v) for k, v in self.daily.items()},
+            "week_start": self.week_start,
+            "weekly_realized": self.weekly_realized,
+            "kelly": [self.wins, self.win_sum, self.losses, self.loss_sum],
+            "positions": self.positions,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RiskLedger":
+        ledger = cls()
+        ledger.daily = {k: DailyPnL(**v) for k, v in data.get("daily", {}).items()}
+        ledger.week_start = data.get("week_start")
+        ledger.weekly_realized = data.get("weekly_realized", 0.0)
+        ledger.wins, ledger.win_sum, ledger.losses, ledger.loss_sum = data.get(
+            "kelly", [0, 0.0, 0, 0.0]
+        )
+        for symbol, (qty, avg, last) in data.get("positions", {}).items():
+            ledger.positions[symbol] = [qty, avg, last]
+            ledger._apply(ledger.positions[symbol], 1)
+        # 스냅샷 포지션은 마지막 거래 시점 기준 → 브로커 갱신이 올 때까지 신뢰하지 않음
+        ledger.positions_known = False
+        return ledger
+
+
+class TradeHistory(list):
+    """
+    거래 기록 목록 (추가 시 Kelly 통계를 장부에 바로 반영)
+
+    ELI5: 기록장에 한 줄 적는 순간 계산기에도 같이 더해지므로,
+          나중에 기록장과 계산기를 맞춰 볼 필요가 없습니다.
+    """
+
+    def __init__(self, ledger: RiskLedger):
+        super().__init__()
+        self._ledger = ledger
+
+    def append(self, trade: Dict[str, Any]) -> None:
+        super().append(trade)
+        self._ledger.add_kelly_sample(trade["pnl_pct"])
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # RiskManager 클래스
 # ═══════════════════════════════════════════════════════════════════════════
@@ -85,6 +284,7 @@ class RiskManager:
         self,
         connector=None,
         config: Optional[RiskConfig] = None,
+        snapshot_path: Optional[str] = None,
     ):
         """
         RiskManager 초기화
@@ -92,19 +292,22 @@ class RiskManager:
         Args:
             connector: IBKRConnector 인스턴스 (None이면 Mock 모드)
             config: RiskConfig 설정 (None이면 기본값)
+            snapshot_path: 리스크 장부 JSON 스냅샷 경로 (있으면 시작 시 복원)
         """
         self.connector = connector
         self.config = config or RiskConfig()
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
 
         # ─────────────────────────────────────────────────────────────────
         # 상태 추적
         # ─────────────────────────────────────────────────────────────────
 
-        # 일일 손익
-        self._daily_pnl: Dict[str, DailyPnL] = {}
+        # [user-035] 증분 리스크 장부 (일일 손익 dict는 장부와 공유)
+        self._ledger = RiskLedger()
+        self._daily_pnl: Dict[str, DailyPnL] = self._ledger.daily
 
-        # 거래 기록 (Kelly 계산용)
-        self._trade_history: List[Dict[str, Any]] = []
+        # 거래 기록 (추가 즉시 장부 Kelly 통계에 반영)
+        self._trade_history: List[Dict[str, Any]] = TradeHistory(self._ledger)
 
         # Kill Switch 상태
         self._is_killed: bool = False
@@ -118,6 +321,9 @@ class RiskManager:
         self._starting_balance: float = 0.0
         self._current_balance: float = 0.0
 
+        if self.snapshot_path and self.snapshot_path.exists():
+            self.load_snapshot()
+
         logger.debug("⚖️ RiskManager 초기화 완료")
 
     # ═══════════════════════════════════════════════════════════════════
@@ -179,7 +385,7 @@ class RiskManager:
 
         if (
             self.config.use_kelly
-            and len(self._trade_history) >= self.config.kelly_min_trades
+            and self._ledger.trade_count >= self.config.kelly_min_trades
         ):
             # Kelly Criterion
             position_pct = self._calculate_kelly_fraction()
@@ -215,37 +421,18 @@ class RiskManager:
 
         Returns:
             float: Kelly 비율 (0.0 ~ 0.25)
-        """
-        if len(self._trade_history) < self.config.kelly_min_trades:
-            return self.config.max_position_pct / 100.0
-
-        # 승/패 분리
-        wins = [t["pnl_pct"] for t in self._trade_history if t["pnl_pct"] > 0]
-        losses = [t["pnl_pct"] for t in self._trade_history if t["pnl_pct"] <= 0]
 
-        if not wins or not losses:
+        Note:
+            [user-035] 승/패 횟수와 합을 장부에 누적해 O(1)로 계산
+            (Fractional Kelly: kelly_fraction 배, 0 ~ 25% 제한)
+        """
+        if self._ledger.trade_count < self.config.kelly_min_trades:
             return self.config.max_position_pct / 100.0
 
-        # 통계 계산
-        win_rate = len(wins) / len(self._trade_history)
-        avg_win = sum(wins) / len(wins)
-        avg_loss = abs(sum(losses) / len(losses))
-
-        if avg_loss == 0:
+        kelly = self._ledger.kelly(self.config.kelly_fraction)
+        if kelly is None:
             return self.config.max_position_pct / 100.0
-
-        # Kelly 공식
-        b = avg_win / avg_loss
-        p = win_rate
-        q = 1 - p
-
-        kelly = (b * p - q) / b
-
-        # Fractional Kelly (1/4 Kelly 권장)
-        adjusted_kelly = kelly * self.config.kelly_fraction
-
-        # 범위 제한 (0 ~ 25%)
-        return max(0.0, min(adjusted_kelly, 0.25))
+        return kelly
 
     # ═══════════════════════════════════════════════════════════════════
     # 손실 한도 체크
@@ -304,22 +491,10 @@ class RiskManager:
         return limit_reached
 
     def _calculate_weekly_pnl(self) -> float:
-        """이번 주 손익률 계산"""
-        # 이번 주 월요일부터의 거래 집계
-        today = date.today()
-        monday = today - timedelta(days=today.weekday())
-
-        weekly_pnl = 0.0
-        for date_str, daily in self._daily_pnl.items():
-            try:
-                d = datetime.strptime(date_str, "%Y-%m-%d").date()
-                if d >= monday:
-                    weekly_pnl += daily.realized_pnl
-            except Exception:
-                pass
-
+        """이번 주 손익률 계산 (장부의 주간 실현 손익 누계, O(1))"""
+        self._ledger._roll(date.today())
         if self._starting_balance > 0:
-            return (weekly_pnl / self._starting_balance) * 100
+            return (self._ledger.weekly_realized / self._starting_balance) * 100
         return 0.0
 
     # ═══════════════════════════════════════════════════════════════════
@@ -354,18 +529,22 @@ class RiskManager:
             return False
 
         # 4. 일일 거래 횟수 체크
-        today = date.today().strftime("%Y-%m-%d")
-        if today in self._daily_pnl:
-            if self._daily_pnl[today].trade_count >= self.config.max_daily_trades:
-                logger.debug(
-                    f"🚫 거래 불가: 일일 거래 한도 ({self.config.max_daily_trades}회)"
-                )
-                return False
+        if self._ledger.today.trade_count >= self.config.max_daily_trades:
+            logger.debug(
+                f"🚫 거래 불가: 일일 거래 한도 ({self.config.max_daily_trades}회)"
+            )
+            return False
 
         return True
 
     def get_position_count(self) -> int:
-        """현재 포지션 수 조회"""
+        """
+        현재 포지션 수 조회
+
+        장부에 포지션이 들어와 있으면(on_positions_update) 브로커 왕복 없이 반환.
+        """
+        if self._ledger.positions_known:
+            return len(self._ledger.positions)
         if not self.connector:
             return 0
 
@@ -496,16 +675,10 @@ class RiskManager:
             pnl: 손익 (USD)
             pnl_pct: 손익률 (%)
         """
-        today = date.today().strftime("%Y-%m-%d")
-
-        # 일일 손익 업데이트
-        if today not in self._daily_pnl:
-            self._daily_pnl[today] = DailyPnL(date=today)
+        # 일/주 손익 (증분)
+        self._ledger.record_realized(pnl)
 
-        self._daily_pnl[today].realized_pnl += pnl
-        self._daily_pnl[today].trade_count += 1
-
-        # 거래 히스토리 추가 (Kelly 계산용)
+        # 거래 히스토리 추가 (Kelly 통계는 TradeHistory가 반영)
         self._trade_history.append(
             {
                 "timestamp": datetime.now().isoformat(),
@@ -517,6 +690,119 @@ class RiskManager:
 
         logger.debug(f"📝 거래 기록: {symbol} P&L {pnl_pct:+.2f}%")
 
+        if self.snapshot_path:
+            self.save_snapshot()
+
+    # ═══════════════════════════════════════════════════════════════════
+    # [user-035] 포지션 / 시세 반영
+    # ═══════════════════════════════════════════════════════════════════
+
+    def on_positions_update(self, positions: list) -> None:
+        """
+        브로커 포지션 목록 반영 (IBKRConnector positions callback 형식)
+
+        OrderManager.add_positions_listener()로 등록되어 브로커 갱신마다 호출됩니다.
+        첫 갱신 이후부터 get_position_count()가 브로커 왕복 없이 장부를 사용합니다.
+
+        Args:
+            positions: [{"symbol", "qty", "avg_price"}, ...] (전체 보유 목록)
+        """
+        current = {
+            p.get("symbol"): p for p in positions if p.get("symbol") and p.get("qty", 0)
+        }
+        for symbol in list(self._ledger.positions):
+            if symbol not in current:
+                self._ledger.update_position(symbol, 0, 0.0)
+        for symbol, pos in current.items():
+            self._ledger.update_position(symbol, pos.get("qty", 0), pos.get("avg_price", 0.0))
+        self._ledger.positions_known = True
+
+    def on_tick(self, tick: dict) -> None:
+        """TickDispatcher 콜백 - 보유 종목 미실현 손익 갱신"""
+        if tick.get("type") == "bar":
+            return
+        price = tick.get("price")
+        if price:
+            self._ledger.mark(tick.get("ticker", ""), float(price))
+
+    def attach(self, dispatcher) -> None:
+        """TickDispatcher 구독"""
+        dispatcher.register("risk_manager", self.on_tick)
+
+    def get_exposure(self) -> Dict[str, Any]:
+        """
+        노출 / 미실현 손익 조회
+
+        Returns:
+            dict: {gross_exposure, unrealized_pnl, by_symbol: {symbol: exposure}}
+        """
+        return {
+            "gross_exposure": self._ledger.gross_exposure,
+            "unrealized_pnl": self._ledger.unrealized,
+            "by_symbol": {s: self._ledger.exposure(s) for s in self._ledger.positions},
+        }
+
+    # ═══════════════════════════════════════════════════════════════════
+    # [user-035] 스냅샷
+    # ═══════════════════════════════════════════════════════════════════
+
+    def save_snapshot(self, path: Optional[str] = None) -> None:
+        """
+        리스크 장부 + Kill Switch 상태를 JSON으로 저장 (tmp 파일 → 원자적 교체)
+
+        Args:
+            path: 저장 경로 (None이면 snapshot_path)
+        """
+        target = Path(path) if path else self.snapshot_path
+        if target is None:
+            return
+        data = {
+            "saved_at": datetime.now().isoformat(),
+            "ledger": self._ledger.to_dict(),
+            "is_killed": self._is_killed,
+            "kill_reason": self._kill_reason,
+            "starting_balance": self._starting_balance,
+        }
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix(target.suffix + ".tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp, target)
+
+    def load_snapshot(self, path: Optional[str] = None) -> bool:
+        """
+        JSON 스냅샷에서 장부 복원
+
+        Kill Switch가 발동된 채 종료되었다면 그 상태도 유지합니다 (보수적 복원).
+        같은 날 저장된 스냅샷이면 시작 잔고도 복원합니다.
+
+        Returns:
+            bool: 복원 성공 여부
+        """
+        source = Path(path) if path else self.snapshot_path
+        try:
+            data = json.loads(source.read_text(encoding="utf-8"))
+            self._ledger = RiskLedger.from_dict(data["ledger"])
+        except Exception as e:
+            logger.warning(f"⚠️ 리스크 스냅샷 복원 실패: {e}")
+            return False
+
+        self._daily_pnl = self._ledger.daily
+        # 거래 기록도 새 장부에 연결 (이전 장부를 가리키면 Kelly 통계가 멈춤)
+        self._trade_history = TradeHistory(self._ledger)
+        # 같은 날 재시작이면 시작 잔고 유지 (일일 손실 한도 기준점)
+        if str(data.get("saved_at", ""))[:10] == date.today().strftime("%Y-%m-%d"):
+            self._starting_balance = data.get("starting_balance", 0.0)
+            self._current_balance = self._starting_balance
+        if data.get("is_killed"):
+            self._is_killed = True
+            self._trading_enabled = False
+            self._kill_reason = data.get("kill_reason")
+        logger.info(
+            f"♻️ 리스크 스냅샷 복원: 거래 {self._ledger.trade_count}건, "
+            f"포지션 {len(self._ledger.positions)}개"
+        )
+        return True
+
     # ═══════════════════════════════════════════════════════════════════
     # 상태 조회
     # ═══════════════════════════════════════════════════════════════════
@@ -536,6 +822,9 @@ class RiskManager:
             "current_balance": self._current_balance,
             "daily_pnl_pct": self.get_daily_pnl_pct(),
             "daily_limit_pct": self.config.daily_loss_limit_pct,
+            "weekly_pnl_pct": self._calculate_weekly_pnl(),
+            "unrealized_pnl": self._ledger.unrealized,
+            "gross_exposure": self._ledger.gross_exposure,
             "position_count": self.get_position_count(),
             "max_positions": self.config.max_positions,
             "config": self.config.to_dict(),
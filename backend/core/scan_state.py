@@ -0,0 +1,412 @@
+# ============================================================================
+# Scan State - 증분 Daily Scan용 종목별 롤링 집계 (user-047)
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - 종목별 스캔 윈도우(최근 N 거래일 일봉)와 롤링 집계
+#     (거래량 합, True Range 합, OBV 증분 합)를 유지
+#   - 새 거래일이 추가되면 윈도우에서 가장 오래된 봉을 빼고 새 봉을 더해
+#     집계를 O(1)로 갱신
+#   - 집계만으로 V2 점수를 미리 계산해, 50점 관문을 넘을 수 있는 종목만
+#     전략(SeismographStrategy)으로 재계산
+#   - 마지막 스캔 결과와 함께 Parquet으로 저장 → 다음 스캔에서 재사용
+#
+# 📖 사용 예시:
+#   >>> store = ScanStateStore("data/parquet/scan_state/daily_scan.parquet")
+#   >>> store.load()
+#   >>> if store.can_advance(20, params, window_dates):
+#   ...     changed = store.apply(window_dates, bars_since_last_date)
+#   >>> store.save()
+#
+# 📂 저장 구조:
+#   data/parquet/scan_state/daily_scan.parquet
+#     - 종목당 1행: 윈도우 봉(list 컬럼), 롤링 집계, 마지막 결과(JSON)
+#     - 스키마 메타데이터: lookback, 윈도우 거래일, 전략 파라미터
+# ============================================================================
+
+import json
+from collections import deque
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from loguru import logger
+
+from backend.strategies.seismograph.scoring.v2 import SCORE_WEIGHTS
+
+
+DEFAULT_STATE_PATH = "data/parquet/scan_state/daily_scan.parquet"
+META_KEY = b"sigma9.scan_state"
+STATE_VERSION = 1
+
+BAR_FIELDS = ("open", "high", "low", "close", "volume")
+
+# V2 시그널 윈도우 (signals/base.get_column 기본값) - 집계 사전 점수는 이 길이에서만 유효
+SIGNAL_WINDOW = 20
+
+# Watchlist 관문 (_calculate_score: score > 50)
+SCORE_GATE = 50.0
+
+# 사전 점수 여유 (롤링 합 부동소수 오차로 강도 반올림이 한 칸 바뀌어도 놓치지 않도록)
+PRESCREEN_MARGIN = 2.0
+
+
+def _bar(record: dict) -> tuple:
+    """일봉 dict → (date, open, high, low, close, volume)"""
+    return (str(record["date"]),) + tuple(float(record.get(f, 0) or 0) for f in BAR_FIELDS)
+
+
+def _true_range(prev: tuple, cur: tuple) -> float:
+    _, _, high, low, _, _ = cur
+    prev_close = prev[4]
+    return max(high - low, abs(high - prev_close), abs(low - prev_close))
+
+
+def _signed_volume(prev: tuple, cur: tuple) -> float:
+    """OBV 증분 (종가 상승 +volume / 하락 -volume / 보합 0)"""
+    if cur[4] > prev[4]:
+        return cur[5]
+    if cur[4] < prev[4]:
+        return -cur[5]
+    return 0.0
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 종목별 롤링 윈도우
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class RollingWindow:
+    """
+    종목 하나의 스캔 윈도우 + 롤링 집계
+
+    ELI5: 20칸짜리 컨베이어 벨트. 새 봉이 들어오면 맨 앞 봉이 빠지고,
+          합계는 들어온 값만 더하고 나간 값만 빼서 갱신합니다.
+
+    Attributes:
+        bars: (date, open, high, low, close, volume) 튜플 deque (오래된 순)
+        vol_sum: 윈도우 거래량 합
+        tr_sum: 윈도우 내 연속 봉 True Range 합 (n-1개)
+        obv_sum: 윈도우 내 OBV 증분 합 (= OBV[-1] - OBV[0])
+        result: 마지막 _calculate_score() 결과 (관문 미달이면 None)
+    """
+
+    __slots__ = ("bars", "vol_sum", "tr_sum", "obv_sum", "result")
+
+    def __init__(self):
+        self.bars: deque = deque()
+        self.vol_sum = 0.0
+        self.tr_sum = 0.0
+        self.obv_sum = 0.0
+        self.result: Optional[dict] = None
+
+    def __len__(self) -> int:
+        return len(self.bars)
+
+    @property
+    def last_date(self) -> Optional[str]:
+        return self.bars[-1][0] if self.bars else None
+
+    def append(self, bar: tuple) -> None:
+        if self.bars:
+            prev = self.bars[-1]
+            self.tr_sum += _true_range(prev, bar)
+            self.obv_sum += _signed_volume(prev, bar)
+        self.bars.append(bar)
+        self.vol_sum += bar[5]
+
+    def pop_last(self) -> None:
+        last = self.bars.pop()
+        self.vol_sum -= last[5]
+        if self.bars:
+            prev = self.bars[-1]
+            self.tr_sum -= _true_range(prev, last)
+            self.obv_sum -= _signed_volume(prev, last)
+        else:
+            self._reset_sums()
+
+    def evict_before(self, start_date: str) -> bool:
+        """start_date 이전 봉 제거. 제거했으면 True"""
+        evicted = False
+        while self.bars and self.bars[0][0] < start_date:
+            old = self.bars.popleft()
+            self.vol_sum -= old[5]
+            if self.bars:
+                self.tr_sum -= _true_range(old, self.bars[0])
+                self.obv_sum -= _signed_volume(old, self.bars[0])
+            evicted = True
+        if not self.bars:
+            self._reset_sums()
+        return evicted
+
+    def upsert(self, bar: tuple) -> bool:
+        """
+        새 봉 반영 (마지막 날짜와 같으면 교체, 이후면 추가, 이전이면 무시)
+
+        Returns:
+            bool: 윈도우가 바뀌었으면 True
+        """
+        last = self.last_date
+        if last is not None and bar[0] < last:
+            return False
+        if last == bar[0]:
+            if self.bars[-1] == bar:
+                return False
+            self.pop_last()
+        self.append(bar)
+        return True
+
+    def _reset_sums(self) -> None:
+        self.vol_sum = self.tr_sum = self.obv_sum = 0.0
+
+    def records(self) -> list[dict]:
+        """전략 입력 형식 (read_daily_bulk 레코드와 같은 키)"""
+        return [
+            {"date": b[0], "open": b[1], "high": b[2], "low": b[3], "close": b[4], "volume": b[5]}
+            for b in self.bars
+        ]
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # V2 사전 점수 (집계 기반)
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def v2_score(self, dryout_threshold: float = 0.4) -> float:
+        """
+        롤링 집계로 계산한 V2 점수 (calculate_score_v2 + signals V2와 같은 공식)
+
+        📌 윈도우가 SIGNAL_WINDOW(20)봉 이하이고 obv_lookback == 20일 때 유효
+        """
+        n = len(self.bars)
+        if n < 5:
+            return 0.0
+
+        bars = self.bars
+        volumes = [bars[-3][5], bars[-2][5], bars[-1][5]]
+        first_close, last = bars[0][4], bars[-1]
+
+        # Tight Range: ATR_5 / ATR_19 (20봉 미만이면 0)
+        tight = 0.0
+        if n >= SIGNAL_WINDOW and self.tr_sum > 0:
+            recent = [bars[i] for i in range(n - 6, n)]
+            atr_5 = sum(_true_range(recent[i], recent[i + 1]) for i in range(5)) / 5
+            ratio = atr_5 / (self.tr_sum / (n - 1))
+            tight = round(max(0.0, min(1.0, (0.7 - ratio) / 0.4)), 2)
+
+        # OBV Divergence
+        obv = 0.0
+        if first_close != 0:
+            price_change = (last[4] - first_close) / first_close
+            total = self.vol_sum if self.vol_sum > 0 else 1
+            obv_ratio = self.obv_sum / total
+            if price_change <= 0.02 and obv_ratio > 0:
+                obv = round(min(1.0, abs(price_change) * 10 + obv_ratio * 5), 2)
+
+        # Accumulation Bar
+        accum = 0.0
+        if last[1] != 0 and abs(last[4] - last[1]) / last[1] <= 0.025:
+            avg_prev = (self.vol_sum - last[5]) / (n - 1)
+            if avg_prev > 0:
+                accum = round(max(0.0, min(1.0, (last[5] / avg_prev - 2) / 3)), 2)
+
+        # Volume Dry-out
+        dryout = 0.0
+        avg_all = self.vol_sum / n
+        if avg_all > 0:
+            ratio = (sum(volumes) / 3) / avg_all
+            if ratio < dryout_threshold:
+                dryout = round(1.0 - ratio / dryout_threshold, 2)
+
+        intensities = {
+            "tight_range": tight,
+            "obv_divergence": obv,
+            "accumulation_bar": accum,
+            "volume_dryout": dryout,
+        }
+        return round(sum(intensities[k] * w for k, w in SCORE_WEIGHTS.items()) * 100, 1)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 저장소
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class ScanStateStore:
+    """
+    종목별 RollingWindow 모음 + Parquet 영속화
+
+    Attributes:
+        path: 상태 Parquet 경로
+        windows: {ticker: RollingWindow}
+        window_dates: 마지막 스캔의 윈도우 거래일 (오름차순)
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_STATE_PATH):
+        self.path = Path(path)
+        self.windows: dict[str, RollingWindow] = {}
+        self.window_dates: list[str] = []
+        self.lookback: Optional[int] = None
+        self.params: dict = {}
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # 상태 판정
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def can_advance(self, lookback: int, params: dict, window_dates: list[str]) -> bool:
+        """
+        저장된 상태에서 증분 갱신이 가능한지
+
+        - lookback / 전략 파라미터 동일
+        - 새 윈도우가 이전 윈도우의 마지막 거래일을 포함하고,
+          그 이전 구간에 새로 생긴 거래일이 없음 (과거 백필 없음)
+        """
+        if not self.window_dates or self.lookback != lookback or self.params != params:
+            return False
+        last = self.window_dates[-1]
+        if last not in window_dates:
+            return False
+        known = set(self.window_dates)
+        return all(d in known for d in window_dates if d <= last)
+
+    def retain(self, tickers: Iterable[str]) -> None:
+        """tickers에 없는 종목 상태 제거 (후보에서 빠진 동안 봉을 못 받으므로)"""
+        keep = set(tickers)
+        self.windows = {t: w for t, w in self.windows.items() if t in keep}
+
+    def reset(self, lookback: int, params: dict) -> None:
+        self.windows = {}
+        self.window_dates = []
+        self.lookback = lookback
+        self.params = dict(params)
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # 갱신
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def apply(self, window_dates: list[str], bars_by_ticker: dict[str, list[dict]]) -> set[str]:
+        """
+        새 윈도우 거래일 + 추가/수정된 봉 반영 (종목당 O(추가 봉 수))
+
+        Args:
+            window_dates: 새 윈도우 거래일 (오름차순)
+            bars_by_ticker: {ticker: 일봉 레코드} - 이전 마지막 거래일 이후 봉
+
+        Returns:
+            set[str]: 윈도우가 바뀐 종목
+        """
+        changed: set[str] = set()
+        start = window_dates[0] if window_dates else ""
+
+        if not self.window_dates or self.window_dates[0] != start:
+            for ticker, window in self.windows.items():
+                if window.evict_before(start):
+                    changed.add(ticker)
+
+        in_window = set(window_dates)
+        for ticker, records in bars_by_ticker.items():
+            window = self.windows.get(ticker)
+            if window is None:
+                window = self.windows[ticker] = RollingWindow()
+            for record in records:
+                bar = _bar(record)
+                if bar[0] in in_window and window.upsert(bar):
+                    changed.add(ticker)
+
+        for ticker in [t for t, w in self.windows.items() if not w.bars]:
+            del self.windows[ticker]
+            changed.discard(ticker)
+
+        self.window_dates = list(window_dates)
+        return changed
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # 저장 / 로드
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def save(self) -> None:
+        tickers = sorted(self.windows)
+        windows = [self.windows[t] for t in tickers]
+        columns = {
+            "ticker": tickers,
+            "dates": [[b[0] for b in w.bars] for w in windows],
+            "vol_sum": [w.vol_sum for w in windows],
+            "tr_sum": [w.tr_sum for w in windows],
+            "obv_sum": [w.obv_sum for w in windows],
+            "result": [
+                json.dumps(w.result, default=_json_default) if w.result is not None else None
+                for w in windows
+            ],
+        }
+        for i, field in enumerate(BAR_FIELDS, start=1):
+            columns[field] = [[b[i] for b in w.bars] for w in windows]
+
+        meta = {
+            "version": STATE_VERSION,
+            "lookback": self.lookback,
+            "window_dates": self.window_dates,
+            "params": self.params,
+        }
+        table = pa.table(columns).replace_schema_metadata({META_KEY: json.dumps(meta).encode()})
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        pq.write_table(table, tmp, compression="snappy")
+        tmp.replace(self.path)
+        logger.debug(f"💾 Scan state saved: {len(tickers):,} tickers → {self.path}")
+
+    def load(self) -> bool:
+        """
+        저장된 상태 로드
+
+        Returns:
+            bool: 유효한 상태를 읽었으면 True
+        """
+        if not self.path.exists():
+            return False
+        try:
+            table = pq.read_table(self.path)
+            meta = json.loads((table.schema.metadata or {})[META_KEY])
+        except Exception as e:
+            logger.warning(f"⚠️ Scan state 로드 실패 (재구축): {e}")
+            return False
+        if meta.get("version") != STATE_VERSION:
+            return False
+
+        data = table.to_pydict()
+        windows = {}
+        for i, ticker in enumerate(data["ticker"]):
+            window = RollingWindow()
+            fields = [data[f][i] for f in BAR_FIELDS]
+            window.bars = deque(zip(data["dates"][i], *fields))
+            window.vol_sum = data["vol_sum"][i]
+            window.tr_sum = data["tr_sum"][i]
+            window.obv_sum = data["obv_sum"][i]
+            raw = data["result"][i]
+            window.result = json.loads(raw) if raw is not None else None
+            windows[ticker] = window
+
+        self.windows = windows
+        self.window_dates = list(meta["window_dates"])
+        self.lookback = meta["lookback"]
+        self.params = meta["params"]
+        return True
+
+    def tickers(self, candidates: Iterable[str]) -> list[str]:
+        """candidates 중 상태가 있는 종목 (정렬)"""
+        return sorted(t for t in candidates if t in self.windows)
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"not JSON serializable: {type(value)}")
+
+
+__all__ = [
+    "RollingWindow",
+    "ScanStateStore",
+    "DEFAULT_STATE_PATH",
+    "SCORE_GATE",
+    "PRESCREEN_MARGIN",
+    "SIGNAL_WINDOW",
+]
@@ -17,13 +17,33 @@
 #   >>> watchlist = await scanner.run_daily_scan()
 #   >>> print(f"Watchlist: {len(watchlist)}개 종목")
 #
+#   # [user-047] 증분 스캔 (어제 롤링 집계 재사용, 바뀐 종목만 재계산)
+#   >>> watchlist = await scanner.run_daily_scan(incremental=True)
+#
+#   # [user-049] ML 확률 첨부 (후보 전체 predict 1회 → 각 항목 ml_prob)
+#   >>> scanner = Scanner(data_repository, gainer_model=container.gainer_model())
+#
 # 📌 [11-002] DataRepository 마이그레이션 완료
 # ============================================================================
 
+import os
+import time
+from pathlib import Path
 from typing import TYPE_CHECKING
+
+import numpy as np
 from loguru import logger
 
 from backend.strategies.seismograph import SeismographStrategy
+from backend.core.scan_state import (
+    DEFAULT_STATE_PATH,
+    PRESCREEN_MARGIN,
+    SCORE_GATE,
+    SIGNAL_WINDOW,
+    ScanStateStore,
+)
+from backend.core.gainer_model import GainerModel
+from backend.core.scoring_pool import ScoringPool
 from backend.core.ticker_filter import TickerFilter, get_ticker_filter
 
 if TYPE_CHECKING:
@@ -34,6 +54,22 @@ if TYPE_CHECKING:
 # [12-002] 모듈 레벨 스코어 계산 함수 (ProcessPoolExecutor pickle 호환성)
 # ═══════════════════════════════════════════════════════════════════════════
 
+# [user-047] 워커 프로세스당 전략 인스턴스 1개 (종목마다 새로 만들지 않음)
+_worker_strategy: SeismographStrategy | None = None
+
+
+def _get_worker_strategy() -> SeismographStrategy:
+    global _worker_strategy
+    if _worker_strategy is None:
+        _worker_strategy = SeismographStrategy()
+    return _worker_strategy
+
+
+def _init_scoring_worker() -> None:
+    """[user-048] ScoringPool 워커 initializer - 전략을 워커 시작 시 1회 생성"""
+    _get_worker_strategy()
+
+
 
 def _calculate_score(item: tuple) -> dict | None:
     """
@@ -51,11 +87,11 @@ def _calculate_score(item: tuple) -> dict | None:
     """
     ticker, data = item
     try:
-        # SeismographStrategy 인스턴스 생성 (각 워커에서)
-        strategy = SeismographStrategy()
+        # [user-047] 워커별로 재사용 (설정만 들고 있는 무상태 객체)
+        strategy = _get_worker_strategy()
         result = strategy.calculate_watchlist_score_detailed(ticker, data)
 
-        if result["score"] > 50:
+        if result["score"] > SCORE_GATE:
             last_close = data[-1]["close"] if data else 0
             prev_close = data[-2]["close"] if len(data) >= 2 else last_close
             change_pct = (
@@ -118,6 +154,9 @@ class Scanner:
         data_repository: "DataRepository",
         watchlist_size: int = 50,
         ticker_filter: TickerFilter | None = None,
+        state_path: str | Path = DEFAULT_STATE_PATH,
+        scoring_pool: ScoringPool | None = None,
+        gainer_model: GainerModel | None = None,
     ):
         """
         Scanner 초기화
@@ -126,6 +165,9 @@ class Scanner:
             data_repository: DataRepository 인스턴스
             watchlist_size: Watchlist에 포함할 종목 수
             ticker_filter: TickerFilter 인스턴스 (None이면 기본값)
+            state_path: [user-047] 증분 스캔 상태 파일 경로
+            scoring_pool: [user-048] 재사용 워커 풀 (None이면 스캔마다 임시 풀)
+            gainer_model: [user-049] Daygainer 분류기 (None이면 ML 단계 생략)
         """
         # [11-002] DataRepository 사용
         self.repo = data_repository
@@ -135,6 +177,15 @@ class Scanner:
         # SeismographStrategy 인스턴스 생성
         self.strategy = SeismographStrategy()
 
+        # [user-047] 증분 스캔 상태 (run_daily_scan(incremental=True)에서 사용)
+        self.state = ScanStateStore(state_path)
+
+        # [user-048] Container 소유 워커 풀 (스캔 간 유지)
+        self.scoring_pool = scoring_pool
+
+        # [user-049] ML 서빙 단계 (Container 소유, 부스터 1회 로드)
+        self.gainer_model = gainer_model
+
         logger.debug(f"🔍 Scanner 초기화 (Watchlist Size: {watchlist_size})")
 
     # ═══════════════════════════════════════════════════════════════════════
@@ -147,6 +198,7 @@ class Scanner:
         max_price: float = 20.0,
         min_volume: int = 100_000,
         lookback_days: int = 20,
+        incremental: bool = False,
     ) -> list[dict]:
         """
         일일 스캔 실행 - Watchlist 생성
@@ -165,12 +217,12 @@ class Scanner:
             max_price: 최대 종가 (기본값: $20.00)
             min_volume: 최소 평균 거래량 (기본값: 100K)
             lookback_days: 데이터 조회 기간 (기본값: 20일)
+            incremental: [user-047] True면 저장된 롤링 집계를 갱신해
+                         바뀐 종목만 재계산 (결과는 전체 스캔과 동일)
 
         Returns:
             list[dict]: Watchlist (점수 내림차순 정렬)
         """
-        import time
-
         start_time = time.time()
 
         logger.info("🔍 Daily Scan 시작 [12-002 벌크 로드 최적화]...")
@@ -191,54 +243,12 @@ class Scanner:
         logger.info(f"📊 스캔 대상: {len(candidates):,}개 종목")
 
         # ─────────────────────────────────────────────────────────────────
-        # 2. [12-002] 벌크 로드 (파일 1회 읽기)
-        # ELI5: 10,000개 티커를 조회해도 파일 읽기는 1번만 수행
-        # ─────────────────────────────────────────────────────────────────
-        bulk_start = time.time()
-        all_data = self.repo.get_daily_bars_bulk(tickers=candidates, days=lookback_days)
-        bulk_elapsed = time.time() - bulk_start
-        logger.info(
-            f"📦 벌크 로드 완료: {len(all_data):,}개 티커 ({bulk_elapsed:.2f}초)"
-        )
-
-        # ─────────────────────────────────────────────────────────────────
-        # 3. [12-002] 병렬 스코어링
-        # ELI5: CPU 여러 개를 동시에 사용해서 계산 속도를 높입니다
+        # 2~3. 데이터 로드 + 스코어링 (전체 / [user-047] 증분)
         # ─────────────────────────────────────────────────────────────────
-        import os
-        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
-
-        # AWS Lambda 환경 감지 (Lambda는 ProcessPool 사용 불가)
-        # ELI5: 어떤 서버에서 돌아가는지 보고, 적절한 병렬 처리 방식 선택
-        IS_LAMBDA = "AWS_LAMBDA_FUNCTION_NAME" in os.environ
-
-        # Executor 선택 (Lambda: ThreadPool, 그 외: ProcessPool)
-        Executor = ThreadPoolExecutor if IS_LAMBDA else ProcessPoolExecutor
-        max_workers = 2 if IS_LAMBDA else min(4, os.cpu_count() or 4)
-
-        logger.info(f"⚡ 병렬 처리 시작 ({Executor.__name__}, workers={max_workers})")
-
-        # 스코어 계산 대상 필터링 (최소 5일 데이터)
-        score_items = [
-            (ticker, data) for ticker, data in all_data.items() if len(data) >= 5
-        ]
-        skipped = len(all_data) - len(score_items)
-
-        # 병렬 스코어 계산 실행
-        score_start = time.time()
-        raw_results = []
-
-        with Executor(max_workers=max_workers) as executor:
-            # map()으로 병렬 실행 (모듈 레벨 함수 사용)
-            raw_results = list(executor.map(_calculate_score, score_items))
-
-        # None 제거 (score <= 50 또는 에러)
-        results = [r for r in raw_results if r is not None]
-
-        score_elapsed = time.time() - score_start
-        logger.info(
-            f"⚡ 병렬 스코어링 완료: {len(results):,}개 (50점+ 통과) / {len(score_items):,}개 ({score_elapsed:.2f}초)"
-        )
+        if incremental:
+            results, skipped = self._score_incremental(candidates, lookback_days)
+        else:
+            results, skipped = self._score_full(candidates, lookback_days)
 
         # ─────────────────────────────────────────────────────────────────
         # 4. Post-Score 가격/거래량 필터링 (Hybrid 옵션)
@@ -263,6 +273,12 @@ class Scanner:
         results.sort(key=lambda x: x["score"], reverse=True)
         watchlist = results[: self.watchlist_size]
 
+        # ─────────────────────────────────────────────────────────────────
+        # 6. [user-049] ML 확률 첨부 (후보 전체 배치 추론, 순위는 그대로)
+        # ─────────────────────────────────────────────────────────────────
+        if self.gainer_model is not None:
+            self._attach_ml_probs(watchlist, candidates)
+
         elapsed = time.time() - start_time
         logger.info(
             f"✅ Daily Scan 완료: {len(watchlist)}개 Watchlist ({elapsed:.1f}초, 스킵: {skipped:,})"
@@ -276,6 +292,175 @@ class Scanner:
 
         return watchlist
 
+    # ═══════════════════════════════════════════════════════════════════════
+    # 스코어링 (전체 / 증분)
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def _score_full(self, candidates: list[str], lookback_days: int) -> tuple[list[dict], int]:
+        """
+        전체 스캔: 후보 전 종목 벌크 로드 → 병렬 스코어링
+
+        Returns:
+            (50점 초과 결과 목록, 데이터 부족 스킵 수)
+        """
+        # ─────────────────────────────────────────────────────────────────
+        # [12-002] 벌크 로드 (파일 1회 읽기)
+        # ELI5: 10,000개 티커를 조회해도 파일 읽기는 1번만 수행
+        # ─────────────────────────────────────────────────────────────────
+        bulk_start = time.time()
+        all_data = self.repo.get_daily_bars_bulk(tickers=candidates, days=lookback_days)
+        bulk_elapsed = time.time() - bulk_start
+        logger.info(
+            f"📦 벌크 로드 완료: {len(all_data):,}개 티커 ({bulk_elapsed:.2f}초)"
+        )
+
+        # 스코어 계산 대상 필터링 (최소 5일 데이터)
+        score_items = [
+            (ticker, data) for ticker, data in all_data.items() if len(data) >= 5
+        ]
+        skipped = len(all_data) - len(score_items)
+
+        score_start = time.time()
+        results = [r for r in self._score_parallel(score_items) if r is not None]
+        score_elapsed = time.time() - score_start
+        logger.info(
+            f"⚡ 병렬 스코어링 완료: {len(results):,}개 (50점+ 통과) / {len(score_items):,}개 ({score_elapsed:.2f}초)"
+        )
+        return results, skipped
+
+    def _score_incremental(
+        self, candidates: list[str], lookback_days: int
+    ) -> tuple[list[dict], int]:
+        """
+        [user-047] 증분 스캔
+
+        1. 거래일 목록(date 컬럼만)으로 새 윈도우 계산
+        2. 저장된 상태가 이어지면 이전 마지막 거래일 이후 봉만 로드해 O(1) 갱신
+           (상태가 없거나 끊겼으면 윈도우 전체 로드로 재구축)
+        3. 윈도우가 바뀐 종목만 재계산:
+           - 롤링 집계로 V2 사전 점수 → 관문(50점) - 여유 이하는 전략 호출 생략
+           - 나머지는 _calculate_score()로 계산 (전체 스캔과 같은 결과)
+        4. 바뀌지 않은 종목은 이전 결과 재사용
+
+        Returns:
+            (50점 초과 결과 목록, 데이터 부족 스킵 수)
+        """
+        state = self.state
+        params = {
+            "obv_lookback": self.strategy.config["obv_lookback"]["value"],
+            "dryout_threshold": self.strategy.config["dryout_threshold"]["value"],
+        }
+
+        load_start = time.time()
+        dates = self.repo.get_daily_dates()[-lookback_days:]
+        window_dates = [str(d) for d in dates]
+        if not dates:
+            return [], 0
+
+        if not state.windows and state.path.exists():
+            state.load()
+
+        if state.can_advance(lookback_days, params, window_dates):
+            state.retain(candidates)
+            # 이전 마지막 거래일도 다시 읽어 당일 봉 수정분 반영
+            since = dates[window_dates.index(state.window_dates[-1])]
+            delta = self.repo.get_daily_bars_since(since, tickers=candidates)
+            # 상태에 없는 새 후보는 윈도우 전체 로드
+            missing = [t for t in candidates if t not in state.windows]
+            if missing:
+                delta.update(self.repo.get_daily_bars_since(dates[0], tickers=missing))
+            mode = "증분"
+        else:
+            state.reset(lookback_days, params)
+            delta = self.repo.get_daily_bars_since(dates[0], tickers=candidates)
+            mode = "재구축"
+
+        changed = state.apply(window_dates, delta)
+        load_elapsed = time.time() - load_start
+        logger.info(
+            f"📦 스캔 상태 {mode}: {len(delta):,}개 티커 로드, 변경 {len(changed):,}개 ({load_elapsed:.2f}초)"
+        )
+
+        tickers = state.tickers(candidates)
+        score_items = []
+        prescreened = 0
+        # 집계 사전 점수는 V2 시그널 윈도우(20봉) + obv_lookback 20에서만 정확
+        use_prescreen = lookback_days <= SIGNAL_WINDOW and params["obv_lookback"] == SIGNAL_WINDOW
+        for ticker in tickers:
+            window = state.windows[ticker]
+            if ticker not in changed or len(window) < 5:
+                continue
+            if use_prescreen and window.v2_score(params["dryout_threshold"]) <= SCORE_GATE - PRESCREEN_MARGIN:
+                window.result = None
+                prescreened += 1
+                continue
+            score_items.append((ticker, window.records()))
+
+        score_start = time.time()
+        for (ticker, _), result in zip(score_items, self._score_parallel(score_items)):
+            state.windows[ticker].result = result
+        score_elapsed = time.time() - score_start
+
+        state.save()
+
+        results = [
+            state.windows[t].result
+            for t in tickers
+            if len(state.windows[t]) >= 5 and state.windows[t].result is not None
+        ]
+        skipped = sum(1 for t in tickers if len(state.windows[t]) < 5)
+        logger.info(
+            f"⚡ 증분 스코어링 완료: {len(results):,}개 (50점+ 통과) / 재계산 {len(score_items):,}개, "
+            f"사전 점수 제외 {prescreened:,}개, 재사용 {len(tickers) - len(changed & set(tickers)):,}개 ({score_elapsed:.2f}초)"
+        )
+        return results, skipped
+
+    def _attach_ml_probs(self, watchlist: list[dict], candidates: list[str]) -> None:
+        """
+        [user-049] 후보 전 종목 피처를 벡터로 계산해 predict 1회 → ml_prob 첨부
+
+        📌 결과는 GainerModel 캐시에도 남아 RealtimeScanner가 조회만으로 재사용
+        📌 모델이 없거나 실패하면 ml_prob 없이 스캔 결과 그대로 반환
+        """
+        try:
+            if not self.gainer_model.load():
+                return
+            probs = self.gainer_model.refresh(self.repo, tickers=candidates)
+        except Exception as e:
+            logger.warning(f"⚠️ ML 추론 단계 실패 (생략): {e}")
+            return
+
+        for item in watchlist:
+            prob = probs.get(item["ticker"])
+            item["ml_prob"] = round(prob, 4) if prob is not None else None
+
+    def _score_parallel(self, score_items: list[tuple]) -> list[dict | None]:
+        """
+        [12-002] 병렬 스코어링 (입력 순서대로 결과 반환)
+
+        ELI5: CPU 여러 개를 동시에 사용해서 계산 속도를 높입니다
+
+        📌 [user-048] scoring_pool이 있으면 유지되는 풀에 청크 단위로 전달,
+           없으면 (단독 실행) 이번 스캔용 임시 풀을 만들고 닫음
+        """
+        if not score_items:
+            return []
+
+        if self.scoring_pool is not None:
+            return self.scoring_pool.map(_calculate_score, score_items)
+
+        # AWS Lambda 환경 감지 (Lambda는 ProcessPool 사용 불가)
+        # ELI5: 어떤 서버에서 돌아가는지 보고, 적절한 병렬 처리 방식 선택
+        is_lambda = "AWS_LAMBDA_FUNCTION_NAME" in os.environ
+        pool = ScoringPool(
+            max_workers=2 if is_lambda else min(4, os.cpu_count() or 4),
+            initializer=_init_scoring_worker,
+        )
+        try:
+            return pool.map(_calculate_score, score_items)
+        finally:
+            pool.shutdown()
+
     # ═══════════════════════════════════════════════════════════════════════
     # Universe Filter
     # ═══════════════════════════════════════════════════════════════════════
@@ -312,7 +497,8 @@ class Scanner:
         logger.info(f"📊 전체 티커: {len(all_tickers):,}개")
 
         # TickerFilter로 Warrant/Preferred/Rights/Units 제외
-        candidates = self.ticker_filter.filter(all_tickers)
+        # [user-039] 티커 컬럼 전체를 한 번에 판정 (np.char 커널, 정규식 패턴이면 캐시 순회)
+        candidates = self.ticker_filter.filter_array(np.asarray(all_tickers, dtype=str)).tolist()
 
         logger.info(
             f"📊 TickerFilter 후: {len(candidates):,}개 (제외: {len(all_tickers) - len(candidates):,}개)"
@@ -356,11 +542,17 @@ class Scanner:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-async def run_scan() -> list[dict]:
+async def run_scan(incremental: bool = True) -> list[dict]:
     """
     스캔 실행 편의 함수
 
     [11-002] DI Container에서 DataRepository 가져와서 스캔 실행
+    [user-047] 기본은 증분 스캔 (결과는 전체 스캔과 동일)
+    [user-048] Container의 ScoringPool 재사용
+    [user-049] Container의 GainerModel로 ml_prob 첨부
+
+    Args:
+        incremental: False면 롤링 상태 없이 전체 재계산
 
     Returns:
         list[dict]: Watchlist
@@ -368,8 +560,12 @@ async def run_scan() -> list[dict]:
     from backend.container import container
 
     repo = container.data_repository()
-    scanner = Scanner(repo)
-    watchlist = await scanner.run_daily_scan()
+    scanner = Scanner(
+        repo,
+        scoring_pool=container.scoring_pool(),
+        gainer_model=container.gainer_model(),
+    )
+    watchlist = await scanner.run_daily_scan(incremental=incremental)
 
     return watchlist
 
@@ -7,6 +7,7 @@ APScheduler 기반 작업 스케줄러.
     1. 장 시작 전 Watchlist 스캔 (09:45 AM ET)
     2. 장 마감 후 일일 데이터 업데이트 (16:30 PM ET)
     3. 정기 헬스체크
+    4. [user-046] 장 전 Z-Score 통계 테이블 생성 (08:00 AM ET)
 
 📌 사용법:
     from backend.core.scheduler import TradingScheduler
@@ -178,7 +179,29 @@ class TradingScheduler:
                 f"📌 Job added: Daily Data Update @ {update_hour:02d}:{update_minute:02d} ET (Mon-Fri)"
             )
 
-        # 3. 헬스체크 (5분마다)
+        # 3. [user-046] 장 전 Z-Score 통계 테이블
+        if self.config.premarket_zscore:
+            zscore_time = self.config.premarket_zscore_time.split(":")
+            zscore_hour = int(zscore_time[0])
+            zscore_minute = int(zscore_time[1]) if len(zscore_time) > 1 else 0
+
+            self.scheduler.add_job(
+                self._run_premarket_zscore,
+                trigger=CronTrigger(
+                    day_of_week="mon-fri",
+                    hour=zscore_hour,
+                    minute=zscore_minute,
+                    timezone=self.config.timezone,
+                ),
+                id="premarket_zscore",
+                name="Pre-market Z-Score Stats",
+                replace_existing=True,
+            )
+            logger.info(
+                f"📌 Job added: Pre-market Z-Score Stats @ {zscore_hour:02d}:{zscore_minute:02d} ET (Mon-Fri)"
+            )
+
+        # 4. 헬스체크 (5분마다)
         self.scheduler.add_job(
             self._run_health_check,
             trigger=IntervalTrigger(minutes=5),
@@ -232,21 +255,20 @@ class TradingScheduler:
             # 기본 스캔 로직 (콜백 미설정 시)
             from backend.core.scanner import run_scan
 
-            if self.db:
-                result = await run_scan(self.db.db_path)
-                logger.info(
-                    f"✅ [SCHEDULED] Market Open Scan completed: {len(result)} items"
-                )
-
-                # WebSocket 브로드캐스트
-                try:
-                    from backend.api.websocket import manager
-
-                    await manager.broadcast_watchlist(result)
-                except Exception as e:
-                    logger.warning(f"⚠️ Failed to broadcast watchlist: {e}")
-            else:
-                logger.warning("⚠️ Database not available for scan")
+            # [user-048] DataRepository + Container 워커 풀 사용 (DB 불필요)
+            # [user-047] run_scan 기본값 = 증분 스캔
+            result = await run_scan()
+            logger.info(
+                f"✅ [SCHEDULED] Market Open Scan completed: {len(result)} items"
+            )
+
+            # WebSocket 브로드캐스트
+            try:
+                from backend.api.websocket import manager
+
+                await manager.broadcast_watchlist(result)
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to broadcast watchlist: {e}")
 
         except Exception as e:
             logger.error(f"❌ [SCHEDULED] Market Open Scan failed: {e}")
@@ -288,6 +310,23 @@ class TradingScheduler:
         except Exception as e:
             logger.error(f"❌ [SCHEDULED] Daily Data Update failed: {e}")
 
+    async def _run_premarket_zscore(self):
+        """
+        [user-046] 장 전 Z-Score 통계 테이블 생성
+
+        📌 실행 시점: 08:00 AM ET (장 시작 전)
+        📌 동작: 전 종목 DailyStats 일괄 계산 → Parquet 저장 (원본 일봉 변경 시에만)
+        """
+        logger.info("📊 [SCHEDULED] Pre-market Z-Score Stats Starting...")
+
+        try:
+            from backend.container import container
+
+            count = await asyncio.to_thread(container.zscore_stats().ensure)
+            logger.info(f"✅ [SCHEDULED] Pre-market Z-Score Stats ready: {count} tickers")
+        except Exception as e:
+            logger.error(f"❌ [SCHEDULED] Pre-market Z-Score Stats failed: {e}")
+
     async def _run_health_check(self):
         """
         정기 헬스체크
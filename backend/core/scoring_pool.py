@@ -0,0 +1,181 @@
+# ============================================================================
+# Scoring Pool - 스캔 간 유지되는 스코어링 워커 풀 (user-048)
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - Daily Scan 스코어링용 ProcessPoolExecutor를 처음 사용할 때 한 번만 만들고
+#     서버가 끝날 때까지 재사용 (워커의 backend/pandas import 비용을 1회로)
+#   - 워커 initializer에서 전략 객체를 미리 생성
+#   - 종목 목록을 청크 단위로 전달 (종목마다 IPC 왕복하지 않음)
+#   - 워커가 죽으면 (BrokenProcessPool) 새 풀로 1회 재시도
+#
+# 📖 사용 예시:
+#   >>> pool = ScoringPool(max_workers=8, initializer=_init_scoring_worker)
+#   >>> results = pool.map(_calculate_score, score_items)
+#   >>> pool.shutdown()
+#
+# 📌 Container가 소유 (container.scoring_pool()),
+#    종료는 backend/startup/shutdown.py에서 호출
+# ============================================================================
+
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Iterable, Optional
+
+from loguru import logger
+
+
+# 자동 청크 크기: 워커당 약 CHUNKS_PER_WORKER개 청크 (부하 분산 vs IPC 횟수)
+CHUNKS_PER_WORKER = 4
+
+
+def _noop(_: Any = None) -> None:
+    """워커 예열용 (initializer 실행 강제)"""
+    return None
+
+
+class ScoringPool:
+    """
+    지연 시작 + 재사용 스코어링 워커 풀
+
+    ELI5: 스캔할 때마다 일꾼을 새로 뽑고 교육(import)시키지 않고,
+          한 번 뽑은 일꾼을 계속 씁니다. 일감은 한 묶음씩 나눠 줍니다.
+
+    Attributes:
+        max_workers: 워커 수 (0/None = CPU 코어 수)
+        chunksize: 워커 1회 전달 항목 수 (0/None = 자동)
+        initializer: 워커 시작 시 1회 실행 함수 (모듈 레벨, pickle 가능)
+        use_threads: True면 ThreadPoolExecutor (AWS Lambda 등 fork 불가 환경)
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        initializer: Optional[Callable[[], None]] = None,
+        use_threads: Optional[bool] = None,
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 4
+        self.chunksize = chunksize or 0
+        self.initializer = initializer
+        if use_threads is None:
+            # AWS Lambda 환경 감지 (Lambda는 ProcessPool 사용 불가)
+            use_threads = "AWS_LAMBDA_FUNCTION_NAME" in os.environ
+        self.use_threads = use_threads
+
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+        # 통계
+        self.starts = 0
+        self.batches = 0
+        self.items = 0
+        self.last_elapsed = 0.0
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # 생명주기
+    # ═══════════════════════════════════════════════════════════════════════
+
+    @property
+    def started(self) -> bool:
+        return self._executor is not None
+
+    def _ensure_started(self) -> Executor:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("ScoringPool is shut down")
+            if self._executor is None:
+                cls = ThreadPoolExecutor if self.use_threads else ProcessPoolExecutor
+                self._executor = cls(max_workers=self.max_workers, initializer=self.initializer)
+                self.starts += 1
+                logger.info(
+                    f"⚡ ScoringPool started ({cls.__name__}, workers={self.max_workers})"
+                )
+            return self._executor
+
+    def warm(self) -> None:
+        """
+        워커를 미리 띄워 initializer까지 실행 (첫 스캔 지연 제거)
+
+        서버 시작 직후 백그라운드 스레드에서 호출하는 용도
+        """
+        executor = self._ensure_started()
+        list(executor.map(_noop, range(self.max_workers)))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """풀 종료 (이후 map 호출은 RuntimeError)"""
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+            logger.info("✅ ScoringPool stopped")
+
+    def _discard(self, executor: Executor) -> None:
+        """깨진 풀 폐기 (다음 호출 시 새로 시작)"""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # 실행
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def chunksize_for(self, n_items: int) -> int:
+        if self.chunksize:
+            return self.chunksize
+        return max(1, n_items // (self.max_workers * CHUNKS_PER_WORKER))
+
+    def map(self, fn: Callable[[Any], Any], items: Iterable[Any]) -> list:
+        """
+        fn을 items에 병렬 적용 (입력 순서대로 결과 반환)
+
+        Args:
+            fn: 모듈 레벨 함수 (ProcessPool pickle 호환)
+            items: 입력 목록
+
+        Returns:
+            list: 결과 목록
+        """
+        items = list(items)
+        if not items:
+            return []
+
+        start = time.perf_counter()
+        chunksize = self.chunksize_for(len(items))
+        for attempt in range(2):
+            executor = self._ensure_started()
+            try:
+                if isinstance(executor, ProcessPoolExecutor):
+                    results = list(executor.map(fn, items, chunksize=chunksize))
+                else:
+                    results = list(executor.map(fn, items))
+                break
+            except BrokenProcessPool:
+                self._discard(executor)
+                if attempt:
+                    raise
+                logger.warning("⚠️ ScoringPool 워커 비정상 종료 → 재시작 후 재시도")
+
+        self.batches += 1
+        self.items += len(items)
+        self.last_elapsed = time.perf_counter() - start
+        return results
+
+    def get_stats(self) -> dict:
+        return {
+            "started": self.started,
+            "workers": self.max_workers,
+            "use_threads": self.use_threads,
+            "starts": self.starts,
+            "batches": self.batches,
+            "items": self.items,
+            "last_elapsed": round(self.last_elapsed, 4),
+        }
+
+
+__all__ = ["ScoringPool"]
@@ -36,6 +36,7 @@ from loguru import logger
 if TYPE_CHECKING:
     from backend.data.massive_ws_client import MassiveWebSocketClient
     from backend.api.websocket import ConnectionManager
+    from backend.core.event_sequencer import EventSequencer
     from backend.core.tick_dispatcher import TickDispatcher
 
 
@@ -59,6 +60,7 @@ class TickBroadcaster:
         ws_manager: "ConnectionManager",
         loop: Optional[asyncio.AbstractEventLoop] = None,
         tick_dispatcher: Optional["TickDispatcher"] = None,
+        sequencer: Optional["EventSequencer"] = None,
     ):
         """
         TickBroadcaster 초기화
@@ -68,11 +70,16 @@ class TickBroadcaster:
             ws_manager: GUI WebSocket ConnectionManager 인스턴스
             loop: asyncio 이벤트 루프 (None이면 자동 감지)
             tick_dispatcher: TickDispatcher 인스턴스 (틱 배포용)
+            sequencer: [user-038] EventSequencer (지정 시 프레임 단위로 받아
+                       event_time 순으로 재정렬 후 배포, 루프 태스크가 꼬리 방출)
         """
         self.massive_ws = massive_ws
         self.ws_manager = ws_manager
         self.loop = loop
         self.tick_dispatcher = tick_dispatcher
+        self.sequencer = sequencer
+        # [user-038] 꼬리 방출 태스크 (set_event_loop에서 시작, stop에서 취소)
+        self._sequencer_task: Optional["asyncio.Future"] = None
 
         # 통계
         self._bar_count = 0
@@ -82,6 +89,10 @@ class TickBroadcaster:
         # 콜백 연결
         self.massive_ws.on_bar = self._on_bar
         self.massive_ws.on_tick = self._on_tick
+        if sequencer is not None:
+            self.massive_ws.on_ticks = self._on_ticks
+        if loop is not None:
+            self._start_sequencer()
 
         logger.info("📡 TickBroadcaster initialized (Massive → GUI + Dispatcher)")
 
@@ -93,8 +104,42 @@ class TickBroadcaster:
             loop: asyncio 이벤트 루프
         """
         self.loop = loop
+        self._start_sequencer()
         logger.debug("📡 TickBroadcaster event loop set")
 
+    def _start_sequencer(self):
+        """
+        [user-038] 워터마크 방출을 이벤트 루프 태스크로 구동
+
+        📌 Massive listen()도 같은 루프에서 on_ticks를 부르므로
+           push/poll → TickDispatcher.dispatch가 모두 루프 스레드에서 실행됨
+           (별도 타이머 스레드와 전략/엔진 콜백이 동시에 돌지 않음)
+        """
+        if self.sequencer is None or self.loop is None or self._sequencer_task is not None:
+            return
+        self._sequencer_task = asyncio.run_coroutine_threadsafe(
+            self._drive_sequencer(), self.loop
+        )
+
+    async def _drive_sequencer(self):
+        """[user-038] buffer_ms/4 주기로 poll() → 조용한 구간에도 꼬리 이벤트 방출"""
+        interval = max(self.sequencer.buffer_ms / 4, 1) / 1000
+        while True:
+            await asyncio.sleep(interval)
+            self._on_sequenced(self.sequencer.poll())
+
+    def stop(self):
+        """
+        [user-038] 시퀀서 태스크 중지 + 버퍼에 남은 틱 배포
+
+        📌 서버 종료 시 shutdown_all()에서 호출
+        """
+        if self._sequencer_task is not None:
+            self._sequencer_task.cancel()
+            self._sequencer_task = None
+        if self.sequencer is not None:
+            self._on_sequenced(list(self.sequencer.flush()))
+
     def _on_bar(self, bar: dict):
         """
         Massive AM (1분봉) 수신 콜백
@@ -172,30 +217,66 @@ class TickBroadcaster:
             if not ticker or price <= 0:
                 return
 
-            # [Step 4.A.0.b] TickDispatcher로 배포 (전략, 엔진, Trailing Stop 등)
-            if self.tick_dispatcher:
-                self.tick_dispatcher.dispatch(tick)
-
-            # GUI에 TICK 메시지 브로드캐스트
-            asyncio.run_coroutine_threadsafe(
-                self.ws_manager.broadcast_tick(
-                    ticker=ticker,
-                    price=price,
-                    volume=tick.get("size", 0),
-                    timestamp=datetime.fromtimestamp(tick.get("time", 0)).isoformat(),
-                ),
-                self.loop,
-            )
+            self._deliver_tick(tick)
 
         except Exception as e:
             logger.error(f"❌ TickBroadcaster tick error: {e}")
 
+    def _on_ticks(self, ticks: list):
+        """
+        [user-038] Massive T 프레임 수신 콜백 (sequencer 사용 시)
+
+        Args:
+            ticks: 한 프레임의 틱 목록 (_on_tick과 같은 형식)
+        """
+        self._tick_count += len(ticks)
+        self._last_update_time = datetime.now()
+        ready = self.sequencer.push_batch(
+            (tick, int(tick.get("time", 0) * 1000))
+            for tick in ticks
+            if tick.get("ticker") and (tick.get("price") or 0) > 0
+        )
+        self._on_sequenced(ready)
+
+    def _on_sequenced(self, events: list):
+        """
+        [user-038] EventSequencer 방출 묶음 → 배포
+
+        📌 루프가 아직 없으면 TickDispatcher에만 배포 (GUI 브로드캐스트만 생략)
+        """
+        for event in events:
+            try:
+                self._deliver_tick(event.data)
+            except Exception as e:
+                logger.error(f"❌ TickBroadcaster tick error: {e}")
+
+    def _deliver_tick(self, tick: dict):
+        """틱 1건을 TickDispatcher + GUI로 배포"""
+        # [Step 4.A.0.b] TickDispatcher로 배포 (전략, 엔진, Trailing Stop 등)
+        if self.tick_dispatcher:
+            self.tick_dispatcher.dispatch(tick)
+
+        if not self.loop:
+            return
+
+        # GUI에 TICK 메시지 브로드캐스트
+        asyncio.run_coroutine_threadsafe(
+            self.ws_manager.broadcast_tick(
+                ticker=tick["ticker"],
+                price=tick["price"],
+                volume=tick.get("size", 0),
+                timestamp=datetime.fromtimestamp(tick.get("time", 0)).isoformat(),
+            ),
+            self.loop,
+        )
+
     @property
     def stats(self) -> dict:
         """브로드캐스터 통계 반환"""
         return {
             "bar_count": self._bar_count,
             "tick_count": self._tick_count,
+            "sequencer": self.sequencer.get_stats() if self.sequencer else None,
             "last_update": self._last_update_time.isoformat()
             if self._last_update_time
             else None,
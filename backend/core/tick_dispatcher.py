@@ -10,6 +10,7 @@
 #       ↓
 #   TickDispatcher.dispatch()
 #       ↓
+#   ├─→ IntradayStateEngine.on_tick() (VWAP/HOD/ATR 상태, 가장 먼저 등록)
 #   ├─→ Seismograph.on_tick() (Ignition 계산)
 #   ├─→ TradingEngine.on_tick() (진입/청산)
 #   ├─→ TrailingStopManager.on_price_update() (손절/익절)
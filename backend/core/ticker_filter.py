@@ -11,16 +11,27 @@
 #   >>> tf = get_ticker_filter()
 #   >>> candidates = tf.filter(["AAPL", "TSLA", "AAPLW", "MSFT+"])
 #   >>> # ["AAPL", "TSLA"]
+#   >>> tf.filter_array(pa.array(all_tickers))   # Arrow/NumPy 컬럼 일괄 필터
 #
 # 📌 [12-001] Full Universe Scan 지원
+# 📌 [user-039] 패턴을 로드 시 1회 컴파일 (길이별 suffix/prefix 집합 + 결합 정규식)
+#              + 판정 캐시 + 벡터화 filter_array
 # ============================================================================
 
+import re
 from pathlib import Path
 from typing import Any
+import numpy as np
 import yaml
 from loguru import logger
 
 
+# 판정 캐시 최대 크기 (가득 차면 비움 - 유니버스 ~1만 종목이면 사실상 전부 캐시)
+VERDICT_CACHE_SIZE = 65_536
+
+PATTERN_TYPES = ("suffix", "prefix", "contains", "exact", "regex")
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # TickerFilter 클래스
 # ═══════════════════════════════════════════════════════════════════════════
@@ -33,6 +44,10 @@ class TickerFilter:
     YAML 설정 파일을 기반으로 Warrant, Preferred Stock 등
     거래 대상에서 제외할 티커를 필터링합니다.
 
+    [user-039] ELI5: 규칙 목록을 매번 처음부터 읽는 대신, 시작할 때
+    "끝 글자 표"(길이별 suffix 집합), "첫 글자 표", "한 줄짜리 정규식"으로
+    정리해 두고, 한 번 판정한 티커는 답을 적어 둡니다.
+
     Attributes:
         patterns: 패턴 매칭 규칙 리스트
         manual_exclusions: 수동 제외 티커 집합
@@ -63,6 +78,9 @@ class TickerFilter:
         self.manual_exclusions = set(manual_exclusions or [])
         self.whitelist = set(whitelist or [])
 
+        self._cache: dict[str, bool] = {}
+        self.recompile()
+
         logger.debug(
             f"🔧 TickerFilter 초기화: "
             f"{len(self.patterns)} patterns, "
@@ -120,6 +138,49 @@ class TickerFilter:
             whitelist=config.get("whitelist", []),
         )
 
+    # ═══════════════════════════════════════════════════════════════════════
+    # [user-039] 컴파일
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def recompile(self) -> None:
+        """
+        패턴 → 매처 컴파일 (patterns / manual_exclusions / whitelist 변경 후 호출)
+
+        - exact + manual_exclusions → 집합 1개
+        - suffix / prefix → {길이: 집합} (티커 끝/앞 L글자를 집합에서 조회)
+        - contains / regex → 결합 정규식 1개 (re.search)
+        """
+        exact = set(self.manual_exclusions)
+        suffixes: dict[int, set[str]] = {}
+        prefixes: dict[int, set[str]] = {}
+        regex_parts: list[str] = []
+
+        for pattern in self.patterns:
+            pattern_type = pattern.get("type", "")
+            value = pattern.get("value", "")
+            if not value:
+                continue
+            if pattern_type == "suffix":
+                suffixes.setdefault(len(value), set()).add(value)
+            elif pattern_type == "prefix":
+                prefixes.setdefault(len(value), set()).add(value)
+            elif pattern_type == "exact":
+                exact.add(value)
+            elif pattern_type == "contains":
+                regex_parts.append(re.escape(value))
+            elif pattern_type == "regex":
+                re.compile(value)  # 잘못된 정규식은 로드 시점에 에러
+                regex_parts.append(f"(?:{value})")
+            else:
+                logger.warning(f"⚠️ 알 수 없는 패턴 타입: {pattern_type}")
+
+        self._exact = frozenset(exact)
+        self._suffixes = sorted(suffixes.items())
+        self._prefixes = sorted(prefixes.items())
+        self._regex_source = "|".join(regex_parts)
+        self._regex = re.compile(self._regex_source) if regex_parts else None
+        self._cache.clear()
+
     # ═══════════════════════════════════════════════════════════════════════
     # 필터링 메서드
     # ═══════════════════════════════════════════════════════════════════════
@@ -139,20 +200,17 @@ class TickerFilter:
         Returns:
             bool: True면 제외 대상
         """
-        # 1. Whitelist 우선 (무조건 통과)
-        if ticker in self.whitelist:
-            return False
-
-        # 2. 수동 제외 체크
-        if ticker in self.manual_exclusions:
-            return True
-
-        # 3. 패턴 매칭 체크
-        for pattern in self.patterns:
-            if self._match_pattern(ticker, pattern):
-                return True
-
-        return False
+        verdict = self._cache.get(ticker)
+        if verdict is None:
+            verdict = self._evaluate(ticker)
+            if len(self._cache) >= VERDICT_CACHE_SIZE:
+                self._cache.clear()
+            self._cache[ticker] = verdict
+        return verdict
+
+    def is_allowed(self, ticker: str) -> bool:
+        """is_excluded()의 반대 (스캔 대상이면 True)"""
+        return not self.is_excluded(ticker)
 
     def filter(self, tickers: list[str]) -> list[str]:
         """
@@ -164,7 +222,8 @@ class TickerFilter:
         Returns:
             list[str]: 제외 대상이 아닌 티커만 반환
         """
-        result = [t for t in tickers if not self.is_excluded(t)]
+        is_excluded = self.is_excluded
+        result = [t for t in tickers if not is_excluded(t)]
 
         excluded_count = len(tickers) - len(result)
         if excluded_count > 0:
@@ -174,13 +233,119 @@ class TickerFilter:
 
         return result
 
+    def excluded_mask(self, values: Any) -> np.ndarray:
+        """
+        [user-039] 문자열 컬럼 전체의 제외 여부 (벡터화)
+
+        Arrow 배열은 pyarrow.compute 커널(ends_with / starts_with / is_in /
+        match_substring_regex)로, NumPy 문자열 배열은 np.char로 계산합니다.
+        그 외(리스트, object 배열, RE2가 지원하지 않는 정규식)는 캐시된 is_excluded로 한 번 순회.
+
+        Args:
+            values: pyarrow Array/ChunkedArray, numpy 배열, 또는 문자열 리스트
+
+        Returns:
+            np.ndarray: bool 배열 (True = 제외). null은 제외하지 않음.
+        """
+        if hasattr(values, "to_numpy") and hasattr(values, "type"):
+            mask = self._arrow_mask(values)
+            if mask is not None:
+                return mask
+            values = values.to_pylist()
+
+        if isinstance(values, np.ndarray) and values.dtype.kind == "U":
+            mask = self._numpy_mask(values)
+            if mask is not None:
+                return mask
+
+        is_excluded = self.is_excluded
+        return np.fromiter(
+            (v is not None and is_excluded(v) for v in values),
+            dtype=bool,
+            count=len(values),
+        )
+
+    def filter_array(self, values: Any) -> Any:
+        """
+        [user-039] 문자열 컬럼에서 제외 대상을 뺀 결과 (입력과 같은 타입)
+
+        Args:
+            values: pyarrow Array/ChunkedArray, numpy 배열, 또는 문자열 리스트
+
+        Returns:
+            입력과 같은 타입 (리스트는 리스트)
+        """
+        keep = ~self.excluded_mask(values)
+        if isinstance(values, list):
+            return [v for v, k in zip(values, keep) if k]
+        if hasattr(values, "filter") and hasattr(values, "type"):
+            return values.filter(keep)
+        return values[keep]
+
     # ═══════════════════════════════════════════════════════════════════════
     # Private Methods
     # ═══════════════════════════════════════════════════════════════════════
 
+    def _evaluate(self, ticker: str) -> bool:
+        """캐시 미스 시 실제 판정"""
+        if ticker in self.whitelist:
+            return False
+        if ticker in self._exact:
+            return True
+        for length, values in self._suffixes:
+            if ticker[-length:] in values:
+                return True
+        for length, values in self._prefixes:
+            if ticker[:length] in values:
+                return True
+        if self._regex is not None and self._regex.search(ticker):
+            return True
+        return False
+
+    def _arrow_mask(self, values: Any) -> np.ndarray | None:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        if not (pa.types.is_string(values.type) or pa.types.is_large_string(values.type)):
+            return None
+
+        excluded = pc.is_in(values, value_set=pa.array(sorted(self._exact), type=values.type))
+        for _, group in self._suffixes:
+            for value in group:
+                excluded = pc.or_(excluded, pc.ends_with(values, pattern=value))
+        for _, group in self._prefixes:
+            for value in group:
+                excluded = pc.or_(excluded, pc.starts_with(values, pattern=value))
+        if self._regex is not None:
+            try:
+                excluded = pc.or_(
+                    excluded, pc.match_substring_regex(values, pattern=self._regex_source)
+                )
+            except pa.ArrowInvalid:
+                return None  # RE2 비호환 정규식 → 순회 경로
+        if self.whitelist:
+            allowed = pc.is_in(values, value_set=pa.array(sorted(self.whitelist), type=values.type))
+            excluded = pc.and_(excluded, pc.invert(allowed))
+
+        return np.asarray(pc.fill_null(excluded, False), dtype=bool)
+
+    def _numpy_mask(self, values: np.ndarray) -> np.ndarray | None:
+        if self._regex is not None:
+            return None  # np.char에 정규식 없음 → 순회 경로
+        excluded = np.isin(values, list(self._exact)) if self._exact else np.zeros(len(values), bool)
+        for _, group in self._suffixes:
+            for value in group:
+                excluded |= np.char.endswith(values, value)
+        for _, group in self._prefixes:
+            for value in group:
+                excluded |= np.char.startswith(values, value)
+        if self.whitelist:
+            excluded &= ~np.isin(values, list(self.whitelist))
+        return excluded
+
     def _match_pattern(self, ticker: str, pattern: dict[str, str]) -> bool:
         """
-        패턴 매칭 체크
+        패턴 매칭 체크 (단일 규칙, 디버깅/설명용)
 
         Args:
             ticker: 티커 심볼
@@ -200,6 +365,7 @@ class TickerFilter:
         # prefix: 시작이 value로 시작하면 True
         # contains: value가 포함되면 True
         # exact: 정확히 같으면 True
+        # regex: 정규식이 어딘가에서 매칭되면 True
         if pattern_type == "suffix":
             return ticker.endswith(value)
         elif pattern_type == "prefix":
@@ -208,6 +374,8 @@ class TickerFilter:
             return value in ticker
         elif pattern_type == "exact":
             return ticker == value
+        elif pattern_type == "regex":
+            return re.search(value, ticker) is not None
         else:
             logger.warning(f"⚠️ 알 수 없는 패턴 타입: {pattern_type}")
             return False
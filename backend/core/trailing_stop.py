@@ -11,6 +11,8 @@
 # 📌 10-001 리팩터링:
 #   - 클라이언트 사이드 → IBKR 네이티브 마이그레이션
 #   - on_price_update() 제거 (서버 사이드에서 자동 추적)
+#
+# 📌 [user-034] order_id -> 심볼 인덱스 (체결/취소 콜백 O(1))
 # ============================================================================
 
 """
@@ -28,6 +30,10 @@ from enum import Enum, auto
 from loguru import logger
 
 
+# ATR을 모를 때의 프록시 (진입가의 1%) - 장중 ATR 봉 수가 부족할 때도 사용
+ATR_PROXY_PCT = 0.01
+
+
 class TrailingStatus(Enum):
     """Trailing Stop 상태"""
 
@@ -84,19 +90,23 @@ class TrailingStopManager:
         >>> # IBKR 서버가 자동으로 고점 추적
     """
 
-    def __init__(self, connector=None, atr_multiplier: float = 1.5):
+    def __init__(self, connector=None, atr_multiplier: float = 1.5, state_engine=None):
         """
         초기화
 
         Args:
             connector: IBKRConnector 인스턴스
             atr_multiplier: ATR 배수 (기본: 1.5)
+            state_engine: IntradayStateEngine (ATR 미지정 시 사용, 선택)
         """
         self.connector = connector
         self.atr_multiplier = atr_multiplier
+        self.state_engine = state_engine
 
         # 활성 Trailing Stop 추적
         self._trailing_orders: Dict[str, TrailingStopOrder] = {}
+        # order_id -> 심볼 (콜백에서 선형 탐색 없이 조회)
+        self._symbol_by_order: Dict[int, str] = {}
 
         logger.debug("📈 TrailingStopManager 초기화 (IBKR Native)")
 
@@ -108,7 +118,7 @@ class TrailingStopManager:
         self,
         symbol: str,
         qty: int,
-        atr: float,
+        atr: Optional[float] = None,
         entry_price: Optional[float] = None,
     ) -> Optional[int]:
         """
@@ -120,12 +130,21 @@ class TrailingStopManager:
         Args:
             symbol: 종목 심볼
             qty: 수량
-            atr: ATR (Average True Range)
-            entry_price: 진입 가격 (로깅용, 선택)
+            atr: ATR (Average True Range). None이면 장중 상태 엔진의 1분봉 ATR,
+                 그것도 없으면(봉 수 부족) 진입가 × ATR_PROXY_PCT 사용
+            entry_price: 진입 가격 (ATR 프록시 / 로깅용, 선택)
 
         Returns:
             int: IBKR 주문 ID (실패 시 None)
         """
+        if not atr:
+            atr = self._live_atr(symbol)
+        if not atr and entry_price:
+            atr = entry_price * ATR_PROXY_PCT
+        if not atr:
+            logger.warning(f"⚠️ Trailing 주문 실패: {symbol} ATR 없음")
+            return None
+
         trail_amount = atr * self.atr_multiplier
 
         order = TrailingStopOrder(
@@ -142,7 +161,11 @@ class TrailingStopManager:
             order.order_id = order_id
             order.status = TrailingStatus.SUBMITTED
             order.submitted_at = datetime.now()
+            previous = self._trailing_orders.get(symbol)
+            if previous and previous.order_id:
+                self._symbol_by_order.pop(previous.order_id, None)
             self._trailing_orders[symbol] = order
+            self._symbol_by_order[order_id] = symbol
 
             logger.info(
                 f"📈 Trailing 주문 전송: {symbol} | "
@@ -154,6 +177,13 @@ class TrailingStopManager:
             logger.warning(f"⚠️ Trailing 주문 실패: {symbol}")
             return None
 
+    def _live_atr(self, symbol: str) -> Optional[float]:
+        """[user-031] 장중 상태 엔진의 1분봉 ATR (봉 수 부족/없으면 None)"""
+        if not self.state_engine:
+            return None
+        snap = self.state_engine.snapshot(symbol)
+        return snap.atr if snap and snap.atr > 0 else None
+
     def _place_trailing_order(self, order: TrailingStopOrder) -> Optional[int]:
         """IBKR에 네이티브 Trailing Stop 주문 전송"""
         if not self.connector:
@@ -182,6 +212,7 @@ class TrailingStopManager:
             return False
 
         order = self._trailing_orders.pop(symbol)
+        self._symbol_by_order.pop(order.order_id, None)
 
         if order.order_id and self.connector:
             self.connector.cancel_order(order.order_id)
@@ -202,11 +233,11 @@ class TrailingStopManager:
         Args:
             order_id: 체결된 주문 ID
         """
-        for symbol, order in list(self._trailing_orders.items()):
-            if order.order_id == order_id:
-                order.status = TrailingStatus.FILLED
-                logger.info(f"✅ Trailing 체결: {symbol} (Order ID: {order_id})")
-                break
+        symbol = self._symbol_by_order.pop(order_id, None)
+        order = self._trailing_orders.get(symbol) if symbol else None
+        if order and order.order_id == order_id:
+            order.status = TrailingStatus.FILLED
+            logger.info(f"✅ Trailing 체결: {symbol} (Order ID: {order_id})")
 
     def on_order_cancelled(self, order_id: int) -> None:
         """
@@ -217,9 +248,9 @@ class TrailingStopManager:
         Args:
             order_id: 취소된 주문 ID
         """
-        for symbol, order in list(self._trailing_orders.items()):
-            if order.order_id == order_id:
-                order.status = TrailingStatus.CANCELLED
-                self._trailing_orders.pop(symbol, None)
-                logger.info(f"🚫 Trailing 취소됨: {symbol} (Order ID: {order_id})")
-                break
+        symbol = self._symbol_by_order.pop(order_id, None)
+        order = self._trailing_orders.get(symbol) if symbol else None
+        if order and order.order_id == order_id:
+            order.status = TrailingStatus.CANCELLED
+            self._trailing_orders.pop(symbol, None)
+            logger.info(f"🚫 Trailing 취소됨: {symbol} (Order ID: {order_id})")
@@ -15,15 +15,30 @@
 #   >>> calc = ZScoreCalculator()
 #   >>> result = calc.calculate("AAPL", daily_bars)
 #   >>> print(f"zenV={result.zenV}, zenP={result.zenP}")
+#
+#   # [user-046] 전 종목 일괄 (DataFrame 한 번에)
+#   >>> stats_df = compute_daily_stats(daily_df, lookback=20)
 # ============================================================================
 
+import math
+import warnings
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional
+from zoneinfo import ZoneInfo
 
 import numpy as np
+import pandas as pd
 from loguru import logger
 
 
+MARKET_TZ = ZoneInfo("America/New_York")
+
+# 정규장 (ET) - 장중 Time-Projection 경과 비율 계산용
+REGULAR_OPEN_MINUTE = 9 * 60 + 30
+REGULAR_SESSION_MINUTES = 390
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # 데이터클래스
 # ═══════════════════════════════════════════════════════════════════════════
@@ -68,6 +83,117 @@ class DailyStats:
     std_change: float
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# 벡터 헬퍼
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _abs_changes(closes: np.ndarray) -> np.ndarray:
+    """
+    일간 절대 변동률 (%) - 전일 종가 ≤ 0인 날은 NaN
+
+    closes가 2차원이면 행(종목)별로 계산합니다.
+    """
+    prev = closes[..., :-1]
+    cur = closes[..., 1:]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(prev > 0, np.abs((cur - prev) / prev * 100), np.nan)
+
+
+def _zscore(today: np.ndarray, hist: np.ndarray) -> np.ndarray:
+    """행별 (today - mean(hist)) / std(hist), std = 0이면 0"""
+    avg = hist.mean(axis=-1)
+    std = hist.std(axis=-1)  # population std (ddof=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(std > 0, (today - avg) / std, 0.0)
+
+
+def _compact_change_zscore(changes: np.ndarray) -> float:
+    """유효한 변동률만 모아 마지막 값의 Z-Score (calculate()의 zenP 규칙)"""
+    valid = changes[~np.isnan(changes)]
+    if len(valid) < 2:
+        return 0.0
+    return float(_zscore(valid[-1], valid[:-1]))
+
+
+def compute_daily_stats(daily_df: pd.DataFrame, lookback: int = 20) -> pd.DataFrame:
+    """
+    [user-046] 전 종목 Z-Score 통계를 한 번에 계산.
+
+    종목별 최근 lookback개 일봉을 (종목 × lookback) 행렬로 펼친 뒤
+    행 단위 numpy 연산으로 계산합니다 (종목 루프 없음).
+
+    ELI5: 종목마다 20칸짜리 줄을 만들어 표로 쌓고, 표 전체의 평균/표준편차를
+          한 번에 구합니다.
+
+    Args:
+        daily_df: ticker, date, close, volume 컬럼의 일봉
+        lookback: 통계 기간 (일봉 수)
+
+    Returns:
+        DataFrame: ticker, date(마지막 일봉), last_close,
+                   avg_volume, std_volume, avg_change, std_change (= build_cache),
+                   zenV, zenP (= calculate, 마지막 일봉 기준)
+        - 일봉이 lookback개 미만인 종목은 제외
+    """
+    columns = [
+        "ticker", "date", "last_close", "avg_volume", "std_volume",
+        "avg_change", "std_change", "zenV", "zenP",
+    ]
+    df = daily_df[["ticker", "date", "close", "volume"]]
+    df = df.sort_values(["ticker", "date"], kind="mergesort")
+    df = df.groupby("ticker", sort=False).tail(lookback)
+    counts = df.groupby("ticker", sort=False)["ticker"].transform("size")
+    df = df[counts.to_numpy() == lookback]
+    if df.empty:
+        return pd.DataFrame(columns=columns)
+
+    n = len(df) // lookback
+    volumes = df["volume"].fillna(0).to_numpy(dtype="float64").reshape(n, lookback)
+    closes = df["close"].fillna(0).to_numpy(dtype="float64").reshape(n, lookback)
+    changes = _abs_changes(closes)
+
+    # build_cache(): lookback 전체 기준
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # 전부 NaN인 행 (Mean of empty slice)
+        avg_change = np.nan_to_num(np.nanmean(changes, axis=1), nan=0.0)
+        std_change = np.nan_to_num(np.nanstd(changes, axis=1), nan=0.0)
+
+    # calculate(): 마지막 일봉 vs 그 이전
+    zen_v = _zscore(volumes[:, -1], volumes[:, :-1])
+    complete = ~np.isnan(changes).any(axis=1)
+    zen_p = np.zeros(n)
+    if changes.shape[1] >= 2:
+        zen_p[complete] = _zscore(changes[complete, -1], changes[complete, :-1])
+    for i in np.flatnonzero(~complete):
+        zen_p[i] = _compact_change_zscore(changes[i])
+
+    last = df.iloc[lookback - 1 :: lookback]
+    return pd.DataFrame({
+        "ticker": last["ticker"].to_numpy(),
+        "date": last["date"].to_numpy(),
+        "last_close": closes[:, -1],
+        "avg_volume": volumes.mean(axis=1),
+        "std_volume": volumes.std(axis=1),
+        "avg_change": avg_change,
+        "std_change": std_change,
+        "zenV": np.round(zen_v, 2),
+        "zenP": np.round(zen_p, 2),
+    })
+
+
+def session_elapsed_ratio(ts: float) -> float:
+    """
+    [user-046] 정규장 경과 비율 (09:30 ET = 0.0, 16:00 ET = 1.0, 범위 밖은 0/1로 고정)
+
+    Args:
+        ts: Unix 초
+    """
+    local = datetime.fromtimestamp(ts, MARKET_TZ)
+    minutes = local.hour * 60 + local.minute + local.second / 60 - REGULAR_OPEN_MINUTE
+    return min(max(minutes / REGULAR_SESSION_MINUTES, 0.0), 1.0)
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # ZScoreCalculator 클래스
 # ═══════════════════════════════════════════════════════════════════════════
@@ -139,18 +265,9 @@ class ZScoreCalculator:
         # - 오늘 거래량이 어제까지의 평균 대비 몇 표준편차인지
         # ─────────────────────────────────────────────────────────────────
         try:
-            volumes = [bar.get("volume", 0) for bar in recent]
-            # 어제까지의 평균과 표준편차 (오늘 제외)
-            historical_volumes = volumes[:-1]
-            avg_vol = float(np.mean(historical_volumes))
-            std_vol = float(np.std(historical_volumes, ddof=0))  # population std
-
-            today_vol = volumes[-1]
-
-            if std_vol > 0:
-                zenV = (today_vol - avg_vol) / std_vol
-            else:
-                zenV = 0.0
+            volumes = np.array([bar.get("volume", 0) for bar in recent], dtype="float64")
+            # 어제까지의 평균과 표준편차 (오늘 제외, population std)
+            zenV = float(_zscore(volumes[-1], volumes[:-1]))
 
         except (ValueError, TypeError) as e:
             logger.warning(f"⚠️ {ticker}: zenV 계산 실패 - {e}")
@@ -161,30 +278,9 @@ class ZScoreCalculator:
         # - 오늘 가격 변동(abs % change)이 어제까지 평균 대비 몇 표준편차인지
         # ─────────────────────────────────────────────────────────────────
         try:
-            # 일간 변동률 계산 (절대값)
-            changes = []
-            for i in range(1, len(recent)):
-                prev_close = recent[i - 1].get("close", 0)
-                curr_close = recent[i].get("close", 0)
-
-                if prev_close > 0:
-                    pct_change = abs((curr_close - prev_close) / prev_close * 100)
-                    changes.append(pct_change)
-
-            if len(changes) < 2:
-                zenP = 0.0
-            else:
-                # 어제까지의 변동률 평균과 표준편차 (오늘 제외)
-                historical_changes = changes[:-1]
-                avg_chg = float(np.mean(historical_changes))
-                std_chg = float(np.std(historical_changes, ddof=0))  # population std
-
-                today_chg = changes[-1] if changes else 0.0
-
-                if std_chg > 0:
-                    zenP = (today_chg - avg_chg) / std_chg
-                else:
-                    zenP = 0.0
+            # 일간 변동률 (절대값, 전일 종가 ≤ 0인 날 제외) → 어제까지 대비 오늘
+            closes = np.array([bar.get("close", 0) for bar in recent], dtype="float64")
+            zenP = _compact_change_zscore(_abs_changes(closes))
 
         except (ValueError, TypeError) as e:
             logger.warning(f"⚠️ {ticker}: zenP 계산 실패 - {e}")
@@ -204,15 +300,28 @@ class ZScoreCalculator:
         """
         여러 종목의 Z-Score 일괄 계산
 
+        [user-046] 전 종목을 하나의 DataFrame으로 모아 compute_daily_stats()로 계산
+
         Args:
             tickers_data: {ticker: daily_bars} 형식의 딕셔너리
 
         Returns:
             dict[str, ZScoreResult]: {ticker: ZScoreResult} 형식의 결과
+            (데이터 부족 종목은 zenV=0, zenP=0)
         """
-        results = {}
-        for ticker, bars in tickers_data.items():
-            results[ticker] = self.calculate(ticker, bars)
+        frames = [
+            pd.DataFrame(bars[-self.lookback :]).assign(ticker=ticker, _seq=range(min(len(bars), self.lookback)))
+            for ticker, bars in tickers_data.items()
+            if bars
+        ]
+        results = {ticker: ZScoreResult(zenV=0.0, zenP=0.0) for ticker in tickers_data}
+        if frames:
+            # 입력 순서(오래된 순)를 그대로 유지하도록 _seq를 date로 사용
+            merged = pd.concat(frames, ignore_index=True).drop(columns=["date"], errors="ignore")
+            merged = merged.rename(columns={"_seq": "date"})
+            stats = compute_daily_stats(merged, lookback=self.lookback)
+            for ticker, zen_v, zen_p in zip(stats["ticker"], stats["zenV"], stats["zenP"]):
+                results[ticker] = ZScoreResult(zenV=float(zen_v), zenP=float(zen_p))
 
         logger.info(f"📊 Z-Score 일괄 계산 완료: {len(results)}개 종목")
         return results
@@ -239,21 +348,17 @@ class ZScoreCalculator:
         recent = daily_bars[-self.lookback :]
 
         # Volume 통계
-        volumes = [bar.get("volume", 0) for bar in recent]
-        avg_volume = float(np.mean(volumes))
-        std_volume = float(np.std(volumes, ddof=0))
-
-        # Price Change 통계
-        changes = []
-        for i in range(1, len(recent)):
-            prev_close = recent[i - 1].get("close", 0)
-            curr_close = recent[i].get("close", 0)
-            if prev_close > 0:
-                pct_change = abs((curr_close - prev_close) / prev_close * 100)
-                changes.append(pct_change)
-
-        avg_change = float(np.mean(changes)) if changes else 0.0
-        std_change = float(np.std(changes, ddof=0)) if changes else 0.0
+        volumes = np.array([bar.get("volume", 0) for bar in recent], dtype="float64")
+        avg_volume = float(volumes.mean())
+        std_volume = float(volumes.std())
+
+        # Price Change 통계 (전일 종가 ≤ 0인 날 제외)
+        closes = np.array([bar.get("close", 0) for bar in recent], dtype="float64")
+        changes = _abs_changes(closes)
+        changes = changes[~np.isnan(changes)]
+
+        avg_change = float(changes.mean()) if len(changes) else 0.0
+        std_change = float(changes.std()) if len(changes) else 0.0
 
         stats = DailyStats(
             avg_volume=avg_volume,
@@ -296,8 +401,6 @@ class ZScoreCalculator:
         expected = stats.avg_volume * elapsed_ratio
 
         # 표준편차도 시간에 따라 조정 (sqrt rule)
-        import math
-
         adjusted_std = stats.std_volume * math.sqrt(elapsed_ratio)
 
         if adjusted_std <= 0:
@@ -325,3 +428,13 @@ class ZScoreCalculator:
     def get_cached_stats(self, ticker: str) -> Optional[DailyStats]:
         """캐시된 통계 조회"""
         return self._cache.get(ticker)
+
+    def load_stats(self, stats: dict[str, DailyStats]) -> None:
+        """
+        [user-046] 일괄 계산된 통계로 캐시 교체 (종목별 build_cache 대신)
+
+        Args:
+            stats: {ticker: DailyStats}
+        """
+        self._cache = dict(stats)
+        logger.debug(f"📊 Z-Score 통계 로드: {len(self._cache)}개 종목")
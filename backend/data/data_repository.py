@@ -15,6 +15,7 @@
 # 📌 [11-002] DataRepository 리팩터링
 # ============================================================================
 
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Optional
 import time
@@ -23,6 +24,9 @@ from loguru import logger
 
 from backend.data.parquet_manager import ParquetManager
 from backend.data.flush_policy import FlushPolicy, IntervalFlush
+from backend.data.gap_fill import GapFillCoordinator
+from backend.data.indicator_engine import IndicatorEngine
+from backend.data.score_journal import ScoreJournal
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -44,8 +48,9 @@ class DataRepository:
         _pm: ParquetManager 인스턴스 (Low-Level I/O)
         _client: MassiveClient 인스턴스 (API 호출용, None 가능)
         _flush_policy: 스코어 Flush 정책
+        _gap_filler: Gap Fill 조정자 (Single-Flight + 배치)
         _score_cache: 메모리 스코어 캐시
-        _indicator_cache: 보조지표 메모리 캐시
+        _indicators: 보조지표 캐시 엔진 (지표별 컬럼형 테이블)
 
     Example:
         >>> pm = ParquetManager("data/parquet")
@@ -74,19 +79,24 @@ class DataRepository:
         # FlushPolicy (ELI5: 스코어를 언제 파일에 저장할지 결정)
         self._flush_policy = flush_policy or IntervalFlush(interval_seconds=30.0)
 
+        # [user-026] Gap Fill 조정자 (ELI5: 같은 티커 동시 요청은 API 1회로 합침)
+        self._gap_filler = GapFillCoordinator(parquet_manager, massive_client)
+
         # 스코어 캐시 (메모리) - {ticker: score_data}
         self._score_cache: dict[str, dict[str, Any]] = {}
         self._last_flush = time.time()
         self._update_count = 0
 
-        # 보조지표 캐시 경로
-        self._indicator_dir = Path(self._pm.base_dir) / "indicators"
-        self._indicator_dir.mkdir(parents=True, exist_ok=True)
+        # [user-027] 보조지표 엔진 (indicators/{indicator}.parquet)
+        self._indicators = IndicatorEngine(parquet_manager)
 
         # 스코어 저장 경로
         self._scores_dir = Path(self._pm.base_dir) / "scores"
         self._scores_dir.mkdir(parents=True, exist_ok=True)
 
+        # [user-028] 스코어 저널 (변경분 Append + 주기적 Compaction)
+        self._score_journal = ScoreJournal(self._scores_dir)
+
         logger.info(f"📦 DataRepository initialized (FlushPolicy: {type(self._flush_policy).__name__})")
 
     # ═══════════════════════════════════════════════════════════════════════
@@ -146,14 +156,22 @@ class DataRepository:
         Returns:
             pd.DataFrame: Intraday 데이터
         """
-        # 1. 로컬에서 먼저 조회
-        df = self._pm.read_intraday(ticker, timeframe, days)
+        # 1. [user-044] 카탈로그로 봉 수 확인 (파일을 읽지 않음)
+        df = None
+        bar_count = self._pm.count_intraday_bars(ticker, timeframe, days)
+        if bar_count is None:
+            # 카탈로그 비활성화 → 로컬 조회 결과로 판단
+            df = self._pm.read_intraday(ticker, timeframe, days)
+            bar_count = len(df)
 
         # 2. auto_fill=True이고 데이터가 부족하면 Gap Fill
-        if auto_fill and self._has_intraday_gaps(df, ticker, timeframe, days):
+        if auto_fill and self._has_intraday_gaps(bar_count, ticker, timeframe, days):
             await self._fill_intraday_gaps(ticker, timeframe, days)
-            df = self._pm.read_intraday(ticker, timeframe, days)
+            df = None
 
+        # 3. 파일은 한 번만 읽음
+        if df is None:
+            df = self._pm.read_intraday(ticker, timeframe, days)
         return df
 
     def get_all_tickers(self) -> list[str]:
@@ -189,6 +207,44 @@ class DataRepository:
         """
         return self._pm.read_daily_bulk(tickers=tickers, days=days)
 
+    def get_daily_dates(self) -> list:
+        """[user-047] 로컬 일봉의 거래일 목록 (오름차순)"""
+        return self._pm.read_daily_dates()
+
+    def get_daily_bars_since(
+        self,
+        start_date,
+        tickers: list[str] | None = None,
+    ) -> dict[str, list[dict]]:
+        """
+        [user-047] start_date 이후 일봉 벌크 조회 (증분 스캔용, 로컬 데이터만)
+
+        Args:
+            start_date: 시작 날짜 (포함)
+            tickers: 조회할 티커 목록 (None이면 전체)
+
+        Returns:
+            dict[str, list[dict]]: 티커 → 일봉 데이터 (날짜순 정렬)
+        """
+        return self._pm.read_daily_since(start_date, tickers=tickers)
+
+    def get_daily_frame_since(
+        self,
+        start_date,
+        tickers: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """
+        [user-049] start_date 이후 일봉을 DataFrame으로 조회 (ML 피처 배치 계산용)
+
+        Args:
+            start_date: 시작 날짜 (포함)
+            tickers: 조회할 티커 목록 (None이면 전체)
+
+        Returns:
+            pd.DataFrame: 일봉 (ticker, date, open, high, low, close, volume ...)
+        """
+        return self._pm.read_daily_frame(start_date, tickers=tickers)
+
     # ═══════════════════════════════════════════════════════════════════════
     # Gap Detection & Fill (누락 감지 및 보충)
     # ═══════════════════════════════════════════════════════════════════════
@@ -225,13 +281,15 @@ class DataRepository:
         return False
 
     def _has_intraday_gaps(
-        self, df: pd.DataFrame, ticker: str, timeframe: str, days: int
+        self, bar_count: int, ticker: str, timeframe: str, days: int
     ) -> bool:
         """
         Intraday 데이터 누락 여부 판단
 
+        [user-044] DataFrame 대신 봉 수를 받음 (카탈로그 조회 결과)
+
         Args:
-            df: 현재 조회된 데이터
+            bar_count: 요청 구간의 저장된 봉 수
             ticker: 티커
             timeframe: 타임프레임
             days: 요청한 일수
@@ -239,7 +297,7 @@ class DataRepository:
         Returns:
             bool: True면 Gap Fill 필요
         """
-        if df.empty:
+        if bar_count == 0:
             logger.debug(f"📭 No intraday data for {ticker}_{timeframe}, gap fill needed")
             return True
 
@@ -248,10 +306,10 @@ class DataRepository:
         bars_per_day = {"1m": 390, "5m": 78, "15m": 26, "1h": 7}.get(timeframe, 390)
         expected_bars = bars_per_day * days * 0.5  # 보수적으로 50%
 
-        if len(df) < expected_bars:
+        if bar_count < expected_bars:
             logger.debug(
                 f"📭 Insufficient intraday data for {ticker}_{timeframe}: "
-                f"{len(df)}/{int(expected_bars)} expected"
+                f"{bar_count}/{int(expected_bars)} expected"
             )
             return True
 
@@ -259,142 +317,69 @@ class DataRepository:
 
     async def _fill_daily_gaps(self, ticker: str, days: int) -> None:
         """
-        일봉 Gap Fill (Massive API 호출)
+        일봉 Gap Fill (GapFillCoordinator 경유)
+
+        [user-026] 동시 요청은 조정자가 하나의 API 호출/저장으로 병합합니다.
 
         Args:
             ticker: 종목 심볼
             days: 조회할 일수
         """
-        if not self._client:
-            logger.warning(f"⚠️ Cannot fill daily gaps for {ticker}: no API client")
-            return
-
-        try:
-            logger.info(f"🔄 Filling daily gaps for {ticker} ({days} days)")
-
-            # Massive API 호출 (daily bars)
-            bars = await self._client.get_bars(ticker, interval="1d", limit=days)
-
-            if not bars:
-                logger.warning(f"⚠️ No daily bars returned for {ticker}")
-                return
-
-            # DataFrame 변환 및 저장
-            df = self._bars_to_daily_df(ticker, bars)
-            if not df.empty:
-                self._pm.append_daily(df)
-                logger.info(f"✅ Daily gap filled for {ticker}: {len(df)} bars")
-
-        except Exception as e:
-            logger.error(f"❌ Failed to fill daily gaps for {ticker}: {e}")
+        start, end = self._date_range(days)
+        await self._gap_filler.fill_daily(ticker, start, end)
 
     async def _fill_intraday_gaps(
         self, ticker: str, timeframe: str, days: int
     ) -> None:
         """
-        Intraday Gap Fill (Massive API 호출)
+        Intraday Gap Fill (GapFillCoordinator 경유)
 
         Args:
             ticker: 종목 심볼
             timeframe: 타임프레임
             days: 조회할 일수
         """
-        if not self._client:
-            logger.warning(f"⚠️ Cannot fill intraday gaps for {ticker}: no API client")
-            return
-
-        try:
-            logger.info(f"🔄 Filling intraday gaps for {ticker}_{timeframe} ({days} days)")
-
-            # Massive API 호출
-            # timeframe 변환: "1m" -> "1min", "1h" -> "1hour"
-            api_interval = self._timeframe_to_api_interval(timeframe)
-            bars = await self._client.get_bars(ticker, interval=api_interval, limit=days * 400)
-
-            if not bars:
-                logger.warning(f"⚠️ No intraday bars returned for {ticker}")
-                return
-
-            # DataFrame 변환 및 저장
-            df = self._bars_to_intraday_df(bars)
-            if not df.empty:
-                self._pm.append_intraday(ticker, timeframe, df)
-                logger.info(f"✅ Intraday gap filled for {ticker}_{timeframe}: {len(df)} bars")
-
-        except Exception as e:
-            logger.error(f"❌ Failed to fill intraday gaps for {ticker}: {e}")
+        start, end = self._date_range(days)
+        await self._gap_filler.fill_intraday(ticker, timeframe, start, end)
 
-    def _timeframe_to_api_interval(self, timeframe: str) -> str:
+    async def fill_daily_gaps_bulk(self, tickers: list[str], days: int = 60) -> int:
         """
-        ParquetManager timeframe → Massive API interval 변환
+        [user-026] 여러 티커의 일봉 Gap을 한 번에 보충
 
-        Args:
-            timeframe: "1m", "5m", "15m", "1h"
-
-        Returns:
-            str: API interval ("1min", "5min", "15min", "1hour")
-        """
-        mapping = {
-            "1m": "1min",
-            "5m": "5min",
-            "15m": "15min",
-            "1h": "1hour",
-        }
-        return mapping.get(timeframe, "1min")
-
-    def _bars_to_daily_df(self, ticker: str, bars: list[dict]) -> pd.DataFrame:
-        """
-        API 응답을 일봉 DataFrame으로 변환
+        ELI5: 로컬 데이터를 한 번에 읽어 부족한 티커만 골라낸 뒤,
+              티커가 많으면 "날짜별 전체 시장" API로 가져와서 한 번에 저장합니다.
 
         Args:
-            ticker: 종목 심볼
-            bars: API 응답 바 리스트
+            tickers: 종목 심볼 목록
+            days: 조회할 일수
 
         Returns:
-            pd.DataFrame: 일봉 데이터
+            int: 저장된 레코드 수
         """
-        if not bars:
-            return pd.DataFrame()
-
-        records = []
-        for bar in bars:
-            records.append({
-                "ticker": ticker,
-                "date": bar.get("date") or bar.get("t", ""),
-                "open": bar.get("open") or bar.get("o", 0),
-                "high": bar.get("high") or bar.get("h", 0),
-                "low": bar.get("low") or bar.get("l", 0),
-                "close": bar.get("close") or bar.get("c", 0),
-                "volume": bar.get("volume") or bar.get("v", 0),
-            })
+        local = self._pm.read_daily_bulk(tickers=tickers, days=days)
+        missing = [
+            t for t in tickers
+            if self._has_daily_gaps(pd.DataFrame(local.get(t, [])), t, days)
+        ]
+        if not missing:
+            return 0
+        start, end = self._date_range(days)
+        return await self._gap_filler.fill_daily_bulk(missing, start, end)
 
-        return pd.DataFrame(records)
-
-    def _bars_to_intraday_df(self, bars: list[dict]) -> pd.DataFrame:
+    @staticmethod
+    def _date_range(days: int) -> tuple[str, str]:
         """
-        API 응답을 Intraday DataFrame으로 변환
+        최근 N일 날짜 범위 (YYYY-MM-DD, 오늘 포함)
 
         Args:
-            bars: API 응답 바 리스트
+            days: 일수
 
         Returns:
-            pd.DataFrame: Intraday 데이터
+            tuple[str, str]: (시작일, 종료일)
         """
-        if not bars:
-            return pd.DataFrame()
-
-        records = []
-        for bar in bars:
-            records.append({
-                "timestamp": bar.get("timestamp") or bar.get("t", 0),
-                "open": bar.get("open") or bar.get("o", 0),
-                "high": bar.get("high") or bar.get("h", 0),
-                "low": bar.get("low") or bar.get("l", 0),
-                "close": bar.get("close") or bar.get("c", 0),
-                "volume": bar.get("volume") or bar.get("v", 0),
-            })
-
-        return pd.DataFrame(records)
+        today = datetime.now()
+        start = today - timedelta(days=days)
+        return start.strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d")
 
     # ═══════════════════════════════════════════════════════════════════════
     # Indicators (On-Demand 생산 + 저장)
@@ -407,131 +392,44 @@ class DataRepository:
         days: int = 60,
     ) -> Optional[pd.Series]:
         """
-        보조지표 조회 (캐시 우선, 없으면 계산 후 저장)
+        보조지표 조회 (캐시 우선, 새 일봉이 있으면 증분 계산)
 
         ELI5: "SMA 20일 줘" → 이미 계산했으면 바로 반환,
-              없으면 계산해서 저장 후 반환
+              어제 이후 새 일봉이 있으면 그 날짜만 이어서 계산
+
+        지원 지표:
+            - sma_{period}: 단순 이동평균
+            - ema_{period}: 지수 이동평균
+            - rsi_{period}: RSI
 
         Args:
             ticker: 종목 심볼
             indicator: 지표 이름 (예: "sma_20", "rsi_14")
-            days: 계산에 사용할 일수
+            days: 반환할 최근 일수
 
         Returns:
-            pd.Series: 계산된 지표 (없으면 None)
-        """
-        # 1. 캐시에서 먼저 확인
-        cached = self._load_indicator_cache(ticker, indicator)
-        if cached is not None:
-            return cached
-
-        # 2. 계산
-        result = self._calculate_indicator(ticker, indicator, days)
-
-        # 3. 저장 (On-Demand 생산 시 항상 저장)
-        if result is not None:
-            self._save_indicator_cache(ticker, indicator, result)
-
-        return result
-
-    def _load_indicator_cache(self, ticker: str, indicator: str) -> Optional[pd.Series]:
+            pd.Series: date 인덱스의 지표 값 (없으면 None)
         """
-        보조지표 캐시 로드
-
-        Args:
-            ticker: 종목 심볼
-            indicator: 지표 이름
+        return self._indicators.get(ticker, indicator, days)
 
-        Returns:
-            pd.Series: 캐시된 지표 (없으면 None)
+    def get_indicator_bulk(
+        self,
+        indicator: str,
+        tickers: list[str] | None = None,
+    ) -> pd.DataFrame:
         """
-        path = self._indicator_dir / f"{indicator}_{ticker}.parquet"
-        if not path.exists():
-            return None
-
-        try:
-            import pyarrow.parquet as pq
-            df = pq.read_table(path).to_pandas()
-            if "value" in df.columns:
-                return df["value"]
-            return None
-        except Exception as e:
-            logger.warning(f"⚠️ Failed to load indicator cache: {e}")
-            return None
+        [user-027] 전체 유니버스 보조지표 벡터화 계산
 
-    def _save_indicator_cache(self, ticker: str, indicator: str, data: pd.Series) -> None:
-        """
-        보조지표 캐시 저장
+        ELI5: 일봉 파일 1회 읽기로 모든 티커의 지표를 계산하고 저장합니다.
 
         Args:
-            ticker: 종목 심볼
             indicator: 지표 이름
-            data: 계산된 지표 시리즈
-        """
-        path = self._indicator_dir / f"{indicator}_{ticker}.parquet"
-        try:
-            import pyarrow as pa
-            import pyarrow.parquet as pq
-
-            df = pd.DataFrame({"value": data})
-            pq.write_table(pa.Table.from_pandas(df), path, compression="snappy")
-            logger.debug(f"💾 Indicator cached: {indicator}_{ticker}")
-        except Exception as e:
-            logger.warning(f"⚠️ Failed to save indicator cache: {e}")
-
-    def _calculate_indicator(
-        self, ticker: str, indicator: str, days: int
-    ) -> Optional[pd.Series]:
-        """
-        보조지표 계산
-
-        지원 지표:
-            - sma_{period}: 단순 이동평균
-            - ema_{period}: 지수 이동평균
-            - rsi_{period}: RSI
-
-        Args:
-            ticker: 종목 심볼
-            indicator: 지표 이름 (예: "sma_20")
-            days: 계산에 사용할 일수
+            tickers: 계산할 티커 목록 (None이면 전체)
 
         Returns:
-            pd.Series: 계산된 지표 (실패 시 None)
+            pd.DataFrame: ticker, date, value 컬럼
         """
-        # 일봉 데이터 조회 (동기 버전, cache only)
-        df = self._pm.read_daily(ticker, days)
-        if df.empty or "close" not in df.columns:
-            return None
-
-        close = df["close"]
-
-        # 지표 파싱 (예: "sma_20" → type="sma", period=20)
-        parts = indicator.split("_")
-        if len(parts) != 2:
-            logger.warning(f"⚠️ Unknown indicator format: {indicator}")
-            return None
-
-        ind_type, period_str = parts
-        try:
-            period = int(period_str)
-        except ValueError:
-            logger.warning(f"⚠️ Invalid indicator period: {indicator}")
-            return None
-
-        # 지표 계산
-        if ind_type == "sma":
-            return close.rolling(window=period).mean()
-        elif ind_type == "ema":
-            return close.ewm(span=period, adjust=False).mean()
-        elif ind_type == "rsi":
-            delta = close.diff()
-            gain = delta.where(delta > 0, 0).rolling(window=period).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-            rs = gain / loss.replace(0, float("nan"))
-            return 100 - (100 / (1 + rs))
-        else:
-            logger.warning(f"⚠️ Unsupported indicator type: {ind_type}")
-            return None
+        return self._indicators.compute_bulk(indicator, tickers)
 
     # ═══════════════════════════════════════════════════════════════════════
     # Scores (메모리 캐시 + 설정 기반 Flush)
@@ -546,7 +444,8 @@ class DataRepository:
         """
         스코어 업데이트 (갱신 주기에 따라 호출)
 
-        메모리 캐시에 저장하고, FlushPolicy에 따라 Parquet 저장
+        메모리 캐시에 저장하고, 값이 바뀌었으면 저널에 1행 추가합니다.
+        FlushPolicy에 따라 저널 변경분을 세그먼트로 저장합니다.
 
         Args:
             ticker: 종목 심볼
@@ -560,6 +459,9 @@ class DataRepository:
         }
         self._update_count += 1
 
+        # [user-028] 변경분만 저널에 기록 (ELI5: 점수가 같으면 기록 안 함)
+        self._score_journal.record(ticker, version, score_data)
+
         # FlushPolicy에 따라 저장 여부 결정
         if self._flush_policy.should_flush(self._last_flush, self._update_count):
             self._flush_scores(version)
@@ -585,29 +487,43 @@ class DataRepository:
         """
         return self._score_cache.copy()
 
-    def _flush_scores(self, version: str = "v3") -> None:
+    def get_score_history(
+        self,
+        ticker: str,
+        date: str | None = None,
+        version: str | None = None,
+    ) -> pd.DataFrame:
         """
-        스코어 Parquet 저장 (내부 호출)
+        [user-028] 티커 스코어 궤적 조회 (장중 score_v3 변화 차트용)
 
         Args:
-            version: 스코어 버전
+            ticker: 종목 심볼
+            date: 조회 날짜 (YYYY-MM-DD, 기본: 오늘)
+            version: 스코어 버전 (None이면 전체)
+
+        Returns:
+            pd.DataFrame: ts, version, score, i_* 컬럼 (시간순)
         """
-        if not self._score_cache:
-            return
+        return self._score_journal.get_trajectory(ticker, date=date, version=version)
 
-        try:
-            import pyarrow as pa
-            import pyarrow.parquet as pq
+    def _flush_scores(self, version: str = "v3") -> None:
+        """
+        스코어 저널 Flush (내부 호출)
 
-            df = pd.DataFrame(list(self._score_cache.values()))
-            path = self._scores_dir / f"current_{version}.parquet"
-            pq.write_table(pa.Table.from_pandas(df), path, compression="snappy")
+        [user-028] 전체 캐시 스냅샷 대신 변경분만 세그먼트로 기록합니다.
+
+        Args:
+            version: 스코어 버전 (저널은 행마다 버전을 기록하므로 로깅용)
+        """
+        try:
+            count = self._score_journal.flush()
 
             # 상태 리셋
             self._last_flush = time.time()
             self._update_count = 0
 
-            logger.debug(f"💾 Scores flushed: {len(df)} tickers → {path}")
+            if count:
+                logger.debug(f"💾 Scores flushed ({version}): {count} changed rows")
         except Exception as e:
             logger.error(f"❌ Failed to flush scores: {e}")
 
@@ -615,11 +531,18 @@ class DataRepository:
         """
         강제 Flush (장 마감, 서버 종료 시 호출)
 
+        저널 Compaction으로 당일 세그먼트까지 병합합니다.
+
         Args:
             version: 스코어 버전
         """
         logger.info("⚡ Force flushing scores...")
         self._flush_scores(version)
+        try:
+            self._score_journal.compact()
+        except Exception as e:
+            logger.error(f"❌ Failed to compact score journal: {e}")
+        self._indicators.flush()
 
     # ═══════════════════════════════════════════════════════════════════════
     # Utilities
@@ -638,4 +561,7 @@ class DataRepository:
             "score_cache_size": len(self._score_cache),
             "flush_policy": type(self._flush_policy).__name__,
             "update_count": self._update_count,
+            "gap_fill": self._gap_filler.get_stats(),
+            "indicators": self._indicators.get_stats(),
+            "score_journal": self._score_journal.get_stats(),
         }
@@ -12,7 +12,9 @@
 #
 # ⚙️ 최적화:
 #   - WAL Mode (Write-Ahead Logging) 활성화로 동시성 향상
-#   - Bulk Upsert로 대량 데이터 빠르게 처리
+#   - 연결마다 synchronous/cache_size/temp_store PRAGMA 적용
+#   - Bulk Upsert: 배치당 트랜잭션 1개 + 준비된 UPSERT 문 executemany
+#   - (선택) TEMP 스테이징 테이블 적재 후 INSERT ... SELECT 병합
 #
 # 📖 사용 예시:
 #   >>> db = MarketDB("data/market_data.db")
@@ -24,7 +26,7 @@ import os
 from datetime import datetime
 from typing import Optional, Sequence
 
-from sqlalchemy import String, Float, Integer, Text, select, text
+from sqlalchemy import String, Float, Integer, Text, event, select, text
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
@@ -285,6 +287,56 @@ class Ticker(Base):
         }
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# [user-030] Bulk 적재용 SQL / PRAGMA
+# ═══════════════════════════════════════════════════════════════════════════
+
+# 연결마다 적용되는 PRAGMA (journal_mode=WAL은 파일에 영구 저장되므로 initialize에서 1회)
+# ELI5: synchronous는 연결 단위 설정이라, 커넥션 풀의 새 연결마다 다시 걸어야 합니다.
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",  # WAL에서는 NORMAL로도 커밋 내구성 유지
+    "PRAGMA temp_store=MEMORY",  # 스테이징 TEMP 테이블을 메모리에
+    "PRAGMA cache_size=-65536",  # 페이지 캐시 64MB
+    "PRAGMA busy_timeout=5000",  # 다른 연결이 쓰는 중이면 5초 대기
+)
+
+DAILY_COLUMNS = ("ticker", "date", "open", "high", "low", "close", "volume", "vwap", "transactions")
+DAILY_KEYS = ("ticker", "date")
+
+INTRADAY_COLUMNS = ("ticker", "timeframe", "timestamp", "open", "high", "low", "close", "volume", "vwap")
+INTRADAY_KEYS = ("ticker", "timeframe", "timestamp")
+
+
+def _upsert_sql(table: str, columns: tuple, keys: tuple, source: Optional[str] = None) -> str:
+    """
+    UPSERT 문 생성
+
+    Args:
+        table: 대상 테이블
+        columns: 컬럼 순서 (executemany 튜플 순서와 동일)
+        keys: 충돌 판단 키 (Primary Key)
+        source: 지정 시 VALUES 대신 해당 테이블에서 INSERT ... SELECT
+
+    Returns:
+        str: qmark 파라미터 스타일 SQL
+    """
+    cols = ", ".join(columns)
+    updates = ", ".join(f"{c}=excluded.{c}" for c in columns if c not in keys)
+    if source:
+        # SELECT 뒤 ON CONFLICT 파싱 모호성 회피를 위해 WHERE true 필요 (SQLite 문서)
+        body = f"SELECT {cols} FROM {source} WHERE true"
+    else:
+        body = "VALUES (" + ", ".join("?" * len(columns)) + ")"
+    return (
+        f"INSERT INTO {table} ({cols}) {body} "
+        f"ON CONFLICT({', '.join(keys)}) DO UPDATE SET {updates}"
+    )
+
+
+DAILY_UPSERT_SQL = _upsert_sql("daily_bars", DAILY_COLUMNS, DAILY_KEYS)
+INTRADAY_UPSERT_SQL = _upsert_sql("intraday_bars", INTRADAY_COLUMNS, INTRADAY_KEYS)
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # MarketDB 클래스 - 데이터베이스 매니저
 # ═══════════════════════════════════════════════════════════════════════════
@@ -344,6 +396,14 @@ class MarketDB:
             echo=False,  # SQL 쿼리 로깅 (디버그 시 True)
         )
 
+        # [user-030] 새 DBAPI 연결마다 PRAGMA 적용
+        @event.listens_for(self.engine.sync_engine, "connect")
+        def _apply_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            for pragma in CONNECTION_PRAGMAS:
+                cursor.execute(pragma)
+            cursor.close()
+
         # ─────────────────────────────────────────────────────────────────
         # Session Factory 생성
         # - expire_on_commit=False: 커밋 후에도 객체 접근 가능
@@ -378,12 +438,11 @@ class MarketDB:
             await conn.run_sync(Base.metadata.create_all)
 
         # ─────────────────────────────────────────────────────────────────
-        # WAL 모드 활성화
+        # WAL 모드 활성화 (DB 파일에 영구 저장)
+        # synchronous 등 연결 단위 PRAGMA는 connect 이벤트에서 적용
         # ─────────────────────────────────────────────────────────────────
-        async with self.session_factory() as session:
-            await session.execute(text("PRAGMA journal_mode=WAL"))
-            await session.execute(text("PRAGMA synchronous=NORMAL"))  # 성능 향상
-            await session.commit()
+        async with self.engine.connect() as conn:
+            await conn.exec_driver_sql("PRAGMA journal_mode=WAL")
 
         logger.info("✅ 데이터베이스 초기화 완료 (WAL Mode 활성화)")
 
@@ -391,19 +450,28 @@ class MarketDB:
     # DailyBar CRUD
     # ═══════════════════════════════════════════════════════════════════════
 
-    async def upsert_bulk(self, bars: Sequence[dict], chunk_size: int = 500) -> int:
+    async def upsert_bulk(
+        self,
+        bars: Sequence[dict],
+        chunk_size: int = 5000,
+        use_staging: bool = False,
+    ) -> int:
         """
-        일봉 데이터 Bulk Upsert (INSERT OR REPLACE)
+        일봉 데이터 Bulk Upsert (INSERT ... ON CONFLICT DO UPDATE)
 
         같은 (ticker, date) 조합이 있으면 업데이트하고,
         없으면 새로 삽입합니다.
 
-        SQLite의 파라미터 제한을 피하기 위해 청크 단위로 처리합니다.
+        호출 1회 = 트랜잭션 1개. 준비된 UPSERT 문을 executemany로 실행하므로
+        SQLite 파라미터 개수 제한과 무관하고, 문장 파싱도 1회뿐입니다.
 
         Args:
             bars: 딕셔너리 리스트. 각 딕셔너리는 다음 키를 가집니다:
                   ticker, date, open, high, low, close, volume, vwap, transactions
-            chunk_size: 한 번에 처리할 레코드 수 (기본값: 500)
+                  (vwap, transactions는 없으면 NULL)
+            chunk_size: executemany 1회당 레코드 수 (메모리 상한, 트랜잭션은 1개)
+            use_staging: True면 TEMP 테이블에 적재 후 INSERT ... SELECT로 병합
+                (여러 날짜를 한 번에 넣는 대량 백필에서 유리)
 
         Returns:
             int: 처리된 레코드 수
@@ -416,46 +484,75 @@ class MarketDB:
             >>> count = await db.upsert_bulk(bars)
             >>> print(f"{count}개 레코드 처리됨")
         """
-        if not bars:
+        count = await self._bulk_write(
+            "daily_bars", DAILY_COLUMNS, DAILY_KEYS, DAILY_UPSERT_SQL,
+            bars, chunk_size, use_staging,
+        )
+        if count:
+            logger.debug(f"📊 {count}개 일봉 데이터 Upsert 완료")
+        return count
+
+    async def _bulk_write(
+        self,
+        table: str,
+        columns: tuple,
+        keys: tuple,
+        upsert_sql: str,
+        rows: Sequence[dict],
+        chunk_size: int,
+        use_staging: bool,
+    ) -> int:
+        """
+        단일 트랜잭션 Bulk Upsert 공통 구현
+
+        ELI5: 상자(트랜잭션)를 한 번만 열고, 같은 주문서(준비된 SQL)에
+              줄만 바꿔 가며 수천 개를 한꺼번에 넣은 뒤 한 번에 닫습니다.
+
+        Args:
+            table: 대상 테이블
+            columns: 컬럼 순서
+            keys: Primary Key 컬럼
+            upsert_sql: VALUES 방식 UPSERT 문
+            rows: 딕셔너리 리스트
+            chunk_size: executemany 1회당 행 수
+            use_staging: TEMP 스테이징 테이블 경유 여부
+
+        Returns:
+            int: 처리된 레코드 수
+        """
+        if not rows:
             return 0
 
-        total_count = 0
+        chunk_size = max(1, chunk_size)
+        stage = f"_stage_{table}"
 
-        # ─────────────────────────────────────────────────────────────────
-        # 청크 단위로 분할 처리
-        # SQLite는 한 쿼리에 999개 파라미터 제한이 있음
-        # 각 레코드가 9개 컬럼 → 약 100개 레코드가 한계
-        # 안전하게 500개씩 처리 (9*500=4500 < SQLITE_MAX_VARIABLE_NUMBER)
-        # ─────────────────────────────────────────────────────────────────
-        for i in range(0, len(bars), chunk_size):
-            chunk = bars[i : i + chunk_size]
-
-            async with self.session_factory() as session:
-                # ─────────────────────────────────────────────────────────
-                # SQLite INSERT OR REPLACE 사용
-                # - Primary Key 충돌 시 기존 레코드를 새 값으로 교체
-                # ─────────────────────────────────────────────────────────
-                stmt = sqlite_insert(DailyBar).values(list(chunk))
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=["ticker", "date"],
-                    set_={
-                        "open": stmt.excluded.open,
-                        "high": stmt.excluded.high,
-                        "low": stmt.excluded.low,
-                        "close": stmt.excluded.close,
-                        "volume": stmt.excluded.volume,
-                        "vwap": stmt.excluded.vwap,
-                        "transactions": stmt.excluded.transactions,
-                    },
+        async with self.engine.begin() as conn:
+            if use_staging:
+                # 제약 없는 TEMP 테이블 → PK 검사 없이 빠르게 적재
+                await conn.exec_driver_sql(
+                    f"CREATE TEMP TABLE IF NOT EXISTS {stage} AS "
+                    f"SELECT {', '.join(columns)} FROM {table} WHERE 0"
+                )
+                await conn.exec_driver_sql(f"DELETE FROM {stage}")
+                write_sql = (
+                    f"INSERT INTO {stage} ({', '.join(columns)}) "
+                    f"VALUES ({', '.join('?' * len(columns))})"
                 )
+            else:
+                write_sql = upsert_sql
 
-                await session.execute(stmt)
-                await session.commit()
+            for i in range(0, len(rows), chunk_size):
+                params = [
+                    tuple(row.get(col) for col in columns)
+                    for row in rows[i : i + chunk_size]
+                ]
+                await conn.exec_driver_sql(write_sql, params)
 
-            total_count += len(chunk)
+            if use_staging:
+                await conn.exec_driver_sql(_upsert_sql(table, columns, keys, source=stage))
+                await conn.exec_driver_sql(f"DELETE FROM {stage}")
 
-        logger.debug(f"📊 {total_count}개 일봉 데이터 Upsert 완료")
-        return total_count
+        return len(rows)
 
     async def get_daily_bars(
         self, ticker: str, days: int = 20, end_date: Optional[str] = None
@@ -528,18 +625,22 @@ class MarketDB:
     # ═══════════════════════════════════════════════════════════════════════
 
     async def upsert_intraday_bulk(
-        self, bars: Sequence[dict], chunk_size: int = 500
+        self,
+        bars: Sequence[dict],
+        chunk_size: int = 5000,
+        use_staging: bool = False,
     ) -> int:
         """
-        Intraday 데이터 Bulk Upsert (INSERT OR REPLACE)
+        Intraday 데이터 Bulk Upsert (INSERT ... ON CONFLICT DO UPDATE)
 
         같은 (ticker, timeframe, timestamp) 조합이 있으면 업데이트하고,
-        없으면 새로 삽입합니다.
+        없으면 새로 삽입합니다. upsert_bulk()와 같이 호출 1회 = 트랜잭션 1개입니다.
 
         Args:
             bars: 딕셔너리 리스트. 각 딕셔너리는 다음 키를 가집니다:
                   ticker, timeframe, timestamp, open, high, low, close, volume, vwap
-            chunk_size: 한 번에 처리할 레코드 수 (기본값: 500)
+            chunk_size: executemany 1회당 레코드 수
+            use_staging: True면 TEMP 테이블에 적재 후 INSERT ... SELECT로 병합
 
         Returns:
             int: 처리된 레코드 수
@@ -550,35 +651,13 @@ class MarketDB:
             ... ]
             >>> count = await db.upsert_intraday_bulk(bars)
         """
-        if not bars:
-            return 0
-
-        total_count = 0
-
-        for i in range(0, len(bars), chunk_size):
-            chunk = bars[i : i + chunk_size]
-
-            async with self.session_factory() as session:
-                stmt = sqlite_insert(IntradayBar).values(list(chunk))
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=["ticker", "timeframe", "timestamp"],
-                    set_={
-                        "open": stmt.excluded.open,
-                        "high": stmt.excluded.high,
-                        "low": stmt.excluded.low,
-                        "close": stmt.excluded.close,
-                        "volume": stmt.excluded.volume,
-                        "vwap": stmt.excluded.vwap,
-                    },
-                )
-
-                await session.execute(stmt)
-                await session.commit()
-
-            total_count += len(chunk)
-
-        logger.debug(f"📊 {total_count}개 Intraday 데이터 Upsert 완료")
-        return total_count
+        count = await self._bulk_write(
+            "intraday_bars", INTRADAY_COLUMNS, INTRADAY_KEYS, INTRADAY_UPSERT_SQL,
+            bars, chunk_size, use_staging,
+        )
+        if count:
+            logger.debug(f"📊 {count}개 Intraday 데이터 Upsert 완료")
+        return count
 
     async def get_intraday_bars(
         self, ticker: str, timeframe: str, start_timestamp: int, end_timestamp: int
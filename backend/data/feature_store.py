@@ -0,0 +1,365 @@
+# ============================================================================
+# Feature Store - 일봉 기반 Point-in-Time 피처 저장소
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - 전체 일봉(all_daily.parquet)에서 모든 (ticker, date)의 피처를
+#     티커별 rolling 한 번으로 계산 (행마다 전체 테이블 필터링 없음)
+#   - 월 단위 파티션 Parquet로 저장 + 원본 변경 시에만 재계산
+#   - 임의의 (ticker, target_date) 목록에 as-of 조인으로 D-1 피처 제공
+#
+# 📂 저장 구조:
+#   features/d1/
+#   ├── _meta.json                  # 원본 경로/mtime/행 수, 피처 버전
+#   └── month=2025-12/part.parquet  # 해당 월 모든 티커의 피처 행
+#
+# 📖 사용 예시:
+#   >>> store = FeatureStore("data/parquet/features/d1")
+#   >>> store.ensure("data/parquet/daily/all_daily.parquet")
+#   >>> df = store.as_of(targets)  # targets: ticker, target_date 컬럼
+#
+# 📌 [user-041] Vectorized point-in-time feature store
+# ============================================================================
+
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+from loguru import logger
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 피처 정의
+# ═══════════════════════════════════════════════════════════════════════════
+
+# 피처 계산식이 바뀌면 올려서 기존 저장소를 무효화
+FEATURE_VERSION = 1
+
+# D-1 피처 컬럼 (scripts/build_d1_features.py 출력과 동일한 이름)
+FEATURE_COLUMNS: list[str] = [
+    "close_d1",
+    "volume_d1",
+    "rvol_20d",
+    "price_vs_20ma",
+    "price_vs_52w_high",
+    "atr_pct",
+    "volume_trend_5d",
+    "gap_count_30d",
+]
+
+# 피처가 유효해지는 최소 관측 수 (해당일 포함 이력 행 수)
+MIN_HISTORY = 2
+
+
+def _ratio_pct(num: pd.Series, den: pd.Series) -> pd.Series:
+    """(num / den - 1) × 100, den ≤ 0 또는 결측이면 NaN"""
+    return ((num / den.where(den > 0)) - 1) * 100
+
+
+def compute_point_in_time_features(daily_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    모든 (ticker, date) 행의 피처를 한 번에 계산.
+
+    각 행의 값은 "그 날 장 마감 시점까지의 이력만으로" 계산됩니다.
+    즉 target_date의 D-1 피처 = target_date 직전 거래일 행의 값.
+
+    ELI5: 종목별로 줄을 세운 뒤, 창문(20일, 14일 ...)을 한 칸씩 밀면서
+          모든 날짜를 한 번에 계산합니다. 창문이 이전 종목으로 넘어가는
+          앞부분 행은 "이력 부족"으로 비워 둡니다.
+
+    Args:
+        daily_df: ticker, date, open, high, low, close, volume 컬럼의 일봉
+
+    Returns:
+        ticker, date(datetime64), n_obs + FEATURE_COLUMNS 컬럼 DataFrame
+        (ticker, date 순 정렬)
+    """
+    df = daily_df[["ticker", "date", "open", "high", "low", "close", "volume"]].copy()
+    df["date"] = pd.to_datetime(df["date"]).dt.normalize()
+    df = df.sort_values(["ticker", "date"], kind="mergesort").reset_index(drop=True)
+
+    # 티커 내 위치 (0부터) - 창문이 티커 경계를 넘는 행을 가려내는 데 사용
+    pos = df.groupby("ticker", sort=False).cumcount().to_numpy()
+
+    close = df["close"].astype("float64")
+    high = df["high"].astype("float64")
+    low = df["low"].astype("float64")
+    opens = df["open"].astype("float64")
+    volume = df["volume"].astype("float64")
+
+    # min_periods=1: 결측을 건너뛰는 Series.mean()과 같은 집계
+    def rolling_mean(s: pd.Series, window: int) -> pd.Series:
+        return s.rolling(window, min_periods=1).mean()
+
+    out = pd.DataFrame({"ticker": df["ticker"], "date": df["date"], "n_obs": pos + 1})
+    out["close_d1"] = close
+    out["volume_d1"] = volume
+
+    # RVOL 20일: 해당일 거래량 / 직전 20일 평균 (해당일 제외)
+    vol_20d = rolling_mean(volume, 20).shift(1)
+    out["rvol_20d"] = (volume / vol_20d.where(vol_20d > 0)).where(pos >= 20)
+
+    # 20MA 대비 가격 (해당일 포함 20일)
+    out["price_vs_20ma"] = _ratio_pct(close, rolling_mean(close, 20)).where(pos >= 19)
+
+    # 52주 고점 대비: 최근 min(252, 이력)일 고점, 이력 20일 이상
+    # 252일 미만 구간은 티커 내 누적 최대 (창문이 이전 티커로 넘어가지 않도록)
+    high_52w = high.rolling(252, min_periods=1).max().where(
+        pos >= 251, high.groupby(df["ticker"], sort=False).cummax()
+    )
+    out["price_vs_52w_high"] = _ratio_pct(close, high_52w).where(pos >= 19)
+
+    # ATR% 14일: (High - Low) 평균 / 종가
+    atr_14 = rolling_mean(high - low, 14)
+    out["atr_pct"] = ((atr_14 / close.where(close > 0)) * 100).where(pos >= 13)
+
+    # 5일 거래량 추세: 최근 5일 평균 vs 그 이전 5일 평균
+    vol_5 = rolling_mean(volume, 5)
+    out["volume_trend_5d"] = _ratio_pct(vol_5, vol_5.shift(5)).where(pos >= 9)
+
+    # 30일 갭 횟수: |Open - PrevClose| / PrevClose > 2% (전일 종가도 같은 티커)
+    prev_close = close.shift(1).where(pos >= 1)
+    gap = ((opens - prev_close) / prev_close).abs() * 100
+    out["gap_count_30d"] = (gap > 2).astype("float64").rolling(30).sum().where(pos >= 30)
+
+    return out
+
+
+def _last_ratio_pct(num: float, den: float) -> float:
+    return (num / den - 1) * 100 if den > 0 else np.nan
+
+
+def compute_latest_features(bars: pd.DataFrame) -> Optional[dict[str, float]]:
+    """
+    [user-049] 한 종목의 마지막 행 피처만 계산 (실시간 단건 추론용)
+
+    compute_point_in_time_features()의 마지막 행과 같은 값을 numpy 슬라이스로
+    계산합니다 (rolling 전체 계산 없이 수십 µs).
+
+    Args:
+        bars: 한 종목의 일봉 (open, high, low, close, volume, 날짜 오름차순)
+
+    Returns:
+        FEATURE_COLUMNS → 값 (계산 불가 항목은 NaN), 이력 부족이면 None
+    """
+    n = len(bars)
+    if n < MIN_HISTORY:
+        return None
+
+    opens = bars["open"].to_numpy(dtype="float64")
+    high = bars["high"].to_numpy(dtype="float64")
+    low = bars["low"].to_numpy(dtype="float64")
+    close = bars["close"].to_numpy(dtype="float64")
+    volume = bars["volume"].to_numpy(dtype="float64")
+    last_close, last_volume = close[-1], volume[-1]
+    nan = np.nan
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vol_20d = np.nanmean(volume[-21:-1]) if n >= 21 else nan
+        ma_20 = np.nanmean(close[-20:]) if n >= 20 else nan
+        high_52w = np.nanmax(high[-252:]) if n >= 20 else nan
+        atr_14 = np.nanmean((high - low)[-14:]) if n >= 14 else nan
+        if n >= 31:
+            prev_close = close[-31:-1]
+            gap = np.abs((opens[-30:] - prev_close) / prev_close) * 100
+            gap_count = float((gap > 2).sum())
+        else:
+            gap_count = nan
+
+        return {
+            "close_d1": last_close,
+            "volume_d1": last_volume,
+            "rvol_20d": last_volume / vol_20d if vol_20d > 0 else nan,
+            "price_vs_20ma": _last_ratio_pct(last_close, ma_20),
+            "price_vs_52w_high": _last_ratio_pct(last_close, high_52w),
+            "atr_pct": atr_14 / last_close * 100 if n >= 14 and last_close > 0 else nan,
+            "volume_trend_5d": (
+                _last_ratio_pct(np.nanmean(volume[-5:]), np.nanmean(volume[-10:-5]))
+                if n >= 10 else nan
+            ),
+            "gap_count_30d": gap_count,
+        }
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# FeatureStore 클래스
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class FeatureStore:
+    """
+    Point-in-Time 피처 저장소
+
+    일봉 원본에서 전 종목·전 날짜 피처를 계산해 월 파티션으로 저장하고,
+    (ticker, target_date) 목록에 대해 직전 거래일 피처를 as-of 조인으로 반환합니다.
+
+    Attributes:
+        root: 저장 디렉터리
+    """
+
+    META_FILE = "_meta.json"
+
+    def __init__(self, root: Union[str, Path] = "data/parquet/features/d1"):
+        self.root = Path(root)
+
+    # ───────────────────────────────────────────────────────────────────────
+    # 빌드
+    # ───────────────────────────────────────────────────────────────────────
+
+    def build(
+        self,
+        daily_df: pd.DataFrame,
+        source: Optional[Union[str, Path]] = None,
+    ) -> pd.DataFrame:
+        """
+        전체 피처 계산 후 저장 (기존 저장소 교체).
+
+        Args:
+            daily_df: 일봉 DataFrame
+            source: 원본 파일 경로 (메타데이터 기록용, stale 판정에 사용)
+
+        Returns:
+            계산된 피처 DataFrame
+        """
+        features = compute_point_in_time_features(daily_df)
+
+        # 임시 디렉터리에 쓴 뒤 교체 (중간에 실패해도 기존 저장소 유지)
+        tmp = self.root.with_name(self.root.name + ".tmp")
+        if tmp.exists():
+            shutil.rmtree(tmp)
+        tmp.mkdir(parents=True)
+
+        # 정수 키로 그룹핑 (dt.strftime은 수백만 행에서 수십 초)
+        month = features["date"].dt.year * 100 + features["date"].dt.month
+        for key, part in features.groupby(month, sort=True):
+            part_dir = tmp / f"month={key // 100}-{key % 100:02d}"
+            part_dir.mkdir()
+            part.to_parquet(part_dir / "part.parquet", index=False)
+
+        meta = {"version": FEATURE_VERSION, "rows": len(features), **self._source_meta(source)}
+        (tmp / self.META_FILE).write_text(json.dumps(meta, indent=2), encoding="utf-8")
+
+        if self.root.exists():
+            shutil.rmtree(self.root)
+        tmp.rename(self.root)
+
+        logger.info(f"📦 FeatureStore 빌드: {len(features):,} rows → {self.root}")
+        return features
+
+    def is_stale(self, source: Union[str, Path]) -> bool:
+        """원본 파일이 바뀌었거나 피처 버전이 다르면 True"""
+        meta_path = self.root / self.META_FILE
+        if not meta_path.exists():
+            return True
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            return True
+        current = self._source_meta(source)
+        return meta.get("version") != FEATURE_VERSION or any(
+            meta.get(k) != v for k, v in current.items()
+        )
+
+    def ensure(self, source: Union[str, Path]) -> bool:
+        """
+        저장소가 최신인지 확인하고, 아니면 원본을 읽어 재빌드.
+
+        Returns:
+            재빌드했으면 True
+        """
+        if not self.is_stale(source):
+            return False
+        logger.info(f"📦 FeatureStore 재빌드 필요: {source}")
+        self.build(pd.read_parquet(source), source=source)
+        return True
+
+    @staticmethod
+    def _source_meta(source: Optional[Union[str, Path]]) -> dict:
+        if source is None:
+            return {}
+        stat = os.stat(source)
+        return {"source": str(source), "source_mtime": stat.st_mtime, "source_size": stat.st_size}
+
+    # ───────────────────────────────────────────────────────────────────────
+    # 조회
+    # ───────────────────────────────────────────────────────────────────────
+
+    def read(
+        self,
+        tickers: Optional[Iterable[str]] = None,
+        start: Optional[pd.Timestamp] = None,
+        end: Optional[pd.Timestamp] = None,
+    ) -> pd.DataFrame:
+        """
+        저장된 피처 조회 (티커/날짜 조건은 Parquet 필터로 전달).
+
+        Args:
+            tickers: 티커 목록 (None이면 전체)
+            start: 시작일 (포함)
+            end: 종료일 (포함)
+        """
+        filters = []
+        if tickers is not None:
+            filters.append(("ticker", "in", sorted(set(tickers))))
+        if start is not None:
+            filters.append(("date", ">=", pd.Timestamp(start)))
+        if end is not None:
+            filters.append(("date", "<=", pd.Timestamp(end)))
+
+        table = pq.read_table(self.root, filters=filters or None, partitioning="hive")
+        df = table.drop_columns(["month"]).to_pandas()
+        return df.sort_values(["ticker", "date"], kind="mergesort").reset_index(drop=True)
+
+    def as_of(self, targets: pd.DataFrame, date_col: str = "target_date") -> pd.DataFrame:
+        """
+        각 (ticker, target_date)의 직전 거래일(target_date 미포함) 피처를 붙여 반환.
+
+        ELI5: "급등 전날 이 종목은 어땠나?"를 표 전체에 대해 한 번에 찾습니다.
+              이력이 2일 미만이면 피처는 비워 둡니다 (기존 has_data=False).
+
+        Args:
+            targets: ticker, date_col 컬럼을 포함한 DataFrame
+            date_col: 기준일 컬럼명
+
+        Returns:
+            targets 원래 순서/컬럼 + d1_date + FEATURE_COLUMNS
+        """
+        keys = pd.DataFrame({
+            "_row": np.arange(len(targets)),
+            "ticker": targets["ticker"].to_numpy(),
+            "_target": pd.to_datetime(targets[date_col]).dt.normalize().to_numpy(),
+        })
+
+        features = self.read(tickers=keys["ticker"].unique(), end=keys["_target"].max())
+        features = features.rename(columns={"date": "d1_date"})
+
+        merged = pd.merge_asof(
+            keys.sort_values("_target", kind="mergesort"),
+            features.sort_values("d1_date", kind="mergesort"),
+            left_on="_target",
+            right_on="d1_date",
+            by="ticker",
+            allow_exact_matches=False,
+            direction="backward",
+        ).sort_values("_row")
+
+        insufficient = ~(merged["n_obs"] >= MIN_HISTORY).to_numpy()
+        merged.loc[insufficient, FEATURE_COLUMNS + ["d1_date"]] = np.nan
+
+        result = targets.reset_index(drop=True).copy()
+        result["d1_date"] = merged["d1_date"].to_numpy()
+        for col in FEATURE_COLUMNS:
+            result[col] = merged[col].to_numpy()
+        return result
+
+
+__all__ = [
+    "FeatureStore",
+    "FEATURE_COLUMNS",
+    "compute_latest_features",
+    "compute_point_in_time_features",
+]
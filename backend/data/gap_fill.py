@@ -0,0 +1,457 @@
+# ============================================================================
+# Gap Fill Coordinator - 단일 비행(Single-Flight) Gap Fill 조정자
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - 동일 (ticker, timeframe, 범위)에 대한 동시 Gap Fill 요청을 하나로 합침
+#   - 인접/겹치는 날짜 범위를 하나의 API 호출로 병합
+#   - 다수 티커의 일봉 Gap은 Grouped Daily API로 일괄 보충
+#   - 배치 결과를 한 번의 저장 트랜잭션(파일 재작성 1회)으로 기록
+#
+# 📖 사용 예시:
+#   >>> coordinator = GapFillCoordinator(parquet_manager, massive_client)
+#   >>> await coordinator.fill_daily("AAPL", "2024-11-01", "2024-12-17")
+#   >>> await coordinator.fill_intraday("AAPL", "1m", "2024-12-16", "2024-12-17")
+#
+# 📌 [user-026] Single-flight Gap Fill + Batched Backfill
+# ============================================================================
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+import pandas as pd
+from loguru import logger
+
+from backend.data.parquet_manager import ParquetManager
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 상수
+# ═══════════════════════════════════════════════════════════════════════════
+
+# 일봉 타임프레임 키 (ELI5: 일봉은 "1D"로 구분합니다)
+DAILY_TIMEFRAME = "1D"
+
+# ParquetManager timeframe → Massive Aggregates API multiplier (분 단위)
+TIMEFRAME_MULTIPLIERS: dict[str, int] = {
+    "1m": 1,
+    "5m": 5,
+    "15m": 15,
+    "1h": 60,
+}
+
+# 하루 정규장 바 개수 (API limit 산정용)
+BARS_PER_DAY: dict[str, int] = {"1m": 390, "5m": 78, "15m": 26, "1h": 7}
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Fill Job
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+@dataclass
+class _FillJob:
+    """
+    하나의 (ticker, timeframe) 범위 보충 작업
+
+    Attributes:
+        ticker: 종목 심볼
+        timeframe: "1D" 또는 intraday 타임프레임
+        start: 시작일 (YYYY-MM-DD, 포함)
+        end: 종료일 (YYYY-MM-DD, 포함)
+        future: 완료 시 저장된 레코드 수로 resolve
+        dispatched: True면 이미 API 호출 시작 (범위 확장 불가)
+    """
+
+    ticker: str
+    timeframe: str
+    start: str
+    end: str
+    future: asyncio.Future = field(repr=False)
+    dispatched: bool = False
+
+    def covers(self, start: str, end: str) -> bool:
+        """요청 범위를 완전히 포함하는지"""
+        return self.start <= start and end <= self.end
+
+    def touches(self, start: str, end: str) -> bool:
+        """요청 범위와 겹치거나 하루 차이로 인접하는지"""
+        return start <= _shift_date(self.end, 1) and _shift_date(self.start, -1) <= end
+
+
+def _shift_date(date_str: str, days: int) -> str:
+    """YYYY-MM-DD 문자열을 days만큼 이동"""
+    dt = datetime.strptime(date_str, "%Y-%m-%d") + timedelta(days=days)
+    return dt.strftime("%Y-%m-%d")
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# GapFillCoordinator 클래스
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class GapFillCoordinator:
+    """
+    Gap Fill 요청 조정자 (Single-Flight + 배치)
+
+    RealtimeScanner, /api/zscore, 차트 페이징, Watchlist 재계산이 같은 티커를
+    동시에 요청해도 API 호출과 파일 재작성은 한 번만 일어납니다.
+
+    ELI5: 여러 사람이 같은 물건을 주문하면 택배를 한 번만 보냅니다.
+          짧은 시간(batch_window) 동안 들어온 주문을 모아서
+          - 같은 티커는 날짜 범위를 합치고
+          - 일봉 티커가 많으면 "날짜별 전체 시장" API로 한꺼번에 가져오고
+          - 결과는 한 번에 저장합니다.
+
+    Attributes:
+        _pm: ParquetManager (저장 담당)
+        _client: MassiveClient (API 호출 담당)
+        _batch_window: 요청 수집 대기 시간 (초)
+        _grouped_threshold: Grouped Daily 전환 기준 티커 수
+        _jobs: (ticker, timeframe) → 진행/대기 중인 작업 목록
+
+    Example:
+        >>> coordinator = GapFillCoordinator(pm, client)
+        >>> results = await asyncio.gather(
+        ...     coordinator.fill_daily("AAPL", "2024-11-01", "2024-12-17"),
+        ...     coordinator.fill_daily("AAPL", "2024-11-01", "2024-12-17"),
+        ... )  # API 호출 1회
+    """
+
+    def __init__(
+        self,
+        parquet_manager: ParquetManager,
+        massive_client: Optional[Any] = None,
+        batch_window: float = 0.05,
+        grouped_daily_threshold: int = 20,
+        max_concurrency: int = 8,
+    ):
+        """
+        GapFillCoordinator 초기화
+
+        Args:
+            parquet_manager: Parquet I/O 담당
+            massive_client: Massive API 클라이언트 (None이면 Gap Fill 불가)
+            batch_window: 요청 수집 대기 시간 (초, 기본 50ms)
+            grouped_daily_threshold: 이 수 이상의 티커가 일봉 Gap을 요청하면
+                Grouped Daily API로 일괄 조회
+            max_concurrency: 배치 내 동시 API 호출 수
+        """
+        self._pm = parquet_manager
+        self._client = massive_client
+        self._batch_window = batch_window
+        self._grouped_threshold = grouped_daily_threshold
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+        # (ticker, timeframe) → 작업 목록 (진행 중 + 대기 중)
+        self._jobs: dict[tuple[str, str], list[_FillJob]] = {}
+        self._pending: list[_FillJob] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # 실행 중 배치 태스크 (참조 유지: GC로 사라지거나 예외가 묻히지 않도록)
+        self._batch_tasks: set[asyncio.Task] = set()
+
+        # 통계
+        self._stats = {
+            "requests": 0,
+            "coalesced": 0,
+            "api_calls": 0,
+            "batches": 0,
+        }
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # Public API
+    # ═══════════════════════════════════════════════════════════════════════
+
+    async def fill_daily(self, ticker: str, start: str, end: str) -> int:
+        """
+        일봉 Gap Fill 요청
+
+        Args:
+            ticker: 종목 심볼
+            start: 시작일 (YYYY-MM-DD)
+            end: 종료일 (YYYY-MM-DD)
+
+        Returns:
+            int: 저장된 레코드 수 (요청이 병합되면 병합된 작업 기준)
+        """
+        return await self._submit(ticker, DAILY_TIMEFRAME, start, end)
+
+    async def fill_daily_bulk(self, tickers: list[str], start: str, end: str) -> int:
+        """
+        여러 티커의 일봉 Gap Fill을 한 배치로 요청
+
+        ELI5: 티커가 많으면 자동으로 Grouped Daily API 경로로 전환됩니다.
+
+        Args:
+            tickers: 종목 심볼 목록
+            start: 시작일 (YYYY-MM-DD)
+            end: 종료일 (YYYY-MM-DD)
+
+        Returns:
+            int: 저장된 레코드 수 합계
+        """
+        results = await asyncio.gather(
+            *(self._submit(t, DAILY_TIMEFRAME, start, end) for t in tickers)
+        )
+        return sum(results)
+
+    async def fill_intraday(
+        self, ticker: str, timeframe: str, start: str, end: str
+    ) -> int:
+        """
+        Intraday Gap Fill 요청
+
+        Args:
+            ticker: 종목 심볼
+            timeframe: 타임프레임 ("1m", "5m", "15m", "1h")
+            start: 시작일 (YYYY-MM-DD)
+            end: 종료일 (YYYY-MM-DD)
+
+        Returns:
+            int: 저장된 레코드 수
+        """
+        return await self._submit(ticker, timeframe, start, end)
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        조정자 통계 반환
+
+        Returns:
+            dict: requests(요청 수), coalesced(병합된 요청 수),
+                  api_calls(실제 API 호출 수), batches(배치 수), in_flight
+        """
+        return {
+            **self._stats,
+            "in_flight": sum(len(jobs) for jobs in self._jobs.values()),
+        }
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # 요청 수집 (Single-Flight)
+    # ═══════════════════════════════════════════════════════════════════════
+
+    async def _submit(self, ticker: str, timeframe: str, start: str, end: str) -> int:
+        """
+        요청을 기존 작업에 합류시키거나 새 작업으로 등록
+
+        1. 진행/대기 중 작업이 범위를 포함 → 그 결과를 기다림
+        2. 대기 중 작업과 겹치거나 인접 → 범위를 확장하고 합류
+        3. 그 외 → 새 작업 등록 후 batch_window 뒤에 배치 실행
+        """
+        if not self._client:
+            logger.warning(f"⚠️ Cannot fill gaps for {ticker}_{timeframe}: no API client")
+            return 0
+
+        self._stats["requests"] += 1
+        key = (ticker, timeframe)
+        jobs = self._jobs.setdefault(key, [])
+
+        job = next((j for j in jobs if j.covers(start, end)), None)
+        if job is None:
+            job = next((j for j in jobs if not j.dispatched and j.touches(start, end)), None)
+            if job is not None:
+                job.start = min(job.start, start)
+                job.end = max(job.end, end)
+
+        if job is not None:
+            self._stats["coalesced"] += 1
+            return await asyncio.shield(job.future)
+
+        loop = asyncio.get_running_loop()
+        job = _FillJob(ticker, timeframe, start, end, future=loop.create_future())
+        jobs.append(job)
+        self._pending.append(job)
+
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._batch_window, self._start_batch)
+
+        return await asyncio.shield(job.future)
+
+    def _start_batch(self) -> None:
+        """대기 중인 작업을 배치로 묶어 실행 (TimerHandle 콜백)"""
+        self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        for job in batch:
+            job.dispatched = True
+        task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._on_batch_done)
+
+    def _on_batch_done(self, task: asyncio.Task) -> None:
+        """배치 태스크 참조 해제 + 예외 로깅"""
+        self._batch_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"❌ Gap fill batch task crashed: {task.exception()}")
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # 배치 실행
+    # ═══════════════════════════════════════════════════════════════════════
+
+    async def _run_batch(self, batch: list[_FillJob]) -> None:
+        """
+        배치 실행: API 호출 → 단일 저장 → 결과 전달
+
+        Args:
+            batch: 실행할 작업 목록
+        """
+        self._stats["batches"] += 1
+        daily_jobs = [j for j in batch if j.timeframe == DAILY_TIMEFRAME]
+        intraday_jobs = [j for j in batch if j.timeframe != DAILY_TIMEFRAME]
+        results: dict[int, int] = {}
+
+        try:
+            if daily_jobs:
+                results.update(await self._run_daily(daily_jobs))
+            if intraday_jobs:
+                results.update(await self._run_intraday(intraday_jobs))
+        except Exception as e:
+            logger.error(f"❌ Gap fill batch failed ({len(batch)} jobs): {e}")
+        finally:
+            for job in batch:
+                if not job.future.done():
+                    job.future.set_result(results.get(id(job), 0))
+                jobs = self._jobs.get((job.ticker, job.timeframe), [])
+                if job in jobs:
+                    jobs.remove(job)
+                if not jobs:
+                    self._jobs.pop((job.ticker, job.timeframe), None)
+
+    async def _run_daily(self, jobs: list[_FillJob]) -> dict[int, int]:
+        """
+        일봉 작업 실행
+
+        티커 수가 grouped_daily_threshold 이상이면 거래일별 Grouped Daily 호출,
+        아니면 티커별 Aggregates(일봉) 호출. 결과는 append_daily 1회로 저장합니다.
+
+        Returns:
+            dict[int, int]: id(job) → 저장된 레코드 수
+        """
+        if len(jobs) >= self._grouped_threshold:
+            frames = await self._fetch_daily_grouped(jobs)
+        else:
+            fetched = await asyncio.gather(*(self._fetch_daily_single(j) for j in jobs))
+            frames = dict(zip((id(j) for j in jobs), fetched))
+
+        non_empty = [df for df in frames.values() if not df.empty]
+        if not non_empty:
+            return {}
+
+        # 단일 저장 트랜잭션 (ELI5: 전체 일봉 파일 재작성은 배치당 1회)
+        combined = pd.concat(non_empty, ignore_index=True)
+        self._pm.append_daily(combined)
+        logger.info(
+            f"✅ Daily gap filled: {len(non_empty)} tickers, {len(combined)} bars (1 write)"
+        )
+        return {job_id: len(df) for job_id, df in frames.items()}
+
+    async def _fetch_daily_grouped(self, jobs: list[_FillJob]) -> dict[int, pd.DataFrame]:
+        """
+        Grouped Daily API로 여러 티커 일봉을 거래일 단위로 조회
+
+        Returns:
+            dict[int, pd.DataFrame]: id(job) → 해당 티커/범위 일봉
+        """
+        from backend.data.massive_loader import MassiveLoader
+
+        start = min(j.start for j in jobs)
+        end = max(j.end for j in jobs)
+        days = MassiveLoader.get_trading_days_between(
+            datetime.strptime(start, "%Y-%m-%d"), datetime.strptime(end, "%Y-%m-%d")
+        )
+        logger.info(
+            f"🔄 Grouped daily backfill: {len(jobs)} tickers × {len(days)} days"
+        )
+
+        async def fetch(date: str) -> list[dict]:
+            async with self._semaphore:
+                self._stats["api_calls"] += 1
+                try:
+                    return await self._client.fetch_grouped_daily(date)
+                except Exception as e:
+                    logger.error(f"❌ Grouped daily fetch failed for {date}: {e}")
+                    return []
+
+        day_bars = await asyncio.gather(*(fetch(d) for d in days))
+        all_bars = [bar for bars in day_bars for bar in bars]
+        if not all_bars:
+            return {}
+
+        df = pd.DataFrame(all_bars)
+        df = df[df["ticker"].isin({j.ticker for j in jobs})]
+
+        frames = {}
+        for job in jobs:
+            mask = (df["ticker"] == job.ticker) & (df["date"] >= job.start) & (df["date"] <= job.end)
+            frames[id(job)] = df[mask]
+        return frames
+
+    async def _fetch_daily_single(self, job: _FillJob) -> pd.DataFrame:
+        """티커 단위 일봉 조회 (Aggregates API)"""
+        async with self._semaphore:
+            self._stats["api_calls"] += 1
+            logger.info(f"🔄 Filling daily gaps for {job.ticker} ({job.start} ~ {job.end})")
+            try:
+                bars = await self._client.fetch_daily_bars(job.ticker, job.start, job.end)
+            except Exception as e:
+                logger.error(f"❌ Failed to fill daily gaps for {job.ticker}: {e}")
+                return pd.DataFrame()
+
+        if not bars:
+            logger.warning(f"⚠️ No daily bars returned for {job.ticker}")
+            return pd.DataFrame()
+        return pd.DataFrame(bars)
+
+    async def _run_intraday(self, jobs: list[_FillJob]) -> dict[int, int]:
+        """
+        Intraday 작업 실행 (작업별 API 호출 병렬, 파일별 append 1회)
+
+        Returns:
+            dict[int, int]: id(job) → 저장된 레코드 수
+        """
+        fetched = await asyncio.gather(*(self._fetch_intraday(j) for j in jobs))
+
+        results = {}
+        for job, df in zip(jobs, fetched):
+            if df.empty:
+                continue
+            self._pm.append_intraday(job.ticker, job.timeframe, df)
+            results[id(job)] = len(df)
+            logger.info(
+                f"✅ Intraday gap filled for {job.ticker}_{job.timeframe}: {len(df)} bars"
+            )
+        return results
+
+    async def _fetch_intraday(self, job: _FillJob) -> pd.DataFrame:
+        """티커 단위 Intraday 조회 (Aggregates API)"""
+        multiplier = TIMEFRAME_MULTIPLIERS.get(job.timeframe, 1)
+        num_days = (
+            datetime.strptime(job.end, "%Y-%m-%d") - datetime.strptime(job.start, "%Y-%m-%d")
+        ).days + 1
+        limit = min(50_000, BARS_PER_DAY.get(job.timeframe, 390) * num_days * 2)
+
+        async with self._semaphore:
+            self._stats["api_calls"] += 1
+            logger.info(
+                f"🔄 Filling intraday gaps for {job.ticker}_{job.timeframe} ({job.start} ~ {job.end})"
+            )
+            try:
+                bars = await self._client.fetch_intraday_bars(
+                    job.ticker,
+                    multiplier=multiplier,
+                    from_date=job.start,
+                    to_date=job.end,
+                    limit=limit,
+                )
+            except Exception as e:
+                logger.error(f"❌ Failed to fill intraday gaps for {job.ticker}: {e}")
+                return pd.DataFrame()
+
+        if not bars:
+            logger.warning(f"⚠️ No intraday bars returned for {job.ticker}")
+            return pd.DataFrame()
+
+        df = pd.DataFrame(bars)
+        return df[["timestamp", "open", "high", "low", "close", "volume"]]
+
@@ -0,0 +1,408 @@
+# ============================================================================
+# Indicator Engine - 보조지표 계산 + 컬럼형 캐시
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - 보조지표(sma/ema/rsi)를 지표별 단일 Parquet 테이블로 저장
+#     (indicators/{indicator}.parquet, 키: ticker + date)
+#   - 일봉 데이터 버전(파일 fingerprint)으로 캐시 무효화
+#   - 새 일봉이 추가되면 마지막 상태(EMA 값 / 롤링 윈도우)에서 증분 계산
+#   - 전체 유니버스를 groupby 1회로 벡터화 계산하는 벌크 API
+#
+# 📖 사용 예시:
+#   >>> engine = IndicatorEngine(parquet_manager)
+#   >>> rsi = engine.get("AAPL", "rsi_14", days=60)
+#   >>> table = engine.compute_bulk("ema_20")   # 전체 유니버스
+#   >>> engine.flush()
+#
+# 📌 [user-027] Indicator Cache Engine
+# ============================================================================
+
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from loguru import logger
+
+from backend.data.parquet_manager import ParquetManager
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 상수
+# ═══════════════════════════════════════════════════════════════════════════
+
+# 계산식 버전 (ELI5: 공식이 바뀌면 숫자를 올려서 기존 캐시를 버립니다)
+FORMULA_VERSION = "1"
+
+# 지원 지표 타입
+SUPPORTED_INDICATORS = ("sma", "ema", "rsi")
+
+# 테이블 컬럼 (close는 증분 계산 시 히스토리 변경 감지용)
+TABLE_COLUMNS = ["ticker", "date", "close", "value"]
+
+
+def parse_indicator(indicator: str) -> Optional[tuple[str, int]]:
+    """
+    지표 이름 파싱 ("sma_20" → ("sma", 20))
+
+    Args:
+        indicator: 지표 이름
+
+    Returns:
+        tuple[str, int] | None: (지표 타입, 기간) 또는 파싱 실패 시 None
+    """
+    parts = indicator.split("_")
+    if len(parts) != 2:
+        logger.warning(f"⚠️ Unknown indicator format: {indicator}")
+        return None
+
+    ind_type, period_str = parts
+    try:
+        period = int(period_str)
+    except ValueError:
+        logger.warning(f"⚠️ Invalid indicator period: {indicator}")
+        return None
+
+    if ind_type not in SUPPORTED_INDICATORS or period <= 0:
+        logger.warning(f"⚠️ Unsupported indicator type: {ind_type}")
+        return None
+
+    return ind_type, period
+
+
+def compute_indicator(df: pd.DataFrame, ind_type: str, period: int) -> pd.Series:
+    """
+    보조지표 벡터화 계산 (여러 티커 동시 지원)
+
+    ELI5: ticker별로 묶어서 한 번에 계산합니다. 티커가 1개든 1만 개든 같은 코드.
+
+    Args:
+        df: ticker, date, close 컬럼 (ticker, date 순 정렬 필수)
+        ind_type: "sma" | "ema" | "rsi"
+        period: 기간
+
+    Returns:
+        pd.Series: df와 같은 인덱스의 지표 값
+    """
+    grouped = df.groupby("ticker", sort=False)["close"]
+
+    if ind_type == "sma":
+        result = grouped.rolling(window=period).mean()
+    elif ind_type == "ema":
+        result = grouped.ewm(span=period, adjust=False).mean()
+    else:  # rsi
+        delta = grouped.diff()
+        gain = delta.where(delta > 0, 0).groupby(df["ticker"], sort=False)
+        loss = (-delta.where(delta < 0, 0)).groupby(df["ticker"], sort=False)
+        avg_gain = gain.rolling(window=period).mean().reset_index(level=0, drop=True)
+        avg_loss = loss.rolling(window=period).mean().reset_index(level=0, drop=True)
+        rs = avg_gain / avg_loss.replace(0, float("nan"))
+        return (100 - (100 / (1 + rs))).reindex(df.index)
+
+    return result.reset_index(level=0, drop=True).reindex(df.index)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# IndicatorEngine 클래스
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class IndicatorEngine:
+    """
+    보조지표 캐시 엔진
+
+    지표마다 하나의 컬럼형 테이블(ticker, date, close, value)을 유지합니다.
+    일봉 파일이 바뀌면(data version 변경) 요청된 티커만 검증하고,
+    새 날짜만 이전 상태에서 이어서 계산합니다.
+
+    ELI5: 매번 처음부터 계산하지 않고, 어제까지 계산해 둔 값에
+          오늘 하루치만 덧붙입니다.
+
+    Attributes:
+        _pm: ParquetManager (일봉 소스)
+        _dir: 지표 테이블 저장 디렉터리
+        _tables: indicator → {ticker → DataFrame}
+        _table_version: indicator → 테이블 전체가 유효한 data version
+        _fresh: indicator → {ticker → 검증 완료된 data version}
+        _dirty: 디스크에 저장되지 않은 변경이 있는 지표
+
+    Example:
+        >>> engine = IndicatorEngine(pm)
+        >>> engine.get("AAPL", "sma_20", days=30)
+    """
+
+    def __init__(self, parquet_manager: ParquetManager, cache_dir: Optional[Path] = None):
+        """
+        IndicatorEngine 초기화
+
+        Args:
+            parquet_manager: Parquet I/O 담당
+            cache_dir: 지표 테이블 디렉터리 (기본: {base_dir}/indicators)
+        """
+        self._pm = parquet_manager
+        self._dir = Path(cache_dir) if cache_dir else Path(self._pm.base_dir) / "indicators"
+        self._dir.mkdir(parents=True, exist_ok=True)
+
+        self._tables: dict[str, dict[str, pd.DataFrame]] = {}
+        self._table_version: dict[str, Optional[str]] = {}
+        self._fresh: dict[str, dict[str, str]] = {}
+        self._dirty: set[str] = set()
+
+        self._stats = {"hits": 0, "incremental": 0, "full": 0}
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # Public API
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def get(self, ticker: str, indicator: str, days: Optional[int] = 60) -> Optional[pd.Series]:
+        """
+        티커 지표 조회 (캐시 → 증분 확장 → 전체 계산)
+
+        Args:
+            ticker: 종목 심볼
+            indicator: 지표 이름 (예: "sma_20", "ema_9", "rsi_14")
+            days: 반환할 최근 일수 (None이면 전체)
+
+        Returns:
+            pd.Series: date 인덱스의 지표 값 (데이터 없으면 None)
+        """
+        spec = parse_indicator(indicator)
+        version = self._data_version()
+        if spec is None or version is None:
+            return None
+
+        self._load(indicator)
+        table = self._tables[indicator]
+
+        if self._table_version.get(indicator) == version or (
+            self._fresh[indicator].get(ticker) == version
+        ):
+            self._stats["hits"] += 1
+        else:
+            self._refresh_ticker(indicator, spec, ticker)
+            self._fresh[indicator][ticker] = version
+
+        rows = table.get(ticker)
+        if rows is None or rows.empty:
+            return None
+        if days:
+            rows = rows.tail(days)
+        return pd.Series(rows["value"].to_numpy(), index=rows["date"].to_numpy(), name=indicator)
+
+    def compute_bulk(
+        self, indicator: str, tickers: Optional[list[str]] = None
+    ) -> pd.DataFrame:
+        """
+        전체 유니버스 지표를 한 번에 계산하고 테이블 저장
+
+        ELI5: 일봉 파일을 1번만 읽고, groupby로 모든 티커를 동시에 계산합니다.
+
+        Args:
+            indicator: 지표 이름
+            tickers: 계산할 티커 목록 (None이면 전체)
+
+        Returns:
+            pd.DataFrame: ticker, date, value 컬럼 (빈 경우 빈 DataFrame)
+        """
+        spec = parse_indicator(indicator)
+        version = self._data_version()
+        if spec is None or version is None:
+            return pd.DataFrame(columns=["ticker", "date", "value"])
+
+        filters = [("ticker", "in", list(tickers))] if tickers else None
+        df = pq.read_table(
+            self._pm.daily_path, columns=["ticker", "date", "close"], filters=filters
+        ).to_pandas()
+        df = df.sort_values(["ticker", "date"]).reset_index(drop=True)
+        df["value"] = compute_indicator(df, *spec)
+
+        self._load(indicator)
+        self._tables[indicator].update(
+            {t: g.reset_index(drop=True) for t, g in df.groupby("ticker", sort=False)}
+        )
+        if tickers:
+            fresh = self._fresh[indicator]
+            fresh.update(dict.fromkeys(tickers, version))
+        else:
+            self._table_version[indicator] = version
+        self._stats["full"] += df["ticker"].nunique()
+        self._dirty.add(indicator)
+        self.flush(indicator)
+
+        logger.info(f"📐 Indicator bulk computed: {indicator} ({len(df)} rows)")
+        return df[["ticker", "date", "value"]]
+
+    def invalidate(self, indicator: Optional[str] = None) -> None:
+        """
+        지표 캐시 무효화 (메모리 + 디스크)
+
+        Args:
+            indicator: 무효화할 지표 (None이면 전체)
+        """
+        if indicator:
+            targets = {indicator}
+        else:
+            targets = {p.stem for p in self._dir.glob("*.parquet")} | set(self._tables)
+        for name in targets:
+            self._tables.pop(name, None)
+            self._table_version.pop(name, None)
+            self._fresh.pop(name, None)
+            self._dirty.discard(name)
+            path = self._table_path(name)
+            if path.exists():
+                path.unlink()
+
+    def flush(self, indicator: Optional[str] = None) -> None:
+        """
+        변경된 지표 테이블을 디스크에 저장
+
+        Args:
+            indicator: 저장할 지표 (None이면 변경된 전체)
+        """
+        targets = [indicator] if indicator else list(self._dirty)
+        for name in targets:
+            if name not in self._dirty:
+                continue
+            frames = [f for f in self._tables.get(name, {}).values() if not f.empty]
+            if not frames:
+                self._dirty.discard(name)
+                continue
+
+            df = pd.concat(frames, ignore_index=True)[TABLE_COLUMNS]
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            table = table.replace_schema_metadata({
+                **(table.schema.metadata or {}),
+                b"formula_version": FORMULA_VERSION.encode(),
+                b"data_version": (self._table_version.get(name) or "").encode(),
+            })
+            pq.write_table(table, self._table_path(name), compression="snappy")
+            self._dirty.discard(name)
+            logger.debug(f"💾 Indicator table saved: {name} ({len(df)} rows)")
+
+    def get_stats(self) -> dict:
+        """
+        엔진 통계 반환
+
+        Returns:
+            dict: hits, incremental, full (티커 단위 계산 횟수), loaded 지표 목록
+        """
+        return {**self._stats, "loaded": sorted(self._tables)}
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # 내부 구현
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def _table_path(self, indicator: str) -> Path:
+        return self._dir / f"{indicator}.parquet"
+
+    def _data_version(self) -> Optional[str]:
+        """
+        일봉 데이터 버전 (파일 mtime + size)
+
+        Returns:
+            str | None: 버전 문자열 (일봉 파일 없으면 None)
+        """
+        path = self._pm.daily_path
+        if not path.exists():
+            return None
+        stat = path.stat()
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+    def _load(self, indicator: str) -> None:
+        """지표 테이블을 메모리로 로드 (최초 1회)"""
+        if indicator in self._tables:
+            return
+
+        self._tables[indicator] = {}
+        self._table_version[indicator] = None
+        self._fresh[indicator] = {}
+
+        path = self._table_path(indicator)
+        if not path.exists():
+            return
+
+        try:
+            table = pq.read_table(path)
+            meta = table.schema.metadata or {}
+            if meta.get(b"formula_version", b"").decode() != FORMULA_VERSION:
+                logger.info(f"♻️ Indicator table outdated (formula): {indicator}")
+                return
+            df = table.to_pandas()
+            self._tables[indicator] = {
+                t: g.reset_index(drop=True) for t, g in df.groupby("ticker", sort=False)
+            }
+            self._table_version[indicator] = meta.get(b"data_version", b"").decode() or None
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to load indicator table {indicator}: {e}")
+
+    def _refresh_ticker(self, indicator: str, spec: tuple[str, int], ticker: str) -> None:
+        """
+        티커 지표를 현재 일봉 데이터에 맞게 갱신
+
+        1. 캐시 마지막 날짜의 종가가 일봉과 같으면 → 새 날짜만 증분 계산
+        2. 히스토리가 바뀌었거나 캐시가 없으면 → 티커 전체 재계산
+        """
+        daily = self._pm.read_daily(ticker)
+        if daily.empty or "close" not in daily.columns:
+            self._tables[indicator].pop(ticker, None)
+            return
+        daily = daily[["ticker", "date", "close"]].reset_index(drop=True)
+
+        cached = self._tables[indicator].get(ticker)
+        new_rows = None
+        if cached is not None and not cached.empty:
+            new_rows = self._extend(cached, daily, spec)
+
+        if new_rows is None:
+            full = daily.copy()
+            full["value"] = compute_indicator(full, *spec)
+            self._tables[indicator][ticker] = full
+            self._stats["full"] += 1
+        elif not new_rows.empty:
+            self._tables[indicator][ticker] = pd.concat([cached, new_rows], ignore_index=True)
+            self._stats["incremental"] += 1
+        else:
+            return
+
+        self._dirty.add(indicator)
+
+    @staticmethod
+    def _extend(
+        cached: pd.DataFrame, daily: pd.DataFrame, spec: tuple[str, int]
+    ) -> Optional[pd.DataFrame]:
+        """
+        캐시 마지막 상태에서 새 날짜만 계산
+
+        - ema: 마지막 EMA 값을 시드로 이어서 계산 (재귀식 그대로)
+        - sma/rsi: 마지막 날짜 이전 period개 종가만 윈도우로 사용
+
+        Returns:
+            pd.DataFrame | None: 새 행 (None이면 증분 불가 → 전체 재계산 필요)
+        """
+        ind_type, period = spec
+        last = cached.iloc[-1]
+
+        pos = daily.index[daily["date"] == last["date"]]
+        if len(pos) == 0 or daily.at[pos[0], "close"] != last["close"]:
+            return None
+        last_pos = int(pos[0])
+
+        new = daily.iloc[last_pos + 1:].copy()
+        if new.empty:
+            return new
+
+        if ind_type == "ema":
+            if pd.isna(last["value"]):
+                return None
+            seed = pd.concat(
+                [pd.Series([last["value"]]), new["close"].reset_index(drop=True)],
+                ignore_index=True,
+            )
+            new["value"] = seed.ewm(span=period, adjust=False).mean().iloc[1:].to_numpy()
+        else:
+            window = daily.iloc[max(0, last_pos + 1 - period):].copy()
+            window["value"] = compute_indicator(window, ind_type, period)
+            new["value"] = window["value"].iloc[-len(new):].to_numpy()
+
+        return new
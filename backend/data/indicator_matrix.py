@@ -0,0 +1,325 @@
+# ============================================================================
+# Indicator Matrix - 티커 × 날짜 지표 행렬 빌더 (병렬 + 증분 캐시)
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - 일봉 전체에서 지표별 (ticker, date) 컬럼형 결과를 계산해 저장
+#   - 티커를 샤드로 나눠 ProcessPoolExecutor로 병렬 계산
+#   - 티커별 입력 해시가 같으면 재계산 생략 (지표마다 독립)
+#     → 새 지표를 추가하면 그 지표 컬럼만 계산
+#   - (ticker, target_date) 목록에 직전 거래일 지표를 한 번의 as-of 조인으로 부착
+#
+# 📂 저장 구조:
+#   indicators/
+#   ├── _manifest.json     # {지표명: {ticker: 입력 해시}}
+#   ├── rsi_5.parquet      # ticker, date, RSI_5
+#   └── macd.parquet       # ticker, date, MACD_12_26_9, MACDh_..., MACDs_...
+#
+# 📖 사용 예시:
+#   >>> matrix = IndicatorMatrix("data/parquet/indicators", {"rsi_14": rsi14_fn})
+#   >>> matrix.build(daily_df)
+#   >>> df = matrix.attach_as_of(targets)  # targets: ticker, target_date 컬럼
+#
+# 📌 [user-042] Parallel, cached indicator matrix builder
+# ============================================================================
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+
+# 지표 함수: 날짜 인덱스의 단일 티커 일봉 → 새 컬럼 (Series 또는 DataFrame)
+# ProcessPoolExecutor로 전달되므로 모듈 레벨 함수 / functools.partial 이어야 함
+IndicatorFn = Callable[[pd.DataFrame], Union[pd.Series, pd.DataFrame, None]]
+
+KEY_COLUMNS = ["ticker", "date"]
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 모듈 레벨 워커 함수 (ProcessPoolExecutor pickle 호환성)
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _compute_shard(item: tuple) -> dict[str, list[pd.DataFrame]]:
+    """
+    티커 샤드 1개의 지표 계산 (병렬 처리용)
+
+    Args:
+        item: (indicators, [(ticker, 일봉 DataFrame, [지표명, ...]), ...])
+
+    Returns:
+        {지표명: [ticker, date + 지표 컬럼 DataFrame, ...]}
+    """
+    indicators, jobs = item
+    out: dict[str, list[pd.DataFrame]] = {}
+
+    for ticker, frame, names in jobs:
+        frame = frame.set_index("date")
+        for name in names:
+            try:
+                result = indicators[name](frame.copy())
+            except Exception as e:
+                logger.warning(f"지표 계산 실패 {ticker}/{name}: {e}")
+                continue
+            if result is None:
+                continue
+            if isinstance(result, pd.Series):
+                result = result.to_frame()
+            result = result.reindex(frame.index).reset_index(drop=True)
+            result.insert(0, "date", frame.index.to_numpy())
+            result.insert(0, "ticker", ticker)
+            out.setdefault(name, []).append(result)
+
+    return out
+
+
+def ticker_hashes(daily_df: pd.DataFrame) -> dict[str, str]:
+    """
+    티커별 입력 데이터 해시 (ticker, date 정렬 기준)
+
+    ELI5: 종목마다 일봉 "지문"을 만들어, 지문이 같으면 지표도 같다고 봅니다.
+    """
+    df = daily_df.sort_values(KEY_COLUMNS, kind="mergesort")
+    row_hash = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    tickers, starts = np.unique(df["ticker"].to_numpy(), return_index=True)
+    bounds = list(starts[1:]) + [len(df)]
+    return {
+        t: hashlib.blake2b(row_hash[s:e].tobytes(), digest_size=16).hexdigest()
+        for t, s, e in zip(tickers, starts, bounds)
+    }
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# IndicatorMatrix 클래스
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class IndicatorMatrix:
+    """
+    지표 행렬 저장소
+
+    지표 정의(이름 → 함수)를 받아 지표별 Parquet 파일로 (ticker, date) 결과를
+    저장합니다. 재실행 시 (지표, 티커)별 입력 해시를 비교해 바뀐 것만 계산합니다.
+
+    Attributes:
+        root: 저장 디렉터리
+        indicators: {지표명: 지표 함수}
+        min_rows: 지표를 계산할 최소 일봉 수 (미만 티커는 제외)
+        max_workers: 병렬 프로세스 수 (1 이하면 현재 프로세스에서 계산)
+    """
+
+    MANIFEST_FILE = "_manifest.json"
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        indicators: dict[str, IndicatorFn],
+        min_rows: int = 30,
+        max_workers: Optional[int] = None,
+        shard_size: int = 100,
+    ):
+        self.root = Path(root)
+        self.indicators = indicators
+        self.min_rows = min_rows
+        self.max_workers = max_workers if max_workers is not None else min(4, os.cpu_count() or 4)
+        self.shard_size = shard_size
+
+    # ───────────────────────────────────────────────────────────────────────
+    # 빌드
+    # ───────────────────────────────────────────────────────────────────────
+
+    def build(self, daily_df: pd.DataFrame, tickers: Optional[Iterable[str]] = None) -> dict:
+        """
+        바뀐 (지표, 티커)만 계산해 저장소 갱신.
+
+        Args:
+            daily_df: ticker, date, OHLCV(+기타) 일봉
+            tickers: 대상 티커 (None이면 전체)
+
+        Returns:
+            통계 {"computed": {지표명: 티커 수}, "skipped": 재사용 (지표, 티커) 수,
+                  "failed": 예외/None으로 결과가 없어 해시를 기록하지 않은 (지표, 티커) 수}
+        """
+        df = daily_df.copy()
+        df["date"] = pd.to_datetime(df["date"]).dt.normalize()
+        if tickers is not None:
+            df = df[df["ticker"].isin(set(tickers))]
+        counts = df["ticker"].value_counts()
+        df = df[df["ticker"].isin(counts.index[counts >= self.min_rows])]
+        df = df.sort_values(KEY_COLUMNS, kind="mergesort").reset_index(drop=True)
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        hashes = ticker_hashes(df)
+        manifest = self._load_manifest()
+
+        # (지표, 티커)별 재계산 필요 여부
+        todo: dict[str, list[str]] = {}
+        skipped = 0
+        for name in self.indicators:
+            known = manifest.get(name, {})
+            if not (self.root / f"{name}.parquet").exists():
+                known = {}
+            for ticker, h in hashes.items():
+                if known.get(ticker) == h:
+                    skipped += 1
+                else:
+                    todo.setdefault(ticker, []).append(name)
+
+        computed = self._compute(df, todo)
+
+        # 지표 파일 갱신: 재계산한 티커 행 교체, 나머지 유지
+        stats = {}
+        failed = 0
+        for name in self.indicators:
+            changed = {t for t, names in todo.items() if name in names}
+            if not changed:
+                continue
+            parts = computed.get(name, [])
+            path = self.root / f"{name}.parquet"
+            if path.exists():
+                old = pd.read_parquet(path)
+                parts = [old[~old["ticker"].isin(changed)]] + parts
+            if parts:
+                merged = pd.concat(parts, ignore_index=True)
+                merged = merged.sort_values(KEY_COLUMNS, kind="mergesort").reset_index(drop=True)
+                tmp = path.with_suffix(".parquet.tmp")
+                merged.to_parquet(tmp, index=False)
+                os.replace(tmp, path)
+
+            # 결과를 낸 티커만 해시 기록 (예외/None → 다음 실행에서 재시도)
+            produced = {part["ticker"].iat[0] for part in computed.get(name, []) if not part.empty}
+            entry = manifest.setdefault(name, {})
+            entry.update({t: hashes[t] for t in produced})
+            for ticker in changed - produced:
+                entry.pop(ticker, None)
+            failed += len(changed - produced)
+            stats[name] = len(produced)
+
+        self._save_manifest(manifest)
+        logger.info(
+            f"📐 IndicatorMatrix: 계산 {sum(stats.values()):,} (지표×티커), 재사용 {skipped:,}"
+            + (f", 결과 없음 {failed:,}" if failed else "")
+        )
+        return {"computed": stats, "skipped": skipped, "failed": failed}
+
+    def _compute(self, df: pd.DataFrame, todo: dict[str, list[str]]) -> dict[str, list[pd.DataFrame]]:
+        """재계산 대상 티커를 샤드로 나눠 계산 (max_workers > 1이면 병렬)"""
+        if not todo:
+            return {}
+
+        tickers = df["ticker"].to_numpy()
+        names_u, starts = np.unique(tickers, return_index=True)
+        bounds = dict(zip(names_u, zip(starts, list(starts[1:]) + [len(df)])))
+
+        jobs = []
+        for ticker, names in todo.items():
+            s, e = bounds[ticker]
+            frame = df.iloc[s:e].drop(columns="ticker")
+            jobs.append((ticker, frame, names))
+        shards = [
+            (self.indicators, jobs[i:i + self.shard_size])
+            for i in range(0, len(jobs), self.shard_size)
+        ]
+
+        if self.max_workers > 1 and len(shards) > 1:
+            logger.info(f"⚡ 지표 병렬 계산: {len(jobs):,} 티커, {len(shards)} 샤드, workers={self.max_workers}")
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(executor.map(_compute_shard, shards))
+        else:
+            results = [_compute_shard(shard) for shard in shards]
+
+        combined: dict[str, list[pd.DataFrame]] = {}
+        for result in results:
+            for name, frames in result.items():
+                combined.setdefault(name, []).extend(frames)
+        return combined
+
+    def _load_manifest(self) -> dict:
+        path = self.root / self.MANIFEST_FILE
+        if not path.exists():
+            return {}
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            return {}
+
+    def _save_manifest(self, manifest: dict) -> None:
+        path = self.root / self.MANIFEST_FILE
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(manifest), encoding="utf-8")
+        os.replace(tmp, path)
+
+    # ───────────────────────────────────────────────────────────────────────
+    # 조회
+    # ───────────────────────────────────────────────────────────────────────
+
+    def read(
+        self,
+        names: Optional[Iterable[str]] = None,
+        tickers: Optional[Iterable[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        지표 파일들을 (ticker, date) 기준으로 합친 넓은 표 반환.
+
+        Args:
+            names: 지표명 목록 (None이면 등록된 전체)
+            tickers: 티커 목록 (None이면 전체)
+        """
+        filters = [("ticker", "in", sorted(set(tickers)))] if tickers is not None else None
+        wide: Optional[pd.DataFrame] = None
+        for name in names if names is not None else self.indicators:
+            path = self.root / f"{name}.parquet"
+            if not path.exists():
+                continue
+            part = pd.read_parquet(path, filters=filters)
+            wide = part if wide is None else wide.merge(part, on=KEY_COLUMNS, how="outer")
+        if wide is None:
+            return pd.DataFrame(columns=KEY_COLUMNS)
+        return wide.sort_values(KEY_COLUMNS, kind="mergesort").reset_index(drop=True)
+
+    def attach_as_of(
+        self,
+        targets: pd.DataFrame,
+        date_col: str = "target_date",
+        names: Optional[Iterable[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        각 (ticker, target_date)에 직전 거래일(target_date 미포함) 지표 컬럼을 부착.
+
+        ELI5: 행마다 찾던 "급등 전날 지표"를 표 전체에 대해 한 번에 붙입니다.
+
+        Returns:
+            targets 원래 순서/컬럼 + 지표 컬럼 (직전 거래일이 없으면 NaN)
+        """
+        wide = self.read(names=names, tickers=targets["ticker"].unique())
+        value_cols = [c for c in wide.columns if c not in KEY_COLUMNS]
+
+        keys = pd.DataFrame({
+            "_row": np.arange(len(targets)),
+            "ticker": targets["ticker"].to_numpy(),
+            "_target": pd.to_datetime(targets[date_col]).dt.normalize().to_numpy(),
+        })
+        wide["date"] = pd.to_datetime(wide["date"]).astype(keys["_target"].dtype)
+        merged = pd.merge_asof(
+            keys.sort_values("_target", kind="mergesort"),
+            wide.sort_values("date", kind="mergesort"),
+            left_on="_target",
+            right_on="date",
+            by="ticker",
+            allow_exact_matches=False,
+            direction="backward",
+        ).sort_values("_row")
+
+        result = targets.reset_index(drop=True).copy()
+        extra = merged[value_cols].reset_index(drop=True)
+        extra = extra.drop(columns=[c for c in value_cols if c in result.columns])
+        return pd.concat([result, extra], axis=1)
+
+
+__all__ = ["IndicatorMatrix", "IndicatorFn", "ticker_hashes"]
@@ -0,0 +1,202 @@
+# ============================================================================
+# Intraday Windows - 분봉 파일에서 (ticker, date) 하루치 구간 일괄 추출
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - 여러 (ticker, date) 타겟을 티커별로 묶어 분봉 파일을 티커당 1번만 읽음
+#   - 요청한 날짜 구간만 Parquet 필터(predicate pushdown)로 로드
+#   - 읽은 데이터를 날짜별로 잘라 타겟마다 콜백 실행
+#   - 티커 단위로 ProcessPoolExecutor 병렬 처리
+#
+# 📖 사용 예시:
+#   >>> extractor = IntradayWindowExtractor("data/parquet/1m")
+#   >>> days = extractor.read_days("AAPL", [date(2026, 1, 8)])
+#   >>> results = extractor.map(targets, my_fn, date_col="target_date")
+#   # my_fn(row: dict, day_data: DataFrame) -> Any  (모듈 레벨 함수)
+#
+# 📌 [user-043] Batched intraday event-window extractor
+# ============================================================================
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from loguru import logger
+
+
+# 시간 컬럼 후보 (앞에서부터 우선)
+TIME_COLUMNS = ["timestamp", "t", "datetime", "time", "date"]
+
+# 타겟별 콜백: (타겟 행 dict, 해당 날짜 분봉) → 결과
+# 분봉이 없으면 빈 DataFrame 전달. ProcessPoolExecutor로 전달되므로 모듈 레벨 함수여야 함
+WindowFn = Callable[[dict, pd.DataFrame], Any]
+
+
+def _to_date(value: Any) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return pd.Timestamp(value).date()
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 파일 1개 읽기
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def read_day_windows(path: Union[str, Path], dates: Iterable[date]) -> dict[date, pd.DataFrame]:
+    """
+    분봉 파일 1개에서 여러 날짜의 하루치 데이터를 한 번에 읽음.
+
+    ELI5: 파일 전체를 펼치지 않고, 필요한 날짜 칸만 골라 읽은 뒤
+          날짜별로 잘라서 돌려줍니다.
+
+    Args:
+        path: 티커 분봉 Parquet 경로
+        dates: 필요한 날짜 목록
+
+    Returns:
+        {날짜: 분봉 DataFrame (_ts 컬럼 추가, 시간순)} - 데이터 없는 날짜는 빈 DataFrame
+    """
+    wanted = sorted({_to_date(d) for d in dates})
+    empty = {d: pd.DataFrame() for d in wanted}
+    path = Path(path)
+    if not wanted or not path.exists():
+        return empty
+
+    schema = pq.read_schema(path)
+    time_col = next((c for c in TIME_COLUMNS if c in schema.names), None)
+    if time_col is None:
+        logger.warning(f"{path.name}: 시간 컬럼 찾을 수 없음. 컬럼: {schema.names}")
+        return empty
+
+    # 날짜별 [시작, 다음날) 구간을 OR로 묶은 필터 (정수 ms / timestamp 타입만 pushdown)
+    field_type = schema.field(time_col).type
+    bounds = [(pd.Timestamp(d), pd.Timestamp(d + timedelta(days=1))) for d in wanted]
+    filters = None
+    if pa.types.is_integer(field_type):
+        filters = [
+            [(time_col, ">=", lo.value // 10**6), (time_col, "<", hi.value // 10**6)]
+            for lo, hi in bounds
+        ]
+    elif pa.types.is_timestamp(field_type) and field_type.tz is None:
+        filters = [[(time_col, ">=", lo), (time_col, "<", hi)] for lo, hi in bounds]
+
+    df = pq.read_table(path, filters=filters).to_pandas()
+    if len(df) == 0:
+        return empty
+
+    values = df[time_col]
+    if pd.api.types.is_numeric_dtype(values):
+        df["_ts"] = pd.to_datetime(values, unit="ms")
+    else:
+        df["_ts"] = pd.to_datetime(values)
+    df = df.sort_values("_ts", kind="mergesort").reset_index(drop=True)
+
+    # 정렬된 _ts에서 날짜 경계를 이진 탐색으로 잘라냄
+    ts = df["_ts"].to_numpy()
+    out = {}
+    for d, (lo, hi) in zip(wanted, bounds):
+        s, e = np.searchsorted(ts, [lo.to_datetime64(), hi.to_datetime64()])
+        out[d] = df.iloc[s:e].reset_index(drop=True)
+    return out
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 모듈 레벨 워커 함수 (ProcessPoolExecutor pickle 호환성)
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _process_ticker(item: tuple) -> list[tuple[int, Any]]:
+    """
+    티커 1개의 모든 타겟 처리 (병렬 처리용)
+
+    Args:
+        item: (파일 경로, fn, [(타겟 순번, 날짜, 타겟 행 dict), ...])
+
+    Returns:
+        [(타겟 순번, fn 결과), ...]
+    """
+    path, fn, jobs = item
+    try:
+        days = read_day_windows(path, [d for _, d, _ in jobs])
+    except Exception as e:
+        logger.error(f"{Path(path).name} 읽기 오류: {e}")
+        days = {}
+
+    results = []
+    for idx, d, row in jobs:
+        day_data = days.get(d)
+        results.append((idx, fn(row, day_data if day_data is not None else pd.DataFrame())))
+    return results
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# IntradayWindowExtractor 클래스
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class IntradayWindowExtractor:
+    """
+    (ticker, date) 타겟 일괄 분봉 추출기
+
+    Attributes:
+        intraday_dir: 티커별 분봉 Parquet 디렉터리 ({ticker}.parquet)
+        max_workers: 병렬 프로세스 수 (1 이하면 현재 프로세스에서 처리)
+    """
+
+    def __init__(self, intraday_dir: Union[str, Path], max_workers: Optional[int] = None):
+        self.intraday_dir = Path(intraday_dir)
+        self.max_workers = max_workers if max_workers is not None else min(4, os.cpu_count() or 4)
+
+    def path_for(self, ticker: str) -> Path:
+        return self.intraday_dir / f"{ticker}.parquet"
+
+    def read_days(self, ticker: str, dates: Iterable[date]) -> dict[date, pd.DataFrame]:
+        """티커 1개의 여러 날짜 분봉 (read_day_windows 참고)"""
+        return read_day_windows(self.path_for(ticker), dates)
+
+    def map(
+        self,
+        targets: pd.DataFrame,
+        fn: WindowFn,
+        date_col: str = "target_date",
+        ticker_col: str = "ticker",
+    ) -> list[Any]:
+        """
+        모든 타겟에 대해 fn(행 dict, 해당 날짜 분봉) 실행.
+
+        티커별로 묶어 파일을 1번씩 읽고, 티커 단위로 병렬 처리합니다.
+
+        Returns:
+            targets 행 순서대로 fn 결과 리스트
+        """
+        records = targets.to_dict("records")
+        by_ticker: dict[str, list] = {}
+        for idx, row in enumerate(records):
+            d = _to_date(row[date_col])
+            by_ticker.setdefault(row[ticker_col], []).append((idx, d, row))
+
+        items = [(self.path_for(t), fn, jobs) for t, jobs in by_ticker.items()]
+        logger.info(f"⚡ 분봉 구간 추출: {len(records):,} 타겟 / {len(items):,} 티커")
+
+        if self.max_workers > 1 and len(items) > 1:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                chunks = list(executor.map(_process_ticker, items, chunksize=8))
+        else:
+            chunks = [_process_ticker(item) for item in items]
+
+        results: list[Any] = [None] * len(records)
+        for chunk in chunks:
+            for idx, value in chunk:
+                results[idx] = value
+        return results
+
+
+__all__ = ["IntradayWindowExtractor", "WindowFn", "read_day_windows"]
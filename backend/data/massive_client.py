@@ -533,6 +533,79 @@ class MassiveClient:
         bars.reverse()
         return bars
 
+    async def fetch_daily_bars(
+        self,
+        ticker: str,
+        from_date: str,
+        to_date: str,
+        limit: int = 5000,
+    ) -> list[dict]:
+        """
+        특정 종목의 일봉 데이터 조회 (기간 지정)
+
+        Massive Aggregates API (1/day)를 사용합니다.
+        반환 형식은 fetch_grouped_daily()와 동일하여 그대로 저장할 수 있습니다.
+
+        Args:
+            ticker: 종목 심볼 (예: "AAPL")
+            from_date: 시작일 (YYYY-MM-DD)
+            to_date: 종료일 (YYYY-MM-DD)
+            limit: 최대 결과 수 (기본값: 5000)
+
+        Returns:
+            list[dict]: 일봉 데이터 리스트 (오래된 → 최신)
+                - ticker, date, open, high, low, close, volume, vwap, transactions
+
+        Note:
+            - 소수 티커 Gap Fill용. 다수 티커는 fetch_grouped_daily()가 효율적입니다.
+        """
+        from datetime import timezone
+
+        # GET /v2/aggs/ticker/{ticker}/range/1/day/{from}/{to}
+        url = f"{self.base_url}/v2/aggs/ticker/{ticker}/range/1/day/{from_date}/{to_date}"
+        params = {
+            "adjusted": "true",
+            "sort": "asc",
+            "limit": str(limit),
+        }
+
+        logger.debug(f"📡 Daily Bars API 호출: {ticker} ({from_date} ~ {to_date})")
+
+        try:
+            data = await self._request_with_retry("GET", url, params=params)
+        except MassiveAPIError as e:
+            logger.warning(f"⚠️ {ticker} 일봉 조회 실패: {e}")
+            return []
+
+        if data.get("status") != "OK":
+            logger.warning(f"⚠️ Daily API 응답 상태: {data.get('status')}")
+            return []
+
+        bars = []
+        for item in data.get("results", []):
+            try:
+                # 일봉 t = 해당 거래일 시작 시각 (UTC 기준 날짜 = 거래일)
+                date = datetime.fromtimestamp(
+                    int(item["t"]) / 1000, tz=timezone.utc
+                ).strftime("%Y-%m-%d")
+                bars.append({
+                    "ticker": ticker,
+                    "date": date,
+                    "open": float(item.get("o", 0)),
+                    "high": float(item.get("h", 0)),
+                    "low": float(item.get("l", 0)),
+                    "close": float(item.get("c", 0)),
+                    "volume": int(item.get("v", 0)),
+                    "vwap": float(item.get("vw", 0)) if item.get("vw") else None,
+                    "transactions": int(item.get("n", 0)) if item.get("n") else None,
+                })
+            except (KeyError, ValueError, TypeError) as e:
+                logger.warning(f"⚠️ 일봉 데이터 파싱 실패: {e}")
+                continue
+
+        logger.info(f"✅ {ticker} 1d: {len(bars)}개 바 데이터 수신")
+        return bars
+
     async def fetch_day_gainers(self, include_otc: bool = False) -> list[dict]:
         """
         당일 급등주 상위 20개 조회
@@ -9,8 +9,9 @@
 # 🔄 증분 업데이트 전략:
 #   1. DB의 마지막 업데이트 날짜 확인
 #   2. 누락된 거래일 계산 (주말/휴일 제외)
-#   3. 각 날짜별 Grouped Daily API 호출
-#   4. DB에 Upsert
+#   3. 날짜별 Grouped Daily API를 동시에 N개까지 호출 (fetch_concurrency)
+#   4. 단일 Writer가 여러 날짜를 모아 한 번에 Upsert (write_batch_days)
+#   5. 커밋마다 체크포인트 기록 → 중단 후 재실행 시 남은 날짜만 로드
 #
 # 📅 거래일 계산:
 #   - 주말 (토, 일) 제외
@@ -23,7 +24,9 @@
 # ============================================================================
 
 import asyncio
+import json
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Optional
 
 from loguru import logger
@@ -103,6 +106,9 @@ class MassiveLoader:
         db: MarketDB,
         client: MassiveClient,
         parquet_manager: ParquetManager | None = None,
+        fetch_concurrency: int = 8,
+        write_batch_days: int = 10,
+        checkpoint_path: str | Path | None = None,
     ):
         """
         MassiveLoader 초기화
@@ -111,12 +117,27 @@ class MassiveLoader:
             db: MarketDB 인스턴스 (initialize() 호출 완료 상태)
             client: MassiveClient 인스턴스
             parquet_manager: ParquetManager 인스턴스 (선택, 있으면 Parquet에도 저장)
+            fetch_concurrency: 동시 Grouped Daily 호출 수
+                (Rate Limit은 MassiveClient의 limiter가 별도로 적용)
+            write_batch_days: 한 번의 저장 커밋에 묶을 거래일 수
+            checkpoint_path: 진행 체크포인트 JSON 경로
+                (기본: DB 파일 옆 {db}.load_checkpoint.json)
         """
         self.db = db
         self.client = client
         # Parquet 저장 (ELI5: Parquet 관리자가 있으면 Parquet 파일에도 저장합니다)
         self.parquet_manager = parquet_manager
 
+        # [user-029] 파이프라인 설정
+        self.fetch_concurrency = max(1, fetch_concurrency)
+        self.write_batch_days = max(1, write_batch_days)
+
+        if checkpoint_path is None:
+            db_path = getattr(db, "db_path", None)
+            if isinstance(db_path, str):
+                checkpoint_path = Path(db_path).with_suffix(".load_checkpoint.json")
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+
         logger.debug(
             f"📦 MassiveLoader 초기화 (Parquet: {'✅' if parquet_manager else '❌'})"
         )
@@ -202,15 +223,17 @@ class MassiveLoader:
     # 저장 헬퍼 메서드
     # ═══════════════════════════════════════════════════════════════════════
 
-    async def _save_daily_bars(self, bars: list[dict]) -> int:
+    async def _save_daily_bars(self, bars: list[dict], strict: bool = False) -> int:
         """
         일봉 데이터 저장 (SQLite + Parquet 듀얼 라이트)
 
         SQLite는 항상 저장하고, ParquetManager가 있으면 Parquet에도 저장합니다.
         이렇게 하면 점진적 전환이 가능합니다.
+        Parquet 쓰기는 동기 I/O이므로 스레드에서 실행합니다 (이벤트 루프 비차단).
 
         Args:
             bars: 저장할 일봉 데이터 리스트 (dict 형태)
+            strict: True면 Parquet 저장 실패도 예외로 전파 (체크포인트용)
 
         Returns:
             int: 저장된 레코드 수
@@ -229,13 +252,172 @@ class MassiveLoader:
         if self.parquet_manager:
             try:
                 df = pd.DataFrame(bars)
-                self.parquet_manager.append_daily(df)
+                await asyncio.to_thread(self.parquet_manager.append_daily, df)
             except Exception as e:
+                if strict:
+                    raise
                 # Parquet 저장 실패해도 SQLite는 성공했으므로 경고만 출력
                 logger.warning(f"⚠️ Parquet 저장 실패 (SQLite는 성공): {e}")
 
         return count
 
+    # ═══════════════════════════════════════════════════════════════════════
+    # [user-029] 파이프라인 로드 (동시 Fetch → 단일 Writer)
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def _read_checkpoint(self) -> dict:
+        """
+        체크포인트 로드
+
+        Returns:
+            dict: {"targets": [...], "completed": [...]} (없으면 빈 dict)
+        """
+        if not self.checkpoint_path or not self.checkpoint_path.exists():
+            return {}
+        try:
+            return json.loads(self.checkpoint_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ 체크포인트 읽기 실패 (무시): {e}")
+            return {}
+
+    def _write_checkpoint(self, targets: list[str], completed: set[str]) -> None:
+        """
+        체크포인트 저장 (임시 파일 → rename으로 원자적 교체)
+
+        모든 대상 날짜가 완료되면 체크포인트 파일을 삭제합니다.
+        """
+        if not self.checkpoint_path:
+            return
+
+        if completed.issuperset(targets):
+            self.checkpoint_path.unlink(missing_ok=True)
+            return
+
+        data = {
+            "targets": targets,
+            "completed": sorted(completed),
+            "updated_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        tmp = self.checkpoint_path.with_suffix(".tmp")
+        tmp.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        tmp.replace(self.checkpoint_path)
+
+    async def _load_days(
+        self,
+        trading_days: list[str],
+        max_errors: Optional[int] = None,
+    ) -> tuple[int, int, int]:
+        """
+        거래일 목록을 파이프라인으로 로드
+
+        ELI5: 여러 명(fetcher)이 동시에 날짜별 데이터를 받아오고,
+              한 명(writer)이 여러 날짜를 모아서 한 번에 저장합니다.
+              저장할 때마다 "어디까지 했는지" 메모(체크포인트)를 남깁니다.
+
+        - fetch_concurrency개의 fetcher가 날짜 큐에서 하나씩 꺼내 API 호출
+        - 결과 큐는 크기 제한(backpressure) → 메모리 사용량 상한
+        - writer는 write_batch_days일치를 모아 _save_daily_bars 1회 호출
+        - 이전 실행에서 끝나지 않은 날짜(체크포인트)도 함께 로드
+
+        Args:
+            trading_days: 로드할 거래일 (YYYY-MM-DD)
+            max_errors: 이 수를 초과하는 API 에러 시 중단 (None이면 계속)
+
+        Returns:
+            tuple[int, int, int]: (저장 레코드 수, 성공 일수, 실패 일수)
+        """
+        checkpoint = self._read_checkpoint()
+        completed = set(checkpoint.get("completed", []))
+        leftover = set(checkpoint.get("targets", [])) - completed
+        if leftover:
+            logger.info(f"♻️ 체크포인트에서 미완료 {len(leftover)}일 재개")
+
+        targets = sorted((set(trading_days) | leftover) - completed)
+        if not targets:
+            return 0, 0, 0
+
+        date_queue: asyncio.Queue[str] = asyncio.Queue()
+        for date in targets:
+            date_queue.put_nowait(date)
+        result_queue: asyncio.Queue = asyncio.Queue(maxsize=self.write_batch_days * 2)
+
+        stats = {"records": 0, "success": 0, "errors": 0}
+        abort = asyncio.Event()
+
+        async def fetcher() -> None:
+            while not abort.is_set():
+                try:
+                    date = date_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    bars = await self.client.fetch_grouped_daily(date)
+                except MassiveAPIError as e:
+                    logger.error(f"❌ {date} 로드 실패: {e}")
+                    stats["errors"] += 1
+                    if max_errors is not None and stats["errors"] > max_errors:
+                        logger.error("🛑 에러가 너무 많아 로드 중단")
+                        abort.set()
+                    continue
+                await result_queue.put((date, bars))
+
+        async def writer() -> None:
+            batch_dates: list[str] = []
+            batch_bars: list[dict] = []
+
+            async def commit() -> None:
+                if not batch_dates:
+                    return
+                # 여러 날짜 → SQLite Upsert 1회 + Parquet Append 1회
+                try:
+                    stats["records"] += await self._save_daily_bars(batch_bars, strict=True)
+                except Exception as e:
+                    # 저장 실패 날짜는 completed에 넣지 않음 → 다음 실행에서 재시도
+                    logger.error(f"❌ {batch_dates[0]}~{batch_dates[-1]} 저장 실패: {e}")
+                    stats["errors"] += len(batch_dates)
+                else:
+                    stats["success"] += len(batch_dates)
+                    completed.update(batch_dates)
+                    self._write_checkpoint(targets, completed)
+                    logger.info(
+                        f"📊 진행: {stats['success']}/{len(targets)} 일 완료 ({stats['records']:,} 레코드)"
+                    )
+                batch_dates.clear()
+                batch_bars.clear()
+
+            while True:
+                item = await result_queue.get()
+                if item is None:
+                    break
+                date, bars = item
+                batch_dates.append(date)
+                batch_bars.extend(bars or [])
+                if len(batch_dates) >= self.write_batch_days:
+                    await commit()
+            await commit()
+
+        self._write_checkpoint(targets, completed)
+
+        fetchers = asyncio.gather(
+            *(fetcher() for _ in range(min(self.fetch_concurrency, len(targets))))
+        )
+        writer_task = asyncio.create_task(writer())
+        try:
+            # writer가 먼저 끝났다면 저장 실패 → 예외 전파
+            await asyncio.wait({fetchers, writer_task}, return_when=asyncio.FIRST_COMPLETED)
+            if writer_task.done():
+                writer_task.result()
+            await fetchers
+            await result_queue.put(None)
+            await writer_task
+        finally:
+            for task in (fetchers, writer_task):
+                if not task.done():
+                    task.cancel()
+
+        return stats["records"], stats["success"], stats["errors"]
+
     # ═══════════════════════════════════════════════════════════════════════
     # 데이터 로드 메서드
     # ═══════════════════════════════════════════════════════════════════════
@@ -260,7 +442,8 @@ class MassiveLoader:
         Note:
             - 365일 ≈ 252 거래일 ≈ 252 API 호출
             - Free Tier (5 req/min) 기준 약 50분 소요
-            - 중간에 실패해도 이미 저장된 데이터는 유지됨
+            - 무제한 요금제(MASSIVE_RATE_LIMIT=0)는 fetch_concurrency개 동시 호출
+            - 중간에 실패해도 이미 저장된 데이터는 유지되고, 재실행 시 체크포인트에서 재개
         """
         end_date = datetime.now() - timedelta(days=1)  # 어제까지
         start_date = end_date - timedelta(days=days)
@@ -272,38 +455,9 @@ class MassiveLoader:
             f"📥 Initial Load 시작: {start_date.date()} ~ {end_date.date()} ({len(trading_days)} 거래일)"
         )
 
-        total_records = 0
-        success_count = 0
-        error_count = 0
-
-        for i, date in enumerate(trading_days):
-            try:
-                # ─────────────────────────────────────────────────────────
-                # API 호출
-                # ─────────────────────────────────────────────────────────
-                bars = await self.client.fetch_grouped_daily(date)
-
-                if bars:
-                    # ─────────────────────────────────────────────────────
-                    # DB 저장 (SQLite + Parquet)
-                    # ─────────────────────────────────────────────────────
-                    count = await self._save_daily_bars(bars)
-                    total_records += count
-                    success_count += 1
-
-                # 진행 상황 로그 (10일마다)
-                if (i + 1) % 10 == 0:
-                    logger.info(
-                        f"📊 진행: {i + 1}/{len(trading_days)} 일 완료 ({total_records:,} 레코드)"
-                    )
-
-            except MassiveAPIError as e:
-                logger.error(f"❌ {date} 로드 실패: {e}")
-                error_count += 1
-                # 에러가 많으면 중단
-                if error_count > 5:
-                    logger.error("🛑 에러가 너무 많아 로드 중단")
-                    break
+        total_records, success_count, error_count = await self._load_days(
+            trading_days, max_errors=5
+        )
 
         logger.info(
             f"✅ Initial Load 완료: {total_records:,} 레코드 저장 (성공 {success_count}, 실패 {error_count})"
@@ -344,7 +498,7 @@ class MassiveLoader:
         # 2. 누락된 거래일 계산
         # ─────────────────────────────────────────────────────────────────
         start_date = datetime.strptime(latest_date, "%Y-%m-%d") + timedelta(days=1)
-        end_date = datetime.now() - timedelta(days=1)  # 어제까지
+        end_date = datetime.strptime(self.get_last_trading_day(), "%Y-%m-%d")
 
         if start_date > end_date:
             logger.info("✅ 이미 최신 상태입니다.")
@@ -361,23 +515,9 @@ class MassiveLoader:
         )
 
         # ─────────────────────────────────────────────────────────────────
-        # 3. 각 날짜별 데이터 가져오기
+        # 3. 파이프라인 로드 (개별 날짜 실패는 무시하고 계속 진행)
         # ─────────────────────────────────────────────────────────────────
-        total_records = 0
-
-        for date in missing_days:
-            try:
-                bars = await self.client.fetch_grouped_daily(date)
-
-                if bars:
-                    count = await self._save_daily_bars(bars)
-                    total_records += count
-                    logger.debug(f"📊 {date}: {count}개 레코드 저장")
-
-            except MassiveAPIError as e:
-                logger.error(f"❌ {date} 업데이트 실패: {e}")
-                # 개별 날짜 실패는 무시하고 계속 진행
-                continue
+        total_records, _, _ = await self._load_days(missing_days)
 
         logger.info(f"✅ 증분 업데이트 완료: {total_records:,} 레코드")
         return total_records
@@ -114,6 +114,8 @@ class MassiveWebSocketClient:
         # 콜백
         self.on_bar: Optional[Callable[[dict], None]] = None
         self.on_tick: Optional[Callable[[dict], None]] = None
+        # [user-038] 프레임 단위 틱 콜백 (설정 시 on_tick 대신 프레임당 1회 호출)
+        self.on_ticks: Optional[Callable[[list], None]] = None
         self.on_error: Optional[Callable[[str], None]] = None
 
         logger.info(
@@ -259,15 +261,16 @@ class MassiveWebSocketClient:
                     data = json.loads(message)
 
                     # 배열로 올 수 있음 (고빈도 데이터)
-                    if isinstance(data, list):
-                        for item in data:
-                            parsed = self._parse_message(item)
-                            if parsed:
-                                yield parsed
-                    else:
-                        parsed = self._parse_message(data)
+                    items = data if isinstance(data, list) else [data]
+                    frame_ticks = []
+                    for item in items:
+                        parsed = self._parse_message(item)
                         if parsed:
+                            if self.on_ticks and parsed["type"] == "tick":
+                                frame_ticks.append(parsed)
                             yield parsed
+                    if frame_ticks:
+                        self.on_ticks(frame_ticks)
 
                 except json.JSONDecodeError:
                     logger.warning(f"Invalid JSON: {message[:100]}")
@@ -332,7 +335,7 @@ class MassiveWebSocketClient:
                 "conditions": data.get("c"),
             }
 
-            if self.on_tick:
+            if self.on_tick and not self.on_ticks:
                 self.on_tick(tick)
 
             return tick
@@ -6,6 +6,9 @@
 #   - 티커별 분봉 파일 (AAPL_1m.parquet, AAPL_1h.parquet)
 #   - 전체 일봉 통합 파일 (daily_all.parquet)
 #   - SQLite 대비 컬럼형 저장소로 분석 쿼리 최적화
+#   - [user-044] 쓰기마다 카탈로그(_catalog.db) 갱신 → 티커 목록/통계/커버리지는
+#     봉 파일을 열지 않고 인덱스 조회 (항목별 mtime/크기가 다르면 그 파일만 다시 읽음,
+#     rebuild_catalog() 완료 전에는 기존 파일 스캔 경로 사용)
 #
 # 📖 사용 예시:
 #   >>> pm = ParquetManager("data/parquet")
@@ -22,6 +25,8 @@ import pyarrow.parquet as pq
 from loguru import logger
 from datetime import datetime, timedelta
 
+from backend.data.storage_catalog import DAILY_TIMEFRAME, StorageCatalog, file_state
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # 리샘플링 규칙 상수
@@ -53,6 +58,7 @@ class ParquetManager:
         base_dir: Parquet 파일 저장 베이스 디렉터리
         intraday_dir: 분봉 파일 저장 디렉터리 (티커별 분리)
         daily_path: 일봉 통합 파일 경로
+        catalog: 저장소 카탈로그 (catalog=False면 None)
 
     Example:
         >>> pm = ParquetManager("data/parquet")
@@ -64,7 +70,10 @@ class ParquetManager:
     # [11-003] 지원하는 타임프레임 목록
     SUPPORTED_TIMEFRAMES: list[str] = ["1m", "3m", "5m", "15m", "1h", "4h"]
 
-    def __init__(self, base_dir: str = "data/parquet"):
+    # [user-044] 카탈로그 파일명 (base_dir 바로 아래)
+    CATALOG_FILE = "_catalog.db"
+
+    def __init__(self, base_dir: str = "data/parquet", catalog: bool = True):
         """
         ParquetManager 초기화
 
@@ -74,6 +83,8 @@ class ParquetManager:
 
         Args:
             base_dir: Parquet 파일 저장 루트 디렉터리
+            catalog: [user-044] 카탈로그 사용 여부. 최초 구축은 rebuild_catalog()로 별도 실행
+                     (서버는 시작 후 백그라운드에서), 완료 전 조회는 파일 스캔
         """
         # 경로 설정 (ELI5: 파일을 저장할 폴더 위치를 정합니다)
         self.base_dir = Path(base_dir)
@@ -92,6 +103,13 @@ class ParquetManager:
         # [11-003] 레거시 intraday 폴더 (하위 호환성 - 읽기 전용 fallback)
         self._legacy_intraday_dir = self.base_dir / "intraday"
 
+        # [user-044] 저장소 카탈로그 (구축 완료 전에는 조회에 사용하지 않음)
+        self.catalog: Optional[StorageCatalog] = None
+        if catalog:
+            self.catalog = StorageCatalog(self.base_dir / self.CATALOG_FILE)
+            if not self.catalog.complete:
+                logger.info("📇 카탈로그 미구축 - rebuild_catalog() 완료 전까지 파일 스캔 사용")
+
         logger.info(f"📦 ParquetManager initialized: {self.base_dir}")
 
     # ═══════════════════════════════════════════════════════════════════════
@@ -125,6 +143,8 @@ class ParquetManager:
             compression="snappy",
             row_group_size=500_000,  # 50만 행 = ~25-30 Row Groups
         )
+        if self.catalog:
+            self.catalog.record_daily(df, self.daily_path)
 
         logger.info(f"📝 Daily written: {len(df)} rows → {self.daily_path}")
         return len(df)
@@ -251,6 +271,68 @@ class ParquetManager:
 
         return result
 
+    def read_daily_dates(self) -> list:
+        """
+        [user-047] 일봉 파일의 거래일 목록 (date 컬럼만 읽음, 오름차순)
+
+        Returns:
+            list: 고유 날짜 목록
+        """
+        if not self.daily_path.exists():
+            return []
+        dates = pq.read_table(self.daily_path, columns=["date"]).column("date")
+        return sorted(dates.unique().to_pylist())
+
+    def read_daily_since(
+        self,
+        start_date,
+        tickers: list[str] | None = None,
+    ) -> dict[str, list[dict]]:
+        """
+        [user-047] start_date 이후 일봉만 조회 (증분 스캔용)
+
+        read_daily_bulk()와 같은 형식이지만 Row Group 통계 필터로
+        필요한 구간만 읽습니다.
+
+        Args:
+            start_date: 시작 날짜 (포함)
+            tickers: 조회할 티커 목록 (None이면 전체)
+
+        Returns:
+            dict[str, list[dict]]: 티커 → 일봉 데이터 (오래된 순 정렬)
+        """
+        df = self.read_daily_frame(start_date, tickers=tickers)
+
+        result = {}
+        for ticker, group in df.groupby("ticker"):
+            result[ticker] = group.sort_values("date").to_dict("records")
+        return result
+
+    def read_daily_frame(
+        self,
+        start_date,
+        tickers: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """
+        [user-049] start_date 이후 일봉을 DataFrame 그대로 조회 (벡터 피처 계산용)
+
+        Args:
+            start_date: 시작 날짜 (포함)
+            tickers: 조회할 티커 목록 (None이면 전체)
+
+        Returns:
+            pd.DataFrame: 일봉 (행 순서는 파일 순서, 없으면 빈 DataFrame)
+        """
+        if not self.daily_path.exists():
+            return pd.DataFrame()
+
+        filters = [("date", ">=", start_date)]
+        if tickers is not None:
+            if not tickers:
+                return pd.DataFrame()
+            filters.append(("ticker", "in", list(tickers)))
+        return pq.read_table(self.daily_path, filters=filters).to_pandas()
+
     # ═══════════════════════════════════════════════════════════════════════
     # Intraday (분봉/시봉) - 티커별 분리 파일
     # ═══════════════════════════════════════════════════════════════════════
@@ -304,6 +386,7 @@ class ParquetManager:
             path,
             compression="snappy",
         )
+        self._record_intraday(ticker, timeframe, df, path)
 
         logger.debug(f"📝 Intraday written: {ticker}_{timeframe} → {len(df)} rows")
         return len(df)
@@ -564,6 +647,10 @@ class ParquetManager:
         Returns:
             list[str]: 티커 목록
         """
+        if self._catalog_ready():
+            self._sync_daily()
+            return self.catalog.tickers(DAILY_TIMEFRAME)
+
         if not self.daily_path.exists():
             return []
 
@@ -584,6 +671,11 @@ class ParquetManager:
         Returns:
             list[str]: 티커 목록
         """
+        # [user-044] 카탈로그 조회 (폴더 mtime이 같으면 glob 없음)
+        if self._catalog_ready():
+            self._sync_timeframe(timeframe)
+            return self.catalog.tickers(timeframe)
+
         tickers = set()
 
         # [11-003] 새 구조에서 조회: {tf}/*.parquet
@@ -617,6 +709,23 @@ class ParquetManager:
                 - intraday_files: 분봉 파일 수 (전체)
                 - intraday_by_tf: 타임프레임별 파일 수
         """
+        # [user-044] 카탈로그 조회 (일봉 파일 전체 읽기 없음)
+        if self._catalog_ready():
+            self._sync_daily()
+            for tf in self._tf_dirs:
+                self._sync_timeframe(tf)
+            cat = self.catalog.stats()
+            by_tf = {tf: cat["intraday_by_tf"].get(tf, 0) for tf in self._tf_dirs}
+            if cat["legacy_intraday"]:
+                by_tf["legacy_intraday"] = cat["legacy_intraday"]
+            return {
+                "daily_rows": cat["daily_rows"],
+                "daily_tickers": cat["daily_tickers"],
+                "daily_file_size_mb": cat["daily_file_size_bytes"] / (1024 * 1024),
+                "intraday_files": sum(by_tf.values()),
+                "intraday_by_tf": by_tf,
+            }
+
         stats = {
             "daily_rows": 0,
             "daily_tickers": 0,
@@ -662,6 +771,14 @@ class ParquetManager:
         """
         deleted = False
 
+        # [user-044] 삭제 전 최신이던 (폴더, TF) 기록만 삭제 후 갱신 (외부 변경은 가리지 않음)
+        fresh_dirs = []
+        if self.catalog:
+            for tf in self.SUPPORTED_TIMEFRAMES:
+                for directory in (self._tf_dirs[tf], self._legacy_intraday_dir):
+                    if self.catalog.is_dir_fresh(directory, tf):
+                        fresh_dirs.append((directory, tf))
+
         # [11-003] 새 구조에서 삭제: {tf}/{ticker}.parquet
         for tf in self.SUPPORTED_TIMEFRAMES:
             path = self._get_intraday_path(ticker, tf)
@@ -679,4 +796,165 @@ class ParquetManager:
                     deleted = True
                     logger.info(f"🗑️ Deleted (legacy): {legacy_path}")
 
+        if self.catalog:
+            self.catalog.remove(ticker)
+            for directory, tf in fresh_dirs:
+                self.catalog.record_dir(directory, tf)
+
         return deleted
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # [user-044] 카탈로그 조회 / 재구축
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def count_intraday_bars(self, ticker: str, timeframe: str, days: int) -> Optional[int]:
+        """
+        최근 N일 봉 수 (카탈로그 조회, 일 단위 근사)
+
+        파일 mtime/크기가 기록과 다르면 그 파일만 다시 읽어 갱신합니다.
+
+        Returns:
+            int: 봉 수 (카탈로그 미사용/미구축 시 None → 호출자가 파일을 직접 읽음)
+        """
+        if not self._catalog_ready():
+            return None
+        self._sync_series(ticker, timeframe)
+        cutoff_ts = int((datetime.now() - timedelta(days=days)).timestamp() * 1000)
+        return self.catalog.count_bars(ticker, timeframe, cutoff_ts)
+
+    def get_intraday_coverage(
+        self, pairs: list[tuple[str, str]], timeframe: str = "1m"
+    ) -> dict[tuple[str, str], tuple[int, int, int]]:
+        """
+        (ticker, 'YYYY-MM-DD') 쌍별 봉 수와 첫/마지막 timestamp (카탈로그 조회)
+
+        Returns:
+            {(ticker, day): (bars, first_ts, last_ts)} - 데이터 있는 쌍만 포함
+        """
+        if not self._catalog_ready():
+            raise RuntimeError("카탈로그 미사용 또는 미구축 (rebuild_catalog() 먼저 실행)")
+        self._sync_timeframe(timeframe)
+        return self.catalog.coverage(pairs, timeframe)
+
+    def rebuild_catalog(self) -> int:
+        """
+        저장된 파일을 모두 다시 읽어 카탈로그 재구축
+
+        최초 구축 / 외부에서 파일을 직접 수정한 경우. 끝까지 완료되어야 complete로 표시되며,
+        그 전(또는 도중 실패 시)에는 조회가 파일 스캔 경로를 사용합니다.
+
+        Returns:
+            int: 기록한 파일 수
+        """
+        if not self.catalog:
+            return 0
+
+        self.catalog.set_complete(False)
+        count = self._sync_daily(force=True)
+
+        timeframes = set(self._tf_dirs)
+        if self._legacy_intraday_dir.exists():
+            timeframes.update(
+                f.stem.rpartition("_")[2] for f in self._legacy_intraday_dir.glob("*_*.parquet")
+            )
+        for tf in sorted(timeframes):
+            count += self._sync_timeframe(tf, force=True)
+
+        self.catalog.set_complete(True)
+        logger.info(f"📇 카탈로그 재구축 완료: {count}개 파일")
+        return count
+
+    # ───────────────────────────────────────────────────────────────────────
+    # [user-044] 카탈로그 ↔ 파일 동기화 (stat 비교, 바뀐 파일만 읽음)
+    # ───────────────────────────────────────────────────────────────────────
+
+    def _catalog_ready(self) -> bool:
+        return self.catalog is not None and self.catalog.complete
+
+    def _record_intraday(self, ticker: str, timeframe: str, df: pd.DataFrame, path: Path) -> None:
+        """쓰기 직후 기록 (폴더가 최신이었으면 폴더 mtime도 갱신 - 새 파일 생성 반영)"""
+        if not self.catalog:
+            return
+        fresh = self.catalog.is_dir_fresh(path.parent, timeframe)
+        self.catalog.record_intraday(ticker, timeframe, df, path)
+        if fresh:
+            self.catalog.record_dir(path.parent, timeframe)
+
+    def _sync_daily(self, force: bool = False) -> int:
+        """일봉 파일 mtime/크기가 기록과 다르면 다시 읽어 기록 (기록한 파일 수 반환)"""
+        if not force and self.catalog.is_file_fresh(self.daily_path):
+            return 0
+        state = file_state(self.daily_path)
+        if state is None:
+            self.catalog.remove_daily(self.daily_path)
+            return 0
+        self.catalog.record_daily(pq.read_table(self.daily_path).to_pandas(), self.daily_path, state)
+        return 1
+
+    def _sync_timeframe(self, timeframe: str, force: bool = False) -> int:
+        """
+        타임프레임 폴더(+레거시) 동기화: 폴더 mtime이 같으면 생략, 다르면 새/바뀐 파일만 읽고
+        사라진 파일은 기록 삭제 (기록한 파일 수 반환)
+        """
+        tf_dir = self.base_dir / timeframe
+        legacy_dir = self._legacy_intraday_dir
+        if not force and self.catalog.is_dir_fresh(tf_dir, timeframe) and self.catalog.is_dir_fresh(
+            legacy_dir, timeframe
+        ):
+            return 0
+
+        dir_states = {d: file_state(d) for d in (tf_dir, legacy_dir)}
+
+        # 레거시 먼저 → 같은 티커의 새 구조 파일이 덮어씀
+        present: dict[str, tuple[Path, bool]] = {}
+        suffix = f"_{timeframe}"
+        if legacy_dir.exists():
+            for f in legacy_dir.glob(f"*{suffix}.parquet"):
+                present[f.stem[: -len(suffix)]] = (f, True)
+        if tf_dir.exists():
+            for f in tf_dir.glob("*.parquet"):
+                present[f.stem] = (f, False)
+
+        known = {} if force else self.catalog.file_states(timeframe)
+        count = 0
+        complete = True
+        for ticker, (path, legacy) in present.items():
+            state = file_state(path)
+            if known.get(str(path)) == state:
+                continue
+            try:
+                df = pq.read_table(path).to_pandas()
+                self.catalog.record_intraday(ticker, timeframe, df, path, legacy=legacy, state=state)
+                count += 1
+            except Exception as e:
+                complete = False
+                logger.warning(f"[CATALOG] {path} 스캔 실패: {e}")
+
+        current = {str(path) for path, _ in present.values()}
+        for path in set(self.catalog.file_states(timeframe)) - current:
+            self.catalog.remove_path(path)
+
+        # 읽기 실패한 파일이 있으면 폴더를 최신으로 표시하지 않음 (다음 조회에서 재시도)
+        if complete:
+            for directory, state in dir_states.items():
+                self.catalog.record_dir(directory, timeframe, state)
+        return count
+
+    def _sync_series(self, ticker: str, timeframe: str) -> None:
+        """티커 1개 파일(새 구조 우선, 없으면 레거시)의 stat이 기록과 다르면 다시 읽음"""
+        path = self.base_dir / timeframe / f"{ticker}.parquet"
+        legacy = False
+        if not path.exists():
+            path = self._legacy_intraday_dir / f"{ticker}_{timeframe}.parquet"
+            legacy = True
+
+        entry = self.catalog.series(ticker, timeframe)
+        state = file_state(path)
+        if state is None:
+            if entry:
+                self.catalog.remove(ticker, timeframe)
+            return
+        if entry and entry["path"] == str(path) and (entry["mtime_ns"], entry["size_bytes"]) == state:
+            return
+        df = pq.read_table(path).to_pandas()
+        self.catalog.record_intraday(ticker, timeframe, df, path, legacy=legacy, state=state)
@@ -0,0 +1,374 @@
+# ============================================================================
+# Parquet Quality Engine - 증분·병렬 Parquet 품질 검사
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - 분봉/시봉 파일 검사를 ProcessPoolExecutor로 병렬 실행
+#   - 검사마다 필요한 컬럼만 읽음 (중복 = timestamp, OHLC = 가격 컬럼)
+#   - Row Group 통계(min/max/null_count)로 판정 가능한 범위 검사는 읽기 생략
+#   - 파일별 결과를 (mtime, size, footer 해시) 기준으로 캐시 → 재실행 시 변경 파일만 검사
+#
+# 📂 저장 구조:
+#   data/parquet/_quality_cache.json   # {파일 경로: {mtime_ns, size, footer, results: {모드: 결과}}}
+#
+# 📖 사용 예시:
+#   >>> engine = ParquetQualityEngine("data/parquet")
+#   >>> files = find_intraday_files(engine.base_dir)
+#   >>> results = engine.validate_intraday_files(files, full_ohlc=True)
+#
+# 📌 [user-045] Parallel, incremental Parquet quality validation
+# ============================================================================
+
+import hashlib
+import json
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+import pyarrow.parquet as pq
+from loguru import logger
+
+from backend.data.validators import PRICE_COLUMNS, validate_ohlc_relationship
+
+
+# 필수 컬럼 정의
+DAILY_REQUIRED_COLS = ["ticker", "date", "open", "high", "low", "close", "volume"]
+INTRADAY_REQUIRED_COLS = ["timestamp", "open", "high", "low", "close", "volume"]
+
+# 검사 대상 타임프레임 폴더
+INTRADAY_TIMEFRAMES = ["1m", "3m", "5m", "15m", "1h", "4h"]
+
+# 캐시 파일명 (base_dir 바로 아래)
+CACHE_FILE = "_quality_cache.json"
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 메타데이터 헬퍼 (데이터 페이지를 읽지 않음)
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def footer_hash(path: Union[str, Path]) -> str:
+    """
+    Parquet footer(스키마 + Row Group 통계) 해시.
+
+    ELI5: 파일 끝의 "목차"만 읽어서 지문을 만듭니다. 내용이 바뀌면
+          통계/오프셋이 바뀌므로 목차 지문도 바뀝니다.
+    """
+    with open(path, "rb") as f:
+        f.seek(-8, os.SEEK_END)
+        length = struct.unpack("<I", f.read(4))[0]
+        f.seek(-(8 + length), os.SEEK_END)
+        footer = f.read(length)
+    return hashlib.blake2b(footer, digest_size=16).hexdigest()
+
+
+def _column_index(metadata: pq.FileMetaData, name: str) -> Optional[int]:
+    for i in range(metadata.num_columns):
+        if metadata.schema.column(i).name == name:
+            return i
+    return None
+
+
+def column_range(metadata: pq.FileMetaData, name: str) -> Optional[tuple]:
+    """Row Group 통계로 컬럼 전체 (min, max). 통계가 없는 Row Group이 있으면 None"""
+    idx = _column_index(metadata, name)
+    if idx is None or metadata.num_row_groups == 0:
+        return None
+    mins, maxs = [], []
+    for rg in range(metadata.num_row_groups):
+        stats = metadata.row_group(rg).column(idx).statistics
+        if stats is None or not stats.has_min_max:
+            return None
+        mins.append(stats.min)
+        maxs.append(stats.max)
+    return min(mins), max(maxs)
+
+
+def column_null_count(metadata: pq.FileMetaData, name: str) -> Optional[int]:
+    """Row Group 통계로 컬럼 NULL 수 합계. 통계가 없으면 None"""
+    idx = _column_index(metadata, name)
+    if idx is None:
+        return None
+    total = 0
+    for rg in range(metadata.num_row_groups):
+        stats = metadata.row_group(rg).column(idx).statistics
+        if stats is None or not stats.has_null_count:
+            return None
+        total += stats.null_count
+    return total
+
+
+def _ohlc_row_groups(metadata: pq.FileMetaData) -> list[int]:
+    """
+    OHLC 위반이 있을 수 있는 Row Group 목록.
+
+    통계만으로 "위반 불가"가 확정되는 Row Group은 제외:
+    모든 가격 min > 0, min(High) >= max(Open, Close, Low), max(Low) <= min(Open, Close)
+    """
+    idx = {c: _column_index(metadata, c) for c in PRICE_COLUMNS}
+    suspects = []
+    for rg in range(metadata.num_row_groups):
+        group = metadata.row_group(rg)
+        stats = {c: group.column(i).statistics for c, i in idx.items()}
+        if any(s is None or not s.has_min_max for s in stats.values()):
+            suspects.append(rg)
+            continue
+        lo = {c: s.min for c, s in stats.items()}
+        hi = {c: s.max for c, s in stats.items()}
+        clean = (
+            min(lo.values()) > 0
+            and lo["high"] >= max(hi["open"], hi["close"], hi["low"])
+            and hi["low"] <= min(lo["open"], lo["close"])
+        )
+        if not clean:
+            suspects.append(rg)
+    return suspects
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 파일 1개 검사 (모듈 레벨 워커 - ProcessPoolExecutor pickle 호환)
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def validate_intraday_file(file_path: Union[str, Path], tf: str, full_ohlc: bool = False) -> dict:
+    """
+    단일 Intraday 파일 검사
+
+    Args:
+        file_path: 파일 경로
+        tf: 타임프레임
+        full_ohlc: OHLC 관계 검사 포함 여부
+
+    Returns:
+        dict: {file, tf, valid, error, warning, ohlc_violations, records, duplicates}
+    """
+    result = {
+        "file": str(file_path),
+        "tf": tf,
+        "valid": False,
+        "error": None,
+        "warning": None,
+        "ohlc_violations": 0,
+        "records": 0,
+        "duplicates": 0,
+    }
+
+    try:
+        pf = pq.ParquetFile(file_path)
+        metadata = pf.metadata
+        result["records"] = metadata.num_rows
+
+        # 필수 컬럼 검사 (스키마만)
+        missing = set(INTRADAY_REQUIRED_COLS) - set(pf.schema_arrow.names)
+        if missing:
+            result["error"] = f"누락 컬럼 {missing}"
+            return result
+
+        # 빈 파일 검사
+        if metadata.num_rows == 0:
+            result["error"] = "빈 파일"
+            return result
+
+        # 중복 검사 (timestamp 컬럼만 읽음, 정렬돼 있으면 diff 한 번)
+        ts = pf.read(columns=["timestamp"]).column(0).to_numpy()
+        if len(ts) > 1 and not bool(np.all(ts[1:] > ts[:-1])):
+            dups = len(ts) - len(np.unique(ts))
+            if dups > 0:
+                result["duplicates"] = int(dups)
+                result["warning"] = f"중복 {dups}건"
+
+        # [11-004] OHLC 관계 검사 (full 모드) - 통계로 확정 못 한 Row Group만 읽음
+        if full_ohlc:
+            row_groups = _ohlc_row_groups(metadata)
+            if row_groups:
+                prices = pf.read_row_groups(row_groups, columns=PRICE_COLUMNS).to_pandas()
+                ohlc_violations = validate_ohlc_relationship(prices)
+                result["ohlc_violations"] = len(ohlc_violations)
+                if ohlc_violations:
+                    result["warning"] = f"OHLC 위반 {len(ohlc_violations)}건"
+
+        result["valid"] = True
+
+    except Exception as e:
+        result["error"] = f"읽기 실패 - {e}"
+
+    return result
+
+
+def _validate_item(item: tuple) -> dict:
+    """(file_path, tf, full_ohlc) → validate_intraday_file 결과 (병렬 처리용)"""
+    return validate_intraday_file(*item)
+
+
+def find_intraday_files(
+    base_dir: Union[str, Path],
+    timeframes: Optional[list[str]] = None,
+) -> list[tuple[Path, str]]:
+    """TF별 폴더의 (파일 경로, tf) 목록"""
+    base_dir = Path(base_dir)
+    files = []
+    for tf in timeframes or INTRADAY_TIMEFRAMES:
+        tf_dir = base_dir / tf
+        if tf_dir.exists():
+            files.extend((f, tf) for f in sorted(tf_dir.glob("*.parquet")))
+    return files
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 결과 캐시
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class QualityCache:
+    """
+    파일별 검사 결과 캐시 (JSON)
+
+    mtime/size가 같으면 그대로 재사용, size는 같고 mtime만 바뀌었으면
+    footer 해시로 내용 변경 여부를 확인합니다 (touch/복사만 된 파일 재검사 방지).
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._entries: dict[str, dict] = {}
+        self._dirty = False
+        if self.path.exists():
+            try:
+                self._entries = json.loads(self.path.read_text(encoding="utf-8"))
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning(f"⚠️ 품질 캐시 손상, 새로 생성: {e}")
+
+    def lookup(self, file_path: Union[str, Path], mode: str) -> Optional[dict]:
+        """변경되지 않은 파일의 캐시된 결과 (없으면 None)"""
+        key = str(file_path)
+        entry = self._entries.get(key)
+        if entry is None or mode not in entry["results"]:
+            return None
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        if stat.st_size != entry["size"]:
+            return None
+        if stat.st_mtime_ns != entry["mtime_ns"]:
+            try:
+                if footer_hash(file_path) != entry["footer"]:
+                    return None
+            except OSError:
+                return None
+            entry["mtime_ns"] = stat.st_mtime_ns
+            self._dirty = True
+        return entry["results"][mode]
+
+    def store(self, file_path: Union[str, Path], mode: str, result: dict) -> None:
+        """검사 결과 기록 (파일이 바뀌었으면 다른 모드 결과는 버림)"""
+        key = str(file_path)
+        try:
+            stat = os.stat(file_path)
+            digest = footer_hash(file_path)
+        except (OSError, struct.error):
+            self._entries.pop(key, None)
+            return
+        entry = self._entries.get(key)
+        if entry is None or entry["footer"] != digest or entry["size"] != stat.st_size:
+            entry = {"results": {}}
+            self._entries[key] = entry
+        entry.update({"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "footer": digest})
+        entry["results"][mode] = result
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self._entries, ensure_ascii=False, default=str), encoding="utf-8")
+        tmp.replace(self.path)
+        self._dirty = False
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# ParquetQualityEngine 클래스
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class ParquetQualityEngine:
+    """
+    증분·병렬 Parquet 품질 검사기
+
+    Attributes:
+        base_dir: Parquet 베이스 디렉터리
+        cache: 결과 캐시 (use_cache=False면 None)
+        max_workers: 병렬 프로세스 수 (1 이하면 현재 프로세스에서 처리)
+        last_run: 마지막 실행 통계 {checked, cached}
+    """
+
+    def __init__(
+        self,
+        base_dir: Union[str, Path] = "data/parquet",
+        use_cache: bool = True,
+        cache_path: Optional[Union[str, Path]] = None,
+        max_workers: Optional[int] = None,
+    ):
+        self.base_dir = Path(base_dir)
+        self.cache = QualityCache(cache_path or self.base_dir / CACHE_FILE) if use_cache else None
+        self.max_workers = max_workers if max_workers is not None else min(4, os.cpu_count() or 4)
+        self.last_run = {"checked": 0, "cached": 0}
+
+    def validate_intraday_files(
+        self,
+        files: list[tuple[Path, str]],
+        full_ohlc: bool = False,
+    ) -> list[dict]:
+        """
+        파일 목록 검사 (캐시 적중은 건너뛰고 나머지만 병렬 검사)
+
+        Args:
+            files: [(파일 경로, tf), ...]
+            full_ohlc: OHLC 관계 검사 포함 여부
+
+        Returns:
+            files 순서대로 validate_intraday_file 결과 리스트
+        """
+        mode = "full" if full_ohlc else "quick"
+        results: list[Optional[dict]] = [None] * len(files)
+        todo: list[int] = []
+        for i, (path, _) in enumerate(files):
+            cached = self.cache.lookup(path, mode) if self.cache else None
+            if cached is None:
+                todo.append(i)
+            else:
+                results[i] = cached
+
+        items = [(files[i][0], files[i][1], full_ohlc) for i in todo]
+        if self.max_workers > 1 and len(items) > 1:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                fresh = list(executor.map(_validate_item, items, chunksize=16))
+        else:
+            fresh = [_validate_item(item) for item in items]
+
+        for i, result in zip(todo, fresh):
+            results[i] = result
+            if self.cache:
+                self.cache.store(files[i][0], mode, result)
+        if self.cache:
+            self.cache.save()
+
+        self.last_run = {"checked": len(todo), "cached": len(files) - len(todo)}
+        logger.info(
+            f"🔍 품질 검사: {len(todo)}개 검사 / {len(files) - len(todo)}개 캐시 재사용 "
+            f"(workers={self.max_workers}, mode={mode})"
+        )
+        return results
+
+
+__all__ = [
+    "ParquetQualityEngine",
+    "QualityCache",
+    "column_null_count",
+    "column_range",
+    "find_intraday_files",
+    "footer_hash",
+    "validate_intraday_file",
+]
@@ -0,0 +1,337 @@
+# ============================================================================
+# Score Journal - 스코어 히스토리 Append-Only 저장소
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - 스코어 변경분만 (ticker, ts, version, score, intensities) 행으로 기록
+#   - Flush 시 변경분만 작은 세그먼트 파일로 추가 (전체 재작성 없음)
+#   - 주기적 Compaction: 일자별 세그먼트를 compacted.parquet로 병합
+#   - 티커별 최신 스코어 스냅샷 조회 (저널에서 계산, 별도 파일 없음)
+#   - 티커별 스코어 궤적(trajectory) 조회 (Predicate Pushdown)
+#
+# 📂 저장 구조:
+#   scores/
+#   └── journal/2024-12-17/
+#       ├── compacted.parquet           # 병합된 당일 히스토리
+#       └── seg_000012.parquet          # 아직 병합되지 않은 세그먼트
+#
+# 📖 사용 예시:
+#   >>> journal = ScoreJournal("data/parquet/scores")
+#   >>> journal.record("AAPL", "v3", {"score_v3": 72.5, "intensities_v3": {...}})
+#   >>> journal.flush()
+#   >>> df = journal.get_trajectory("AAPL")
+#
+# 📌 [user-028] Columnar Score History Store
+# ============================================================================
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+import time
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from loguru import logger
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 스키마
+# ═══════════════════════════════════════════════════════════════════════════
+
+# Seismograph 시그널 (intensities 키)
+SIGNAL_NAMES = ("tight_range", "obv_divergence", "accumulation_bar", "volume_dryout")
+
+# 저널 스키마 (ELI5: 시그널 강도는 컬럼 하나씩 펼쳐서 저장합니다)
+JOURNAL_SCHEMA = pa.schema(
+    [
+        ("ticker", pa.string()),
+        ("ts", pa.int64()),  # Unix ms
+        ("version", pa.string()),
+        ("score", pa.float64()),
+        *[(f"i_{name}", pa.float64()) for name in SIGNAL_NAMES],
+    ]
+)
+
+
+def _extract_row(ticker: str, version: str, score_data: dict[str, Any], ts: int) -> dict:
+    """
+    스코어 딕셔너리 → 저널 행 변환
+
+    score_{version} / intensities_{version} 키를 우선 사용하고,
+    없으면 score / intensities를 사용합니다.
+    """
+    score = score_data.get(f"score_{version}", score_data.get("score", 0.0))
+    intensities = score_data.get(f"intensities_{version}") or score_data.get("intensities") or {}
+    row = {
+        "ticker": ticker,
+        "ts": ts,
+        "version": version,
+        "score": float(score) if score is not None else None,
+    }
+    for name in SIGNAL_NAMES:
+        value = intensities.get(name)
+        row[f"i_{name}"] = float(value) if value is not None else None
+    return row
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# ScoreJournal 클래스
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class ScoreJournal:
+    """
+    스코어 히스토리 Append-Only 저널
+
+    ELI5: 매번 전체 성적표를 새로 쓰는 대신, 바뀐 점수만 일기장에 한 줄씩 적습니다.
+          가끔(Compaction) 일기장의 낱장들을 한 권으로 묶습니다.
+          "현재 점수표"는 일기장의 마지막 줄들을 읽어 만듭니다.
+
+    Attributes:
+        _dir: scores 디렉터리
+        _journal_dir: 일자별 세그먼트 디렉터리
+        _pending: 아직 디스크에 기록되지 않은 행
+        _last: 티커별 마지막 기록 (변경 감지용)
+        _compact_every: 이 수만큼 세그먼트가 쌓이면 자동 Compaction
+
+    Example:
+        >>> journal = ScoreJournal(Path("data/parquet/scores"))
+        >>> journal.record("AAPL", "v3", {"score_v3": 72.5})
+        >>> journal.flush()
+    """
+
+    def __init__(self, scores_dir: Path | str, compact_every: int = 50):
+        """
+        ScoreJournal 초기화
+
+        Args:
+            scores_dir: scores 디렉터리 (journal/)
+            compact_every: 자동 Compaction 세그먼트 수 (기본 50)
+        """
+        self._dir = Path(scores_dir)
+        self._journal_dir = self._dir / "journal"
+        self._journal_dir.mkdir(parents=True, exist_ok=True)
+        self._compact_every = compact_every
+
+        self._pending: list[dict] = []
+        self._last: dict[tuple[str, str], tuple] = {}
+        self._seq = self._next_seq()
+        self._segments_since_compaction = 0
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # 기록
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def record(
+        self,
+        ticker: str,
+        version: str,
+        score_data: dict[str, Any],
+        ts: Optional[int] = None,
+    ) -> bool:
+        """
+        스코어 기록 (값이 바뀐 경우에만)
+
+        Args:
+            ticker: 종목 심볼
+            version: 스코어 버전 (예: "v3")
+            score_data: 스코어 데이터 딕셔너리
+            ts: 기록 시각 (Unix ms, 기본: 현재)
+
+        Returns:
+            bool: 새 행이 추가되었으면 True (변경 없으면 False)
+        """
+        ts = ts if ts is not None else int(time.time() * 1000)
+        row = _extract_row(ticker, version, score_data, ts)
+
+        values = tuple(row[k] for k in JOURNAL_SCHEMA.names[3:])
+        if self._last.get((ticker, version)) == values:
+            return False
+
+        self._last[(ticker, version)] = values
+        self._pending.append(row)
+        return True
+
+    def flush(self) -> int:
+        """
+        대기 중인 행을 새 세그먼트로 기록
+
+        ELI5: 변경분만 작은 파일 하나로 씁니다. 비용 = 변경 수.
+
+        Returns:
+            int: 기록된 행 수
+        """
+        count = self._write_segment()
+        if self._segments_since_compaction >= self._compact_every:
+            self.compact()
+        return count
+
+    def _write_segment(self) -> int:
+        """대기 행 → 일자별 seg_{seq}.parquet (Compaction 없음)"""
+        if not self._pending:
+            return 0
+
+        rows, self._pending = self._pending, []
+
+        # 자정을 걸친 배치는 행마다 날짜 디렉터리로 나눠 기록
+        by_day: dict[Path, list[dict]] = {}
+        for row in rows:
+            by_day.setdefault(self._day_dir(row["ts"]), []).append(row)
+
+        for day_dir, day_rows in by_day.items():
+            day_dir.mkdir(parents=True, exist_ok=True)
+            path = day_dir / f"seg_{self._seq:06d}.parquet"
+            pq.write_table(
+                pa.Table.from_pylist(day_rows, schema=JOURNAL_SCHEMA),
+                path,
+                compression="snappy",
+            )
+            self._seq += 1
+            self._segments_since_compaction += 1
+            logger.debug(f"💾 Score journal segment: {len(day_rows)} rows → {day_dir.name}/{path.name}")
+
+        return len(rows)
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # Compaction
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def compact(self) -> None:
+        """
+        세그먼트 병합
+
+        일자별로 세그먼트를 compacted.parquet에 병합 후 세그먼트를 삭제합니다.
+        """
+        self._write_segment()
+
+        for day_dir in sorted(p for p in self._journal_dir.iterdir() if p.is_dir()):
+            segments = sorted(day_dir.glob("seg_*.parquet"))
+            if not segments:
+                continue
+
+            compacted = day_dir / "compacted.parquet"
+            sources = ([compacted] if compacted.exists() else []) + segments
+            table = pa.concat_tables([pq.read_table(p, schema=JOURNAL_SCHEMA) for p in sources])
+            table = table.sort_by([("ticker", "ascending"), ("ts", "ascending")])
+
+            tmp = day_dir / "compacted.parquet.tmp"
+            pq.write_table(table, tmp, compression="snappy")
+            tmp.replace(compacted)
+            for seg in segments:
+                seg.unlink()
+
+        self._segments_since_compaction = 0
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # 조회
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def get_trajectory(
+        self,
+        ticker: str,
+        date: Optional[str] = None,
+        version: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        티커의 스코어 궤적 조회 (시간순)
+
+        Args:
+            ticker: 종목 심볼
+            date: 조회 날짜 (YYYY-MM-DD, 기본: 오늘)
+            version: 스코어 버전 필터 (None이면 전체)
+
+        Returns:
+            pd.DataFrame: ts, version, score, i_* 컬럼 (빈 경우 빈 DataFrame)
+        """
+        date = date or datetime.now().strftime("%Y-%m-%d")
+        day_dir = self._journal_dir / date
+
+        expr = ds.field("ticker") == ticker
+        if version:
+            expr = expr & (ds.field("version") == version)
+        df = self._read_day(day_dir, expr)
+
+        # 아직 디스크에 기록되지 않은 행도 포함
+        pending = [
+            r for r in self._pending
+            if r["ticker"] == ticker
+            and (version is None or r["version"] == version)
+            and self._day_dir(r["ts"]) == day_dir
+        ]
+        if pending:
+            df = pd.concat([df, pd.DataFrame(pending)], ignore_index=True)
+
+        if df.empty:
+            return df
+        return df.sort_values("ts").reset_index(drop=True)
+
+    def get_snapshot(self, version: str = "v3") -> pd.DataFrame:
+        """
+        티커별 최신 스코어 조회 (가장 최근 일자 저널 + 대기 행 기준)
+
+        ELI5: 따로 점수표 파일을 두지 않고, 일기장 마지막 날의
+              티커별 마지막 줄을 그때그때 골라냅니다 (항상 최신).
+
+        Args:
+            version: 스코어 버전
+
+        Returns:
+            pd.DataFrame: 티커별 최신 스코어 (없으면 빈 DataFrame)
+        """
+        days = sorted(p for p in self._journal_dir.iterdir() if p.is_dir())
+        pending = [r for r in self._pending if r["version"] == version]
+        if pending:
+            latest_pending = max(self._day_dir(r["ts"]) for r in pending)
+            if not days or latest_pending > days[-1]:
+                days.append(latest_pending)
+        if not days:
+            return pd.DataFrame()
+
+        day_dir = days[-1]
+        df = self._read_day(day_dir, ds.field("version") == version)
+        pending = [r for r in pending if self._day_dir(r["ts"]) == day_dir]
+        if pending:
+            df = pd.concat([df, pd.DataFrame(pending)], ignore_index=True)
+        if df.empty:
+            return df
+        latest = df.sort_values("ts", kind="stable").groupby("ticker", sort=True).tail(1)
+        return latest.sort_values("ticker").reset_index(drop=True)
+
+    def get_stats(self) -> dict:
+        """
+        저널 통계 반환
+
+        Returns:
+            dict: pending_rows, segments_since_compaction, tracked_keys
+        """
+        return {
+            "pending_rows": len(self._pending),
+            "segments_since_compaction": self._segments_since_compaction,
+            "tracked_keys": len(self._last),
+        }
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # 내부 헬퍼
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def _day_dir(self, ts_ms: int) -> Path:
+        return self._journal_dir / datetime.fromtimestamp(ts_ms / 1000).strftime("%Y-%m-%d")
+
+    def _read_day(self, day_dir: Path, expr: Optional[ds.Expression] = None) -> pd.DataFrame:
+        """일자 디렉터리의 compacted + 세그먼트 읽기"""
+        if not day_dir.exists():
+            return pd.DataFrame()
+        files = sorted(str(p) for p in day_dir.glob("*.parquet"))
+        if not files:
+            return pd.DataFrame()
+        dataset = ds.dataset(files, schema=JOURNAL_SCHEMA, format="parquet")
+        return dataset.to_table(filter=expr).to_pandas()
+
+    def _next_seq(self) -> int:
+        """기존 세그먼트 번호 이후부터 시작 (재시작 시 덮어쓰기 방지)"""
+        seqs = [
+            int(p.stem.split("_")[1])
+            for p in self._journal_dir.glob("*/seg_*.parquet")
+        ]
+        return max(seqs, default=-1) + 1
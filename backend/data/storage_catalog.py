@@ -0,0 +1,438 @@
+# ============================================================================
+# Storage Catalog - Parquet 저장소 메타데이터 인덱스 (SQLite)
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - ParquetManager가 파일을 쓸 때마다 요약 정보를 기록
+#     · 시리즈(ticker, timeframe): 경로, 최소/최대 timestamp, 행 수, 내용 해시
+#     · 일자별 봉 수 (분봉/시봉): 날짜, 봉 수, 첫/마지막 timestamp
+#     · 파일 단위: 일봉 통합 파일 행 수/크기/해시
+#   - 티커 목록, 통계, 커버리지, Gap 판단을 봉 파일을 열지 않고 인덱스 조회로 처리
+#   - 항목마다 파일 mtime/크기, 폴더마다 mtime을 함께 저장 → 외부에서 파일을 바꾸면
+#     is_file_fresh / is_dir_fresh가 False (ParquetManager가 해당 항목만 다시 스캔)
+#   - 전체 구축이 끝나야 complete=True (그 전에는 ParquetManager가 파일 스캔 사용)
+#
+# 📖 사용 예시:
+#   >>> catalog = StorageCatalog("data/parquet/_catalog.db")
+#   >>> catalog.record_intraday("AAPL", "1m", df, path)
+#   >>> catalog.tickers("1m")
+#   >>> catalog.coverage([("AAPL", "2026-01-08")], "1m")
+#
+# 📌 [user-044] Intraday storage catalog maintained on write
+# ============================================================================
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+
+MS_PER_DAY = 86_400_000
+
+# 일봉 시리즈의 timeframe 표기
+DAILY_TIMEFRAME = "1D"
+
+# 스키마 버전 (다르면 테이블을 지우고 다시 구축 - 카탈로그는 파생 데이터)
+SCHEMA_VERSION = 2
+
+
+def content_hash(df: pd.DataFrame) -> str:
+    """DataFrame 내용 해시 (행 순서/값 기준, 인덱스 제외)"""
+    row_hash = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    return hashlib.blake2b(row_hash.tobytes(), digest_size=16).hexdigest()
+
+
+def _day_str(day_index: int) -> str:
+    """1970-01-01 기준 일수 → 'YYYY-MM-DD'"""
+    return str(np.datetime64(int(day_index), "D"))
+
+
+def file_state(path: Union[str, Path]) -> Optional[tuple[int, int]]:
+    """파일/폴더의 (mtime_ns, size) - 없으면 None"""
+    try:
+        st = Path(path).stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _to_ms(values: pd.Series) -> np.ndarray:
+    """timestamp(ms 정수) 또는 날짜/시간 컬럼 → ms 정수 배열"""
+    if pd.api.types.is_integer_dtype(values):
+        return values.to_numpy(dtype="int64")
+    return pd.to_datetime(values).to_numpy(dtype="datetime64[ms]").astype("int64")
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# StorageCatalog 클래스
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class StorageCatalog:
+    """
+    Parquet 저장소 카탈로그
+
+    ELI5: 도서관 카드 목록처럼, 책(봉 파일)을 꺼내 보지 않고도
+          "어떤 종목의 몇 월 며칠 데이터가 몇 개 있는지"를 바로 알려줍니다.
+
+    Attributes:
+        db_path: SQLite 파일 경로
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # 연결 1개를 락으로 보호 (ParquetManager는 여러 스레드에서 호출됨)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                self._conn.executescript("""
+                    DROP TABLE IF EXISTS series;
+                    DROP TABLE IF EXISTS day_bars;
+                    DROP TABLE IF EXISTS files;
+                    DROP TABLE IF EXISTS dirs;
+                    DROP TABLE IF EXISTS meta;
+                """)
+                self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS series (
+                    ticker TEXT NOT NULL,
+                    timeframe TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    min_ts INTEGER,
+                    max_ts INTEGER,
+                    rows INTEGER NOT NULL,
+                    content_hash TEXT,
+                    legacy INTEGER NOT NULL DEFAULT 0,
+                    mtime_ns INTEGER,
+                    size_bytes INTEGER,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (ticker, timeframe)
+                );
+                CREATE TABLE IF NOT EXISTS day_bars (
+                    ticker TEXT NOT NULL,
+                    timeframe TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    bars INTEGER NOT NULL,
+                    first_ts INTEGER NOT NULL,
+                    last_ts INTEGER NOT NULL,
+                    PRIMARY KEY (ticker, timeframe, day)
+                );
+                CREATE TABLE IF NOT EXISTS files (
+                    path TEXT PRIMARY KEY,
+                    rows INTEGER NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    content_hash TEXT,
+                    mtime_ns INTEGER,
+                    updated_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS dirs (
+                    path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER
+                );
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+            """)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # 기록 (ParquetManager 쓰기 경로에서 호출)
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def record_intraday(
+        self,
+        ticker: str,
+        timeframe: str,
+        df: pd.DataFrame,
+        path: Union[str, Path],
+        legacy: bool = False,
+        state: Optional[tuple[int, int]] = None,
+    ) -> None:
+        """
+        분봉/시봉 파일 1개의 요약 기록 (기존 기록 교체).
+
+        Args:
+            ticker: 종목 심볼
+            timeframe: 타임프레임
+            df: 파일에 쓴 전체 데이터 (timestamp 컬럼, ms)
+            path: 파일 경로
+            legacy: 레거시 intraday/ 폴더 파일 여부
+            state: 읽기 직전의 (mtime_ns, size). None이면 지금 stat
+                   (스캔 중 파일이 바뀌면 다음 조회에서 다시 읽히도록)
+        """
+        ts = np.sort(_to_ms(df["timestamp"]))
+        days, first_idx, counts = np.unique(ts // MS_PER_DAY, return_index=True, return_counts=True)
+        last_idx = first_idx + counts - 1
+        day_rows = [
+            (ticker, timeframe, _day_str(d), int(n), int(ts[f]), int(ts[l]))
+            for d, n, f, l in zip(days, counts, first_idx, last_idx)
+        ]
+        min_ts = int(ts[0]) if len(ts) else None
+        max_ts = int(ts[-1]) if len(ts) else None
+        digest = content_hash(df)
+        mtime_ns, size = state or file_state(path) or (None, None)
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM day_bars WHERE ticker = ? AND timeframe = ?", (ticker, timeframe)
+            )
+            self._conn.executemany("INSERT INTO day_bars VALUES (?, ?, ?, ?, ?, ?)", day_rows)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO series VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (ticker, timeframe, str(path), min_ts, max_ts, len(df), digest, int(legacy),
+                 mtime_ns, size, time.time()),
+            )
+
+    def record_daily(
+        self,
+        df: pd.DataFrame,
+        path: Union[str, Path],
+        state: Optional[tuple[int, int]] = None,
+    ) -> None:
+        """
+        일봉 통합 파일 요약 기록 (파일 단위 + 티커별 시리즈).
+
+        Args:
+            df: 파일에 쓴 전체 일봉 (ticker, date 정렬 상태)
+            path: 일봉 파일 경로
+            state: 읽기 직전의 (mtime_ns, size). None이면 지금 stat
+        """
+        path = Path(path)
+        ms = _to_ms(df["date"])
+        tickers = df["ticker"].to_numpy()
+        names, starts, counts = np.unique(tickers, return_index=True, return_counts=True)
+        row_hash = pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+        now = time.time()
+        mtime_ns, size = state or file_state(path) or (None, 0)
+        series_rows = []
+        for t, s, n in zip(names, starts, counts):
+            seg = ms[s:s + n]
+            digest = hashlib.blake2b(row_hash[s:s + n].tobytes(), digest_size=16).hexdigest()
+            series_rows.append(
+                (t, DAILY_TIMEFRAME, str(path), int(seg.min()), int(seg.max()), int(n), digest, 0,
+                 mtime_ns, size, now)
+            )
+        file_digest = hashlib.blake2b(row_hash.tobytes(), digest_size=16).hexdigest()
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM series WHERE timeframe = ?", (DAILY_TIMEFRAME,))
+            self._conn.executemany(
+                "INSERT INTO series VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", series_rows
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)",
+                (str(path), len(df), size, file_digest, mtime_ns, now),
+            )
+
+    def remove_daily(self, path: Union[str, Path]) -> None:
+        """일봉 파일 기록 삭제 (파일이 외부에서 지워진 경우)"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM series WHERE timeframe = ?", (DAILY_TIMEFRAME,))
+            self._conn.execute("DELETE FROM files WHERE path = ?", (str(path),))
+
+    def record_dir(
+        self, path: Union[str, Path], timeframe: str, state: Optional[tuple[int, int]] = None
+    ) -> None:
+        """
+        폴더 mtime 기록 (파일 추가/삭제 감지용, 없는 폴더는 NULL)
+
+        레거시 intraday/ 폴더는 타임프레임끼리 공유하므로 (폴더, 타임프레임)별로 기록합니다.
+        """
+        state = state if state is not None else file_state(path)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO dirs VALUES (?, ?)",
+                (f"{path}#{timeframe}", state[0] if state else None),
+            )
+
+    def remove_path(self, path: Union[str, Path]) -> None:
+        """파일 경로로 시리즈 기록 삭제 (파일이 외부에서 지워진 경우)"""
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                "SELECT ticker, timeframe FROM series WHERE path = ?", (str(path),)
+            ).fetchall()
+            for ticker, timeframe in rows:
+                self._conn.execute(
+                    "DELETE FROM day_bars WHERE ticker = ? AND timeframe = ?", (ticker, timeframe)
+                )
+            self._conn.execute("DELETE FROM series WHERE path = ?", (str(path),))
+
+    def remove(self, ticker: str, timeframe: Optional[str] = None) -> None:
+        """시리즈 기록 삭제 (timeframe None이면 일봉 제외 전체 타임프레임)"""
+        where = "ticker = ? AND timeframe = ?" if timeframe else "ticker = ? AND timeframe != ?"
+        params = (ticker, timeframe or DAILY_TIMEFRAME)
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM series WHERE {where}", params)
+            self._conn.execute(f"DELETE FROM day_bars WHERE {where}", params)
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # 구축 상태 / 신선도 (stat만, 봉 파일을 열지 않음)
+    # ═══════════════════════════════════════════════════════════════════════
+
+    @property
+    def complete(self) -> bool:
+        """전체 구축(ParquetManager.rebuild_catalog)이 끝까지 완료되었는지"""
+        return bool(self._query("SELECT 1 FROM meta WHERE key = 'complete' AND value = '1'"))
+
+    def set_complete(self, complete: bool) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('complete', ?)", ("1" if complete else "0",)
+            )
+
+    def is_file_fresh(self, path: Union[str, Path]) -> bool:
+        """일봉 파일의 기록된 mtime/크기 == 현재 (둘 다 없으면 True)"""
+        rows = self._query("SELECT mtime_ns, size_bytes FROM files WHERE path = ?", (str(path),))
+        state = file_state(path)
+        if not rows:
+            return state is None
+        return state == (rows[0][0], rows[0][1])
+
+    def is_dir_fresh(self, path: Union[str, Path], timeframe: str) -> bool:
+        """(폴더, 타임프레임)의 기록된 mtime == 현재 (기록 없으면 False)"""
+        rows = self._query("SELECT mtime_ns FROM dirs WHERE path = ?", (f"{path}#{timeframe}",))
+        if not rows:
+            return False
+        state = file_state(path)
+        return rows[0][0] == (state[0] if state else None)
+
+    def file_states(self, timeframe: str) -> dict[str, tuple[int, int]]:
+        """타임프레임의 {경로: (mtime_ns, size)} (폴더 재동기화 시 변경 파일 판별용)"""
+        rows = self._query(
+            "SELECT path, mtime_ns, size_bytes FROM series WHERE timeframe = ?", (timeframe,)
+        )
+        return {path: (mtime_ns, size) for path, mtime_ns, size in rows}
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # 조회 (봉 파일을 열지 않음)
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def _query(self, sql: str, params: tuple = ()) -> list[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def is_empty(self) -> bool:
+        return not self._query("SELECT 1 FROM series LIMIT 1") and not self._query(
+            "SELECT 1 FROM files LIMIT 1"
+        )
+
+    def tickers(self, timeframe: str) -> list[str]:
+        """타임프레임별 저장된 티커 목록 (정렬)"""
+        rows = self._query(
+            "SELECT ticker FROM series WHERE timeframe = ? ORDER BY ticker", (timeframe,)
+        )
+        return [r[0] for r in rows]
+
+    def series(self, ticker: str, timeframe: str) -> Optional[dict]:
+        """시리즈 요약 (없으면 None)"""
+        rows = self._query(
+            "SELECT path, min_ts, max_ts, rows, content_hash, legacy, mtime_ns, size_bytes, updated_at "
+            "FROM series WHERE ticker = ? AND timeframe = ?",
+            (ticker, timeframe),
+        )
+        if not rows:
+            return None
+        path, min_ts, max_ts, n, digest, legacy, mtime_ns, size, updated_at = rows[0]
+        return {
+            "path": path, "min_ts": min_ts, "max_ts": max_ts, "rows": n,
+            "content_hash": digest, "legacy": bool(legacy),
+            "mtime_ns": mtime_ns, "size_bytes": size, "updated_at": updated_at,
+        }
+
+    def day_bars(
+        self,
+        ticker: str,
+        timeframe: str,
+        start_day: Optional[str] = None,
+        end_day: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """일자별 봉 수 (day, bars, first_ts, last_ts)"""
+        sql = "SELECT day, bars, first_ts, last_ts FROM day_bars WHERE ticker = ? AND timeframe = ?"
+        params: list = [ticker, timeframe]
+        if start_day:
+            sql += " AND day >= ?"
+            params.append(start_day)
+        if end_day:
+            sql += " AND day <= ?"
+            params.append(end_day)
+        rows = self._query(sql + " ORDER BY day", tuple(params))
+        return pd.DataFrame(rows, columns=["day", "bars", "first_ts", "last_ts"])
+
+    def count_bars(self, ticker: str, timeframe: str, since_ms: int) -> int:
+        """since_ms가 속한 날부터의 봉 수 합계 (Gap 판단용, 일 단위 근사)"""
+        rows = self._query(
+            "SELECT COALESCE(SUM(bars), 0) FROM day_bars "
+            "WHERE ticker = ? AND timeframe = ? AND day >= ?",
+            (ticker, timeframe, _day_str(since_ms // MS_PER_DAY)),
+        )
+        return int(rows[0][0])
+
+    def coverage(
+        self, pairs: Iterable[tuple[str, str]], timeframe: str = "1m"
+    ) -> dict[tuple[str, str], tuple[int, int, int]]:
+        """
+        (ticker, 'YYYY-MM-DD') 목록의 일자별 봉 정보.
+
+        Returns:
+            {(ticker, day): (bars, first_ts, last_ts)} - 데이터 있는 쌍만 포함
+        """
+        pairs = list(pairs)
+        with self._lock:
+            self._conn.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS _wanted (ticker TEXT, day TEXT)"
+            )
+            self._conn.execute("DELETE FROM _wanted")
+            self._conn.executemany("INSERT INTO _wanted VALUES (?, ?)", pairs)
+            rows = self._conn.execute(
+                "SELECT d.ticker, d.day, d.bars, d.first_ts, d.last_ts FROM _wanted w "
+                "JOIN day_bars d ON d.ticker = w.ticker AND d.day = w.day AND d.timeframe = ?",
+                (timeframe,),
+            ).fetchall()
+        return {(t, d): (n, f, l) for t, d, n, f, l in rows}
+
+    def stats(self) -> dict:
+        """
+        카탈로그 기반 저장소 통계.
+
+        Returns:
+            dict: daily_rows, daily_tickers, daily_file_size_bytes,
+                  intraday_by_tf {tf: 파일 수}, legacy_intraday, intraday_rows
+        """
+        daily = self._query(
+            "SELECT COALESCE(SUM(rows), 0), COUNT(*) FROM series WHERE timeframe = ?",
+            (DAILY_TIMEFRAME,),
+        )[0]
+        daily_size = self._query(
+            "SELECT COALESCE(SUM(size_bytes), 0) FROM files"
+        )[0][0]
+        by_tf = self._query(
+            "SELECT timeframe, COUNT(*), SUM(rows) FROM series "
+            "WHERE timeframe != ? AND legacy = 0 GROUP BY timeframe",
+            (DAILY_TIMEFRAME,),
+        )
+        legacy = self._query("SELECT COUNT(*) FROM series WHERE legacy = 1")[0][0]
+        return {
+            "daily_rows": int(daily[0]),
+            "daily_tickers": int(daily[1]),
+            "daily_file_size_bytes": int(daily_size),
+            "intraday_by_tf": {tf: n for tf, n, _ in by_tf},
+            "legacy_intraday": int(legacy),
+            "intraday_rows": int(sum(r or 0 for _, _, r in by_tf)),
+        }
+
+
+__all__ = ["StorageCatalog", "content_hash", "file_state", "DAILY_TIMEFRAME"]
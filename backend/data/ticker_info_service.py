@@ -7,24 +7,32 @@
 #   - Massive API를 통한 13개 카테고리 티커 정보 조회
 #   - SQLite 캐싱으로 UX 최적화 (즉시 표시)
 #   - 카테고리별 갱신 정책 적용
+#   - [user-040] 2단 캐시: 프로세스 메모리 LRU → SQLite (전용 스레드의 단일 연결)
+#     + stale-while-revalidate (만료 직후엔 이전 값 즉시 반환, 백그라운드 갱신)
+#     + single-flight (같은 티커/카테고리 동시 요청은 API 1회)
 #
 # 갱신 정책:
 #   - Static (7일): Profile
 #   - Semi-Static (1일): Float, IPO, Ticker Events
-#   - Dynamic (1초): Snapshot, Short Interest/Volume (캐시 안함)
+#   - Dynamic (1초): Snapshot (메모리만), Short Interest/Volume (1시간)
 #   - Periodic (분기별): Financials, SEC Filings
-#   - Real-time: News (캐시 안함)
+#   - Real-time: News (1분, 메모리만)
 #
 # 원본: scripts/demos/ticker_info_demo.py에서 리팩터링
 # ============================================================================
 
 import asyncio
+import concurrent.futures
 import json
 import os
 import sqlite3
-from datetime import datetime, timedelta
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 
 import httpx
 from dotenv import load_dotenv
@@ -56,13 +64,26 @@ REFRESH_POLICY: dict[str, int] = {
     "dividends": 7 * 24 * 3600,
     "splits": 30 * 24 * 3600,
     "related": 7 * 24 * 3600,
-    # Dynamic/Real-time: 캐시 안함 (0)
-    "snapshot": 0,
-    "short_interest": 0,
-    "short_volume": 0,
-    "news": 0,
+    # Dynamic/Real-time: 짧은 TTL (동시 요청/창 재오픈 흡수)
+    "snapshot": 1,
+    "short_interest": 3600,
+    "short_volume": 3600,
+    "news": 60,
 }
 
+# [user-040] 만료 후에도 이전 값을 즉시 반환하며 백그라운드 갱신하는 추가 시간 (초)
+# 기본값 = TTL (즉, 나이 ≤ 2×TTL이면 즉시 반환). snapshot(1초)은 기본값 그대로
+# → 2초 넘은 시세는 반환하지 않음
+STALE_GRACE: dict[str, int] = {
+    "news": 600,
+}
+
+# [user-040] 이 TTL 이상인 카테고리만 SQLite에 저장 (짧은 것은 메모리만)
+PERSIST_MIN_TTL = 3600
+
+# [user-040] 메모리 LRU 최대 항목 수 (티커 × 카테고리)
+MEMORY_CACHE_SIZE = 4096
+
 
 class TickerInfoService:
     """
@@ -80,6 +101,7 @@ class TickerInfoService:
         self,
         api_key: Optional[str] = None,
         db_path: str = "data/ticker_info_cache.db",
+        memory_size: int = MEMORY_CACHE_SIZE,
     ):
         """
         TickerInfoService 초기화.
@@ -87,107 +109,296 @@ class TickerInfoService:
         Args:
             api_key: Massive API 키 (없으면 환경변수에서 로드)
             db_path: SQLite 캐시 DB 경로
+            memory_size: 메모리 LRU 최대 항목 수
         """
         self.api_key = api_key or os.getenv("MASSIVE_API_KEY", "")
         self.db_path = db_path
-        self._client: Optional[httpx.AsyncClient] = None
+        self.memory_size = memory_size
+
+        # [user-040] HTTP 클라이언트는 이벤트 루프별 1개
+        # (GUI는 호출마다 새 루프를 만들고 닫음 → 닫힌 루프의 클라이언트 재사용 방지)
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+        # [user-040] 1단: 메모리 LRU {(ticker, category): (data, fetched_at_epoch)}
+        self._memory: "OrderedDict[tuple[str, str], tuple[Any, float]]" = OrderedDict()
+        self._memory_lock = threading.Lock()
+
+        # [user-040] 2단: SQLite - 전용 스레드 1개가 연결 1개를 소유 (루프 블로킹 없음)
+        self._db_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ticker-info-db"
+        )
+        self._db_conn: Optional[sqlite3.Connection] = None
+        # shutdown() 중복 호출 방지 (종료된 executor에 submit 금지)
+        self._closed = False
+        self._closed_lock = threading.Lock()
+
+        # [user-040] single-flight: 루프/스레드와 무관하게 공유되는 진행 중 요청
+        self._inflight: dict[tuple[str, str], concurrent.futures.Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # [user-040] stale-while-revalidate용 백그라운드 루프 (필요할 때 시작)
+        self._bg_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._bg_lock = threading.Lock()
+
+        self._stats = {"memory_hits": 0, "db_hits": 0, "stale_served": 0, "fetches": 0, "coalesced": 0}
 
         # DB 초기화
-        self._init_db()
+        self._db_executor.submit(self._init_db).result()
 
         if not self.api_key:
             logger.warning("MASSIVE_API_KEY 미설정. API 호출이 실패합니다.")
 
+    def _connection(self) -> sqlite3.Connection:
+        """DB 스레드 전용 연결 (최초 호출 시 생성)."""
+        if self._db_conn is None:
+            self._db_conn = sqlite3.connect(self.db_path)
+            self._db_conn.execute("PRAGMA journal_mode=WAL")
+            self._db_conn.execute("PRAGMA synchronous=NORMAL")
+        return self._db_conn
+
     def _init_db(self) -> None:
         """SQLite 캐시 테이블 생성."""
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS ticker_info_cache (
-                    id INTEGER PRIMARY KEY,
-                    ticker TEXT NOT NULL,
-                    category TEXT NOT NULL,
-                    data TEXT NOT NULL,
-                    fetched_at TEXT NOT NULL,
-                    UNIQUE(ticker, category)
-                )
-            """)
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_ticker_category
-                ON ticker_info_cache(ticker, category)
-            """)
-            conn.commit()
+        conn = self._connection()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS ticker_info_cache (
+                id INTEGER PRIMARY KEY,
+                ticker TEXT NOT NULL,
+                category TEXT NOT NULL,
+                data TEXT NOT NULL,
+                fetched_at TEXT NOT NULL,
+                UNIQUE(ticker, category)
+            )
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_ticker_category
+            ON ticker_info_cache(ticker, category)
+        """)
+        conn.commit()
 
     async def _ensure_client(self) -> httpx.AsyncClient:
-        """HTTP 클라이언트 반환 (없으면 생성)."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(timeout=30.0)
-        return self._client
+        """현재 이벤트 루프의 HTTP 클라이언트 반환 (없으면 생성)."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(timeout=30.0)
+            self._clients[loop] = client
+        return client
 
     async def close(self) -> None:
-        """HTTP 클라이언트 종료."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """HTTP 클라이언트(현재 루프 + 백그라운드 루프) 종료 + 백그라운드 루프 정지."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client:
+            await client.aclose()
+        future = self._close_background()
+        if future is not None:
+            await asyncio.wrap_future(future)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """
+        [user-040] 동기 종료 (앱 종료 시): 백그라운드 갱신 루프의 HTTP 클라이언트를
+        닫고 루프 정지, DB 연결/스레드 정리. 두 번째 호출부터는 아무것도 하지 않음.
+        """
+        with self._closed_lock:
+            if self._closed:
+                return
+            self._closed = True
+        future = self._close_background()
+        if future is not None:
+            try:
+                future.result(timeout=timeout)
+            except Exception as e:
+                logger.debug(f"TickerInfo 백그라운드 종료 실패: {e}")
+        self._db_executor.submit(self._close_db).result(timeout=timeout)
+        self._db_executor.shutdown(wait=True)
+
+    def _close_background(self) -> Optional[concurrent.futures.Future]:
+        """백그라운드 루프에서 자기 HTTP 클라이언트를 닫은 뒤 루프 정지 (완료 Future 반환)."""
+        with self._bg_lock:
+            loop, self._bg_loop = self._bg_loop, None
+        if loop is None:
+            return None
+
+        async def close_and_stop():
+            try:
+                client = self._clients.pop(loop, None)
+                if client:
+                    await client.aclose()
+            finally:
+                loop.call_soon(loop.stop)
+
+        return asyncio.run_coroutine_threadsafe(close_and_stop(), loop)
+
+    def _close_db(self) -> None:
+        """DB 스레드에서 연결 종료."""
+        if self._db_conn is not None:
+            self._db_conn.close()
+            self._db_conn = None
 
     # =========================================================================
     # 캐시 로직
     # =========================================================================
 
-    def _get_cached(self, ticker: str, category: str) -> Optional[dict[str, Any]]:
+    def _get_cached(self, ticker: str, category: str) -> Optional[tuple[Any, float]]:
         """
-        캐시에서 데이터 조회.
+        SQLite에서 데이터 조회 (DB 스레드에서 실행).
 
         Returns:
-            캐시 데이터 또는 None (만료/미존재)
+            (데이터, fetched_at epoch) 또는 None (미존재). TTL 판정은 호출자가 합니다.
         """
-        ttl = REFRESH_POLICY.get(category, 0)
-        if ttl == 0:
-            # Dynamic 카테고리는 캐시 안함
-            return None
-
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                """
-                SELECT data, fetched_at FROM ticker_info_cache
-                WHERE ticker = ? AND category = ?
-                """,
-                (ticker.upper(), category),
-            )
-            row = cursor.fetchone()
+        row = self._connection().execute(
+            """
+            SELECT data, fetched_at FROM ticker_info_cache
+            WHERE ticker = ? AND category = ?
+            """,
+            (ticker.upper(), category),
+        ).fetchone()
 
         if not row:
             return None
 
         data_json, fetched_at_str = row
-        fetched_at = datetime.fromisoformat(fetched_at_str)
-
-        # TTL 체크
-        if datetime.now() - fetched_at > timedelta(seconds=ttl):
-            return None  # 만료됨
-
         try:
-            return json.loads(data_json)
-        except json.JSONDecodeError:
+            return json.loads(data_json), datetime.fromisoformat(fetched_at_str).timestamp()
+        except (json.JSONDecodeError, ValueError):
             return None
 
-    def _set_cached(self, ticker: str, category: str, data: Any) -> None:
-        """캐시에 데이터 저장."""
+    def _set_cached(self, ticker: str, category: str, data: Any, fetched_at: float) -> None:
+        """SQLite에 데이터 저장 (DB 스레드에서 실행)."""
+        conn = self._connection()
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO ticker_info_cache (ticker, category, data, fetched_at)
+            VALUES (?, ?, ?, ?)
+            """,
+            (ticker.upper(), category, json.dumps(data), datetime.fromtimestamp(fetched_at).isoformat()),
+        )
+        conn.commit()
+
+    async def _run_db(self, fn: Callable, *args) -> Any:
+        """DB 작업을 DB 스레드에서 실행하고 결과를 기다림 (루프 블로킹 없음)."""
+        return await asyncio.wrap_future(self._db_executor.submit(fn, *args))
+
+    def _memory_get(self, key: tuple[str, str]) -> Optional[tuple[Any, float]]:
+        with self._memory_lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+            return entry
+
+    def _memory_put(self, key: tuple[str, str], data: Any, fetched_at: float) -> None:
+        with self._memory_lock:
+            self._memory[key] = (data, fetched_at)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    async def _get_category(
+        self,
+        ticker: str,
+        category: str,
+        fetch_fn: Callable[[], Awaitable[Any]],
+        force_refresh: bool = False,
+    ) -> Any:
+        """
+        [user-040] 카테고리 1개 조회: 메모리 → SQLite → API
+
+        ELI5: 책상 위(메모리)에 있으면 바로, 서랍(SQLite)에 있으면 꺼내서,
+              둘 다 없으면 도서관(API)에 갑니다. 조금 지난 책은 일단 보여주고
+              심부름꾼(백그라운드)에게 새 책을 사 오라고 시킵니다.
+        """
+        key = (ticker, category)
         ttl = REFRESH_POLICY.get(category, 0)
-        if ttl == 0:
-            # Dynamic 카테고리는 캐시 안함
-            return
-
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO ticker_info_cache (ticker, category, data, fetched_at)
-                VALUES (?, ?, ?, ?)
-                """,
-                (ticker.upper(), category, json.dumps(data), datetime.now().isoformat()),
-            )
-            conn.commit()
+
+        if not force_refresh and ttl > 0:
+            entry = self._memory_get(key)
+            if entry is not None:
+                self._stats["memory_hits"] += 1
+            elif ttl >= PERSIST_MIN_TTL:
+                entry = await self._run_db(self._get_cached, ticker, category)
+                if entry is not None:
+                    self._stats["db_hits"] += 1
+                    self._memory_put(key, *entry)
+
+            if entry is not None:
+                data, fetched_at = entry
+                age = time.time() - fetched_at
+                if age <= ttl:
+                    return data
+                if age <= ttl + STALE_GRACE.get(category, ttl):
+                    self._stats["stale_served"] += 1
+                    self._revalidate(key, fetch_fn)
+                    return data
+
+        return await self._fetch(key, fetch_fn)
+
+    async def _fetch(self, key: tuple[str, str], fetch_fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        [user-040] single-flight API 호출 + 캐시 저장
+
+        같은 key가 이미 진행 중이면 (다른 스레드/루프여도) 그 결과를 기다립니다.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = concurrent.futures.Future()
+                self._inflight[key] = future
+
+        if not leader:
+            self._stats["coalesced"] += 1
+            return await asyncio.wrap_future(future)
+
+        try:
+            self._stats["fetches"] += 1
+            data = await fetch_fn()
+            fetched_at = time.time()
+            ticker, category = key
+            self._memory_put(key, data, fetched_at)
+            if REFRESH_POLICY.get(category, 0) >= PERSIST_MIN_TTL:
+                await self._run_db(self._set_cached, ticker, category, data, fetched_at)
+            future.set_result(data)
+            return data
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _revalidate(self, key: tuple[str, str], fetch_fn: Callable[[], Awaitable[Any]]) -> None:
+        """만료된 항목을 백그라운드 루프에서 갱신 (이미 진행 중이면 생략)."""
+        with self._inflight_lock:
+            if key in self._inflight:
+                return
+
+        async def refresh():
+            try:
+                await self._fetch(key, fetch_fn)
+            except Exception as e:
+                logger.debug(f"TickerInfo 백그라운드 갱신 실패 {key}: {e}")
+
+        asyncio.run_coroutine_threadsafe(refresh(), self._background_loop())
+
+    def _background_loop(self) -> asyncio.AbstractEventLoop:
+        with self._bg_lock:
+            if self._bg_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, daemon=True, name="ticker-info-refresh"
+                ).start()
+                self._bg_loop = loop
+            return self._bg_loop
+
+    @property
+    def cache_stats(self) -> dict[str, int]:
+        """캐시 통계 (메모리/DB 적중, stale 반환, API 호출, 합쳐진 요청 수)."""
+        with self._memory_lock:
+            size = len(self._memory)
+        return {**self._stats, "memory_size": size}
 
     # =========================================================================
     # API 호출 메서드
@@ -356,7 +567,8 @@ class TickerInfoService:
         티커 종합 정보 조회.
 
         캐시 우선 조회 후, 만료되었거나 force_refresh=True면 API 호출.
-        Dynamic 카테고리(snapshot, short, news)는 항상 API 호출.
+        [user-040] 만료 직후(STALE_GRACE 이내)면 이전 값을 즉시 반환하고
+        백그라운드에서 갱신합니다. 최근에 본 티커는 메모리에서 바로 반환됩니다.
 
         Args:
             ticker: 종목 심볼
@@ -369,29 +581,15 @@ class TickerInfoService:
         info = TickerInfo(ticker=ticker)
 
         # Profile 먼저 조회 (CIK 필요)
-        if force_refresh:
-            info.profile = await self._get_profile(ticker)
-            self._set_cached(ticker, "profile", info.profile)
-        else:
-            cached = self._get_cached(ticker, "profile")
-            if cached:
-                info.profile = cached
-            else:
-                info.profile = await self._get_profile(ticker)
-                self._set_cached(ticker, "profile", info.profile)
+        info.profile = await self._get_category(
+            ticker, "profile", lambda: self._get_profile(ticker), force_refresh
+        )
 
         cik = info.profile.get("cik")
 
         # 나머지 카테고리 병렬 조회
         async def fetch_or_cache(category: str, fetch_fn) -> Any:
-            if force_refresh or REFRESH_POLICY.get(category, 0) == 0:
-                return await fetch_fn()
-            cached = self._get_cached(ticker, category)
-            if cached is not None:
-                return cached
-            result = await fetch_fn()
-            self._set_cached(ticker, category, result)
-            return result
+            return await self._get_category(ticker, category, fetch_fn, force_refresh)
 
         # 병렬 실행
         results = await asyncio.gather(
@@ -432,7 +630,8 @@ class TickerInfoService:
         Dynamic 데이터만 조회 (1초 갱신용).
 
         Snapshot, Short Interest, Short Volume만 반환합니다.
-        캐싱 없이 항상 API 호출.
+        Snapshot은 항상 API 호출 (결과는 메모리 캐시에 반영),
+        Short Interest/Volume은 캐시 TTL을 따릅니다.
 
         Args:
             ticker: 종목 심볼
@@ -443,9 +642,9 @@ class TickerInfoService:
         ticker = ticker.upper()
 
         snapshot, short_interest, short_volume = await asyncio.gather(
-            self._get_snapshot(ticker),
-            self._get_short_interest(ticker),
-            self._get_short_volume(ticker),
+            self._get_category(ticker, "snapshot", lambda: self._get_snapshot(ticker), True),
+            self._get_category(ticker, "short_interest", lambda: self._get_short_interest(ticker)),
+            self._get_category(ticker, "short_volume", lambda: self._get_short_volume(ticker)),
             return_exceptions=True,
         )
 
@@ -0,0 +1,265 @@
+# ============================================================================
+# Validators - OHLCV 데이터 검증 유틸리티 (11-004)
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - OHLC 관계 / Volume 유효성 검사
+#   - 일봉 거래일 갭, 분봉 시간 갭 탐지
+#   - 종가 변화율 Z-score 기반 이상치 탐지 및 보간
+#
+# 📖 사용 예시:
+#   >>> violations = validate_ohlc_relationship(df)
+#   >>> gaps = detect_daily_gaps(daily_df)
+#   >>> outliers = detect_price_outliers(ticker_df, z_threshold=4.0)
+#
+# 📌 모든 검사는 컬럼 단위 벡터 연산 (행 루프 없음)
+# ============================================================================
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+PRICE_COLUMNS = ["open", "high", "low", "close"]
+
+
+def _records(df: pd.DataFrame, mask: np.ndarray, violation_type: str, columns: list[str]) -> list[dict]:
+    """마스크된 행 → [{index, violation_type, 컬럼값...}] (Python 기본 타입)"""
+    if not mask.any():
+        return []
+    rows = df.loc[mask, [c for c in columns if c in df.columns]]
+    out = []
+    for idx, values in zip(rows.index.tolist(), rows.to_dict("records")):
+        record = {"index": idx, "violation_type": violation_type}
+        for key, value in values.items():
+            record[key] = value.item() if isinstance(value, np.generic) else value
+        out.append(record)
+    return out
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# OHLC / Volume 검증
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def validate_ohlc_relationship(df: pd.DataFrame) -> list[dict]:
+    """
+    OHLC 관계 무결성 검사
+
+    - 가격 > 0 (non_positive_open 등)
+    - High >= Low (high_lt_low)
+    - High >= max(Open, Close) (high_lt_max_oc)
+    - Low <= min(Open, Close) (low_gt_min_oc)
+
+    ELI5: "최고가가 시가보다 낮다" 같은 말이 안 되는 캔들을 찾습니다.
+
+    Args:
+        df: open, high, low, close 컬럼 DataFrame
+
+    Returns:
+        list[dict]: 위반 목록 (index, violation_type, 해당 행 값)
+    """
+    if len(df) == 0:
+        return []
+
+    context = ["ticker", "date", "timestamp"] + PRICE_COLUMNS
+    o, h, lo, c = (df[col].to_numpy(dtype="float64") for col in PRICE_COLUMNS)
+
+    violations: list[dict] = []
+    for col, values in zip(PRICE_COLUMNS, (o, h, lo, c)):
+        violations += _records(df, values <= 0, f"non_positive_{col}", context)
+
+    violations += _records(df, h < lo, "high_lt_low", context)
+    violations += _records(df, h < np.maximum(o, c), "high_lt_max_oc", context)
+    violations += _records(df, lo > np.minimum(o, c), "low_gt_min_oc", context)
+    return violations
+
+
+def validate_volume(df: pd.DataFrame) -> list[dict]:
+    """
+    Volume 검사 (음수 거래량)
+
+    Returns:
+        list[dict]: 위반 목록 (violation_type="negative_volume")
+    """
+    if len(df) == 0 or "volume" not in df.columns:
+        return []
+    mask = df["volume"].to_numpy(dtype="float64") < 0
+    return _records(df, mask, "negative_volume", ["ticker", "date", "timestamp", "volume"])
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 갭 탐지
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def detect_daily_gaps(
+    df: pd.DataFrame,
+    trading_calendar: Optional[list[str]] = None,
+) -> dict[str, list[str]]:
+    """
+    거래일 갭 탐지 (티커별 첫~마지막 거래일 사이 누락 날짜)
+
+    Args:
+        df: ticker, date 컬럼 DataFrame
+        trading_calendar: 거래일 목록 ('YYYY-MM-DD'). None이면 df에 등장한
+                          모든 날짜(어느 티커든 거래된 날)를 거래일로 간주
+
+    Returns:
+        dict[str, list[str]]: 티커 → 누락 날짜 목록 (갭 없는 티커 제외)
+    """
+    if len(df) == 0:
+        return {}
+
+    dates = pd.to_datetime(df["date"]).dt.normalize()
+    if trading_calendar is None:
+        calendar = np.unique(dates.to_numpy())
+    else:
+        calendar = np.unique(pd.to_datetime(pd.Series(trading_calendar)).dt.normalize().to_numpy())
+
+    # 티커별 (거래일 인덱스 범위, 보유 날짜 수) → 범위 내 개수 차이로 갭 티커만 골라냄
+    pos = np.searchsorted(calendar, dates.to_numpy())
+    frame = pd.DataFrame({"ticker": df["ticker"].to_numpy(), "date": dates.to_numpy(), "pos": pos})
+    frame = frame.drop_duplicates(["ticker", "date"])
+    frame = frame[np.isin(frame["date"].to_numpy(), calendar)]
+    summary = frame.groupby("ticker", sort=True)["pos"].agg(["min", "max", "count"])
+    gap_tickers = summary[(summary["max"] - summary["min"] + 1) > summary["count"]]
+
+    gaps: dict[str, list[str]] = {}
+    subset = frame[frame["ticker"].isin(gap_tickers.index)]
+    for ticker, have in subset.groupby("ticker", sort=True)["pos"]:
+        expected = np.arange(gap_tickers.at[ticker, "min"], gap_tickers.at[ticker, "max"] + 1)
+        missing = calendar[np.setdiff1d(expected, have.to_numpy())]
+        gaps[ticker] = [str(d)[:10] for d in missing]
+    return gaps
+
+
+def detect_intraday_gaps(
+    df: pd.DataFrame,
+    timeframe_minutes: int = 1,
+    market_hours: Optional[tuple[str, str]] = None,
+) -> list[dict]:
+    """
+    장중 시간 갭 탐지 (같은 날 연속 봉 간격 > 타임프레임)
+
+    Args:
+        df: timestamp 컬럼 DataFrame (ms 정수 또는 datetime/문자열)
+        timeframe_minutes: 봉 간격 (분)
+        market_hours: ("HH:MM", "HH:MM") - 지정 시 해당 시간대 봉만 검사
+
+    Returns:
+        list[dict]: [{start, end, missing_bars}]
+    """
+    if len(df) < 2:
+        return []
+
+    values = df["timestamp"]
+    ts = pd.to_datetime(values, unit="ms") if pd.api.types.is_numeric_dtype(values) else pd.to_datetime(values)
+    ts = ts.sort_values().reset_index(drop=True)
+    if market_hours is not None:
+        minutes = ts.dt.hour * 60 + ts.dt.minute
+        start_h, start_m = map(int, market_hours[0].split(":"))
+        end_h, end_m = map(int, market_hours[1].split(":"))
+        ts = ts[(minutes >= start_h * 60 + start_m) & (minutes < end_h * 60 + end_m)].reset_index(drop=True)
+        if len(ts) < 2:
+            return []
+
+    step = pd.Timedelta(minutes=timeframe_minutes)
+    delta = ts.diff()
+    same_day = ts.dt.normalize() == ts.dt.normalize().shift()
+    mask = (same_day & (delta > step)).to_numpy()
+
+    return [
+        {
+            "start": str(ts.iloc[i - 1]),
+            "end": str(ts.iloc[i]),
+            "missing_bars": int(delta.iloc[i] / step) - 1,
+        }
+        for i in np.flatnonzero(mask)
+    ]
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 이상치 탐지 / 보간
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def detect_price_outliers(df: pd.DataFrame, z_threshold: float = 3.0) -> list[dict]:
+    """
+    종가 변화율 Z-score 기반 이상치 탐지
+
+    ELI5: 평소 하루 ±1% 움직이던 종목이 갑자기 +500%면 데이터 오류 의심.
+
+    Args:
+        df: close 컬럼 DataFrame (시간순 정렬)
+        z_threshold: 이상치 판정 Z-score
+
+    Returns:
+        list[dict]: [{index, close, pct_change, z_score}]
+    """
+    if len(df) < 3:
+        return []
+
+    close = df["close"].astype("float64")
+    pct = close.pct_change()
+    std = pct.std(ddof=0)
+    if not np.isfinite(std) or std == 0:
+        return []
+
+    z = (pct - pct.mean()) / std
+    mask = (z.abs() > z_threshold).to_numpy()
+    return [
+        {
+            "index": idx,
+            "close": float(close.loc[idx]),
+            "pct_change": round(float(pct.loc[idx]) * 100, 2),
+            "z_score": round(float(z.loc[idx]), 2),
+        }
+        for idx in df.index[mask].tolist()
+    ]
+
+
+def interpolate_outliers(
+    df: pd.DataFrame,
+    indices: list,
+    method: str = "linear",
+) -> tuple[pd.DataFrame, list[dict]]:
+    """
+    지정한 행의 OHLC 값을 보간값으로 교체
+
+    Args:
+        df: OHLC DataFrame
+        indices: 이상치 행 인덱스
+        method: pandas interpolate 방식 ("linear" 등)
+
+    Returns:
+        (보간된 DataFrame 복사본, [{index, before, after}] 리포트)
+    """
+    result = df.copy()
+    cols = [c for c in PRICE_COLUMNS if c in result.columns]
+    if not indices or not cols:
+        return result, []
+
+    before = result.loc[indices, cols].copy()
+    result.loc[indices, cols] = np.nan
+    result[cols] = result[cols].astype("float64").interpolate(method=method, limit_direction="both")
+
+    report = [
+        {
+            "index": idx,
+            "before": {c: float(before.at[idx, c]) for c in cols},
+            "after": {c: float(result.at[idx, c]) for c in cols},
+        }
+        for idx in indices
+    ]
+    return result, report
+
+
+__all__ = [
+    "validate_ohlc_relationship",
+    "validate_volume",
+    "detect_daily_gaps",
+    "detect_intraday_gaps",
+    "detect_price_outliers",
+    "interpolate_outliers",
+]
@@ -0,0 +1,289 @@
+# ============================================================================
+# ZScore Stats Store - 장 전 Z-Score 통계 테이블 (user-046)
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - 전 종목 DailyStats (거래량/절대 변동률 평균·표준편차) + 전일 zenV/zenP를
+#     장 시작 전 한 번에 계산해 Parquet 테이블로 저장
+#   - 장중에는 테이블 + IntradayStateEngine 스냅샷으로 Time-Projected zenV/zenP 계산
+#   - API는 종목별 일봉 재조회 없이 dict 조회(O(1))로 응답
+#
+# 📖 사용 예시:
+#   >>> store = ZScoreStatsStore(source="data/parquet/daily/all_daily.parquet")
+#   >>> store.ensure()                       # 원본 일봉이 바뀌었을 때만 재계산
+#   >>> store.get("AAPL")                    # {"zenV": 2.35, "zenP": 0.45, ...}
+#   >>> store.get("AAPL", as_of="2026-02-20") # 행이 기준 거래일 이전이면 None
+#   >>> store.live(state.snapshot_all())     # {ticker: {"zenV": ..., "zenP": ...}}
+#
+# 📂 저장 구조:
+#   data/parquet/zscore/daily_stats.parquet
+#     - 컬럼: compute_daily_stats() 결과 (종목당 1행)
+#     - 스키마 메타데이터: 원본 일봉 mtime/size, lookback (staleness 판정용)
+# ============================================================================
+
+import json
+from datetime import date, timedelta
+from pathlib import Path
+from threading import Lock
+from typing import Mapping, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from loguru import logger
+
+from backend.core.zscore_calculator import (
+    DailyStats,
+    ZScoreCalculator,
+    compute_daily_stats,
+    session_elapsed_ratio,
+)
+from backend.data.parquet_quality import column_range
+
+
+DEFAULT_STATS_PATH = "data/parquet/zscore/daily_stats.parquet"
+DEFAULT_SOURCE_PATH = "data/parquet/daily/all_daily.parquet"
+META_KEY = b"sigma9.zscore"
+
+# lookback 거래일 → 달력일 환산 시 여유 (휴장/연휴, 상장폐지 직전 공백 등)
+CALENDAR_MARGIN_DAYS = 14
+
+
+class ZScoreStatsStore:
+    """
+    장 전 Z-Score 통계 테이블
+
+    ELI5: 아침에 전 종목 "평소 거래량/변동폭" 표를 한 번 만들어 두고,
+          장중에는 표만 보고 "지금 평소보다 얼마나 튀는지" 바로 계산합니다.
+
+    Attributes:
+        path: 통계 테이블 Parquet 경로
+        source: 원본 일봉 Parquet 경로
+        lookback: 통계 기간 (일봉 수)
+    """
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_STATS_PATH,
+        source: str | Path = DEFAULT_SOURCE_PATH,
+        lookback: int = 20,
+    ):
+        self.path = Path(path)
+        self.source = Path(source)
+        self.lookback = lookback
+        self._lock = Lock()
+        self._rows: dict[str, dict] = {}
+        self._meta: dict = {}
+        self.calculator = ZScoreCalculator(lookback=lookback)
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # 빌드 / 저장
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def _source_meta(self) -> dict:
+        stat = self.source.stat()
+        return {
+            "source_mtime_ns": stat.st_mtime_ns,
+            "source_size": stat.st_size,
+            "lookback": self.lookback,
+        }
+
+    def _read_recent_daily(self) -> pd.DataFrame:
+        """
+        원본 일봉에서 최근 구간 + 필요한 컬럼만 읽기
+
+        📌 date 컬럼의 Row Group 통계로 최신 날짜를 구하고, 그 이전
+           lookback × 7/5 + CALENDAR_MARGIN_DAYS 달력일만 필터 로드
+        """
+        columns = ["ticker", "date", "close", "volume"]
+        filters = None
+        date_range = column_range(pq.ParquetFile(self.source).metadata, "date")
+        if date_range is not None:
+            latest = date_range[1]
+            if isinstance(latest, str):
+                days = self.lookback * 7 // 5 + CALENDAR_MARGIN_DAYS
+                cutoff = date.fromisoformat(latest[:10]) - timedelta(days=days)
+                filters = [("date", ">=", cutoff.isoformat())]
+        return pq.read_table(self.source, columns=columns, filters=filters).to_pandas()
+
+    def build(self, daily_df: Optional[pd.DataFrame] = None) -> int:
+        """
+        전 종목 통계 계산 후 저장 + 메모리 갱신
+
+        Args:
+            daily_df: 일봉 DataFrame (None이면 source에서 최근 구간만 로드)
+
+        Returns:
+            int: 통계가 계산된 종목 수
+        """
+        if daily_df is None:
+            daily_df = self._read_recent_daily()
+        stats = compute_daily_stats(daily_df, lookback=self.lookback)
+        stats["date"] = stats["date"].astype(str)
+
+        meta = self._source_meta() if self.source.exists() else {"lookback": self.lookback}
+        table = pa.Table.from_pandas(stats, preserve_index=False)
+        table = table.replace_schema_metadata(
+            {**(table.schema.metadata or {}), META_KEY: json.dumps(meta).encode()}
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        pq.write_table(table, tmp, compression="snappy")
+        tmp.replace(self.path)
+
+        self._install(stats, meta)
+        logger.info(f"📊 Z-Score 통계 테이블 생성: {len(stats)}개 종목 → {self.path}")
+        return len(stats)
+
+    def _install(self, stats: pd.DataFrame, meta: dict) -> None:
+        rows = {row["ticker"]: row for row in stats.to_dict("records")}
+        cache = {
+            ticker: DailyStats(
+                avg_volume=float(row["avg_volume"]),
+                std_volume=float(row["std_volume"]),
+                avg_change=float(row["avg_change"]),
+                std_change=float(row["std_change"]),
+            )
+            for ticker, row in rows.items()
+        }
+        with self._lock:
+            self._rows = rows
+            self._meta = meta
+            self.calculator.load_stats(cache)
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # 로드 / Staleness
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def _stored_meta(self) -> Optional[dict]:
+        if not self.path.exists():
+            return None
+        raw = (pq.read_schema(self.path).metadata or {}).get(META_KEY)
+        return json.loads(raw) if raw else {}
+
+    def is_stale(self) -> bool:
+        """저장된 테이블이 없거나 원본 일봉/lookback이 바뀌었으면 True"""
+        stored = self._stored_meta()
+        if stored is None:
+            return True
+        if not self.source.exists():
+            return stored.get("lookback") != self.lookback
+        return stored != self._source_meta()
+
+    def load(self) -> bool:
+        """
+        저장된 테이블을 메모리로 로드
+
+        Returns:
+            bool: 테이블이 있으면 True
+        """
+        meta = self._stored_meta()
+        if meta is None:
+            return False
+        self._install(pq.read_table(self.path).to_pandas(), meta)
+        logger.debug(f"📊 Z-Score 통계 테이블 로드: {len(self._rows)}개 종목")
+        return True
+
+    def ensure(self) -> int:
+        """
+        장 전 잡 진입점: stale이면 재계산, 아니면 (미로드 시) 로드만
+
+        Returns:
+            int: 메모리에 올라온 종목 수
+        """
+        if self.is_stale():
+            if not self.source.exists():
+                logger.warning(f"⚠️ 일봉 파일 없음: {self.source}")
+                return 0
+            return self.build()
+        if not self._rows:
+            self.load()
+        return len(self._rows)
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # 조회
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def _ensure_loaded(self) -> None:
+        if not self._meta and self.path.exists():
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get(self, ticker: str, as_of: Optional[str] = None) -> Optional[dict]:
+        """
+        종목 통계 행 (전일 zenV/zenP 포함)
+
+        📌 freshness는 종목별 판정: 원본 일봉 파일이 장중 gap-fill 등으로 바뀌어도
+           그 종목 행의 date가 as_of 이후면 그대로 사용 (파일 전체 stale 판정 아님)
+
+        Args:
+            ticker: 종목 심볼
+            as_of: 필요한 기준 거래일 (YYYY-MM-DD). 행의 date가 이보다 이전이면 None
+
+        Returns:
+            dict | None: {ticker, date, last_close, avg_volume, std_volume,
+                          avg_change, std_change, zenV, zenP}
+        """
+        self._ensure_loaded()
+        row = self._rows.get(ticker)
+        if row is not None and as_of is not None and str(row["date"])[:10] < as_of:
+            return None
+        return row
+
+    def daily_stats(self, ticker: str) -> Optional[DailyStats]:
+        """장중 Time-Projection용 DailyStats"""
+        self._ensure_loaded()
+        return self.calculator.get_cached_stats(ticker)
+
+    def project(self, snapshot) -> Optional[dict]:
+        """
+        IntradaySnapshot 하나로 장중 zenV/zenP 계산
+
+        📌 zenV는 당일 거래량이 시드된 스냅샷만 계산 (volume_seeded=False면
+           volume이 구독 이후 틱 거래량뿐이라 과소 추정 → None)
+
+        Args:
+            snapshot: IntradaySnapshot (volume, volume_seeded, last, last_ts 사용)
+
+        Returns:
+            dict | None: {zenV, zenP, elapsed_ratio, change_pct} - 통계 없는 종목은 None
+        """
+        row = self.get(snapshot.ticker)
+        if row is None:
+            return None
+
+        elapsed = session_elapsed_ratio(snapshot.last_ts)
+        last_close = row["last_close"]
+        change_pct = (snapshot.last - last_close) / last_close * 100 if last_close > 0 else 0.0
+        zenV = None
+        if snapshot.volume_seeded:
+            zenV = self.calculator.calculate_projected_zenV(
+                snapshot.ticker, snapshot.volume, elapsed
+            )
+        return {
+            "zenV": zenV,
+            "zenP": self.calculator.calculate_projected_zenP(snapshot.ticker, change_pct),
+            "elapsed_ratio": round(elapsed, 4),
+            "change_pct": round(change_pct, 2),
+        }
+
+    def live(self, snapshots: Mapping[str, object]) -> dict[str, dict]:
+        """
+        틱 구독 중인 전 종목 장중 zenV/zenP
+
+        Args:
+            snapshots: {ticker: IntradaySnapshot} (IntradayStateEngine.snapshot_all())
+
+        Returns:
+            dict[str, dict]: {ticker: project() 결과} - 통계 없는 종목 제외
+        """
+        result = {}
+        for ticker, snap in snapshots.items():
+            projected = self.project(snap)
+            if projected is not None:
+                result[ticker] = projected
+        return result
+
+
+__all__ = ["ZScoreStatsStore", "DEFAULT_STATS_PATH"]
@@ -6,6 +6,8 @@
 #   - NULL 값 보간/삭제
 #   - Dry-run 모드 지원
 #   - 복구 전 자동 백업 (변경 파일만)
+#   - [user-045] 문제 탐지는 필요한 컬럼/통계만 읽고, 문제 있는 파일만 전체 로드
+#   - [user-045] 쓰기는 ParquetManager 경유 (저장소 카탈로그 동기화)
 #
 # 📖 사용 예시:
 #   >>> python -m backend.scripts.repair_parquet_data --dry-run
@@ -36,6 +38,13 @@ from pathlib import Path
 import pyarrow.parquet as pq
 from loguru import logger
 
+from backend.data.parquet_manager import ParquetManager
+from backend.data.parquet_quality import (
+    ParquetQualityEngine,
+    column_null_count,
+    find_intraday_files,
+)
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # DataRepairer 클래스
@@ -64,6 +73,8 @@ class DataRepairer:
         base_dir: Path,
         backup_dir: Path = None,
         dry_run: bool = True,
+        engine: ParquetQualityEngine = None,
+        parquet_manager: ParquetManager = None,
     ):
         """
         DataRepairer 초기화
@@ -72,10 +83,14 @@ class DataRepairer:
             base_dir: Parquet 베이스 디렉터리
             backup_dir: 백업 저장 디렉터리 (기본: data/backup)
             dry_run: True면 실제 수정 없이 시뮬레이션
+            engine: [user-045] 중복 탐지용 검사 엔진 (기본: base_dir 캐시 사용)
+            parquet_manager: [user-045] 복구 결과 저장용 (기본: 첫 쓰기 때 base_dir로 생성)
         """
         self.base_dir = Path(base_dir)
         self.backup_dir = Path(backup_dir) if backup_dir else Path("data/backup")
         self.dry_run = dry_run
+        self.engine = engine or ParquetQualityEngine(self.base_dir)
+        self._pm = parquet_manager
 
         # 복구 리포트
         self.report: dict = {
@@ -87,6 +102,19 @@ class DataRepairer:
 
         logger.info(f"🔧 DataRepairer 초기화: base_dir={base_dir}, dry_run={dry_run}")
 
+    @property
+    def pm(self) -> ParquetManager:
+        """
+        [user-045] 저장용 ParquetManager
+
+        ELI5: 직접 파일을 덮어쓰면 카탈로그(목차)가 옛 내용을 가리키므로,
+              목차까지 함께 고치는 ParquetManager로 저장합니다.
+              dry-run에서는 쓰지 않으므로 첫 쓰기 때 만듭니다.
+        """
+        if self._pm is None:
+            self._pm = ParquetManager(str(self.base_dir))
+        return self._pm
+
     # ═══════════════════════════════════════════════════════════════════════
     # 백업
     # ═══════════════════════════════════════════════════════════════════════
@@ -140,12 +168,10 @@ class DataRepairer:
             return 0
 
         try:
-            df = pq.read_table(daily_path).to_pandas()
-            original_count = len(df)
-
-            # 중복 확인
-            dups = df.duplicated(subset=["ticker", "date"], keep="last")
-            dup_count = dups.sum()
+            # [user-045] 키 컬럼만 읽어 중복 확인, 있을 때만 전체 로드
+            keys = pq.read_table(daily_path, columns=["ticker", "date"]).to_pandas()
+            dups = keys.duplicated(subset=["ticker", "date"], keep="last")
+            dup_count = int(dups.sum())
 
             if dup_count == 0:
                 logger.info("✅ Daily 데이터: 중복 없음")
@@ -153,13 +179,16 @@ class DataRepairer:
 
             logger.info(f"🔍 Daily 중복 발견: {dup_count}건")
 
+            df = pq.read_table(daily_path).to_pandas()
+            original_count = len(df)
+
             # 중복 제거
             df_dedup = df[~dups].reset_index(drop=True)
 
             if not self.dry_run:
                 # 백업 후 저장
                 self.backup_file(daily_path)
-                df_dedup.to_parquet(daily_path, index=False)
+                self.pm.write_daily(df_dedup)
                 logger.info(f"✅ Daily 중복 제거 완료: {dup_count}건")
             else:
                 logger.info(f"  [DRY-RUN] 중복 제거 예정: {dup_count}건")
@@ -193,57 +222,68 @@ class DataRepairer:
 
         timestamp 기준으로 중복 제거.
 
+        [user-045] 중복 탐지는 검사 엔진(timestamp 컬럼만, 병렬, 캐시)으로 하고
+        중복이 있는 파일만 전체를 읽어 다시 씁니다.
+
         Returns:
             int: 총 제거된 중복 레코드 수
         """
         total_removed = 0
-        tf_folders = ["1m", "3m", "5m", "15m", "1h", "4h"]
 
-        for tf in tf_folders:
-            tf_dir = self.base_dir / tf
-            if not tf_dir.exists():
+        checked = self.engine.validate_intraday_files(find_intraday_files(self.base_dir))
+        for result in checked:
+            if result["error"] and result["error"].startswith("읽기 실패"):
+                logger.error(f"❌ {result['file']}: 처리 실패 - {result['error']}")
+                self.report["errors"].append(
+                    {
+                        "type": "remove_duplicates",
+                        "file": result["file"],
+                        "error": result["error"],
+                    }
+                )
                 continue
-
-            for f in tf_dir.glob("*.parquet"):
-                try:
-                    df = pq.read_table(f).to_pandas()
-
-                    dups = df.duplicated(subset=["timestamp"], keep="last")
-                    dup_count = dups.sum()
-
-                    if dup_count == 0:
-                        continue
-
-                    df_dedup = df[~dups].reset_index(drop=True)
-
-                    if not self.dry_run:
-                        self.backup_file(f)
-                        df_dedup.to_parquet(f, index=False)
-
-                    total_removed += dup_count
-
-                    self.report["actions"].append(
-                        {
-                            "type": "remove_duplicates",
-                            "file": str(f),
-                            "removed": dup_count,
-                        }
-                    )
-
-                    logger.info(
-                        f"  {'[DRY-RUN] ' if self.dry_run else ''}"
-                        f"{tf}/{f.name}: 중복 {dup_count}건 제거"
-                    )
-
-                except Exception as e:
-                    logger.error(f"❌ {f}: 처리 실패 - {e}")
-                    self.report["errors"].append(
-                        {
-                            "type": "remove_duplicates",
-                            "file": str(f),
-                            "error": str(e),
-                        }
-                    )
+            if result["duplicates"] <= 0:
+                continue
+            f, tf = Path(result["file"]), result["tf"]
+            try:
+                df = pq.read_table(f).to_pandas()
+
+                dups = df.duplicated(subset=["timestamp"], keep="last")
+                dup_count = int(dups.sum())
+
+                if dup_count == 0:
+                    continue
+
+                df_dedup = df[~dups].reset_index(drop=True)
+
+                if not self.dry_run:
+                    self.backup_file(f)
+                    self.pm.write_intraday(f.stem, tf, df_dedup)
+
+                total_removed += dup_count
+
+                self.report["actions"].append(
+                    {
+                        "type": "remove_duplicates",
+                        "file": str(f),
+                        "removed": dup_count,
+                    }
+                )
+
+                logger.info(
+                    f"  {'[DRY-RUN] ' if self.dry_run else ''}"
+                    f"{tf}/{f.name}: 중복 {dup_count}건 제거"
+                )
+
+            except Exception as e:
+                logger.error(f"❌ {f}: 처리 실패 - {e}")
+                self.report["errors"].append(
+                    {
+                        "type": "remove_duplicates",
+                        "file": str(f),
+                        "error": str(e),
+                    }
+                )
 
         return total_removed
 
@@ -268,11 +308,18 @@ class DataRepairer:
         if not daily_path.exists():
             return 0
 
+        # OHLCV 컬럼만 대상
+        price_cols = ["open", "high", "low", "close", "volume"]
+
         try:
-            df = pq.read_table(daily_path).to_pandas()
+            # [user-045] Row Group 통계상 NULL이 없으면 파일을 읽지 않음
+            metadata = pq.read_metadata(daily_path)
+            stat_nulls = [column_null_count(metadata, c) for c in price_cols]
+            if all(n == 0 for n in stat_nulls):
+                logger.info("✅ Daily 데이터: NULL 없음")
+                return 0
 
-            # OHLCV 컬럼만 대상
-            price_cols = ["open", "high", "low", "close", "volume"]
+            df = pq.read_table(daily_path).to_pandas()
             null_counts = df[price_cols].isnull().sum()
             total_nulls = null_counts.sum()
 
@@ -298,7 +345,7 @@ class DataRepairer:
 
             if not self.dry_run:
                 self.backup_file(daily_path)
-                df_clean.to_parquet(daily_path, index=False)
+                self.pm.write_daily(df_clean)
                 logger.info(f"✅ Daily NULL 처리 완료: {total_nulls}건 ({strategy})")
             else:
                 logger.info(f"  [DRY-RUN] NULL 처리 예정: {total_nulls}건")
@@ -425,6 +472,17 @@ def main():
         action="store_true",
         help="상세 로그 출력",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="중복 탐지 병렬 프로세스 수 (기본: 4)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="품질 검사 캐시 무시",
+    )
 
     args = parser.parse_args()
 
@@ -441,6 +499,9 @@ def main():
         base_dir=base_dir,
         backup_dir=Path(args.backup_dir),
         dry_run=dry_run,
+        engine=ParquetQualityEngine(
+            base_dir, use_cache=not args.no_cache, max_workers=args.workers
+        ),
     )
 
     report = repairer.repair_all(null_strategy=args.null_strategy)
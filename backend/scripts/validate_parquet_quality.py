@@ -8,11 +8,13 @@
 #   - 중복 레코드 검사
 #   - 데이터 범위 유효성 검증
 #   - JSON 리포트 출력 (11-004)
+#   - [user-045] 병렬 프로세스 + 필요한 컬럼만 읽기 + 변경 파일만 재검사 (캐시)
 #
 # 📖 사용 예시:
 #   >>> python -m backend.scripts.validate_parquet_quality
 #   >>> python -m backend.scripts.validate_parquet_quality --verbose
 #   >>> python -m backend.scripts.validate_parquet_quality --output-json report.json
+#   >>> python -m backend.scripts.validate_parquet_quality --no-cache  # 전체 재검사
 # ============================================================================
 
 """
@@ -38,6 +40,7 @@ import sys
 from pathlib import Path
 from collections import defaultdict
 from datetime import datetime
+from typing import Optional
 
 import pyarrow.parquet as pq
 from loguru import logger
@@ -50,19 +53,31 @@ from backend.data.validators import (
     detect_price_outliers,
 )
 
-
-# 필수 컬럼 정의
-DAILY_REQUIRED_COLS = ["ticker", "date", "open", "high", "low", "close", "volume"]
-INTRADAY_REQUIRED_COLS = ["timestamp", "open", "high", "low", "close", "volume"]
+# [user-045] 증분·병렬 검사 엔진
+from backend.data.parquet_quality import (
+    DAILY_REQUIRED_COLS,
+    ParquetQualityEngine,
+    QualityCache,
+    column_range,
+    find_intraday_files,
+)
 
 
-def validate_daily(daily_dir: Path, verbose: bool = False) -> dict:
+def validate_daily(
+    daily_dir: Path,
+    verbose: bool = False,
+    cache: Optional[QualityCache] = None,
+) -> dict:
     """
     Daily Parquet 품질 검사
 
+    [user-045] 필수 컬럼만 읽고, 날짜 범위/음수 거래량은 Row Group 통계로 판정.
+    cache가 있으면 파일이 바뀌지 않은 경우 이전 결과를 재사용.
+
     Args:
         daily_dir: daily 디렉터리 경로
         verbose: 상세 로그 출력
+        cache: 결과 캐시 (None이면 항상 검사)
 
     Returns:
         dict: 검사 결과
@@ -82,15 +97,24 @@ def validate_daily(daily_dir: Path, verbose: bool = False) -> dict:
 
     results["files"] = 1
 
+    if cache is not None:
+        cached = cache.lookup(all_daily_path, "daily")
+        if cached is not None:
+            logger.info("♻️ Daily: 변경 없음, 캐시된 결과 사용")
+            return cached
+
     try:
-        df = pq.read_table(all_daily_path).to_pandas()
+        pf = pq.ParquetFile(all_daily_path)
+        metadata = pf.metadata
 
-        # 필수 컬럼 검사
-        missing = set(DAILY_REQUIRED_COLS) - set(df.columns)
+        # 필수 컬럼 검사 (스키마만)
+        missing = set(DAILY_REQUIRED_COLS) - set(pf.schema_arrow.names)
         if missing:
             results["errors"].append(f"누락 컬럼: {missing}")
             return results
 
+        df = pf.read(columns=DAILY_REQUIRED_COLS).to_pandas()
+
         # 데이터 존재 검사
         if len(df) == 0:
             results["errors"].append("빈 파일")
@@ -109,7 +133,11 @@ def validate_daily(daily_dir: Path, verbose: bool = False) -> dict:
 
         # 티커 수, 날짜 범위
         num_tickers = df["ticker"].nunique()
-        date_range = f"{df['date'].min()} ~ {df['date'].max()}"
+        stats_range = column_range(metadata, "date")
+        if stats_range is not None:
+            date_range = f"{stats_range[0]} ~ {stats_range[1]}"
+        else:
+            date_range = f"{df['date'].min()} ~ {df['date'].max()}"
 
         if verbose:
             logger.info(f"  📊 티커 수: {num_tickers}")
@@ -122,8 +150,12 @@ def validate_daily(daily_dir: Path, verbose: bool = False) -> dict:
             results["warnings"].append(f"OHLC 위반: {len(ohlc_violations)}건")
             results["ohlc_violations"] = ohlc_violations[:10]  # 상위 10건만 저장
 
-        # [11-004] Volume 검증 (음수)
-        vol_violations = validate_volume(df)
+        # [11-004] Volume 검증 (음수) - 통계상 최솟값이 0 이상이면 생략
+        volume_range = column_range(metadata, "volume")
+        if volume_range is not None and volume_range[0] >= 0:
+            vol_violations = []
+        else:
+            vol_violations = validate_volume(df)
         if vol_violations:
             results["warnings"].append(f"Volume 음수: {len(vol_violations)}건")
 
@@ -131,7 +163,7 @@ def validate_daily(daily_dir: Path, verbose: bool = False) -> dict:
         vol_missing_mask = ((df["volume"].isnull()) | (df["volume"] == 0)) & (
             df["close"] > 0
         )
-        vol_missing_count = vol_missing_mask.sum()
+        vol_missing_count = int(vol_missing_mask.sum())
         if vol_missing_count > 0:
             results["warnings"].append(f"Volume 누락(0/NULL): {vol_missing_count}건")
             # 샘플 5개 저장
@@ -159,8 +191,9 @@ def validate_daily(daily_dir: Path, verbose: bool = False) -> dict:
         # 티커별로 그룹핑하여 검사
         total_outliers = 0
         outlier_samples = []
+        sample_groups = df_sample.groupby("ticker", sort=False)
         for ticker in top_tickers[:20]:  # 상위 20개만
-            ticker_df = df[df["ticker"] == ticker].sort_values("date")
+            ticker_df = sample_groups.get_group(ticker).sort_values("date")
             if len(ticker_df) < 10:
                 continue
             outliers = detect_price_outliers(ticker_df, z_threshold=4.0)
@@ -189,69 +222,13 @@ def validate_daily(daily_dir: Path, verbose: bool = False) -> dict:
 
     except Exception as e:
         results["errors"].append(f"읽기 실패: {e}")
+        return results
 
-    return results
-
-
-def _validate_single_intraday_file(
-    file_path: Path,
-    tf: str,
-    full_ohlc: bool = False,
-) -> dict:
-    """
-    단일 Intraday 파일 검사 (병렬 처리용 헬퍼)
-
-    Args:
-        file_path: 파일 경로
-        tf: 타임프레임
-        full_ohlc: OHLC 관계 검사 포함 여부
-
-    Returns:
-        dict: {valid, error, warning, ohlc_violations}
-    """
-    result = {
-        "file": str(file_path),
-        "tf": tf,
-        "valid": False,
-        "error": None,
-        "warning": None,
-        "ohlc_violations": 0,
-        "records": 0,
-    }
-
-    try:
-        df = pq.read_table(file_path).to_pandas()
-        result["records"] = len(df)
-
-        # 필수 컬럼 검사
-        missing = set(INTRADAY_REQUIRED_COLS) - set(df.columns)
-        if missing:
-            result["error"] = f"누락 컬럼 {missing}"
-            return result
-
-        # 빈 파일 검사
-        if len(df) == 0:
-            result["error"] = "빈 파일"
-            return result
-
-        # 중복 검사
-        dups = df.duplicated(subset=["timestamp"]).sum()
-        if dups > 0:
-            result["warning"] = f"중복 {dups}건"
-
-        # [11-004] OHLC 관계 검사 (full 모드)
-        if full_ohlc:
-            ohlc_violations = validate_ohlc_relationship(df)
-            result["ohlc_violations"] = len(ohlc_violations)
-            if ohlc_violations:
-                result["warning"] = f"OHLC 위반 {len(ohlc_violations)}건"
-
-        result["valid"] = True
-
-    except Exception as e:
-        result["error"] = f"읽기 실패 - {e}"
+    if cache is not None:
+        cache.store(all_daily_path, "daily", results)
+        cache.save()
 
-    return result
+    return results
 
 
 def validate_intraday(
@@ -260,22 +237,28 @@ def validate_intraday(
     full_ohlc: bool = False,
     sample_ratio: float = 1.0,
     max_workers: int = 4,
+    engine: Optional[ParquetQualityEngine] = None,
 ) -> dict:
     """
     Intraday Parquet 품질 검사 (TF별 폴더 구조)
 
+    [user-045] 파일 검사는 ParquetQualityEngine에 위임 (프로세스 병렬, 캐시).
+
     Args:
         base_dir: Parquet 베이스 디렉터리
         verbose: 상세 로그 출력
         full_ohlc: OHLC 관계 심층 검사 (느림)
         sample_ratio: 샘플링 비율 (0.1 = 10%, 1.0 = 전체)
-        max_workers: 병렬 처리 스레드 수
+        max_workers: 병렬 처리 프로세스 수
+        engine: 검사 엔진 (None이면 캐시 사용 엔진 생성)
 
     Returns:
         dict: 검사 결과
     """
     import random
-    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    if engine is None:
+        engine = ParquetQualityEngine(base_dir, max_workers=max_workers)
 
     results = {
         "files": 0,
@@ -291,15 +274,7 @@ def validate_intraday(
     }
 
     # TF별 폴더에서 파일 목록 수집
-    tf_folders = ["1m", "3m", "5m", "15m", "1h", "4h"]
-    all_files: list[tuple[Path, str]] = []  # (file_path, tf)
-
-    for tf in tf_folders:
-        tf_dir = base_dir / tf
-        if not tf_dir.exists():
-            continue
-        for f in tf_dir.glob("*.parquet"):
-            all_files.append((f, tf))
+    all_files: list[tuple[Path, str]] = find_intraday_files(base_dir)  # (file_path, tf)
 
     # 샘플링
     total_files = len(all_files)
@@ -312,45 +287,35 @@ def validate_intraday(
 
     results["files"] = len(all_files)
 
-    # 병렬 검사
+    # 병렬 검사 (변경되지 않은 파일은 캐시 결과)
     logger.info(
-        f"🔍 {len(all_files)}개 파일 검사 시작 (workers={max_workers}, full_ohlc={full_ohlc})"
+        f"🔍 {len(all_files)}개 파일 검사 시작 (workers={engine.max_workers}, full_ohlc={full_ohlc})"
     )
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {
-            executor.submit(_validate_single_intraday_file, f, tf, full_ohlc): (f, tf)
-            for f, tf in all_files
-        }
-
-        done_count = 0
-        for future in as_completed(futures):
-            done_count += 1
-            if verbose and done_count % 1000 == 0:
-                logger.info(f"  진행: {done_count}/{len(all_files)}")
-
-            result = future.result()
-            tf = result["tf"]
-            results["by_tf"][tf]["files"] += 1
-
-            if result["valid"]:
-                results["valid"] += 1
-                results["by_tf"][tf]["valid"] += 1
-            if result["error"]:
-                results["errors"].append(
-                    f"{tf}/{Path(result['file']).name}: {result['error']}"
-                )
-                results["by_tf"][tf]["errors"] += 1
-            if result["warning"]:
-                results["warnings"].append(
-                    f"{tf}/{Path(result['file']).name}: {result['warning']}"
-                )
-            if result["ohlc_violations"] > 0:
-                results["ohlc_violations_total"] += result["ohlc_violations"]
-                results["by_tf"][tf]["ohlc_violations"] = (
-                    results["by_tf"][tf].get("ohlc_violations", 0)
-                    + result["ohlc_violations"]
-                )
+    for done_count, result in enumerate(
+        engine.validate_intraday_files(all_files, full_ohlc=full_ohlc), start=1
+    ):
+        if verbose and done_count % 1000 == 0:
+            logger.info(f"  집계: {done_count}/{len(all_files)}")
+
+        tf = result["tf"]
+        results["by_tf"][tf]["files"] += 1
+
+        if result["valid"]:
+            results["valid"] += 1
+            results["by_tf"][tf]["valid"] += 1
+        if result["error"]:
+            results["errors"].append(
+                f"{tf}/{Path(result['file']).name}: {result['error']}"
+            )
+            results["by_tf"][tf]["errors"] += 1
+        if result["warning"]:
+            results["warnings"].append(
+                f"{tf}/{Path(result['file']).name}: {result['warning']}"
+            )
+        if result["ohlc_violations"] > 0:
+            results["ohlc_violations_total"] += result["ohlc_violations"]
+            results["by_tf"][tf]["ohlc_violations"] += result["ohlc_violations"]
 
     logger.info(f"✅ 검사 완료: {results['valid']}/{results['files']} 정상")
 
@@ -394,7 +359,12 @@ def main():
         "--workers",
         type=int,
         default=4,
-        help="병렬 처리 스레드 수 (기본: 4)",
+        help="병렬 처리 프로세스 수 (기본: 4)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="검사 결과 캐시 무시하고 전체 재검사",
     )
 
     args = parser.parse_args()
@@ -411,9 +381,16 @@ def main():
 
     total_errors = 0
 
+    # [user-045] 캐시는 Daily/Intraday 공용
+    engine = ParquetQualityEngine(
+        base_dir, use_cache=not args.no_cache, max_workers=args.workers
+    )
+
     # Daily 검사
     print("\n📊 Daily 데이터 검사:")
-    daily_results = validate_daily(base_dir / "daily", verbose=args.verbose)
+    daily_results = validate_daily(
+        base_dir / "daily", verbose=args.verbose, cache=engine.cache
+    )
     print(f"  파일 수: {daily_results['files']}")
     print(f"  정상: {daily_results['valid']}")
     print(f"  오류: {len(daily_results['errors'])}")
@@ -443,6 +420,7 @@ def main():
         full_ohlc=args.full,
         sample_ratio=args.sample,
         max_workers=args.workers,
+        engine=engine,
     )
     print(f"  파일 수: {intraday_results['files']}")
     print(f"  정상: {intraday_results['valid']}")
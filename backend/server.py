@@ -23,6 +23,7 @@ from dotenv import load_dotenv
 # .env 파일 로드 (최상위 레벨에서 실행)
 load_dotenv()
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
@@ -35,7 +36,11 @@ from loguru import logger
 
 # [04-001] Startup module imports
 from backend.startup.config import initialize_config
-from backend.startup.database import initialize_database, sync_daily_data
+from backend.startup.database import (
+    build_storage_catalog,
+    initialize_database,
+    sync_daily_data,
+)
 from backend.startup.realtime import initialize_realtime_services
 from backend.startup.shutdown import shutdown_all
 
@@ -68,6 +73,7 @@ class AppState:
         self.trailing_stop = None  # TrailingStopManager (Step 4.A.0.b)
         self.ignition_monitor = None  # IgnitionMonitor [Step 4.A.4]
         self.realtime_scanner = None  # RealtimeScanner [Step 4.A.5]
+        self.warmup_task = None  # [user-048] ScoringPool 예열 태스크
 
 
 # 전역 상태 (의존성 주입용)
@@ -116,6 +122,9 @@ async def lifespan(app: FastAPI):
     # 3. Daily Data Sync
     await sync_daily_data(app_state.config, app_state.db)
 
+    # 3-1. [user-044] 저장소 카탈로그 최초 구축 (백그라운드, 완료 전에는 파일 스캔)
+    catalog_task = asyncio.create_task(build_storage_catalog())
+
     # 4. 실시간 서비스 초기화 (IgnitionMonitor, Massive WS, Scanner, Scheduler)
     realtime_result = await initialize_realtime_services(
         config=app_state.config,
@@ -133,17 +142,21 @@ async def lifespan(app: FastAPI):
     app_state.realtime_scanner = realtime_result.realtime_scanner
     app_state.scheduler = realtime_result.scheduler
     app_state.ibkr = realtime_result.ibkr
+    app_state.warmup_task = realtime_result.warmup_task
 
     yield  # 서버 실행 중
 
     # ─────────────────────────────────────────────────────────────
     # SHUTDOWN
     # ─────────────────────────────────────────────────────────────
+    catalog_task.cancel()  # 구축 중이면 대기 중단 (complete 표시 없이 남음 → 다음 시작 시 재시도)
     await shutdown_all(
         realtime_scanner=app_state.realtime_scanner,
         ignition_monitor=app_state.ignition_monitor,
         scheduler=app_state.scheduler,
         ibkr=app_state.ibkr,
+        tick_broadcaster=app_state.tick_broadcaster,
+        warmup_task=app_state.warmup_task,
     )
 
 
@@ -82,8 +82,22 @@ def initialize_config() -> "ServerConfig":
         container.config.from_dict(
             {
                 "market_data": {"db_path": config.market_data.db_path},
-                "scanner": {"poll_interval": 1.0},
+                "scanner": {
+                    "poll_interval": 1.0,
+                    "workers": config.scanner.workers,
+                    "chunksize": config.scanner.chunksize,
+                    "model_path": config.scanner.model_path,
+                    "model_latency_ms": config.scanner.model_latency_ms,
+                },
                 "ignition": {"poll_interval": 1.0},
+                "dedup": {
+                    "window_seconds": config.dedup.window_seconds,
+                    "max_entries": config.dedup.max_entries,
+                },
+                "sequencer": {
+                    "buffer_ms": config.sequencer.buffer_ms,
+                    "max_pending": config.sequencer.max_pending,
+                },
             }
         )
         container.wire(
@@ -7,8 +7,10 @@ DB 연결 및 Strategy Loader 초기화를 담당.
     1. MarketDB 초기화
     2. StrategyLoader 초기화
     3. Daily Data Sync 점검
+    4. [user-044] Parquet 저장소 카탈로그 최초 구축 (백그라운드)
 """
 
+import asyncio
 import os
 from typing import TYPE_CHECKING, Optional, Tuple
 
@@ -97,3 +99,23 @@ async def sync_daily_data(config: "ServerConfig", db: Optional["MarketDB"]) -> N
                 logger.info("✅ Daily data already up-to-date")
     except Exception as e:
         logger.warning(f"⚠️ Daily data sync skipped: {e}")
+
+
+async def build_storage_catalog() -> None:
+    """
+    [user-044] Parquet 저장소 카탈로그 최초 구축 (서버 시작 후 백그라운드)
+
+    📌 ParquetManager 생성자는 스캔하지 않음 → 구축이 끝나기 전까지 조회는 파일 스캔 경로
+    📌 이미 구축된 카탈로그는 조회 시 항목별 mtime/크기로 바뀐 파일만 다시 읽음
+    """
+    try:
+        from backend.container import container
+
+        pm = container.parquet_manager()
+        if pm.catalog is None or pm.catalog.complete:
+            return
+        logger.info("📇 Storage catalog build started (background)")
+        count = await asyncio.to_thread(pm.rebuild_catalog)
+        logger.info(f"✅ Storage catalog built: {count} files")
+    except Exception as e:
+        logger.warning(f"⚠️ Storage catalog build skipped: {e}")
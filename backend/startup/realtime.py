@@ -9,6 +9,7 @@ Realtime Services Initialization
     3. RealtimeScanner 시작
     4. IBKR 연결 (Optional)
     5. Scheduler 초기화
+    6. [user-048] ScoringPool 예열 (백그라운드)
 """
 
 import asyncio
@@ -40,6 +41,8 @@ class RealtimeServicesResult:
         self.realtime_scanner = None
         self.scheduler = None
         self.ibkr = None
+        # [user-048] ScoringPool 예열 태스크 (종료 시 취소/대기)
+        self.warmup_task: Optional[asyncio.Task] = None
 
 
 async def initialize_ignition_monitor(
@@ -93,14 +96,17 @@ async def start_ignition_monitor(
         if not watchlist:
             logger.info("📡 No watchlist found, running auto-scanner...")
             try:
+                from backend.container import container
                 from backend.core.scanner import Scanner
-                from backend.strategies.seismograph import SeismographStrategy
 
-                scanner = Scanner(db)
-                strategy = SeismographStrategy()
-
-                # 간단한 스캔 실행 (Day Gainers 기반)
-                results = await scanner.scan_with_strategy(strategy, limit=30)
+                # [user-048] DataRepository + Container 워커 풀로 Daily Scan 실행
+                scanner = Scanner(
+                    container.data_repository(),
+                    watchlist_size=30,
+                    scoring_pool=container.scoring_pool(),
+                    gainer_model=container.gainer_model(),  # [user-049]
+                )
+                results = await scanner.run_daily_scan(incremental=True)  # [user-047]
 
                 if results:
                     # [Issue 6.2 Fix] 덮어쓰기 대신 병합
@@ -156,6 +162,12 @@ async def initialize_massive_websocket(
         # [02-004] Container에서 TickDispatcher 획득 (Singleton)
         result.tick_dispatcher = container.tick_dispatcher()
 
+        # [user-031] 장중 상태 엔진을 가장 먼저 등록 (다른 구독자가 갱신된 상태를 읽도록)
+        container.intraday_state().attach(result.tick_dispatcher)
+
+        # [user-035] 보유 종목 미실현 손익 / 노출을 틱마다 증분 갱신
+        container.risk_manager().attach(result.tick_dispatcher)
+
         # 활성 전략이 있으면 TickDispatcher에 등록
         if strategy_loader:
             active_strategy = strategy_loader.get_strategy(
@@ -279,6 +291,7 @@ async def initialize_realtime_scanner(
             ignition_monitor=ignition_monitor,  # 런타임 주입
             poll_interval=1.0,
             scoring_strategy=scoring_strategy,
+            gainer_model=container.gainer_model(),  # [user-049] ML 확률
         )
 
         # 기존 Watchlist 로드 후 시작
@@ -323,6 +336,23 @@ def initialize_scheduler(
         return None
 
 
+async def warm_scoring_pool() -> None:
+    """
+    [user-048] Container ScoringPool 예열 (서버 시작 후 백그라운드)
+
+    📌 워커 프로세스 생성 + initializer(전략 로드)를 미리 끝내 첫 Daily Scan 지연 제거
+    📌 예열 중 스캔이 시작돼도 같은 풀을 공유 (풀 생성은 1회)
+    """
+    try:
+        from backend.container import container
+
+        pool = container.scoring_pool()
+        await asyncio.to_thread(pool.warm)
+        logger.info(f"✅ ScoringPool warmed ({pool.max_workers} workers)")
+    except Exception as e:
+        logger.warning(f"⚠️ ScoringPool warm-up skipped: {e}")
+
+
 async def initialize_realtime_services(
     config: "ServerConfig",
     db: Optional["MarketDB"],
@@ -335,7 +365,7 @@ async def initialize_realtime_services(
         1. IgnitionMonitor 초기화
         2. Daily Data Sync
         3. IBKR 연결 (auto_connect시)
-        4. Scheduler 초기화
+        4. Scheduler 초기화 + ScoringPool 예열 (백그라운드)
         5. Massive WebSocket 초기화
         6. IgnitionMonitor 자동 시작
         7. RealtimeScanner 초기화
@@ -366,6 +396,10 @@ async def initialize_realtime_services(
     # 4. Scheduler 초기화
     result.scheduler = initialize_scheduler(config, db)
 
+    # 4-1. [user-048] 스코어링 워커 풀 예열 (WebSocket 연결/자동 스캔과 병행)
+    # 핸들을 보관 (루프는 약한 참조만 유지 → 실행 중 GC 방지, 종료 시 정리)
+    result.warmup_task = asyncio.create_task(warm_scoring_pool())
+
     # 5. Massive WebSocket 초기화
     ws_result = await initialize_massive_websocket(strategy_loader, result.ibkr, db)
     result.massive_ws = ws_result.massive_ws
@@ -8,8 +8,10 @@ Shutdown Logic
     2. IgnitionMonitor 종료
     3. Scheduler 종료
     4. IBKR 연결 해제
+    5. [user-048] Scanner 워커 풀 종료
 """
 
+import asyncio
 from typing import TYPE_CHECKING, Optional, Any
 
 from loguru import logger
@@ -23,24 +25,40 @@ async def shutdown_all(
     ignition_monitor: Optional[Any] = None,
     scheduler: Optional[Any] = None,
     ibkr: Optional[Any] = None,
+    scoring_pool: Optional[Any] = None,
+    tick_broadcaster: Optional[Any] = None,
+    warmup_task: Optional[asyncio.Task] = None,
 ) -> None:
     """
     모든 서비스 종료
 
     📌 Graceful shutdown 순서:
+        0. TickBroadcaster (틱 시퀀서 태스크)
         1. RealtimeScanner
         2. IgnitionMonitor
         3. Scheduler
         4. IBKR
+        5. ScoringPool 예열 태스크 → ScoringPool (스케줄된 스캔이 끝난 뒤)
 
     Args:
         realtime_scanner: RealtimeScanner 인스턴스
         ignition_monitor: IgnitionMonitor 인스턴스
         scheduler: TradingScheduler 인스턴스
         ibkr: IBKR 커넥터 인스턴스
+        scoring_pool: ScoringPool 인스턴스 (None이면 Container에서 조회)
+        tick_broadcaster: TickBroadcaster 인스턴스
+        warmup_task: [user-048] ScoringPool 예열 태스크 (진행 중이면 취소)
     """
     logger.info("🛑 Server Shutting Down...")
 
+    # 0. [user-038] 틱 시퀀서 중지 (버퍼에 남은 틱은 배포 후 종료)
+    if tick_broadcaster:
+        try:
+            tick_broadcaster.stop()
+            logger.info("✅ TickBroadcaster stopped")
+        except Exception as e:
+            logger.error(f"❌ TickBroadcaster shutdown error: {e}")
+
     # 1. RealtimeScanner 종료 [Step 4.A.5]
     if realtime_scanner:
         try:
@@ -73,6 +91,27 @@ async def shutdown_all(
         except Exception as e:
             logger.error(f"❌ IBKR disconnect error: {e}")
 
+    # 5. [user-048] 예열 태스크 정리 후 Scanner 워커 풀 종료 (시작된 적 없으면 생략)
+    if warmup_task is not None:
+        if not warmup_task.done():
+            warmup_task.cancel()
+        try:
+            await warmup_task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"❌ ScoringPool warm-up error: {e}")
+
+    try:
+        if scoring_pool is None:
+            from backend.container import container
+
+            scoring_pool = container.scoring_pool()
+        if scoring_pool.started:
+            scoring_pool.shutdown(wait=True)
+    except Exception as e:
+        logger.error(f"❌ ScoringPool shutdown error: {e}")
+
     logger.info("👋 Goodbye!")
 
 
@@ -88,4 +127,6 @@ async def shutdown_from_result(result: "RealtimeServicesResult") -> None:
         ignition_monitor=result.ignition_monitor,
         scheduler=result.scheduler,
         ibkr=result.ibkr,
+        tick_broadcaster=result.tick_broadcaster,
+        warmup_task=result.warmup_task,
     )
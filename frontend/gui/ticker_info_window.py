@@ -20,7 +20,7 @@ if TYPE_CHECKING:
     from frontend.gui.state.dashboard_state import DashboardState
 
 try:
-    from PySide6.QtCore import Qt, QTimer, Slot, Signal, QObject
+    from PySide6.QtCore import Qt, QTimer, Slot, Signal, QObject, QCoreApplication
     from PySide6.QtWidgets import (
         QDialog,
         QFrame,
@@ -35,7 +35,7 @@ try:
         QWidget,
     )
 except ImportError:
-    from PyQt6.QtCore import Qt, QTimer, pyqtSlot as Slot, pyqtSignal as Signal, QObject  # noqa: F401
+    from PyQt6.QtCore import Qt, QTimer, pyqtSlot as Slot, pyqtSignal as Signal, QObject, QCoreApplication  # noqa: F401
     from PyQt6.QtWidgets import (
         QDialog,
         QFrame,
@@ -472,6 +472,11 @@ class TickerInfoWindow(QDialog):
         self._service = get_container().ticker_info_service()
         self._dynamic_fail_count: int = 0  # 연속 실패 카운트
 
+        # [user-040] 앱 종료 시 서비스의 백그라운드 HTTP 클라이언트/DB 스레드 정리
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._service.shutdown)
+
         self._setup_window()
         self._setup_ui()
         self._setup_timer()
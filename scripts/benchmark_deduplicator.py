@@ -0,0 +1,124 @@
+"""
+EventDeduplicator 벤치마크
+
+틱마다 event_id를 만드는 부하(기본 100k events/s)를 가상 시간으로 재생하며
+이전 dict 전체 스캔 방식과 시간 버킷 휠 방식을 비교.
+  - throughput: 초당 처리 이벤트 수
+  - 지연 스파이크: 가상 1초(= 100k 이벤트) 단위 처리 시간의 p50 / max
+    (이전 방식은 2×window마다 전체 스캔 → max가 튐)
+  - 메모리: 최대 정확 계층 크기 (max_entries 지정 시 Bloom 계층 이동 수)
+
+Usage:
+    python scripts/benchmark_deduplicator.py
+    python scripts/benchmark_deduplicator.py --rate 100000 --seconds 180 --max-entries 1000000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from loguru import logger
+
+from backend.core.deduplicator import EventDeduplicator
+
+
+class DictScanDeduplicator:
+    """비교 기준: [user-037] 이전 구현 (2×window마다 전체 dict 스캔)"""
+
+    def __init__(self, window_seconds: int = 60):
+        self.window_seconds = window_seconds
+        self._seen = {}
+        self._last_cleanup = 0.0
+        self._cleanup_interval = window_seconds * 2
+
+    def is_duplicate(self, event_id: str, event_time: float) -> bool:
+        now = event_time
+        if now - self._last_cleanup > self._cleanup_interval:
+            expired = [k for k, v in self._seen.items() if now - v > self.window_seconds]
+            for k in expired:
+                del self._seen[k]
+            self._last_cleanup = now
+        last_seen = self._seen.get(event_id)
+        if last_seen is not None and now - last_seen <= self.window_seconds:
+            return True
+        self._seen[event_id] = now
+        return False
+
+    @property
+    def size(self) -> int:
+        return len(self._seen)
+
+
+def run(dedup, rate: int, seconds: int, dup_every: int = 50) -> dict:
+    """가상 시간 재생: rate events/s, dup_every건마다 직전 이벤트 재전송"""
+    tickers = [f"T{i:03d}" for i in range(500)]
+    make_id = EventDeduplicator.make_event_id
+    chunk_times = []
+    duplicates = 0
+    peak = 0
+    t0 = 1_700_000_000.0
+    step = 1.0 / rate
+
+    start = time.perf_counter()
+    for sec in range(seconds):
+        chunk_start = time.perf_counter()
+        base = t0 + sec
+        prev_id = None
+        for i in range(rate):
+            ts = base + i * step
+            event_id = make_id(tickers[i % 500], "tick", int(ts * 1000) * 1000 + i % 1000)
+            if dedup.is_duplicate(event_id, event_time=ts):
+                duplicates += 1
+            if prev_id is not None and i % dup_every == 0 and dedup.is_duplicate(prev_id, event_time=ts):
+                duplicates += 1
+            prev_id = event_id
+        chunk_times.append(time.perf_counter() - chunk_start)
+        peak = max(peak, dedup.size)
+    elapsed = time.perf_counter() - start
+
+    total = rate * seconds * (1 + 1 / dup_every)
+    chunk_times.sort()
+    return {
+        "events_per_s": total / elapsed,
+        "chunk_p50_ms": chunk_times[len(chunk_times) // 2] * 1000,
+        "chunk_max_ms": chunk_times[-1] * 1000,
+        "peak_size": peak,
+        "duplicates": duplicates,
+    }
+
+
+def main(rate: int, seconds: int, window: int, max_entries) -> None:
+    candidates = [
+        ("dict scan", DictScanDeduplicator(window_seconds=window)),
+        ("time wheel", EventDeduplicator(window_seconds=window)),
+    ]
+    if max_entries:
+        candidates.append(
+            (f"wheel cap={max_entries:,}", EventDeduplicator(window_seconds=window, max_entries=max_entries))
+        )
+
+    for name, dedup in candidates:
+        r = run(dedup, rate, seconds)
+        extra = ""
+        if hasattr(dedup, "get_stats"):
+            stats = dedup.get_stats()
+            extra = f" | spilled {stats['spilled']:,}, approx hits {stats['approx_hits']:,}"
+        print(
+            f"🧹 {name:>18}: {r['events_per_s']:,.0f} ev/s | 1s chunk p50 {r['chunk_p50_ms']:.0f}ms "
+            f"max {r['chunk_max_ms']:.0f}ms | peak {r['peak_size']:,} | dups {r['duplicates']:,}{extra}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rate", type=int, default=100_000)
+    parser.add_argument("--seconds", type=int, default=150)
+    parser.add_argument("--window", type=int, default=60)
+    parser.add_argument("--max-entries", type=int, default=None)
+    args = parser.parse_args()
+
+    logger.remove()
+    main(args.rate, args.seconds, args.window, args.max_entries)
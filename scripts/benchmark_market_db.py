@@ -0,0 +1,103 @@
+"""
+MarketDB Bulk 적재 벤치마크 (rows/sec)
+
+Grouped Daily 규모(일 10k 종목)의 합성 일봉으로 세 가지 쓰기 경로를 비교.
+  - legacy:  500행 청크마다 세션/커밋 + insert().values(list) (기존 upsert_bulk 방식)
+  - prepared: 트랜잭션 1개 + 준비된 UPSERT executemany (upsert_bulk 기본)
+  - staging:  TEMP 테이블 적재 후 INSERT ... SELECT 병합 (upsert_bulk(use_staging=True))
+
+각 경로는 빈 DB 삽입(insert)과 같은 행 재적재(update) 두 단계를 측정.
+
+Usage:
+    python scripts/benchmark_market_db.py
+    python scripts/benchmark_market_db.py --tickers 10000 --days 5
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from loguru import logger
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from backend.data.database import DailyBar, MarketDB
+
+
+def make_bars(n_tickers: int, n_days: int) -> list[dict]:
+    """합성 일봉 생성 (n_tickers × n_days 행)."""
+    bars = []
+    for d in range(n_days):
+        date = f"2024-12-{d + 1:02d}"
+        for i in range(n_tickers):
+            price = 10.0 + i * 0.01 + d
+            bars.append({
+                "ticker": f"T{i:05d}", "date": date,
+                "open": price, "high": price + 0.5, "low": price - 0.5,
+                "close": price + 0.2, "volume": 100_000 + i,
+                "vwap": price + 0.1, "transactions": 1_000 + i,
+            })
+    return bars
+
+
+async def legacy_upsert(db: MarketDB, bars: list[dict], chunk_size: int = 500) -> int:
+    """기존 upsert_bulk 구현 (청크마다 세션 + 커밋)."""
+    for i in range(0, len(bars), chunk_size):
+        chunk = bars[i : i + chunk_size]
+        async with db.session_factory() as session:
+            stmt = sqlite_insert(DailyBar).values(list(chunk))
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["ticker", "date"],
+                set_={c: stmt.excluded[c] for c in
+                      ("open", "high", "low", "close", "volume", "vwap", "transactions")},
+            )
+            await session.execute(stmt)
+            await session.commit()
+    return len(bars)
+
+
+async def run_case(name: str, bars: list[dict], writer) -> dict:
+    """빈 DB에서 insert → update 두 번 측정."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = MarketDB(os.path.join(tmpdir, "bench.db"))
+        await db.initialize()
+        result = {"case": name}
+        for phase in ("insert", "update"):
+            start = time.perf_counter()
+            await writer(db, bars)
+            elapsed = time.perf_counter() - start
+            result[phase] = len(bars) / elapsed
+        await db.close()
+    return result
+
+
+async def main(n_tickers: int, n_days: int) -> None:
+    bars = make_bars(n_tickers, n_days)
+    print(f"📊 {len(bars):,} rows ({n_tickers:,} tickers × {n_days} days)\n")
+
+    cases = [
+        ("legacy", legacy_upsert),
+        ("prepared", lambda db, b: db.upsert_bulk(b)),
+        ("staging", lambda db, b: db.upsert_bulk(b, use_staging=True)),
+    ]
+    results = [await run_case(name, bars, fn) for name, fn in cases]
+
+    base = results[0]
+    print(f"{'case':<10}{'insert rows/s':>16}{'update rows/s':>16}{'speedup':>10}")
+    for r in results:
+        print(f"{r['case']:<10}{r['insert']:>16,.0f}{r['update']:>16,.0f}"
+              f"{r['insert'] / base['insert']:>9.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--tickers", type=int, default=10_000)
+    parser.add_argument("--days", type=int, default=3)
+    args = parser.parse_args()
+
+    logger.remove()
+    asyncio.run(main(args.tickers, args.days))
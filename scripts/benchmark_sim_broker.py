@@ -0,0 +1,161 @@
+"""
+SimulatedBroker 기반 주문 관리 벤치마크
+
+IB Gateway 없이 주문 경로 처리량과 손절 반응 시간을 측정.
+  - burst:    OrderManager 진입 + OCA 청산 N종목 일괄 제출 (orders/s),
+              작업 주문이 걸린 상태의 틱 처리량 (ticks/s)
+  - reaction: 실시간 모드에서 TrailingStopManager 손절 K개를 한 번에 트리거,
+              틱 입력 → 체결 callback까지 벽시계 지연 (설정 fill 지연 대비 오버헤드)
+  - kill:     RiskManager.kill_switch() 전 포지션 청산 소요 시간
+
+Usage:
+    python scripts/benchmark_sim_broker.py
+    python scripts/benchmark_sim_broker.py --symbols 500 --fill-ms 20
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from loguru import logger
+
+from backend.broker.simulated_broker import SimBrokerConfig, SimulatedBroker
+from backend.core.order_manager import OrderManager
+from backend.core.risk_manager import RiskManager
+from backend.core.trailing_stop import TrailingStopManager
+
+
+def symbols_for(n: int) -> list[str]:
+    return [f"S{i:04d}" for i in range(n)]
+
+
+def bench_burst(n_symbols: int, ticks_per_symbol: int) -> dict:
+    """가상 시간: 진입/OCA 제출 처리량 + 틱 매칭 처리량."""
+    broker = SimulatedBroker(SimBrokerConfig(ack_latency_ms=1, fill_latency_ms=1))
+    manager = OrderManager(broker)
+    symbols = symbols_for(n_symbols)
+    for sym in symbols:
+        broker.process_tick(sym, 10.0, 1000, ts=0.0)
+
+    start = time.perf_counter()
+    for sym in symbols:
+        manager.execute_entry(sym, 100)
+        manager.execute_oca_exit(sym, 100, entry_price=10.0)
+    submit_elapsed = time.perf_counter() - start
+    n_orders = broker.get_stats()["orders"]
+
+    start = time.perf_counter()
+    ts = 0.0
+    for i in range(ticks_per_symbol):
+        ts += 0.001
+        price = 10.0 + 0.01 * (i % 5)  # OCA 범위 안에서 흔들기
+        for sym in symbols:
+            broker.process_tick(sym, price, 1000, ts=ts)
+    tick_elapsed = time.perf_counter() - start
+    n_ticks = ticks_per_symbol * n_symbols
+
+    return {
+        "orders": n_orders,
+        "orders_per_s": n_orders / submit_elapsed,
+        "ticks": n_ticks,
+        "ticks_per_s": n_ticks / tick_elapsed,
+        "working": broker.get_stats()["working"],
+    }
+
+
+def bench_reaction(n_symbols: int, fill_ms: float) -> dict:
+    """실시간: 손절 K개 동시 트리거 → 체결 callback 벽시계 지연."""
+    broker = SimulatedBroker(SimBrokerConfig(ack_latency_ms=1, fill_latency_ms=fill_ms))
+    trailing = TrailingStopManager(connector=broker)
+    symbols = symbols_for(n_symbols)
+
+    done = threading.Event()
+    fill_times: dict[int, float] = {}
+
+    def on_fill(info: dict) -> None:
+        fill_times[info["order_id"]] = time.perf_counter()
+        if len(fill_times) == n_symbols:
+            done.set()
+
+    broker.set_on_order_filled(on_fill)
+    broker.start()
+    try:
+        for sym in symbols:
+            broker.process_tick(sym, 10.0, 1000)
+            trailing.create_trailing(sym, 100, atr=0.2)
+        time.sleep(0.05)  # 접수 대기
+
+        trigger_at = time.perf_counter()
+        for sym in symbols:
+            broker.process_tick(sym, 9.0, 1000)
+        done.wait(timeout=10)
+    finally:
+        broker.stop()
+
+    waits = sorted((t - trigger_at) * 1000 for t in fill_times.values())
+    if not waits:
+        return {"filled": 0}
+    return {
+        "filled": len(waits),
+        "p50_ms": waits[len(waits) // 2],
+        "p99_ms": waits[min(len(waits) - 1, int(len(waits) * 0.99))],
+        "max_ms": waits[-1],
+        "overhead_p50_ms": waits[len(waits) // 2] - fill_ms,
+    }
+
+
+def bench_kill(n_symbols: int) -> dict:
+    """가상 시간: 포지션 N개 보유 상태에서 kill_switch 소요 시간."""
+    broker = SimulatedBroker(SimBrokerConfig(ack_latency_ms=0, fill_latency_ms=0))
+    symbols = symbols_for(n_symbols)
+    for sym in symbols:
+        broker.process_tick(sym, 10.0, 1000, ts=0.0)
+        broker.place_market_order(sym, 100)
+        broker.place_stop_order(sym, 100, 9.0)
+    broker.advance(0.001)
+
+    start = time.perf_counter()
+    result = RiskManager(connector=broker).kill_switch("benchmark")
+    elapsed = time.perf_counter() - start
+    broker.advance(0.01)
+
+    return {
+        "liquidated": len(result["liquidated_positions"]),
+        "cancelled": result["cancelled_orders"],
+        "elapsed_ms": elapsed * 1000,
+        "flat": not broker.get_positions(),
+    }
+
+
+def main(n_symbols: int, ticks: int, fill_ms: float) -> None:
+    burst = bench_burst(n_symbols, ticks)
+    print(f"📦 burst: {burst['orders']:,} orders @ {burst['orders_per_s']:,.0f} orders/s | "
+          f"{burst['ticks']:,} ticks @ {burst['ticks_per_s']:,.0f} ticks/s "
+          f"({burst['working']:,} working)")
+
+    reaction = bench_reaction(n_symbols, fill_ms)
+    if reaction["filled"]:
+        print(f"🛑 stop reaction ({reaction['filled']} stops, fill {fill_ms:.0f}ms): "
+              f"p50 {reaction['p50_ms']:.1f}ms / p99 {reaction['p99_ms']:.1f}ms / "
+              f"max {reaction['max_ms']:.1f}ms (overhead p50 {reaction['overhead_p50_ms']:.1f}ms)")
+    else:
+        print("🛑 stop reaction: no fills")
+
+    kill = bench_kill(n_symbols)
+    print(f"🔴 kill switch: {kill['liquidated']} positions, {kill['cancelled']} orders "
+          f"in {kill['elapsed_ms']:.1f}ms (flat={kill['flat']})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--symbols", type=int, default=200)
+    parser.add_argument("--ticks", type=int, default=50)
+    parser.add_argument("--fill-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    logger.remove()
+    main(args.symbols, args.ticks, args.fill_ms)
@@ -7,11 +7,17 @@ Daygainer(75%+ 급등주)에 대응하는 대조군 자동 매칭.
 - ML 학습용 데이터셋 생성
 """
 
+import os
+import sys
 import pandas as pd
 from pathlib import Path
 from typing import Optional
 import logging
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.data.intraday_windows import read_day_windows  # noqa: E402
+
 # ============================================================
 # 설정
 # ============================================================
@@ -193,24 +199,16 @@ def load_intraday_for_ticker(ticker: str, target_date) -> Optional[pd.DataFrame]
     Returns:
         해당 날짜의 분봉 데이터 또는 None (없을 경우)
     """
-    parquet_path = INTRADAY_DIR / f"{ticker}.parquet"
-    
-    if not parquet_path.exists():
-        return None
-    
+    # [user-043] 파일 전체 대신 해당 날짜 구간만 필터로 읽음
     try:
-        df = pd.read_parquet(parquet_path)
+        days = read_day_windows(INTRADAY_DIR / f"{ticker}.parquet", [target_date])
+        df = next(iter(days.values()))
+        if len(df) == 0:
+            return None
+
         df.columns = df.columns.str.lower()
-        
-        # 날짜 필터링
-        if 'date' in df.columns:
-            df['date'] = pd.to_datetime(df['date']).dt.date
-            df = df[df['date'] == target_date]
-        elif 'timestamp' in df.columns:
-            df['date'] = pd.to_datetime(df['timestamp']).dt.date
-            df = df[df['date'] == target_date]
-        
-        return df if len(df) > 0 else None
+        df['date'] = df['_ts'].dt.date
+        return df
     except Exception as e:
         logger.debug(f"Error loading {ticker}: {e}")
         return None
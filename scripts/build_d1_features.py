@@ -9,18 +9,25 @@ Usage:
 """
 
 import logging
+import os
+import sys
 from datetime import date
 from pathlib import Path
 from typing import NamedTuple
 
 import pandas as pd
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.data.feature_store import FEATURE_COLUMNS, FeatureStore  # noqa: E402
+
 # ==================================================
 # 설정
 # ==================================================
 DAILY_PARQUET = Path("data/parquet/daily/all_daily.parquet")
 CONTROL_CSV = Path("scripts/control_groups.csv")
 OUTPUT_PARQUET = Path("scripts/d1_features.parquet")
+FEATURE_STORE_DIR = Path("data/parquet/features/d1")
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -201,69 +208,27 @@ def calculate_d1_features(
 def build_d1_features() -> pd.DataFrame:
     """
     전체 D-1 피처 추출 실행.
-    
+
+    [user-041] 행마다 calculate_d1_features()로 일봉 전체를 필터링하지 않고,
+    FeatureStore(전 종목·전 날짜 피처, 원본 변경 시에만 재계산)에서
+    as-of 조인으로 한 번에 가져옵니다. calculate_d1_features()는 검증용 기준 구현.
+
     Returns:
         D-1 피처 DataFrame
     """
-    # 데이터 로드
-    logger.info("일봉 데이터 로드...")
-    daily_df = pd.read_parquet(DAILY_PARQUET)
-    logger.info(f"일봉 데이터: {len(daily_df):,} rows")
-    
+    logger.info("피처 저장소 확인...")
+    store = FeatureStore(FEATURE_STORE_DIR)
+    if store.ensure(DAILY_PARQUET):
+        logger.info(f"피처 저장소 재빌드 완료: {FEATURE_STORE_DIR}")
+
     targets = load_control_groups()
-    
-    results = []
     total = len(targets)
-    success_count = 0
-    
-    logger.info(f"D-1 피처 계산 시작: {total}건")
-    
-    for idx, row in targets.iterrows():
-        ticker = row["ticker"]
-        target_date = row["target_date"]
-        label = row["label"]
-        price_tier = row["price_tier"]
-        
-        features = calculate_d1_features(ticker, target_date, daily_df)
-        
-        if features.get("has_data"):
-            success_count += 1
-            results.append({
-                "ticker": ticker,
-                "target_date": target_date,
-                "label": label,
-                "price_tier": price_tier,
-                "close_d1": features["close_d1"],
-                "volume_d1": features["volume_d1"],
-                "rvol_20d": features["rvol_20d"],
-                "price_vs_20ma": features["price_vs_20ma"],
-                "price_vs_52w_high": features["price_vs_52w_high"],
-                "atr_pct": features["atr_pct"],
-                "volume_trend_5d": features["volume_trend_5d"],
-                "gap_count_30d": features["gap_count_30d"],
-            })
-        else:
-            # 데이터 없는 경우도 기록 (None 피처)
-            results.append({
-                "ticker": ticker,
-                "target_date": target_date,
-                "label": label,
-                "price_tier": price_tier,
-                "close_d1": None,
-                "volume_d1": None,
-                "rvol_20d": None,
-                "price_vs_20ma": None,
-                "price_vs_52w_high": None,
-                "atr_pct": None,
-                "volume_trend_5d": None,
-                "gap_count_30d": None,
-            })
-        
-        if (idx + 1) % 500 == 0:
-            logger.info(f"진행: {idx + 1}/{total}")
-    
-    df = pd.DataFrame(results)
-    
+
+    logger.info(f"D-1 피처 조회 시작: {total}건")
+    df = store.as_of(targets[["ticker", "target_date", "label", "price_tier"]])
+    df = df[["ticker", "target_date", "label", "price_tier"] + FEATURE_COLUMNS]
+    success_count = int(df["close_d1"].notna().sum())
+
     # 통계 출력
     logger.info("=" * 60)
     logger.info("D-1 피처 추출 결과")
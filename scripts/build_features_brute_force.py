@@ -12,10 +12,17 @@ Output:
 """
 
 import logging
+import os
+import sys
+from functools import partial
 from pathlib import Path
 
 import pandas as pd
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.data.indicator_matrix import IndicatorMatrix  # noqa: E402
+
 # pandas_ta 임포트 (설치 필요: pip install pandas_ta)
 try:
     import pandas_ta as ta  # noqa: F401 - df.ta 확장 메서드로 사용됨
@@ -29,6 +36,7 @@ except ImportError:
 DAILY_PARQUET = Path("data/parquet/daily/all_daily.parquet")
 D1_FEATURES = Path("scripts/d1_features.parquet")
 OUTPUT_PARQUET = Path("scripts/d1_features_extended.parquet")
+INDICATOR_DIR = Path("data/parquet/indicators/daily")
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -123,150 +131,121 @@ def calculate_divergence_features(df: pd.DataFrame) -> pd.DataFrame:
     return result
 
 
+# ==================================================
+# 지표 정의
+# ==================================================
+# [user-042] 지표명 → 함수. 지표별로 캐시되므로 새 지표를 추가하면
+# 그 지표만 계산됩니다. 파라미터를 바꿀 때는 이름도 바꿔야 재계산됩니다.
+# ProcessPoolExecutor로 전달되므로 lambda 대신 partial(_ta, ...) 사용.
+
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+
+def _ta(df: pd.DataFrame, method: str, **kwargs):
+    """df.ta.<method>(**kwargs) 결과 (Series/DataFrame) 반환."""
+    return getattr(df.ta, method)(**kwargs)
+
+
+def _daily_extra(df: pd.DataFrame) -> pd.DataFrame:
+    """일봉의 OHLCV 외 컬럼 (vwap, transactions 등) - 기존 출력 호환."""
+    return df.drop(columns=[c for c in OHLCV_COLUMNS if c in df.columns])
+
+
+INDICATORS = {
+    "daily_extra": _daily_extra,
+    # Momentum 지표
+    "rsi_5": partial(_ta, method="rsi", length=5),
+    "rsi_14": partial(_ta, method="rsi", length=14),
+    "macd_12_26_9": partial(_ta, method="macd", fast=12, slow=26, signal=9),
+    "stoch_14_3_3": partial(_ta, method="stoch", k=14, d=3, smooth_k=3),
+    "cci_20": partial(_ta, method="cci", length=20),
+    "willr_14": partial(_ta, method="willr", length=14),
+    "mom_10": partial(_ta, method="mom", length=10),
+    "roc_10": partial(_ta, method="roc", length=10),
+    # Trend 지표
+    "ema_9": partial(_ta, method="ema", length=9),
+    "ema_21": partial(_ta, method="ema", length=21),
+    "sma_10": partial(_ta, method="sma", length=10),
+    "sma_20": partial(_ta, method="sma", length=20),
+    "sma_50": partial(_ta, method="sma", length=50),
+    "adx_14": partial(_ta, method="adx", length=14),
+    "aroon_25": partial(_ta, method="aroon", length=25),
+    # Volatility 지표
+    "atr_14": partial(_ta, method="atr", length=14),
+    "bbands_20_2": partial(_ta, method="bbands", length=20, std=2),
+    "kc_20_1.5": partial(_ta, method="kc", length=20, scalar=1.5),
+    # Volume 지표
+    "obv": partial(_ta, method="obv"),
+    "cmf_20": partial(_ta, method="cmf", length=20),
+    "mfi_14": partial(_ta, method="mfi", length=14),
+    "ad": partial(_ta, method="ad"),
+}
+
+
 # ==================================================
 # 메인 피처 빌더
 # ==================================================
 
 def calculate_all_indicators(ticker_df: pd.DataFrame) -> pd.DataFrame:
     """
-    단일 티커에 대해 pandas_ta로 모든 지표 계산.
-    
-    ELI5:
-    - pandas_ta.strategy("All")은 130개 이상 지표를 한번에 계산
-    - 하지만 메모리/시간 효율을 위해 핵심 지표만 선택
+    단일 티커에 대해 INDICATORS 전체 계산 (디버깅/단건 확인용).
+
+    전체 빌드는 IndicatorMatrix가 병렬 + 캐시로 수행합니다.
     """
     if len(ticker_df) < 30:
-        # 데이터 부족 시 빈 DataFrame 반환
+        # 데이터 부족 시 원본 반환
         return ticker_df
-    
-    df = ticker_df.copy()
-    df = df.sort_values("date")
-    
-    # pandas_ta에 필요한 컬럼명 매핑
-    if "date" in df.columns:
-        df = df.set_index("date")
-    
-    # 핵심 지표 계산 (전략별)
-    try:
-        # Momentum 지표
-        df.ta.rsi(length=5, append=True)
-        df.ta.rsi(length=14, append=True)
-        df.ta.macd(fast=12, slow=26, signal=9, append=True)
-        df.ta.stoch(k=14, d=3, smooth_k=3, append=True)
-        df.ta.cci(length=20, append=True)
-        df.ta.willr(length=14, append=True)
-        df.ta.mom(length=10, append=True)
-        df.ta.roc(length=10, append=True)
-        
-        # Trend 지표
-        df.ta.ema(length=9, append=True)
-        df.ta.ema(length=21, append=True)
-        df.ta.sma(length=10, append=True)
-        df.ta.sma(length=20, append=True)
-        df.ta.sma(length=50, append=True)
-        df.ta.adx(length=14, append=True)
-        df.ta.aroon(length=25, append=True)
-        
-        # Volatility 지표
-        df.ta.atr(length=14, append=True)
-        df.ta.bbands(length=20, std=2, append=True)
-        df.ta.kc(length=20, scalar=1.5, append=True)
-        
-        # Volume 지표
-        df.ta.obv(append=True)
-        df.ta.cmf(length=20, append=True)
-        df.ta.mfi(length=14, append=True)
-        df.ta.ad(append=True)
-        
-    except Exception as e:
-        logger.warning(f"지표 계산 실패: {e}")
-    
-    # Index 복원
-    df = df.reset_index()
-    
-    return df
+
+    df = ticker_df.sort_values("date").set_index("date")
+    parts = [df]
+    for name, fn in INDICATORS.items():
+        if name == "daily_extra":
+            continue
+        try:
+            parts.append(fn(df.copy()))
+        except Exception as e:
+            logger.warning(f"지표 계산 실패 {name}: {e}")
+
+    return pd.concat(parts, axis=1).reset_index()
 
 
 def build_extended_features() -> pd.DataFrame:
     """
     D-1 피처 확장 실행.
-    
+
     1. 기존 d1_features.parquet 로드
-    2. 각 (ticker, target_date) 조합에 대해 D-1 시점까지의 지표 계산
-    3. 괴리 피처 + 레짐 라벨 추가
+    2. [user-042] IndicatorMatrix로 대상 티커 지표 계산 (병렬, 입력이 바뀐 티커만)
+    3. 직전 거래일 지표를 as-of 조인으로 한 번에 부착
+    4. 괴리 피처 + 레짐 라벨 추가
     """
     # 데이터 로드
     logger.info("데이터 로드 중...")
-    
-    daily_df = pd.read_parquet(DAILY_PARQUET)
-    daily_df["date"] = pd.to_datetime(daily_df["date"]).dt.date
-    logger.info(f"일봉 데이터: {len(daily_df):,} rows")
-    
+
     d1_df = pd.read_parquet(D1_FEATURES)
     d1_df["target_date"] = pd.to_datetime(d1_df["target_date"]).dt.date
     logger.info(f"D-1 피처: {len(d1_df):,} rows")
-    
+
     # 고유 티커 목록
     unique_tickers = d1_df["ticker"].unique()
     logger.info(f"고유 티커: {len(unique_tickers)}개")
-    
-    # 티커별로 지표 계산
+
+    daily_df = pd.read_parquet(DAILY_PARQUET, filters=[("ticker", "in", list(unique_tickers))])
+    logger.info(f"일봉 데이터: {len(daily_df):,} rows")
+
+    # 지표 계산 (캐시 재사용)
     logger.info("지표 계산 시작...")
-    ticker_indicators = {}
-    
-    for i, ticker in enumerate(unique_tickers):
-        ticker_data = daily_df[daily_df["ticker"] == ticker].copy()
-        
-        if len(ticker_data) >= 30:
-            indicators = calculate_all_indicators(ticker_data)
-            ticker_indicators[ticker] = indicators
-        
-        if (i + 1) % 200 == 0:
-            logger.info(f"진행: {i + 1}/{len(unique_tickers)} 티커")
-    
-    logger.info(f"지표 계산 완료: {len(ticker_indicators)} 티커")
-    
-    # D-1 피처에 지표 병합
-    results = []
-    
-    for idx, row in d1_df.iterrows():
-        ticker = row["ticker"]
-        target_date = row["target_date"]
-        
-        result_row = row.to_dict()
-        
-        # 레짐 라벨 추가
-        result_row["market_regime"] = label_regime(pd.Timestamp(target_date))
-        result_row["day_of_week"] = pd.Timestamp(target_date).dayofweek
-        
-        # 지표 병합
-        if ticker in ticker_indicators:
-            ind_df = ticker_indicators[ticker]
-            
-            # D-1 시점 데이터 찾기
-            d1_data = ind_df[ind_df["date"] < target_date]
-            
-            if len(d1_data) > 0:
-                d1_row = d1_data.iloc[-1]
-                
-                # 지표 컬럼들 추출
-                indicator_cols = [
-                    c for c in d1_row.index 
-                    if c not in ["ticker", "date", "open", "high", "low", "close", "volume"]
-                ]
-                
-                for col in indicator_cols:
-                    val = d1_row[col]
-                    if pd.notna(val):
-                        result_row[col] = float(val)
-        
-        results.append(result_row)
-        
-        if (idx + 1) % 1000 == 0:
-            logger.info(f"병합 진행: {idx + 1}/{len(d1_df)}")
-    
-    df = pd.DataFrame(results)
-    
+    matrix = IndicatorMatrix(INDICATOR_DIR, INDICATORS, min_rows=30)
+    stats = matrix.build(daily_df)
+    logger.info(f"지표 계산 완료: 계산 {stats['computed']}, 재사용 {stats['skipped']:,}")
+
+    # 레짐 라벨 + 요일
+    target_ts = pd.to_datetime(d1_df["target_date"])
+    d1_df["market_regime"] = target_ts.map(label_regime)
+    d1_df["day_of_week"] = target_ts.dt.dayofweek
+
+    # D-1 피처에 지표 병합 (직전 거래일, 한 번의 as-of 조인)
+    df = matrix.attach_as_of(d1_df)
+
     # 괴리 피처 계산
     logger.info("괴리 피처 계산 중...")
     df = calculate_divergence_features(df)
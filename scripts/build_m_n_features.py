@@ -9,11 +9,17 @@ Usage:
 """
 
 import logging
+import os
+import sys
 from datetime import date
 from pathlib import Path
 
 import pandas as pd
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.data.intraday_windows import IntradayWindowExtractor  # noqa: E402
+
 # ==================================================
 # 설정
 # ==================================================
@@ -300,46 +306,26 @@ def get_prev_close(ticker: str, target_date: date, d1_df: pd.DataFrame) -> float
     return None
 
 
-def process_single_ticker(
-    ticker: str, 
-    target_date: date, 
+def compute_m_n_features(
+    day_data: pd.DataFrame,
+    ticker: str,
+    target_date: date,
     label: str,
     price_tier: str,
-    d1_df: pd.DataFrame
+    prev_close: float | None,
 ) -> dict | None:
-    """단일 (ticker, date) M-n 피처 계산."""
-    parquet_path = INTRADAY_DIR / f"{ticker}.parquet"
-    
-    if not parquet_path.exists():
+    """하루치 분봉(_ts 컬럼 포함, 시간순)으로 M-n 피처 계산."""
+    if len(day_data) < 10:
         return None
-    
+
     try:
-        df = pd.read_parquet(parquet_path)
-        
-        # 타임스탬프 변환
-        if str(df["timestamp"].dtype) in ["int64", "float64"]:
-            df["_ts"] = pd.to_datetime(df["timestamp"], unit="ms")
-        else:
-            df["_ts"] = pd.to_datetime(df["timestamp"])
-        
-        df["_date"] = df["_ts"].dt.date
-        
-        # 해당 날짜 필터
-        day_data = df[df["_date"] == target_date].copy()
-        
-        if len(day_data) < 10:
-            return None
-        
         day_data = day_data.sort_values("_ts").reset_index(drop=True)
-        
-        # 전일 종가
-        prev_close = get_prev_close(ticker, target_date, d1_df)
-        
+
         # T0 탐지 (방식 A, B 병렬)
         t0_threshold = detect_t0_threshold(day_data, prev_close) if prev_close else None
         t0_accel = detect_t0_acceleration(day_data)
         t0_fallback = detect_t0_fallback(day_data)
-        
+
         # 결과 구성
         result = {
             "ticker": ticker,
@@ -352,51 +338,85 @@ def process_single_ticker(
             "t0_accel": str(t0_accel) if t0_accel else None,
             "t0_fallback": str(t0_fallback),
         }
-        
+
         # 프리마켓 피처 (5개, 002-02 확장)
         premarket_features = calculate_premarket_features(day_data, target_date, prev_close)
         result.update(premarket_features)
-        
+
         # 윈도우별 피처 (T0 방식 A 기준)
         t0_for_features = t0_threshold or t0_fallback
         for window in WINDOWS:
             window_features = calculate_window_features(day_data, t0_for_features, window)
             result.update(window_features)
-        
+
         return result
-        
+
+    except Exception as e:
+        logger.error(f"{ticker} {target_date} 처리 오류: {e}")
+        return None
+
+
+def _m_n_worker(row: dict, day_data: pd.DataFrame) -> dict | None:
+    """IntradayWindowExtractor 콜백 (병렬 처리용 모듈 레벨 함수)."""
+    prev_close = row.get("prev_close")
+    return compute_m_n_features(
+        day_data,
+        row["ticker"],
+        row["target_date"],
+        row.get("label", "unknown"),
+        row.get("price_tier", "unknown"),
+        None if pd.isna(prev_close) else prev_close,
+    )
+
+
+def process_single_ticker(
+    ticker: str,
+    target_date: date,
+    label: str,
+    price_tier: str,
+    d1_df: pd.DataFrame
+) -> dict | None:
+    """단일 (ticker, date) M-n 피처 계산 (해당 날짜 구간만 읽음)."""
+    extractor = IntradayWindowExtractor(INTRADAY_DIR)
+    if not extractor.path_for(ticker).exists():
+        return None
+
+    try:
+        day_data = extractor.read_days(ticker, [target_date])[target_date]
     except Exception as e:
         logger.error(f"{ticker} {target_date} 처리 오류: {e}")
         return None
 
+    prev_close = get_prev_close(ticker, target_date, d1_df)
+    return compute_m_n_features(day_data, ticker, target_date, label, price_tier, prev_close)
+
 
 def build_m_n_features() -> pd.DataFrame:
-    """M-n 피처 추출 메인."""
+    """
+    M-n 피처 추출 메인.
+
+    [user-043] 타겟을 티커별로 묶어 분봉 파일을 한 번씩만 읽고
+    (필요한 날짜 구간만 필터), 티커 단위로 병렬 처리합니다.
+    """
     targets = load_targets_with_minute_data()
-    
-    # D-1 피처 로드
+
+    # D-1 피처 로드 → 전일 종가를 타겟에 한 번에 조인
     d1_df = pd.read_parquet(D1_FEATURES)
     d1_df["target_date"] = pd.to_datetime(d1_df["target_date"]).dt.date
-    
-    results = []
+    prev_close = (
+        d1_df[["ticker", "target_date", "close_d1"]]
+        .drop_duplicates(subset=["ticker", "target_date"])
+        .rename(columns={"close_d1": "prev_close"})
+    )
+    targets = targets.merge(prev_close, on=["ticker", "target_date"], how="left")
+
     total = len(targets)
-    
+
     logger.info(f"M-n 피처 계산 시작: {total}건")
-    
-    for idx, row in targets.iterrows():
-        ticker = row["ticker"]
-        target_date = row["target_date"]
-        label = row.get("label", "unknown")
-        price_tier = row.get("price_tier", "unknown")
-        
-        result = process_single_ticker(ticker, target_date, label, price_tier, d1_df)
-        
-        if result:
-            results.append(result)
-        
-        if (idx + 1) % 10 == 0:
-            logger.info(f"진행: {idx + 1}/{total}")
-    
+
+    extractor = IntradayWindowExtractor(INTRADAY_DIR)
+    results = [r for r in extractor.map(targets, _m_n_worker) if r]
+
     df = pd.DataFrame(results)
     
     # 통계 출력
@@ -9,16 +9,24 @@ Usage:
 """
 
 import logging
+import os
+import sys
 from datetime import date
 from pathlib import Path
 from typing import NamedTuple
 
 import pandas as pd
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.data.intraday_windows import IntradayWindowExtractor  # noqa: E402
+from backend.data.storage_catalog import StorageCatalog  # noqa: E402
+
 # ==================================================
 # 설정
 # ==================================================
 INTRADAY_DIR = Path("data/parquet/1m")
+CATALOG_DB = INTRADAY_DIR.parent / "_catalog.db"  # [user-044] ParquetManager 카탈로그
 CONTROL_CSV = Path("scripts/control_groups.csv")
 OUTPUT_REPORT = Path("scripts/minute_coverage_report.csv")
 
@@ -68,17 +76,14 @@ def load_control_groups() -> pd.DataFrame:
     return all_pairs
 
 
-def check_intraday_coverage(ticker: str, target_date: date) -> CoverageResult:
+def coverage_from_day(ticker: str, target_date: date, day_data: pd.DataFrame) -> CoverageResult:
     """
-    특정 (ticker, date)의 분봉 데이터 커버리지 확인.
-    
+    하루치 분봉(_ts 컬럼 포함)으로 커버리지 결과 생성.
+
     Returns:
         CoverageResult with has_data, row_count, has_premarket status
     """
-    # 티커 파일 경로 (특수문자 처리: '.'를 파일명에 포함)
-    parquet_path = INTRADAY_DIR / f"{ticker}.parquet"
-    
-    if not parquet_path.exists():
+    if len(day_data) == 0:
         return CoverageResult(
             ticker=ticker,
             target_date=target_date,
@@ -88,118 +93,111 @@ def check_intraday_coverage(ticker: str, target_date: date) -> CoverageResult:
             earliest_time=None,
             latest_time=None,
         )
-    
+
+    # 시간 범위 확인
+    earliest = day_data["_ts"].min()
+    latest = day_data["_ts"].max()
+
+    # 프리마켓 체크: 4:00 AM ~ 9:30 AM ET
+    # ELI5: 정규장 시작(9:30) 전에 데이터가 있으면 프리마켓 데이터 존재
+    earliest_hour = earliest.hour
+    has_premarket = earliest_hour < 9 or (earliest_hour == 9 and earliest.minute < 30)
+
+    return CoverageResult(
+        ticker=ticker,
+        target_date=target_date,
+        has_data=True,
+        row_count=len(day_data),
+        has_premarket=has_premarket,
+        earliest_time=earliest.strftime("%H:%M"),
+        latest_time=latest.strftime("%H:%M"),
+    )
+
+
+def _coverage_worker(row: dict, day_data: pd.DataFrame) -> CoverageResult:
+    """IntradayWindowExtractor 콜백 (병렬 처리용 모듈 레벨 함수)."""
+    return coverage_from_day(row["ticker"], row["date"], day_data)
+
+
+def check_intraday_coverage(ticker: str, target_date: date) -> CoverageResult:
+    """
+    특정 (ticker, date)의 분봉 데이터 커버리지 확인 (단건).
+
+    [user-043] 해당 날짜 구간만 필터로 읽습니다. 전체 체크는 run_coverage_check()가
+    티커별로 묶어 파일을 한 번씩만 읽습니다.
+
+    Returns:
+        CoverageResult with has_data, row_count, has_premarket status
+    """
     try:
-        df = pd.read_parquet(parquet_path)
-        
-        # 컬럼명 확인 및 시간 파싱
-        # ELI5: 분봉 데이터는 보통 'timestamp' 또는 't' 컬럼에 시간 정보가 있음
-        time_col = None
-        for col in ["timestamp", "t", "datetime", "time", "date"]:
-            if col in df.columns:
-                time_col = col
-                break
-        
-        if time_col is None:
-            logger.warning(f"{ticker}: 시간 컬럼 찾을 수 없음. 컬럼: {list(df.columns)}")
-            return CoverageResult(
-                ticker=ticker,
-                target_date=target_date,
-                has_data=False,
-                row_count=0,
-                has_premarket=False,
-                earliest_time=None,
-                latest_time=None,
-            )
-        
-        # 시간 변환
-        # ELI5: timestamp가 유닉스 밀리초(1970년 이후 경과 밀리초) 형식일 수 있음
-        time_values = df[time_col]
-        dtype_str = str(time_values.dtype)
-        if dtype_str in ['int64', 'float64'] and time_values.iloc[0] > 1e12:
-            # 유닉스 밀리초 형식 (숫자가 매우 큰 경우)
-            df["_ts"] = pd.to_datetime(time_values, unit='ms')
-        else:
-            # 일반 datetime 형식
-            df["_ts"] = pd.to_datetime(time_values)
-        df["_date"] = df["_ts"].dt.date
-        
-        # 타겟 날짜 필터링
-        day_data = df[df["_date"] == target_date]
-        
-        if len(day_data) == 0:
-            return CoverageResult(
-                ticker=ticker,
-                target_date=target_date,
-                has_data=False,
-                row_count=0,
-                has_premarket=False,
-                earliest_time=None,
-                latest_time=None,
-            )
-        
-        # 시간 범위 확인
-        earliest = day_data["_ts"].min()
-        latest = day_data["_ts"].max()
-        
-        # 프리마켓 체크: 4:00 AM ~ 9:30 AM ET
-        # ELI5: 정규장 시작(9:30) 전에 데이터가 있으면 프리마켓 데이터 존재
-        earliest_hour = earliest.hour
-        has_premarket = earliest_hour < 9 or (earliest_hour == 9 and earliest.minute < 30)
-        
-        return CoverageResult(
+        day_data = IntradayWindowExtractor(INTRADAY_DIR).read_days(ticker, [target_date])[target_date]
+    except Exception as e:
+        logger.error(f"{ticker} 처리 중 오류: {e}")
+        day_data = pd.DataFrame()
+    return coverage_from_day(ticker, target_date, day_data)
+
+
+def coverage_from_catalog(pairs: pd.DataFrame, catalog: StorageCatalog) -> list[CoverageResult]:
+    """
+    [user-044] 카탈로그의 일자별 봉 정보로 커버리지 결과 생성 (분봉 파일 읽기 없음).
+
+    Returns:
+        pairs 행 순서대로 CoverageResult 리스트
+    """
+    keys = [(t, d.isoformat()) for t, d in zip(pairs["ticker"], pairs["date"])]
+    found = catalog.coverage(keys, "1m")
+
+    results = []
+    for (ticker, day), target_date in zip(keys, pairs["date"]):
+        if (ticker, day) not in found:
+            results.append(coverage_from_day(ticker, target_date, pd.DataFrame()))
+            continue
+        bars, first_ts, last_ts = found[(ticker, day)]
+        earliest = pd.to_datetime(first_ts, unit="ms")
+        latest = pd.to_datetime(last_ts, unit="ms")
+        results.append(CoverageResult(
             ticker=ticker,
             target_date=target_date,
             has_data=True,
-            row_count=len(day_data),
-            has_premarket=has_premarket,
+            row_count=bars,
+            has_premarket=earliest.hour < 9 or (earliest.hour == 9 and earliest.minute < 30),
             earliest_time=earliest.strftime("%H:%M"),
             latest_time=latest.strftime("%H:%M"),
-        )
-        
-    except Exception as e:
-        logger.error(f"{ticker} 처리 중 오류: {e}")
-        return CoverageResult(
-            ticker=ticker,
-            target_date=target_date,
-            has_data=False,
-            row_count=0,
-            has_premarket=False,
-            earliest_time=None,
-            latest_time=None,
-        )
+        ))
+    return results
 
 
 def run_coverage_check() -> pd.DataFrame:
     """
     전체 커버리지 체크 실행.
-    
+
+    [user-043] 티커별로 분봉 파일을 한 번씩만 읽고 티커 단위로 병렬 처리.
+    [user-044] 카탈로그가 있으면 인덱스 조회만으로 처리.
+
     Returns:
         커버리지 리포트 DataFrame
     """
     pairs = load_control_groups()
-    results: list[CoverageResult] = []
-    
+
     total = len(pairs)
     logger.info(f"커버리지 체크 시작: {total}건")
-    
-    for idx, row in pairs.iterrows():
-        ticker = row["ticker"]
-        target_date = row["date"]
-        
-        result = check_intraday_coverage(ticker, target_date)
-        results.append(result)
-        
-        if (idx + 1) % 500 == 0:
-            logger.info(f"진행: {idx + 1}/{total}")
-    
+
+    # 구축 완료 + 1m 폴더에 외부 변경 없음일 때만 카탈로그 신뢰
+    catalog = StorageCatalog(CATALOG_DB) if CATALOG_DB.exists() else None
+    if catalog is not None and catalog.complete and catalog.is_dir_fresh(INTRADAY_DIR, "1m"):
+        logger.info(f"카탈로그 조회: {CATALOG_DB}")
+        results = coverage_from_catalog(pairs, catalog)
+    else:
+        extractor = IntradayWindowExtractor(INTRADAY_DIR)
+        results = extractor.map(pairs, _coverage_worker, date_col="date")
+
     # 결과 DataFrame 생성
     df = pd.DataFrame(results)
-    
+
     # 통계 출력
     has_data_count = df["has_data"].sum()
     has_premarket_count = df["has_premarket"].sum()
-    
+
     logger.info("=" * 60)
     logger.info("커버리지 리포트")
     logger.info("=" * 60)
@@ -207,7 +205,7 @@ def run_coverage_check() -> pd.DataFrame:
     logger.info(f"분봉 데이터 존재: {has_data_count} ({100 * has_data_count / total:.1f}%)")
     logger.info(f"프리마켓 데이터 포함: {has_premarket_count} ({100 * has_premarket_count / total:.1f}%)")
     logger.info(f"누락: {total - has_data_count}")
-    
+
     return df
 
 
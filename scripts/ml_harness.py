@@ -0,0 +1,453 @@
+"""
+R-4 학습 하네스: 캐시된 학습 행렬 + 병렬 Walk-Forward CV + 하이퍼파라미터 탐색
+
+train_xgboost.py에서 사용. 피처를 고칠 때마다 parquet 재병합과 직렬 학습을
+기다리지 않도록:
+- D-1/M-n 병합 결과를 바이너리 행렬(.npy)로 캐시, 원본이 바뀔 때만 재생성
+- 날짜 기준 walk-forward fold (같은 날짜가 train/test에 동시에 들어가지 않음)
+- (trial × fold) 작업을 프로세스 풀에서 병렬 실행 (워커는 행렬을 mmap으로 1회 로드)
+- 실험 로그(JSONL)에 trial/fold별 지표와 소요 시간 기록
+
+Usage:
+    matrix = load_training_matrix(build_fn, sources=[D1_EXTENDED, M_N_FEATURES])
+    folds = walk_forward_folds(matrix.dates, n_splits=5)
+    trials = sample_params(MODEL_PARAMS, PARAM_SPACE, n_trials=20)
+    record = run_search(matrix, trials, folds)
+    record["best"]["params"]
+
+Output:
+    scripts/cache/r4_matrix/   - X.npy, y.npy, dates.npy, meta.json
+    scripts/experiments.jsonl  - 실행 1회당 1줄
+"""
+
+import hashlib
+import json
+import logging
+import os
+import random
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterable, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+# ==================================================
+# 설정
+# ==================================================
+DEFAULT_CACHE_DIR = Path("scripts/cache/r4_matrix")
+DEFAULT_EXPERIMENT_LOG = Path("scripts/experiments.jsonl")
+
+# 캐시 형식이 바뀌면 올려서 기존 캐시 무효화
+CACHE_VERSION = 1
+
+# 탐색 공간 (trial은 이 격자에서 중복 없이 무작위 추출)
+PARAM_SPACE: dict[str, list] = {
+    "n_estimators": [100, 200, 400],
+    "max_depth": [3, 4, 6, 8],
+    "learning_rate": [0.03, 0.05, 0.1, 0.2],
+    "min_child_weight": [1, 5, 10],
+    "subsample": [0.7, 0.85, 1.0],
+    "colsample_bytree": [0.6, 0.8, 1.0],
+    "reg_alpha": [0.0, 0.1, 1.0],
+    "reg_lambda": [1.0, 5.0],
+}
+
+logger = logging.getLogger(__name__)
+
+
+# ==================================================
+# 학습 행렬 캐시
+# ==================================================
+
+@dataclass
+class TrainingMatrix:
+    """
+    날짜순 정렬된 학습 행렬.
+
+    ELI5: 매번 parquet 여러 개를 읽고 합치는 대신,
+          합친 결과를 숫자 배열 그대로 디스크에 저장해 두고 바로 꺼내 씁니다.
+    """
+
+    X: np.ndarray  # float32 (n_samples, n_features)
+    y: np.ndarray  # int8 (n_samples,)
+    dates: np.ndarray  # datetime64[D] (n_samples,), 오름차순
+    feature_names: list[str]
+    path: Path
+    signature: str
+
+    def __len__(self) -> int:
+        return len(self.y)
+
+    def frame(self) -> pd.DataFrame:
+        """피처 이름이 붙은 DataFrame (최종 학습/SHAP용)"""
+        return pd.DataFrame(np.asarray(self.X), columns=self.feature_names)
+
+
+def _signature(sources: Iterable[Path], extra: Optional[dict]) -> str:
+    """원본 파일 경로/mtime/크기 + 전처리 설정 해시"""
+    parts = []
+    for src in sources:
+        src = Path(src)
+        if src.exists():
+            stat = src.stat()
+            parts.append([str(src), stat.st_mtime, stat.st_size])
+    payload = json.dumps(
+        {"version": CACHE_VERSION, "sources": parts, "extra": extra or {}},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _open_arrays(path: Path, mmap: bool) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    mode = "r" if mmap else None
+    return (
+        np.load(path / "X.npy", mmap_mode=mode),
+        np.load(path / "y.npy", mmap_mode=mode),
+        np.load(path / "dates.npy"),
+    )
+
+
+def load_training_matrix(
+    build: Callable[[], tuple[pd.DataFrame, pd.Series, pd.Series]],
+    sources: Iterable[Path],
+    cache_dir: Path = DEFAULT_CACHE_DIR,
+    extra: Optional[dict] = None,
+    rebuild: bool = False,
+) -> TrainingMatrix:
+    """
+    캐시된 학습 행렬 로드 (원본이 바뀌었거나 rebuild=True면 build()로 재생성).
+
+    Args:
+        build: (X, y, dates) 반환 함수 (parquet 로드 + 병합 + 전처리)
+        sources: 원본 파일 목록 (mtime/크기로 캐시 유효성 판정)
+        cache_dir: 캐시 디렉터리
+        extra: 캐시 키에 포함할 전처리 설정 (제외 컬럼 등)
+        rebuild: True면 캐시 무시
+
+    Returns:
+        TrainingMatrix (날짜 오름차순)
+    """
+    cache_dir = Path(cache_dir)
+    sources = list(sources)
+    signature = _signature(sources, extra)
+    meta_path = cache_dir / "meta.json"
+
+    if not rebuild and meta_path.exists():
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        if meta.get("signature") == signature:
+            X, y, dates = _open_arrays(cache_dir, mmap=False)
+            logger.info(f"학습 행렬 캐시 사용: {cache_dir} ({X.shape[0]:,} x {X.shape[1]})")
+            return TrainingMatrix(X, y, dates, meta["feature_names"], cache_dir, signature)
+
+    start = time.perf_counter()
+    X_df, y_s, date_s = build()
+    dates = pd.to_datetime(pd.Series(date_s).to_numpy()).to_numpy().astype("datetime64[D]")
+    order = np.argsort(dates, kind="stable")
+    X = X_df.to_numpy(dtype=np.float32)[order]
+    y = y_s.to_numpy(dtype=np.int8)[order]
+    dates = dates[order]
+    feature_names = [str(c) for c in X_df.columns]
+
+    # 임시 디렉터리에 쓴 뒤 교체 (중간 실패 시 기존 캐시 유지)
+    tmp = cache_dir.with_name(cache_dir.name + ".tmp")
+    if tmp.exists():
+        shutil.rmtree(tmp)
+    tmp.mkdir(parents=True)
+    np.save(tmp / "X.npy", X)
+    np.save(tmp / "y.npy", y)
+    np.save(tmp / "dates.npy", dates)
+    meta = {
+        "signature": signature,
+        "feature_names": feature_names,
+        "n_samples": int(len(y)),
+        "built_at": datetime.now().isoformat(timespec="seconds"),
+    }
+    (tmp / "meta.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    if cache_dir.exists():
+        shutil.rmtree(cache_dir)
+    tmp.rename(cache_dir)
+
+    logger.info(
+        f"학습 행렬 캐시 생성: {cache_dir} ({X.shape[0]:,} x {X.shape[1]}, "
+        f"{time.perf_counter() - start:.1f}초)"
+    )
+    return TrainingMatrix(X, y, dates, feature_names, cache_dir, signature)
+
+
+# ==================================================
+# Walk-Forward Fold
+# ==================================================
+
+class Fold(NamedTuple):
+    """
+    날짜순 행렬에서의 연속 구간.
+
+    train = [0, train_end), test = [train_end, test_end)
+    """
+    index: int
+    train_end: int
+    test_end: int
+    test_from: str
+    test_to: str
+
+
+def walk_forward_folds(dates: np.ndarray, n_splits: int = 5) -> list[Fold]:
+    """
+    날짜 기준 확장형 walk-forward fold.
+
+    ELI5:
+    - 거래일을 (n_splits + 1)개 구간으로 나눔
+    - k번째 fold: 앞의 k개 구간으로 학습 → 다음 구간으로 평가
+    - 같은 날짜의 Daygainer/Control은 항상 같은 쪽에 들어감 (미래 정보 누수 없음)
+
+    Args:
+        dates: 오름차순 정렬된 날짜 배열
+        n_splits: fold 수
+
+    Returns:
+        list[Fold]
+    """
+    unique = np.unique(dates)
+    if len(unique) < n_splits + 1:
+        raise ValueError(f"거래일 {len(unique)}개로 {n_splits}개 fold 불가")
+
+    blocks = np.array_split(unique, n_splits + 1)
+    folds = []
+    for k, block in enumerate(blocks[1:]):
+        train_end = int(np.searchsorted(dates, block[0], side="left"))
+        test_end = int(np.searchsorted(dates, block[-1], side="right"))
+        folds.append(Fold(k, train_end, test_end, str(block[0]), str(block[-1])))
+    return folds
+
+
+# ==================================================
+# 하이퍼파라미터 탐색 공간
+# ==================================================
+
+def sample_params(
+    base: dict,
+    space: dict[str, list] = PARAM_SPACE,
+    n_trials: int = 1,
+    seed: int = 42,
+) -> list[dict]:
+    """
+    기본 파라미터 + 격자에서 중복 없이 무작위 추출 (최대 n_trials개).
+
+    Args:
+        base: 기본 파라미터 (trial 0, 추출값은 이 위에 덮어씀)
+        space: 파라미터 → 후보 목록
+        n_trials: 기본 포함 총 trial 수 (격자 크기로 상한)
+        seed: 재현용 시드
+
+    Returns:
+        list[dict]
+    """
+    rng = random.Random(seed)
+    keys = sorted(space)
+    grid_size = int(np.prod([len(space[k]) for k in keys])) if keys else 0
+    n_trials = min(n_trials, grid_size + 1)
+
+    trials = [dict(base)]
+    seen = set()
+    while len(trials) < n_trials:
+        combo = tuple(rng.choice(space[k]) for k in keys)
+        if combo in seen:
+            continue
+        seen.add(combo)
+        trials.append({**base, **dict(zip(keys, combo))})
+    return trials
+
+
+# ==================================================
+# 지표
+# ==================================================
+
+def roc_auc(y: np.ndarray, p: np.ndarray) -> Optional[float]:
+    """ROC AUC (Mann-Whitney 순위 공식, 동점은 평균 순위). 한 클래스뿐이면 None"""
+    y = np.asarray(y)
+    pos = y == 1
+    n_pos = int(pos.sum())
+    n_neg = len(y) - n_pos
+    if n_pos == 0 or n_neg == 0:
+        return None
+    ranks = pd.Series(np.asarray(p)).rank(method="average").to_numpy()
+    return float((ranks[pos].sum() - n_pos * (n_pos + 1) / 2) / (n_pos * n_neg))
+
+
+def log_loss(y: np.ndarray, p: np.ndarray) -> float:
+    p = np.clip(np.asarray(p, dtype="float64"), 1e-15, 1 - 1e-15)
+    y = np.asarray(y, dtype="float64")
+    return float(-np.mean(y * np.log(p) + (1 - y) * np.log(1 - p)))
+
+
+# ==================================================
+# 병렬 Fold 실행 (ProcessPoolExecutor 워커)
+# ==================================================
+
+def xgb_factory(params: dict, n_jobs: int) -> Any:
+    """워커 모델 생성 (모듈 레벨: pickle 호환, xgboost는 워커에서 임포트)"""
+    from xgboost import XGBClassifier
+
+    return XGBClassifier(**{**params, "n_jobs": n_jobs})
+
+
+# 워커 프로세스당 1회 로드 (mmap → 프로세스 간 페이지 캐시 공유)
+_worker_arrays: Optional[tuple[np.ndarray, np.ndarray]] = None
+
+
+def _init_worker(path: str) -> None:
+    global _worker_arrays
+    X, y, _ = _open_arrays(Path(path), mmap=True)
+    _worker_arrays = (X, y)
+
+
+def _run_fold(task: dict) -> dict:
+    """(trial, fold) 1개 학습/평가"""
+    X, y = _worker_arrays
+    fold: Fold = task["fold"]
+
+    start = time.perf_counter()
+    model = task["factory"](task["params"], task["n_jobs"])
+    model.fit(X[: fold.train_end], y[: fold.train_end])
+    fit_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    y_test = np.asarray(y[fold.train_end : fold.test_end])
+    proba = model.predict_proba(X[fold.train_end : fold.test_end])[:, 1]
+    predict_s = time.perf_counter() - start
+
+    return {
+        "trial": task["trial"],
+        "fold": fold.index,
+        "test_from": fold.test_from,
+        "test_to": fold.test_to,
+        "n_train": fold.train_end,
+        "n_test": fold.test_end - fold.train_end,
+        "n_test_positive": int(y_test.sum()),
+        "auc": roc_auc(y_test, proba),
+        "logloss": log_loss(y_test, proba),
+        "fit_s": round(fit_s, 3),
+        "predict_s": round(predict_s, 3),
+        "pid": os.getpid(),
+    }
+
+
+def _summarize(trial: int, params: dict, fold_results: list[dict]) -> dict:
+    aucs = [r["auc"] for r in fold_results if r["auc"] is not None]
+    return {
+        "trial": trial,
+        "params": params,
+        "auc_mean": float(np.mean(aucs)) if aucs else None,
+        "auc_std": float(np.std(aucs)) if aucs else None,
+        "logloss_mean": float(np.mean([r["logloss"] for r in fold_results])),
+        "fit_s_total": round(sum(r["fit_s"] for r in fold_results), 3),
+        "folds": sorted(fold_results, key=lambda r: r["fold"]),
+    }
+
+
+def run_search(
+    matrix: TrainingMatrix,
+    trials: list[dict],
+    folds: list[Fold],
+    workers: Optional[int] = None,
+    factory: Callable[[dict, int], Any] = xgb_factory,
+    log_path: Optional[Path] = DEFAULT_EXPERIMENT_LOG,
+    tag: str = "",
+) -> dict:
+    """
+    모든 (trial × fold)를 프로세스 풀에서 병렬 학습/평가 후 실험 로그 기록.
+
+    ELI5:
+    - 파라미터 조합 N개 × fold K개 = N·K개의 독립 작업
+    - CPU 코어마다 워커 1개, 워커 안의 XGBoost 스레드 수는 코어/워커로 나눠 과할당 방지
+    - 가장 좋은 평균 AUC의 조합을 best로 반환
+
+    Args:
+        matrix: load_training_matrix() 결과 (워커가 같은 캐시 파일을 mmap)
+        trials: 파라미터 목록 (sample_params)
+        folds: walk_forward_folds() 결과
+        workers: 워커 수 (None = CPU 코어 수, 1 = 현재 프로세스에서 실행)
+        factory: (params, n_jobs) → fit/predict_proba 가능한 모델 (모듈 레벨 함수)
+        log_path: 실험 로그 JSONL 경로 (None이면 기록 안 함)
+        tag: 실험 메모 (로그에 기록)
+
+    Returns:
+        실험 기록 dict (trials, best, 소요 시간 ...)
+    """
+    started_at = datetime.now()
+    wall_start = time.perf_counter()
+    tasks = [
+        {"trial": i, "fold": fold, "params": params, "factory": factory}
+        for i, params in enumerate(trials)
+        for fold in folds
+    ]
+    cpu = os.cpu_count() or 1
+    workers = max(1, min(workers or cpu, len(tasks)))
+    n_jobs = max(1, cpu // workers)
+    for task in tasks:
+        task["n_jobs"] = n_jobs
+
+    logger.info(
+        f"CV 시작: trial {len(trials)}개 × fold {len(folds)}개 = {len(tasks)}개 작업 "
+        f"(워커 {workers}, 워커당 스레드 {n_jobs})"
+    )
+
+    results: list[dict] = []
+    if workers == 1:
+        _init_worker(str(matrix.path))
+        for task in tasks:
+            results.append(_run_fold(task))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(str(matrix.path),)
+        ) as pool:
+            futures = [pool.submit(_run_fold, task) for task in tasks]
+            for done, future in enumerate(as_completed(futures), 1):
+                r = future.result()
+                results.append(r)
+                logger.info(
+                    f"  [{done}/{len(tasks)}] trial {r['trial']} fold {r['fold']}: "
+                    f"AUC={r['auc'] if r['auc'] is None else round(r['auc'], 3)} ({r['fit_s']:.1f}초)"
+                )
+
+    summaries = [
+        _summarize(i, params, [r for r in results if r["trial"] == i])
+        for i, params in enumerate(trials)
+    ]
+    ranked = [s for s in summaries if s["auc_mean"] is not None]
+    best = max(ranked, key=lambda s: s["auc_mean"]) if ranked else summaries[0]
+    wall_s = time.perf_counter() - wall_start
+
+    record = {
+        "run_id": started_at.strftime("%Y%m%d-%H%M%S"),
+        "started_at": started_at.isoformat(timespec="seconds"),
+        "tag": tag,
+        "wall_s": round(wall_s, 3),
+        "workers": workers,
+        "n_jobs_per_worker": n_jobs,
+        "matrix": {
+            "path": str(matrix.path),
+            "signature": matrix.signature,
+            "n_samples": len(matrix),
+            "n_features": len(matrix.feature_names),
+        },
+        "folds": [f._asdict() for f in folds],
+        "trials": summaries,
+        "best": {k: best[k] for k in ("trial", "params", "auc_mean", "auc_std")},
+    }
+
+    if log_path is not None:
+        log_path = Path(log_path)
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, default=str) + "\n")
+
+    auc = "n/a" if best["auc_mean"] is None else f"{best['auc_mean']:.3f} ± {best['auc_std']:.3f}"
+    logger.info(f"CV 완료: best trial {best['trial']} AUC {auc} ({wall_s:.1f}초)")
+    return record
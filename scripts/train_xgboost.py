@@ -4,17 +4,28 @@ R-4 Phase E Step 3: XGBoost + SHAP 분석
 D-1 + M-n 통합 피처셋으로 XGBoost 분류기 학습 후 SHAP로 유의미 피처 도출.
 스캐너 필터 조건 발굴이 목표.
 
+병렬 walk-forward CV / 하이퍼파라미터 탐색 / 학습 행렬 캐시는 scripts/ml_harness.py.
+
 Usage:
-    python scripts/train_xgboost.py
+    python scripts/train_xgboost.py                    # 기본 파라미터, 5-fold
+    python scripts/train_xgboost.py --trials 30        # 탐색 (기본 포함 30개 조합)
+    python scripts/train_xgboost.py --skip-shap --tag "gap 피처 추가"
+    python scripts/train_xgboost.py --rebuild-cache    # 피처 parquet 재병합 강제
 
 Output:
     scripts/feature_importance.csv  - SHAP 기반 피처 랭킹
     scripts/shap_summary.png        - SHAP Summary Plot
     scripts/ml_report.json          - CV 점수, AUC, 모델 파라미터
+    scripts/xgb_scanner.json        - 스캐너 서빙용 부스터 (backend/core/gainer_model.py)
+    scripts/experiments.jsonl       - 실험 로그 (trial/fold별 지표, 소요 시간)
+    scripts/cache/r4_matrix/        - 병합된 학습 행렬 캐시
 """
 
+import argparse
 import json
 import logging
+import os
+import sys
 from pathlib import Path
 
 import pandas as pd
@@ -22,20 +33,25 @@ import numpy as np
 
 # ML 라이브러리 임포트
 try:
-    from xgboost import XGBClassifier
+    from xgboost import DMatrix, XGBClassifier
 except ImportError:
     print("xgboost 설치 필요: pip install xgboost")
     raise
 
-try:
-    import shap
-except ImportError:
-    print("shap 설치 필요: pip install shap")
-    raise
-
-from sklearn.model_selection import cross_val_score, TimeSeriesSplit
 from sklearn.metrics import roc_auc_score
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.data.feature_store import FEATURE_COLUMNS  # noqa: E402
+from scripts.ml_harness import (  # noqa: E402
+    PARAM_SPACE,
+    TrainingMatrix,
+    load_training_matrix,
+    run_search,
+    sample_params,
+    walk_forward_folds,
+)
+
 # ==================================================
 # 설정
 # ==================================================
@@ -45,6 +61,20 @@ M_N_FEATURES = Path("scripts/m_n_features.parquet")
 OUTPUT_IMPORTANCE = Path("scripts/feature_importance.csv")
 OUTPUT_PLOT = Path("scripts/shap_summary.png")
 OUTPUT_REPORT = Path("scripts/ml_report.json")
+OUTPUT_SCANNER_MODEL = Path("scripts/xgb_scanner.json")
+
+# 모델 하이퍼파라미터 (002-02 합의: L1/L2 정규화에 의존)
+MODEL_PARAMS = dict(
+    n_estimators=100,
+    max_depth=6,
+    learning_rate=0.1,
+    reg_alpha=0.1,    # L1 정규화
+    reg_lambda=1.0,   # L2 정규화
+    random_state=42,
+    n_jobs=-1,
+    use_label_encoder=False,
+    eval_metric="logloss",
+)
 
 # 제외할 컬럼 (피처가 아닌 메타데이터)
 EXCLUDE_COLS = [
@@ -146,74 +176,118 @@ def prepare_features(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.Series, list]:
     return X, y, feature_cols
 
 
+def build_training_data() -> tuple[pd.DataFrame, pd.Series, pd.Series]:
+    """
+    학습 행렬 캐시 생성용: parquet 로드 + 병합 + 전처리 ([user-050]).
+
+    Returns:
+        (X, y, target_date) - 같은 행 순서
+    """
+    df = load_and_merge_features()
+    X, y, _ = prepare_features(df)
+    return X, y, df["target_date"]
+
+
+def load_matrix(rebuild: bool = False) -> TrainingMatrix:
+    """
+    병합된 학습 행렬 (원본 parquet 또는 제외 컬럼이 바뀔 때만 재병합).
+
+    ELI5: 피처 파일이 그대로면 지난번에 합쳐 둔 숫자 배열을 바로 씀
+    """
+    return load_training_matrix(
+        build_training_data,
+        sources=[D1_EXTENDED, D1_BASIC, M_N_FEATURES],
+        extra={"exclude_cols": EXCLUDE_COLS, "missing": -999},
+        rebuild=rebuild,
+    )
+
+
 # ==================================================
 # 모델 학습
 # ==================================================
 
 def train_xgboost(
-    X: pd.DataFrame, 
-    y: pd.Series,
-    cv_splits: int = 5
+    matrix: TrainingMatrix,
+    cv_splits: int = 5,
+    n_trials: int = 1,
+    workers: int | None = None,
+    tag: str = "",
 ) -> tuple[XGBClassifier, dict]:
     """
-    XGBoost 분류기 학습 + CV 평가.
-    
+    병렬 walk-forward CV (+ 하이퍼파라미터 탐색) 후 best 파라미터로 전체 학습.
+
     ELI5:
-    - XGBoost는 트리 기반 ML로 피처 중요도 자동 추출
-    - 5-Fold CV로 과적합 여부 확인
+    - 날짜순으로 "과거로 학습 → 다음 구간으로 평가"를 cv_splits번 반복
+    - 파라미터 조합 × fold를 CPU 코어 수만큼 동시에 학습
+    - 평균 AUC가 가장 높은 조합으로 전체 데이터 재학습
     - AUC 0.6 이상이면 "랜덤보다 유의미"
+
+    📌 [user-050] 기존 TimeSeriesSplit은 행 순서(라벨별로 묶여 있음) 기준이라
+       fold에 한 클래스만 들어가 CV AUC가 NaN이었음 → 날짜 기준 fold로 교체
     """
-    logger.info("XGBoost 학습 시작...")
-    
-    # 모델 정의 (002-02 합의: L1/L2 정규화에 의존)
-    model = XGBClassifier(
-        n_estimators=100,
-        max_depth=6,
-        learning_rate=0.1,
-        reg_alpha=0.1,    # L1 정규화
-        reg_lambda=1.0,   # L2 정규화
-        random_state=42,
-        n_jobs=-1,
-        use_label_encoder=False,
-        eval_metric="logloss",
-    )
-    
-    # TimeSeriesSplit CV (시간순 분할)
-    tscv = TimeSeriesSplit(n_splits=cv_splits)
-    
-    # Cross-validation
-    cv_scores = cross_val_score(
-        model, X, y, 
-        cv=tscv, 
-        scoring="roc_auc",
-        n_jobs=-1
-    )
-    
-    logger.info(f"CV AUC: {cv_scores.mean():.3f} ± {cv_scores.std():.3f}")
-    logger.info(f"CV 점수: {[f'{s:.3f}' for s in cv_scores]}")
-    
+    folds = walk_forward_folds(matrix.dates, n_splits=cv_splits)
+    trials = sample_params(MODEL_PARAMS, PARAM_SPACE, n_trials=n_trials)
+    search = run_search(matrix, trials, folds, workers=workers, tag=tag)
+    best = search["trials"][search["best"]["trial"]]
+
+    logger.info(f"CV AUC (best trial {best['trial']}): {best['auc_mean']} ± {best['auc_std']}")
+    logger.info(f"Best 파라미터: {best['params']}")
+
     # 전체 데이터로 학습
+    X = matrix.frame()
+    y = pd.Series(matrix.y, dtype=int)
+    model = XGBClassifier(**best["params"])
     model.fit(X, y)
-    
+
     # 학습 데이터 AUC
     y_pred = model.predict_proba(X)[:, 1]
     train_auc = roc_auc_score(y, y_pred)
     logger.info(f"Train AUC: {train_auc:.3f}")
-    
+
     results = {
-        "cv_auc_mean": float(cv_scores.mean()),
-        "cv_auc_std": float(cv_scores.std()),
-        "cv_scores": [float(s) for s in cv_scores],
+        "cv_auc_mean": best["auc_mean"],
+        "cv_auc_std": best["auc_std"],
+        "cv_scores": [f["auc"] for f in best["folds"]],
         "train_auc": float(train_auc),
         "n_features": len(X.columns),
         "n_samples": len(X),
         "n_positive": int(y.sum()),
         "n_negative": int(len(y) - y.sum()),
+        "best_params": best["params"],
+        "experiment_run_id": search["run_id"],
+        "cv_wall_s": search["wall_s"],
     }
-    
+
     return model, results
 
 
+def train_scanner_model(X: pd.DataFrame, y: pd.Series, params: dict = MODEL_PARAMS) -> dict:
+    """
+    스캐너 서빙용 모델 학습 + 저장 ([user-049]).
+
+    ELI5:
+    - 분석 모델은 분봉(M-n)/보조지표 피처까지 쓰지만, 장 시작 전 스캐너는
+      저장된 일봉만 가지고 있음
+    - 일봉으로 계산 가능한 D-1 피처(FEATURE_COLUMNS)만으로 다시 학습해
+      서빙 시 피처가 학습과 똑같이 만들어지도록 함 (결측 -999도 동일)
+    - 부스터 JSON에 피처 이름/순서가 함께 저장됨 → GainerModel이 그대로 로드
+    """
+    cols = [c for c in FEATURE_COLUMNS if c in X.columns]
+    model = XGBClassifier(**params)
+    model.fit(X[cols], y)
+    model.get_booster().save_model(str(OUTPUT_SCANNER_MODEL))
+
+    train_auc = roc_auc_score(y, model.predict_proba(X[cols])[:, 1])
+    logger.info(
+        f"스캐너 모델 저장: {OUTPUT_SCANNER_MODEL} ({len(cols)}개 피처, Train AUC {train_auc:.3f})"
+    )
+    return {
+        "path": str(OUTPUT_SCANNER_MODEL),
+        "features": cols,
+        "train_auc": float(train_auc),
+    }
+
+
 # ==================================================
 # SHAP 분석
 # ==================================================
@@ -233,9 +307,10 @@ def analyze_shap(
     """
     logger.info("SHAP 분석 시작...")
     
-    # TreeExplainer (XGBoost에 최적화)
-    explainer = shap.TreeExplainer(model)
-    shap_values = explainer.shap_values(X)
+    # [user-050] XGBoost 내장 TreeSHAP (pred_contribs, 멀티스레드)
+    # shap.TreeExplainer와 같은 값, 마지막 열은 bias라 제외
+    contribs = model.get_booster().predict(DMatrix(X), pred_contribs=True)
+    shap_values = contribs[:, :-1]
     
     # 피처별 평균 SHAP (절대값)
     # ELI5: 각 피처가 평균적으로 얼마나 영향을 줬는지
@@ -254,8 +329,9 @@ def analyze_shap(
     for _, row in importance_df.head(top_k).iterrows():
         print(f"  {row['rank']:3d}. {row['feature']:40s} SHAP={row['mean_abs_shap']:.4f}")
     
-    # SHAP Summary Plot 저장
+    # SHAP Summary Plot 저장 (shap 패키지는 플롯에만 사용)
     try:
+        import shap
         import matplotlib
         matplotlib.use("Agg")  # 백엔드 설정
         import matplotlib.pyplot as plt
@@ -281,25 +357,40 @@ def analyze_shap(
 # 메인
 # ==================================================
 
-def main() -> None:
+def main(args: argparse.Namespace) -> None:
     """메인 실행."""
     logger.info("=" * 60)
     logger.info("R-4 Phase E Step 3: XGBoost + SHAP 분석")
     logger.info("=" * 60)
     
-    # 데이터 로드
-    df = load_and_merge_features()
-    
-    # 피처 준비
-    X, y, feature_cols = prepare_features(df)
+    # 학습 행렬 (캐시 우선, 원본 변경 시에만 parquet 재병합)
+    matrix = load_matrix(rebuild=args.rebuild_cache)
     
-    if len(X) < 100:
-        logger.error(f"샘플 부족: {len(X)}건 (최소 100건 필요)")
+    if len(matrix) < 100:
+        logger.error(f"샘플 부족: {len(matrix)}건 (최소 100건 필요)")
         return
     
-    # XGBoost 학습
-    model, results = train_xgboost(X, y)
+    # 병렬 CV + 탐색 → best 파라미터로 XGBoost 학습
+    model, results = train_xgboost(
+        matrix,
+        cv_splits=args.folds,
+        n_trials=args.trials,
+        workers=args.workers,
+        tag=args.tag,
+    )
+    X = matrix.frame()
+    y = pd.Series(matrix.y, dtype=int)
     
+    # 스캐너 서빙 모델 (일봉 D-1 피처만, best 파라미터)
+    scanner_model = train_scanner_model(X, y, params=results["best_params"])
+
+    if args.skip_shap:
+        logger.info("SHAP 생략 (--skip-shap)")
+        with open(OUTPUT_REPORT, "w") as f:
+            json.dump({**results, "scanner_model": scanner_model}, f, indent=2)
+        logger.info(f"ML 리포트 저장: {OUTPUT_REPORT}")
+        return
+
     # SHAP 분석
     importance_df = analyze_shap(model, X, top_k=30)
     
@@ -312,24 +403,17 @@ def main() -> None:
         **results,
         "top_20_features": importance_df.head(20)["feature"].tolist(),
         "model_params": model.get_params(),
+        "scanner_model": scanner_model,
     }
     with open(OUTPUT_REPORT, "w") as f:
         json.dump(report, f, indent=2)
     logger.info(f"ML 리포트 저장: {OUTPUT_REPORT}")
     
-    # 스캐너 필터 조건 제안
-    logger.info("\n" + "=" * 60)
-    logger.info("스캐너 필터 조건 제안 (상위 5개 피처)")
-    logger.info("=" * 60)
-    top_5 = importance_df.head(5)["feature"].tolist()
-    print(f"""
-# 예시 스캐너 필터 (실제 임계값은 EDA 필요)
-def scanner_filter(features):
-    return (
-        features['{top_5[0]}'] > X['{top_5[0]}'].quantile(0.75) and
-        features['{top_5[1]}'] > X['{top_5[1]}'].quantile(0.75)
+    # 스캐너 연동: 필터 조건을 손으로 옮기지 않고 저장된 부스터를 서빙
+    # (backend/core/gainer_model.py → Scanner/RealtimeScanner의 ml_prob)
+    logger.info(
+        f"스캐너 연동: {OUTPUT_SCANNER_MODEL} → GainerModel (server_config.yaml scanner.model_path)"
     )
-""")
     
     logger.info("=" * 60)
     logger.info("완료")
@@ -337,4 +421,11 @@ def scanner_filter(features):
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--folds", type=int, default=5, help="walk-forward fold 수")
+    parser.add_argument("--trials", type=int, default=1, help="탐색 조합 수 (기본 파라미터 포함)")
+    parser.add_argument("--workers", type=int, default=None, help="CV 워커 프로세스 수")
+    parser.add_argument("--rebuild-cache", action="store_true", help="학습 행렬 캐시 재생성")
+    parser.add_argument("--skip-shap", action="store_true", help="SHAP 분석 생략")
+    parser.add_argument("--tag", default="", help="실험 로그 메모")
+    main(parser.parse_args())
@@ -0,0 +1,91 @@
+# ============================================================================
+# 공용 테스트 Fixture
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - 여러 테스트 모듈이 함께 쓰는 가짜 일봉 생성기 / 스캔 인자
+#   - 테스트 모듈끼리 서로 import하지 않도록 여기서 fixture로 제공
+#
+# 📖 사용 예시:
+#   def test_scan(make_universe, scan_kwargs):
+#       df = make_universe(n_tickers=40)
+#       asyncio.run(scanner.run_daily_scan(**scan_kwargs))
+# ============================================================================
+
+import itertools
+import string
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+# 스캔 테스트 유니버스 거래일 (34 영업일)
+DATES = pd.bdate_range("2026-01-01", periods=34).strftime("%Y-%m-%d").tolist()
+
+# 가격/거래량 필터 해제 (유니버스 전 종목 스캔)
+SCAN_KWARGS = {"min_price": 0.0, "max_price": 1e9, "min_volume": 0}
+
+
+def _universe(n_tickers: int = 150, seed: int = 1) -> pd.DataFrame:
+    """저변동 랜덤워크 일봉 (일부 결측일 포함)"""
+    rng = np.random.default_rng(seed)
+    names = ["".join(p) for p in itertools.product(string.ascii_uppercase, repeat=3)][:n_tickers]
+    n = len(DATES)
+    rows = []
+    for ticker in names:
+        close = np.maximum(5 + np.cumsum(rng.normal(0, 0.05, n)), 0.5)
+        open_ = close * (1 + rng.normal(0, 0.005, n))
+        high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.01, n)))
+        low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.01, n)))
+        volume = rng.lognormal(12, 1, n).astype(int)
+        for i, day in enumerate(DATES):
+            if rng.random() < 0.03:
+                continue
+            rows.append((ticker, day, open_[i], high[i], low[i], close[i], volume[i]))
+    return pd.DataFrame(rows, columns=["ticker", "date", "open", "high", "low", "close", "volume"])
+
+
+def _make_daily(seed: int = 7) -> pd.DataFrame:
+    """티커별 길이가 다른 가짜 일봉 (거래 정지 구간, 결측 거래량 포함)"""
+    rng = np.random.default_rng(seed)
+    frames = []
+    for ticker, n in [("AAA", 300), ("BBB", 40), ("CCC", 1), ("DDD", 15)]:
+        dates = pd.bdate_range("2024-01-01", periods=n + 10)
+        dates = dates.delete(list(range(5, 10)))[:n]  # 5일 거래 정지
+        close = 5 + rng.random(n).cumsum() * 0.1
+        frames.append(pd.DataFrame({
+            "ticker": ticker,
+            "date": dates.strftime("%Y-%m-%d"),
+            "open": close * (1 + rng.normal(0, 0.03, n)),
+            "high": close * 1.05,
+            "low": close * 0.95,
+            "close": close,
+            "volume": rng.integers(1_000, 100_000, n).astype(float),
+        }))
+    daily = pd.concat(frames, ignore_index=True)
+    daily.loc[50, "volume"] = np.nan
+    return daily.sample(frac=1, random_state=seed)  # 정렬되지 않은 입력
+
+
+@pytest.fixture
+def trading_dates() -> list[str]:
+    """make_universe() 일봉의 거래일 목록"""
+    return list(DATES)
+
+
+@pytest.fixture
+def scan_kwargs() -> dict:
+    """필터 없는 run_daily_scan 인자"""
+    return dict(SCAN_KWARGS)
+
+
+@pytest.fixture
+def make_universe():
+    """스캔용 유니버스 일봉 생성기: make_universe(n_tickers=150, seed=1)"""
+    return _universe
+
+
+@pytest.fixture
+def make_daily():
+    """피처 계산용 일봉 생성기: make_daily(seed=7)"""
+    return _make_daily
@@ -0,0 +1,120 @@
+# ============================================================================
+# AuditLogger Tests
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - audit_logger.py 모듈의 단위 테스트
+#   - 비동기 배치 기록, 세그먼트 회전, 인덱스 기반 재생, 이전 형식 호환 검증
+#
+# 📖 실행 방법:
+#   pytest tests/test_audit_logger.py -v
+# ============================================================================
+
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.core.audit_logger import AuditLogger, AuditReader
+
+
+BASE = datetime(2026, 1, 8, 9, 30)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 기록 / 재생 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestAuditLogger:
+    """AuditLogger 비동기 기록 + AuditReader 재생 검증"""
+
+    def test_async_records_roundtrip(self, tmp_path):
+        """큐에 넣은 기록이 flush 후 같은 내용으로 재생됨"""
+        with AuditLogger(log_dir=str(tmp_path)) as audit:
+            context = {"ignition_score": 85, "price": 150.25}
+            audit.log_decision("AAPL", "BUY", context, event_time=BASE, signals={"obv": 0.6})
+            context["price"] = 0  # 호출 후 수정은 기록에 영향 없음
+            audit.log_ignition("TSLA", 72.34, passed_filter=False, filter_reason="spread")
+            assert audit.flush()
+            assert audit.get_stats()["written"] == 2
+
+        records = list(AuditReader(tmp_path).replay())
+        assert [r["ticker"] for r in records] == ["AAPL", "TSLA"]
+        assert records[0]["context"]["price"] == 150.25
+        assert records[0]["event_time"] == BASE.isoformat()
+        assert records[0]["signals"] == {"obv": 0.6}
+        assert records[1]["decision"] == "FILTER_REJECTED"
+
+    def test_replay_filters_by_ticker_and_time(self, tmp_path):
+        """종목/시간 범위 재생 - 인덱스로 블록을 건너뛰어도 결과는 동일"""
+        audit = AuditLogger(log_dir=str(tmp_path), durability="sync", compress=False)
+        for i in range(30):
+            ticker = "AAPL" if i % 3 == 0 else "NVDA"
+            audit.log_decision(ticker, "HOLD", {"i": i}, event_time=BASE + timedelta(minutes=i))
+        audit.close()
+
+        reader = AuditReader(tmp_path)
+        result = list(
+            reader.replay("AAPL", start=BASE + timedelta(minutes=5), end=BASE + timedelta(minutes=20))
+        )
+        assert [r["context"]["i"] for r in result] == [6, 9, 12, 15, 18]
+        assert list(reader.replay("MSFT")) == []
+
+    def test_segments_rotate_by_size(self, tmp_path):
+        """세그먼트 크기 한도 → 여러 세그먼트, 재시작 시 다음 번호로 이어 씀"""
+        audit = AuditLogger(log_dir=str(tmp_path), durability="sync", segment_max_bytes=200)
+        for i in range(10):
+            audit.log_decision("AAPL", "HOLD", {"i": i}, event_time=BASE)
+        audit.close()
+        day_dir = next(tmp_path.iterdir())
+        n_segments = len(list(day_dir.glob("decisions.*.jsonl.gz")))
+        assert n_segments > 1
+
+        audit = AuditLogger(log_dir=str(tmp_path), durability="sync")
+        audit.log_decision("AAPL", "BUY", {"i": 10}, event_time=BASE)
+        audit.close()
+
+        assert len(list(day_dir.glob("decisions.*.jsonl.gz"))) == n_segments + 1
+        records = list(AuditReader(tmp_path).replay("AAPL"))
+        assert [r["context"]["i"] for r in records] == list(range(11))
+
+    def test_replay_opens_only_days_in_range(self, tmp_path, monkeypatch):
+        """일별 디렉토리는 event_time 날짜 → 기간 밖 날짜의 인덱스는 열지 않음"""
+        audit = AuditLogger(log_dir=str(tmp_path), durability="sync")
+        for day in range(10):
+            audit.log_decision("AAPL", "HOLD", {"day": day}, event_time=BASE + timedelta(days=day))
+        audit.close()
+        assert len([p for p in tmp_path.iterdir() if p.is_dir()]) == 10
+
+        reader = AuditReader(tmp_path)
+        opened = []
+        scan = reader._scan_segment
+
+        def spy(index_path, *args):
+            opened.append(index_path.parent.name)
+            return scan(index_path, *args)
+
+        monkeypatch.setattr(reader, "_scan_segment", spy)
+        target = BASE + timedelta(days=5)
+        result = list(reader.replay(start=target, end=target))
+
+        assert [r["context"]["day"] for r in result] == [5]
+        assert len(opened) == 3  # 자정 전후 ±1일
+
+    def test_reads_legacy_daily_file(self, tmp_path):
+        """이전 형식(일별 decisions.jsonl)도 재생"""
+        day_dir = tmp_path / "2026-01-08"
+        day_dir.mkdir()
+        legacy = {"event_time": BASE.isoformat(), "ticker": "AAPL", "decision": "BUY"}
+        (day_dir / "decisions.jsonl").write_text(json.dumps(legacy) + "\n", encoding="utf-8")
+
+        assert list(AuditReader(tmp_path).replay("AAPL", start=BASE, end=BASE)) == [legacy]
+
+    def test_invalid_durability(self, tmp_path):
+        """알 수 없는 durability 모드는 거부"""
+        with pytest.raises(ValueError):
+            AuditLogger(log_dir=str(tmp_path), durability="never")
@@ -363,6 +363,60 @@ async def test_bulk_insert_performance(temp_db):
     print(f"\n📊 5000 레코드 삽입: {elapsed:.2f}초")
 
 
+@pytest.mark.asyncio
+async def test_staging_upsert_matches_prepared(temp_db, sample_bars):
+    """
+    스테이징 테이블 병합도 동일하게 Upsert되는지 확인 [user-030]
+    """
+    await temp_db.upsert_bulk(sample_bars, use_staging=True)
+
+    updated = dict(sample_bars[0], close=999.0)
+    # vwap/transactions 누락 행도 허용 (NULL)
+    partial = {k: v for k, v in sample_bars[1].items() if k not in ("vwap", "transactions")}
+    count = await temp_db.upsert_bulk([updated, partial], use_staging=True)
+
+    assert count == 2
+    stats = await temp_db.get_stats()
+    assert stats["total_bars"] == 3
+
+    bars = await temp_db.get_daily_bars(updated["ticker"], days=5)
+    by_date = {b.date: b for b in bars}
+    assert by_date[updated["date"]].close == 999.0
+
+
+@pytest.mark.asyncio
+async def test_upsert_intraday_bulk(temp_db):
+    """
+    Intraday Upsert: 중복 키는 갱신, 호출당 트랜잭션 1개 [user-030]
+    """
+    bars = [
+        {"ticker": "AAPL", "timeframe": "5m", "timestamp": 1702905600000 + i * 300_000,
+         "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 10, "vwap": 1.0}
+        for i in range(20)
+    ]
+    assert await temp_db.upsert_intraday_bulk(bars, chunk_size=7) == 20
+
+    bars[0] = dict(bars[0], close=2.0)
+    await temp_db.upsert_intraday_bulk(bars[:1])
+
+    rows = await temp_db.get_intraday_bars("AAPL", "5m", 0, 2**62)
+    assert len(rows) == 20
+    assert rows[0].close == 2.0
+
+
+@pytest.mark.asyncio
+async def test_connection_pragmas(temp_db):
+    """
+    WAL + 연결 단위 PRAGMA 적용 확인 [user-030]
+    """
+    async with temp_db.engine.connect() as conn:
+        journal = (await conn.exec_driver_sql("PRAGMA journal_mode")).scalar()
+        synchronous = (await conn.exec_driver_sql("PRAGMA synchronous")).scalar()
+
+    assert journal == "wal"
+    assert synchronous == 1  # NORMAL
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Empty Input Tests
 # ═══════════════════════════════════════════════════════════════════════════
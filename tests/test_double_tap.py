@@ -12,6 +12,7 @@ Double Tap & Trailing Stop Tests
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -178,6 +179,29 @@ class TestTrailingStopManager:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+class TestTrailingStopIndex:
+    """[user-034] order_id 인덱스로 체결/취소 콜백 처리"""
+
+    def test_callbacks_use_order_index(self):
+        """재진입으로 덮어쓴 이전 주문의 콜백은 새 주문에 영향 없음"""
+        connector = MagicMock()
+        connector.place_trailing_stop_order.side_effect = [11, 12, 21]
+        manager = TrailingStopManager(connector=connector)
+        manager.create_trailing("AAPL", 100, atr=1.0)
+        manager.create_trailing("AAPL", 50, atr=1.0)  # 재진입 → 11 대체
+        manager.create_trailing("TSLA", 10, atr=2.0)
+
+        manager.on_order_cancelled(11)
+        assert manager.get_trailing("AAPL").order_id == 12
+
+        manager.on_order_filled(12)
+        manager.on_order_cancelled(21)
+
+        assert manager.get_trailing("AAPL").status == TrailingStatus.FILLED
+        assert manager.get_trailing("TSLA") is None
+        assert manager._symbol_by_order == {}
+
+
 class TestDoubleTapEntry:
     """DoubleTapEntry 데이터클래스 테스트"""
 
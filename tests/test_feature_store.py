@@ -0,0 +1,92 @@
+# ============================================================================
+# FeatureStore Tests
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - feature_store.py 모듈의 단위 테스트 ([user-041])
+#   - 벡터화 피처 == 기존 행 단위 계산(calculate_d1_features), as-of 조인, stale 판정
+#
+# 📖 실행 방법:
+#   pytest tests/test_feature_store.py -v
+# ============================================================================
+
+import os
+import sys
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.data.feature_store import FEATURE_COLUMNS, FeatureStore
+from scripts.build_d1_features import calculate_d1_features
+
+
+@pytest.fixture
+def daily(make_daily):
+    return make_daily()
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 피처 저장소 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestFeatureStore:
+    """FeatureStore 빌드/조회 검증"""
+
+    def test_as_of_matches_row_by_row(self, daily, tmp_path):
+        """as-of 조인 결과 == 기존 calculate_d1_features (모든 티커/경계 날짜)"""
+        store = FeatureStore(tmp_path / "d1")
+        store.build(daily)
+
+        targets = [
+            (t, d)
+            for t in ["AAA", "BBB", "CCC", "DDD", "ZZZ"]
+            for d in [date(2024, 1, 3), date(2024, 2, 20), date(2024, 3, 1), date(2025, 6, 2)]
+        ]
+        targets_df = pd.DataFrame(targets, columns=["ticker", "target_date"])
+        result = store.as_of(targets_df)
+
+        assert list(result[["ticker", "target_date"]].itertuples(index=False, name=None)) == targets
+        for row in result.itertuples(index=False):
+            expected = calculate_d1_features(row.ticker, row.target_date, daily)
+            for col in FEATURE_COLUMNS:
+                got = getattr(row, col)
+                want = expected.get(col)
+                if want is None or (isinstance(want, float) and np.isnan(want)):
+                    assert pd.isna(got), (row.ticker, row.target_date, col)
+                else:
+                    assert got == pytest.approx(want, rel=1e-9), (row.ticker, row.target_date, col)
+
+    def test_target_on_trading_day_uses_previous_day(self, daily, tmp_path):
+        """target_date 당일 행은 사용하지 않음 (look-ahead 없음)"""
+        store = FeatureStore(tmp_path / "d1")
+        store.build(daily)
+
+        result = store.as_of(pd.DataFrame({"ticker": ["BBB"], "target_date": ["2024-01-17"]}))
+        assert result.loc[0, "d1_date"] == pd.Timestamp("2024-01-16")
+
+    def test_partitions_and_filtered_read(self, daily, tmp_path):
+        """월 파티션 저장, 티커/날짜 필터 조회"""
+        store = FeatureStore(tmp_path / "d1")
+        store.build(daily)
+
+        assert (tmp_path / "d1" / "month=2024-01" / "part.parquet").exists()
+        df = store.read(tickers=["BBB"], start="2024-02-01", end="2024-02-29")
+        assert set(df["ticker"]) == {"BBB"}
+        assert df["date"].min() >= pd.Timestamp("2024-02-01")
+        assert df["date"].max() <= pd.Timestamp("2024-02-29")
+
+    def test_ensure_rebuilds_only_when_source_changes(self, daily, tmp_path):
+        """원본 mtime/크기가 같으면 재빌드하지 않음"""
+        source = tmp_path / "all_daily.parquet"
+        daily.to_parquet(source, index=False)
+        store = FeatureStore(tmp_path / "d1")
+
+        assert store.ensure(source) is True
+        assert store.ensure(source) is False
+
+        daily.iloc[:-10].to_parquet(source, index=False)
+        assert store.ensure(source) is True
@@ -0,0 +1,186 @@
+# ============================================================================
+# Gainer Model Tests
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - compute_latest_features() == compute_point_in_time_features() 마지막 행
+#   - GainerModel 배치 추론 (predict 1회) == 단건 추론, 결측 피처 처리, 지연시간 예산
+#   - Scanner가 순위 변경 없이 ml_prob를 첨부하는지 검증
+#
+# 📖 실행 방법:
+#   pytest tests/test_gainer_model.py -v
+# ============================================================================
+
+import asyncio
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.core.gainer_model import MISSING_VALUE, GainerModel
+from backend.core.scanner import Scanner
+from backend.data.data_repository import DataRepository
+from backend.data.feature_store import (
+    FEATURE_COLUMNS,
+    compute_latest_features,
+    compute_point_in_time_features,
+)
+from backend.data.parquet_manager import ParquetManager
+
+
+class FakeBooster:
+    """xgboost.Booster 대역 (피처 선형 결합의 시그모이드, 호출 기록)"""
+
+    def __init__(self, feature_names: list[str]):
+        self.feature_names = feature_names
+        self.weights = np.linspace(-0.5, 0.5, len(feature_names)) / 1_000
+        self.calls: list[int] = []
+
+    def num_features(self) -> int:
+        return len(self.feature_names)
+
+    def inplace_predict(self, matrix: np.ndarray) -> np.ndarray:
+        self.calls.append(len(matrix))
+        return 0.5 * (1 + np.tanh(matrix.astype("float64") @ self.weights / 2))
+
+
+@pytest.fixture
+def booster():
+    return FakeBooster(FEATURE_COLUMNS)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 피처 계산 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestLatestFeatures:
+    """단건 numpy 계산 == 벡터 계산 마지막 행"""
+
+    def test_matches_point_in_time_last_row(self, make_daily):
+        daily = make_daily()
+        full = compute_point_in_time_features(daily).groupby("ticker").tail(1).set_index("ticker")
+
+        for ticker, group in daily.groupby("ticker"):
+            latest = compute_latest_features(group.sort_values("date"))
+            if len(group) < 2:
+                assert latest is None
+                continue
+            row = full.loc[ticker]
+            for col in FEATURE_COLUMNS:
+                if np.isnan(row[col]):
+                    assert np.isnan(latest[col]), (ticker, col)
+                else:
+                    assert latest[col] == pytest.approx(row[col]), (ticker, col)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# GainerModel 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestGainerModel:
+    """배치 / 단건 / 결측 / 예산"""
+
+    def test_batch_single_predict_matches_single(self, booster, make_universe):
+        daily = make_universe(n_tickers=40)
+        model = GainerModel(booster=booster)
+        booster.calls.clear()  # 로드 시 예열 호출 제외
+
+        probs = model.predict_frame(daily)
+        assert booster.calls == [40]
+        assert len(probs) == 40 and model.as_of == pd.Timestamp(daily["date"].max())
+
+        fresh = GainerModel(booster=booster)
+        for ticker, group in daily.groupby("ticker"):
+            assert fresh.predict_ticker(ticker, group.sort_values("date")) == pytest.approx(
+                probs[ticker], rel=1e-6
+            )
+
+    def test_cache_hit_and_new_day_resets(self, booster, make_universe):
+        daily = make_universe(n_tickers=5)
+        model = GainerModel(booster=booster)
+        model.predict_frame(daily[daily["date"] < daily["date"].max()])
+        booster.calls.clear()
+
+        assert model.predict_ticker("AAA") is not None
+        assert booster.calls == [] and model.cache_hits == 1
+        assert model.predict_ticker("NOPE") is None
+
+        # 새 거래일 배치 → 이전 캐시 교체
+        model.predict_frame(daily[daily["ticker"] == "AAB"])
+        assert model.cached("AAB") and not model.cached("AAA")
+
+    def test_unknown_features_use_missing_value(self):
+        booster = FakeBooster(["atr_pct", "CCI_20_0.015"])
+        model = GainerModel(booster=booster)
+        matrix = model._matrix(pd.DataFrame({"atr_pct": [1.5, np.nan, np.inf]}))
+        assert matrix.tolist() == [
+            [1.5, MISSING_VALUE],
+            [MISSING_VALUE, MISSING_VALUE],
+            [MISSING_VALUE, MISSING_VALUE],
+        ]
+
+    def test_unavailable_model_is_noop(self, tmp_path, make_universe):
+        model = GainerModel(tmp_path / "missing.json")
+        assert model.predict_frame(make_universe(n_tickers=3)) == {}
+        assert model.predict_ticker("AAA", make_universe(n_tickers=1)) is None
+        assert not model.available
+
+    def test_latency_budget_counts_over_budget(self, booster, make_daily):
+        """단건 추론 시간이 주입한 예산을 넘을 때만 over_budget 집계"""
+        bars = make_daily().query("ticker == 'AAA'").sort_values("date").tail(252)
+
+        relaxed = GainerModel(booster=booster, latency_budget_ms=float("inf"))
+        relaxed.predict_ticker("AAA", bars)
+        assert relaxed.single_calls == 1 and relaxed.over_budget == 0
+
+        strict = GainerModel(booster=booster, latency_budget_ms=0.0)
+        strict.predict_ticker("AAA", bars)
+        assert strict.single_calls == 1 and strict.over_budget == 1
+
+    def test_xgboost_roundtrip(self, tmp_path, make_universe):
+        xgb = pytest.importorskip("xgboost")
+        daily = make_universe(n_tickers=30)
+        features = compute_point_in_time_features(daily).dropna()
+        labels = (features["rvol_20d"] > 1).astype(int)
+        clf = xgb.XGBClassifier(n_estimators=5, max_depth=2)
+        clf.fit(features[FEATURE_COLUMNS], labels)
+        path = tmp_path / "model.json"
+        clf.get_booster().save_model(str(path))
+
+        model = GainerModel(path)
+        probs = model.predict_frame(daily)
+        latest = features.groupby("ticker").tail(1).set_index("ticker")
+        expected = clf.predict_proba(latest[FEATURE_COLUMNS])[:, 1]
+        assert [probs[t] for t in latest.index] == pytest.approx(expected.tolist(), rel=1e-5)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Scanner 연동 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestScannerMlStage:
+    """ml_prob 첨부, 순위/점수 불변"""
+
+    def test_attaches_probabilities(self, tmp_path, monkeypatch, booster, make_universe, scan_kwargs):
+        monkeypatch.setenv("AWS_LAMBDA_FUNCTION_NAME", "test")
+        pm = ParquetManager(str(tmp_path))
+        pm.write_daily(make_universe())
+        repo = DataRepository(pm)
+
+        plain = asyncio.run(Scanner(repo, watchlist_size=1_000).run_daily_scan(**scan_kwargs))
+        model = GainerModel(booster=booster)
+        booster.calls.clear()
+        scanned = asyncio.run(
+            Scanner(repo, watchlist_size=1_000, gainer_model=model).run_daily_scan(**scan_kwargs)
+        )
+
+        assert booster.calls == [model.batch_rows]  # 후보 전체 predict 1회
+        assert model.batch_rows > len(scanned)
+        assert [{k: v for k, v in item.items() if k != "ml_prob"} for item in scanned] == plain
+        assert scanned and all(item["ml_prob"] == round(model._probs[item["ticker"]], 4) for item in scanned)
@@ -0,0 +1,208 @@
+# ============================================================================
+# Gap Fill Coordinator Tests
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - gap_fill.py 모듈의 단위 테스트
+#   - 동시 요청 병합 (Single-Flight) 검증
+#   - 인접 범위 병합 및 Grouped Daily 배치 검증 (Mock API 사용)
+#
+# 📖 실행 방법:
+#   pytest tests/test_gap_fill.py -v
+# ============================================================================
+
+import asyncio
+import shutil
+import tempfile
+from unittest.mock import AsyncMock, MagicMock
+
+import pandas as pd
+import pytest
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.data.gap_fill import GapFillCoordinator
+from backend.data.parquet_manager import ParquetManager
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Fixtures
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+@pytest.fixture
+def parquet_manager():
+    """임시 디렉터리 기반 ParquetManager"""
+    tmpdir = tempfile.mkdtemp()
+    yield ParquetManager(tmpdir)
+    shutil.rmtree(tmpdir)
+
+
+def _daily_bar(ticker: str, date: str) -> dict:
+    return {
+        "ticker": ticker,
+        "date": date,
+        "open": 10.0,
+        "high": 11.0,
+        "low": 9.5,
+        "close": 10.5,
+        "volume": 1000,
+    }
+
+
+@pytest.fixture
+def mock_client():
+    """Massive API Mock (요청 범위의 바를 반환)"""
+    client = MagicMock()
+
+    async def fetch_daily_bars(ticker, from_date, to_date, limit=5000):
+        await asyncio.sleep(0.01)
+        return [_daily_bar(ticker, from_date), _daily_bar(ticker, to_date)]
+
+    async def fetch_grouped_daily(date):
+        return [_daily_bar(t, date) for t in ("AAA", "BBB", "CCC", "ZZZ")]
+
+    async def fetch_intraday_bars(ticker, multiplier=1, from_date=None, to_date=None, limit=5000):
+        await asyncio.sleep(0.01)
+        return [
+            {"ticker": ticker, "timestamp": 1734355800000 + i * 60000,
+             "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 1}
+            for i in range(3)
+        ]
+
+    client.fetch_daily_bars = AsyncMock(side_effect=fetch_daily_bars)
+    client.fetch_grouped_daily = AsyncMock(side_effect=fetch_grouped_daily)
+    client.fetch_intraday_bars = AsyncMock(side_effect=fetch_intraday_bars)
+    return client
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Single-Flight 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestSingleFlight:
+    """동시 요청 병합 테스트"""
+
+    async def test_same_request_calls_api_once(self, parquet_manager, mock_client):
+        """같은 (ticker, 범위) 동시 요청은 API 1회"""
+        coordinator = GapFillCoordinator(parquet_manager, mock_client)
+
+        results = await asyncio.gather(*(
+            coordinator.fill_daily("AAPL", "2024-12-02", "2024-12-06")
+            for _ in range(5)
+        ))
+
+        assert mock_client.fetch_daily_bars.await_count == 1
+        assert results == [2] * 5
+        assert coordinator.get_stats()["coalesced"] == 4
+
+    async def test_adjacent_ranges_are_merged(self, parquet_manager, mock_client):
+        """인접 범위는 하나의 요청으로 병합"""
+        coordinator = GapFillCoordinator(parquet_manager, mock_client)
+
+        await asyncio.gather(
+            coordinator.fill_intraday("AAPL", "1m", "2024-12-02", "2024-12-03"),
+            coordinator.fill_intraday("AAPL", "1m", "2024-12-04", "2024-12-05"),
+        )
+
+        mock_client.fetch_intraday_bars.assert_awaited_once()
+        kwargs = mock_client.fetch_intraday_bars.await_args.kwargs
+        assert kwargs["from_date"] == "2024-12-02"
+        assert kwargs["to_date"] == "2024-12-05"
+
+    async def test_contained_request_joins_running_fill(self, parquet_manager, mock_client):
+        """진행 중인 작업이 범위를 포함하면 합류"""
+        coordinator = GapFillCoordinator(parquet_manager, mock_client, batch_window=0.0)
+
+        first = asyncio.create_task(
+            coordinator.fill_daily("AAPL", "2024-12-01", "2024-12-31")
+        )
+        await asyncio.sleep(0.005)  # 배치 시작 (API 호출 진행 중)
+        second = await coordinator.fill_daily("AAPL", "2024-12-10", "2024-12-12")
+
+        assert await first == second
+        assert mock_client.fetch_daily_bars.await_count == 1
+
+    async def test_no_client_returns_zero(self, parquet_manager):
+        """API 클라이언트가 없으면 0 반환"""
+        coordinator = GapFillCoordinator(parquet_manager, None)
+        assert await coordinator.fill_daily("AAPL", "2024-12-02", "2024-12-06") == 0
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Batched Backfill 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestBatchedBackfill:
+    """Grouped Daily 배치 및 단일 저장 테스트"""
+
+    async def test_many_tickers_use_grouped_daily(self, parquet_manager, mock_client):
+        """티커 수가 임계값 이상이면 Grouped Daily 사용"""
+        coordinator = GapFillCoordinator(
+            parquet_manager, mock_client, grouped_daily_threshold=3
+        )
+
+        # 2024-12-16(월) ~ 2024-12-17(화) = 2 거래일
+        total = await coordinator.fill_daily_bulk(
+            ["AAA", "BBB", "CCC"], "2024-12-16", "2024-12-17"
+        )
+
+        assert mock_client.fetch_grouped_daily.await_count == 2
+        mock_client.fetch_daily_bars.assert_not_awaited()
+        assert total == 6
+
+        df = parquet_manager.read_daily()
+        assert set(df["ticker"]) == {"AAA", "BBB", "CCC"}  # 요청 외 티커 제외
+
+    async def test_batch_writes_daily_file_once(self, parquet_manager, mock_client):
+        """배치 결과는 append_daily 1회로 저장"""
+        coordinator = GapFillCoordinator(parquet_manager, mock_client)
+        parquet_manager.append_daily = MagicMock(wraps=parquet_manager.append_daily)
+
+        await asyncio.gather(
+            coordinator.fill_daily("AAPL", "2024-12-02", "2024-12-06"),
+            coordinator.fill_daily("MSFT", "2024-12-02", "2024-12-06"),
+        )
+
+        assert parquet_manager.append_daily.call_count == 1
+        assert len(parquet_manager.read_daily()) == 4
+
+    async def test_batch_task_handle_kept_until_done(self, parquet_manager, mock_client):
+        """배치 태스크는 완료 전까지 참조 유지, 완료 후 해제"""
+        coordinator = GapFillCoordinator(parquet_manager, mock_client)
+
+        fill = asyncio.create_task(coordinator.fill_daily("AAPL", "2024-12-02", "2024-12-06"))
+        while not coordinator._batch_tasks:
+            await asyncio.sleep(0.005)
+        assert len(coordinator._batch_tasks) == 1
+
+        assert await fill == 2
+        await asyncio.sleep(0)
+        assert not coordinator._batch_tasks
+
+
+class TestRepositoryBulkFill:
+    """DataRepository.fill_daily_gaps_bulk: 로컬 누락 티커만 보충"""
+
+    async def test_only_missing_tickers_are_filled(self, parquet_manager):
+        from backend.data.data_repository import DataRepository
+
+        dates = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=10)
+        parquet_manager.write_daily(pd.DataFrame(
+            [_daily_bar("FULL", d.strftime("%Y-%m-%d")) for d in dates]
+            + [_daily_bar("THIN", dates[-1].strftime("%Y-%m-%d"))]
+        ))
+        repo = DataRepository(parquet_manager)
+        repo._gap_filler.fill_daily_bulk = AsyncMock(return_value=5)
+
+        assert await repo.fill_daily_gaps_bulk(["FULL", "THIN", "NONE"], days=10) == 5
+        missing = repo._gap_filler.fill_daily_bulk.await_args.args[0]
+        assert missing == ["THIN", "NONE"]
+
+        repo._gap_filler.fill_daily_bulk.reset_mock()
+        assert await repo.fill_daily_gaps_bulk(["FULL"], days=10) == 0
+        repo._gap_filler.fill_daily_bulk.assert_not_awaited()
@@ -16,6 +16,10 @@ IBKRConnector Unit Tests
 IB Gateway 연결 없이 기본 동작을 검증하는 Mock 기반 테스트입니다.
 """
 
+import asyncio
+import threading
+from types import SimpleNamespace
+
 import pytest
 import os
 from unittest.mock import patch
@@ -171,6 +175,190 @@ class TestIBKRConnectorConnection:
         assert not connector._is_running
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# 명령 큐 / Contract 캐시 / 지연 추적 테스트 [user-032]
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class FakeIB:
+    """IB 루프 스레드에서만 호출되는지 기록하는 가짜 IB"""
+
+    def __init__(self):
+        self.calls = []
+        self.qualified = 0
+        self._next_id = 100
+
+    def isConnected(self):
+        return True
+
+    def qualifyContracts(self, *contracts):
+        self.qualified += len(contracts)
+        return list(contracts)
+
+    def placeOrder(self, contract, order):
+        self.calls.append(threading.get_ident())
+        self._next_id += 1
+        order.orderId = self._next_id
+        return SimpleNamespace(
+            order=order,
+            contract=contract,
+            orderStatus=SimpleNamespace(status="PendingSubmit", avgFillPrice=0.0),
+        )
+
+    def positions(self):
+        return []
+
+
+@pytest.fixture
+def looped_connector():
+    """IB 루프 스레드를 흉내 낸 연결 상태 커넥터"""
+    connector = IBKRConnector()
+    connector.ib = FakeIB()
+    connector._is_connected = True
+
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+
+    def run():
+        asyncio.set_event_loop(loop)
+        connector._loop = loop
+        connector._loop_thread_id = threading.get_ident()
+        loop.call_soon(ready.set)
+        loop.run_forever()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    ready.wait(timeout=2)
+
+    yield connector
+
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=2)
+    loop.close()
+
+
+class TestIBKRCommandQueue:
+    """IB 루프 스레드 마샬링 테스트"""
+
+    def test_orders_run_on_loop_thread(self, looped_connector):
+        """다른 스레드에서 호출해도 placeOrder는 IB 루프 스레드에서 실행"""
+        order_id = looped_connector.place_market_order("AAPL", 10, "BUY")
+
+        assert order_id == 101
+        assert looped_connector.ib.calls == [looped_connector._loop_thread_id]
+        assert looped_connector.get_latency_stats()["queue_wait"]["count"] == 1
+
+    def test_contract_cache(self, looped_connector):
+        """같은 심볼은 한 번만 qualify"""
+        looped_connector.place_market_order("AAPL", 10)
+        looped_connector.place_stop_order("AAPL", 10, 95.0)
+
+        assert looped_connector.ib.qualified == 1
+        assert looped_connector.qualify_symbols(["AAPL", "MSFT"]) == 2
+
+    def test_qualify_watchlist_on_connect(self, looped_connector):
+        """연결 직후 저장된 Watchlist 종목의 Contract를 미리 캐시"""
+        watchlist = [{"ticker": "AAPL"}, {"ticker": "MSFT"}, {"score": 1}]
+        with patch("backend.data.watchlist_store.load_watchlist", return_value=watchlist):
+            looped_connector.submit_command(looped_connector._qualify_watchlist).result(timeout=2)
+
+        assert set(looped_connector._contracts) == {"AAPL", "MSFT"}
+        looped_connector.place_market_order("AAPL", 10)
+        assert looped_connector.ib.qualified == 2  # 주문 시 추가 qualify 없음
+
+    def test_status_events_record_latency(self, looped_connector):
+        """Submitted → Filled 상태로 ack/fill 지연 기록 + 체결 콜백 1회"""
+        fills = []
+        looped_connector.set_on_order_filled(fills.append)
+        order_id = looped_connector.place_market_order("AAPL", 10)
+        trade = looped_connector._active_orders[order_id]
+
+        for status in ("Submitted", "Submitted", "Filled", "Filled"):
+            trade.orderStatus.status = status
+            looped_connector._on_order_status(trade)
+
+        stats = looped_connector.get_latency_stats()
+        assert stats["submit_to_ack"]["count"] == 1
+        assert stats["submit_to_fill"]["count"] == 1
+        assert stats["ack_to_fill"]["count"] == 1
+        assert stats["in_flight"] == 0
+        assert len(fills) == 1
+
+    def test_submit_command_future(self, looped_connector):
+        """submit_command는 asyncio에서 await 가능한 Future 반환"""
+
+        async def main():
+            fut = looped_connector.submit_command(threading.get_ident)
+            return await asyncio.wrap_future(fut)
+
+        assert asyncio.run(main()) == looped_connector._loop_thread_id
+
+    def test_submit_without_loop_fails_fast(self):
+        """루프가 없으면 즉시 예외가 담긴 Future"""
+        fut = IBKRConnector().submit_command(lambda: 1)
+        with pytest.raises(RuntimeError):
+            fut.result(timeout=0.1)
+
+    def test_timeout_before_run_returns_default(self, looped_connector):
+        """IB 스레드가 꺼내기 전에 타임아웃 → 취소 확정, default 반환"""
+        looped_connector.COMMAND_TIMEOUT = 0.05
+        release = threading.Event()
+        looped_connector.submit_command(release.wait, 2)  # IB 루프 점유
+
+        try:
+            assert looped_connector.place_market_order("AAPL", 10) is None
+        finally:
+            release.set()
+        looped_connector.submit_command(lambda: None).result(timeout=2)
+        assert looped_connector.ib.calls == []
+
+    def test_timeout_while_running_is_unknown_state(self, looped_connector):
+        """실행 중 타임아웃 → IBCommandTimeout, 늦은 결과는 추적 후 기록"""
+        from backend.broker.ibkr_connector import IBCommandTimeout
+
+        looped_connector.COMMAND_TIMEOUT = 0.05
+        release = threading.Event()
+        place = looped_connector.ib.placeOrder
+
+        def slow_place(contract, order):
+            release.wait(2)
+            return place(contract, order)
+
+        looped_connector.ib.placeOrder = slow_place
+        logs = []
+        looped_connector.set_on_log_message(logs.append)
+
+        with pytest.raises(IBCommandTimeout) as exc:
+            looped_connector.place_market_order("AAPL", 10)
+        assert exc.value.future in looped_connector._unsettled_commands
+
+        release.set()
+        assert exc.value.future.result(timeout=2) == 101
+        looped_connector.submit_command(lambda: None).result(timeout=2)  # 콜백 완료 대기
+        assert not looped_connector._unsettled_commands
+        assert any("늦은 완료" in msg for msg in logs)
+
+    def test_oca_children_reach_order_book(self, looped_connector):
+        """[user-034] OCA 자식 주문이 OrderManager 장부에 등록되고 체결이 로그에 남음"""
+        from backend.core.order_manager import OrderManager
+
+        manager = OrderManager(looped_connector)
+        oca_id = manager.execute_oca_exit("AAPL", 10, 100.0)
+
+        children = manager.get_oca_orders(oca_id)
+        assert sorted(o.order_id for o in children) == sorted(looped_connector._oca_groups[oca_id])
+        assert {o.stop_price for o in children} == {98.0, None}
+        assert {o.limit_price for o in children} == {108.0, None}
+
+        stop_id = min(o.order_id for o in children)
+        trade = looped_connector._active_orders[stop_id]
+        trade.orderStatus.status = "Filled"
+        trade.orderStatus.avgFillPrice = 98.0
+        looped_connector._on_order_status(trade)
+
+        assert [e["order_id"] for e in manager.get_trade_log()] == [stop_id]
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # 실행
 # ═══════════════════════════════════════════════════════════════════════════
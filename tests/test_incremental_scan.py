@@ -0,0 +1,182 @@
+# ============================================================================
+# Incremental Daily Scan Tests
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - scan_state.py 롤링 집계 / V2 사전 점수 단위 테스트
+#   - Scanner.run_daily_scan(incremental=True) == 전체 스캔 (정답 기준) 검증
+#
+# 📖 실행 방법:
+#   pytest tests/test_incremental_scan.py -v
+# ============================================================================
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.core.scan_state import RollingWindow, _bar
+from backend.core.scanner import Scanner
+from backend.data.data_repository import DataRepository
+from backend.data.parquet_manager import ParquetManager
+from backend.strategies.seismograph import SeismographStrategy
+
+
+@pytest.fixture
+def env(tmp_path, monkeypatch):
+    # ThreadPool 경로 사용 (테스트에서 프로세스 생성 생략)
+    monkeypatch.setenv("AWS_LAMBDA_FUNCTION_NAME", "test")
+    pm = ParquetManager(str(tmp_path))
+    repo = DataRepository(pm)
+    state_path = tmp_path / "scan_state" / "daily_scan.parquet"
+    return pm, repo, state_path
+
+
+@pytest.fixture
+def scan(scan_kwargs):
+    """scan(scanner, **kwargs) → 필터 없는 run_daily_scan 결과"""
+
+    def run(scanner: Scanner, **kwargs) -> list[dict]:
+        return asyncio.run(scanner.run_daily_scan(**scan_kwargs, **kwargs))
+
+    return run
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 롤링 집계 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestRollingWindow:
+    """O(1) 갱신 집계 == 윈도우 재계산"""
+
+    def test_sums_match_recompute_after_slides(self, make_universe):
+        df = make_universe(n_tickers=1)
+        window = RollingWindow()
+        records = df.to_dict("records")
+        for i, record in enumerate(records):
+            window.upsert(_bar(record))
+            window.evict_before(records[max(0, i - 19)]["date"])
+
+        fresh = RollingWindow()
+        for bar in list(window.bars):
+            fresh.append(bar)
+        assert len(window) == 20
+        assert window.vol_sum == pytest.approx(fresh.vol_sum)
+        assert window.tr_sum == pytest.approx(fresh.tr_sum)
+        assert window.obv_sum == pytest.approx(fresh.obv_sum)
+
+    def test_upsert_replaces_same_day(self):
+        window = RollingWindow()
+        bars = [("2026-01-0%d" % d, 1.0, 1.2, 0.9, 1.0 + d / 10, 100.0) for d in range(1, 4)]
+        for bar in bars:
+            window.append(bar)
+        revised = bars[-1][:5] + (500.0,)
+
+        assert not window.upsert(bars[-1])
+        assert not window.upsert(bars[0])
+        assert window.upsert(revised)
+        assert window.vol_sum == 700.0 and window.bars[-1] == revised
+
+    def test_v2_prescreen_close_to_strategy(self, make_universe):
+        """집계 기반 V2 점수 ≈ 전략 V2 점수 (반올림 차이 이내)"""
+        strategy = SeismographStrategy()
+        for ticker, group in make_universe(n_tickers=60, seed=5).groupby("ticker"):
+            window = RollingWindow()
+            for record in group.tail(20).to_dict("records"):
+                window.append(_bar(record))
+            expected = strategy.calculate_watchlist_score_detailed(ticker, window.records())["score"]
+            assert window.v2_score() == pytest.approx(expected, abs=0.5)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 증분 스캔 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestIncrementalScan:
+    """전체 스캔 결과를 정답으로 비교"""
+
+    def test_matches_full_scan_day_by_day(self, env, scan, make_universe, trading_dates):
+        pm, repo, state_path = env
+        df = make_universe()
+        full = Scanner(repo, watchlist_size=10_000, state_path=state_path)
+        passed = 0
+
+        for day in trading_dates[22:]:
+            pm.write_daily(df[df["date"] <= day])
+            # 매일 새 Scanner → 저장된 상태 파일에서 이어서 갱신
+            incremental = Scanner(repo, watchlist_size=10_000, state_path=state_path)
+            expected = scan(full)
+            assert scan(incremental, incremental=True) == expected
+            passed += len(expected)
+
+        assert passed > 0
+
+    def test_only_changed_tickers_rescored(self, env, monkeypatch, scan, make_universe, trading_dates):
+        pm, repo, state_path = env
+        df = make_universe()
+        pm.write_daily(df[df["date"] <= trading_dates[25]])
+        scanner = Scanner(repo, watchlist_size=10_000, state_path=state_path)
+        first = scan(scanner, incremental=True)
+
+        scored = []
+        original = Scanner._score_parallel
+
+        def spy(self, items):
+            scored.extend(t for t, _ in items)
+            return original(self, items)
+
+        monkeypatch.setattr(Scanner, "_score_parallel", spy)
+
+        # 데이터 변화 없음 → 재계산 없음, 결과 동일
+        assert scan(scanner, incremental=True) == first
+        assert scored == []
+
+        # 한 종목의 당일 봉만 수정 → 그 종목만 변경 대상
+        revised = df[df["date"] <= trading_dates[25]].copy()
+        mask = (revised["ticker"] == "AAA") & (revised["date"] == trading_dates[25])
+        revised.loc[mask, "volume"] *= 50
+        pm.write_daily(revised)
+        expected = scan(Scanner(repo, watchlist_size=10_000, state_path=state_path))
+        scored.clear()  # 전체 스캔(정답) 호출분 제외
+        assert scan(scanner, incremental=True) == expected
+        assert set(scored) <= {"AAA"}
+        assert scanner.state.windows["AAA"].bars[-1][5] == revised.loc[mask, "volume"].iloc[0]
+
+    def test_rebuilds_on_lookback_change(self, env, scan, make_universe):
+        pm, repo, state_path = env
+        df = make_universe(n_tickers=40)
+        pm.write_daily(df)
+        scanner = Scanner(repo, watchlist_size=10_000, state_path=state_path)
+        scan(scanner, incremental=True)
+
+        expected = scan(scanner, lookback_days=15)
+        assert scan(scanner, lookback_days=15, incremental=True) == expected
+        assert scanner.state.lookback == 15
+        assert all(len(w) <= 15 for w in scanner.state.windows.values())
+
+    def test_run_scan_defaults_to_incremental(self, env, monkeypatch):
+        """아침 스캔 진입점(run_scan → 스케줄러)은 증분 경로 사용"""
+        from dependency_injector import providers
+
+        from backend.container import container
+        from backend.core.scanner import run_scan
+
+        _, repo, _ = env
+        calls = []
+
+        async def spy(self, **kwargs):
+            calls.append(kwargs)
+            return []
+
+        monkeypatch.setattr(Scanner, "run_daily_scan", spy)
+        with container.data_repository.override(providers.Object(repo)), \
+                container.scoring_pool.override(providers.Object(None)), \
+                container.gainer_model.override(providers.Object(None)):
+            asyncio.run(run_scan())
+            asyncio.run(run_scan(incremental=False))
+
+        assert calls == [{"incremental": True}, {"incremental": False}]
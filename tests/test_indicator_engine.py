@@ -0,0 +1,153 @@
+# ============================================================================
+# Indicator Engine Tests
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - indicator_engine.py 모듈의 단위 테스트
+#   - 증분 계산 결과 == 전체 재계산 결과 검증
+#   - data version 기반 무효화 / 벌크 계산 / 영속화 검증
+#
+# 📖 실행 방법:
+#   pytest tests/test_indicator_engine.py -v
+# ============================================================================
+
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.data.indicator_engine import IndicatorEngine, compute_indicator
+from backend.data.parquet_manager import ParquetManager
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Fixtures
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+@pytest.fixture
+def parquet_manager():
+    """임시 디렉터리 기반 ParquetManager"""
+    tmpdir = tempfile.mkdtemp()
+    yield ParquetManager(tmpdir)
+    shutil.rmtree(tmpdir)
+
+
+def _make_daily(tickers: list[str], n_days: int, seed: int = 0) -> pd.DataFrame:
+    """랜덤 워크 일봉 생성"""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2024-01-02", periods=n_days).strftime("%Y-%m-%d")
+    rows = []
+    for ticker in tickers:
+        closes = 10 + np.cumsum(rng.normal(0, 0.5, n_days))
+        for date, close in zip(dates, closes):
+            rows.append({
+                "ticker": ticker, "date": date, "open": close, "high": close,
+                "low": close, "close": float(close), "volume": 1000,
+            })
+    return pd.DataFrame(rows)
+
+
+def _full(df: pd.DataFrame, ticker: str, ind_type: str, period: int) -> np.ndarray:
+    one = df[df["ticker"] == ticker].sort_values("date").reset_index(drop=True)
+    return compute_indicator(one[["ticker", "date", "close"]], ind_type, period).to_numpy()
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 증분 계산 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestIncrementalExtension:
+    """새 일봉 추가 시 증분 계산 검증"""
+
+    @pytest.mark.parametrize("indicator", ["sma_5", "ema_10", "rsi_14"])
+    def test_incremental_matches_full(self, parquet_manager, indicator):
+        """증분 확장 결과는 전체 재계산과 동일"""
+        df = _make_daily(["AAPL"], 80)
+        parquet_manager.write_daily(df.iloc[:60])
+
+        engine = IndicatorEngine(parquet_manager)
+        engine.get("AAPL", indicator, days=None)
+
+        parquet_manager.append_daily(df.iloc[60:])
+        result = engine.get("AAPL", indicator, days=None)
+
+        ind_type, period = indicator.split("_")
+        expected = _full(df, "AAPL", ind_type, int(period))
+        np.testing.assert_allclose(result.to_numpy(), expected, equal_nan=True)
+        assert engine.get_stats()["incremental"] == 1
+
+    def test_rewritten_history_triggers_full_recompute(self, parquet_manager):
+        """과거 종가가 바뀌면 전체 재계산"""
+        df = _make_daily(["AAPL"], 40)
+        parquet_manager.write_daily(df)
+        engine = IndicatorEngine(parquet_manager)
+        engine.get("AAPL", "sma_5")
+
+        df.loc[df.index[-1], "close"] += 1.0
+        parquet_manager.write_daily(df)
+        result = engine.get("AAPL", "sma_5", days=None)
+
+        np.testing.assert_allclose(
+            result.to_numpy(), _full(df, "AAPL", "sma", 5), equal_nan=True
+        )
+        assert engine.get_stats()["full"] == 2
+
+    def test_unchanged_data_is_cache_hit(self, parquet_manager):
+        """데이터 버전이 같으면 재계산 없음"""
+        parquet_manager.write_daily(_make_daily(["AAPL"], 30))
+        engine = IndicatorEngine(parquet_manager)
+
+        engine.get("AAPL", "ema_5")
+        engine.get("AAPL", "ema_5")
+
+        stats = engine.get_stats()
+        assert stats["full"] == 1
+        assert stats["hits"] == 1
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 벌크 / 영속화 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestBulkAndPersistence:
+    """벌크 계산 및 테이블 저장 검증"""
+
+    def test_bulk_matches_per_ticker(self, parquet_manager):
+        """벌크 계산 결과는 티커별 계산과 동일"""
+        df = _make_daily(["AAA", "BBB", "CCC"], 50)
+        parquet_manager.write_daily(df)
+        engine = IndicatorEngine(parquet_manager)
+
+        bulk = engine.compute_bulk("rsi_14")
+
+        for ticker in ["AAA", "BBB", "CCC"]:
+            values = bulk[bulk["ticker"] == ticker]["value"].to_numpy()
+            np.testing.assert_allclose(values, _full(df, ticker, "rsi", 14), equal_nan=True)
+
+    def test_table_persists_across_instances(self, parquet_manager):
+        """저장된 테이블은 새 인스턴스에서 재계산 없이 사용"""
+        parquet_manager.write_daily(_make_daily(["AAA", "BBB"], 30))
+        IndicatorEngine(parquet_manager).compute_bulk("sma_10")
+
+        engine = IndicatorEngine(parquet_manager)
+        result = engine.get("BBB", "sma_10", days=5)
+
+        assert len(result) == 5
+        assert engine.get_stats()["hits"] == 1
+        assert engine.get_stats()["full"] == 0
+
+    def test_invalid_indicator_returns_none(self, parquet_manager):
+        """지원하지 않는 지표는 None"""
+        parquet_manager.write_daily(_make_daily(["AAA"], 10))
+        engine = IndicatorEngine(parquet_manager)
+        assert engine.get("AAA", "macd") is None
+        assert engine.get("AAA", "foo_10") is None
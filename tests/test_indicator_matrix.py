@@ -0,0 +1,138 @@
+# ============================================================================
+# IndicatorMatrix Tests
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - indicator_matrix.py 모듈의 단위 테스트 ([user-042])
+#   - 병렬 계산 == 순차 계산, 입력 해시 기반 증분 재계산, as-of 부착 검증
+#
+# 📖 실행 방법:
+#   pytest tests/test_indicator_matrix.py -v
+# ============================================================================
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.data.indicator_matrix import IndicatorMatrix
+
+
+# 지표 함수 (ProcessPoolExecutor로 전달되므로 모듈 레벨)
+def sma_5(df: pd.DataFrame) -> pd.Series:
+    return df["close"].rolling(5).mean().rename("SMA_5")
+
+
+def bands(df: pd.DataFrame) -> pd.DataFrame:
+    mid = df["close"].rolling(10).mean()
+    return pd.DataFrame({"BBU": mid * 1.1, "BBL": mid * 0.9})
+
+
+def vol_z(df: pd.DataFrame) -> pd.Series:
+    v = df["volume"]
+    return ((v - v.rolling(20).mean()) / v.rolling(20).std()).rename("VOL_Z")
+
+
+def fails_on_bbb(df: pd.DataFrame) -> pd.Series:
+    if len(df) == 45:  # BBB
+        raise ValueError("boom")
+    return df["close"].diff().rename("DIFF")
+
+
+INDICATORS = {"sma_5": sma_5, "bands": bands}
+
+
+def make_daily(seed: int = 3) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    frames = []
+    for ticker, n in [("AAA", 60), ("BBB", 45), ("CCC", 10), ("DDD", 35)]:
+        close = 10 + rng.random(n).cumsum()
+        frames.append(pd.DataFrame({
+            "ticker": ticker,
+            "date": pd.bdate_range("2024-01-01", periods=n),
+            "open": close, "high": close * 1.02, "low": close * 0.98, "close": close,
+            "volume": rng.integers(1_000, 9_000, n).astype(float),
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+@pytest.fixture
+def daily():
+    return make_daily()
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 빌드 / 조회 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestIndicatorMatrix:
+    """IndicatorMatrix 병렬/증분 빌드 검증"""
+
+    def test_parallel_matches_serial(self, daily, tmp_path):
+        """ProcessPool 결과 == 현재 프로세스 계산, 최소 행 수 미만 티커 제외"""
+        serial = IndicatorMatrix(tmp_path / "s", INDICATORS, max_workers=1)
+        parallel = IndicatorMatrix(tmp_path / "p", INDICATORS, max_workers=2, shard_size=1)
+        serial.build(daily)
+        parallel.build(daily)
+
+        a, b = serial.read(), parallel.read()
+        pd.testing.assert_frame_equal(a, b)
+        assert set(a["ticker"]) == {"AAA", "BBB", "DDD"}
+        assert list(a.columns) == ["ticker", "date", "SMA_5", "BBU", "BBL"]
+
+        aaa = daily[daily["ticker"] == "AAA"].set_index("date")
+        expected = aaa["close"].rolling(5).mean().to_numpy()
+        np.testing.assert_allclose(a[a["ticker"] == "AAA"]["SMA_5"].to_numpy(), expected)
+
+    def test_rerun_only_changed_tickers_and_new_indicators(self, daily, tmp_path):
+        """입력이 같으면 재사용, 바뀐 티커/새 지표만 계산"""
+        matrix = IndicatorMatrix(tmp_path / "m", INDICATORS, max_workers=1)
+        first = matrix.build(daily)
+        assert first["computed"] == {"sma_5": 3, "bands": 3}
+
+        assert matrix.build(daily) == {"computed": {}, "skipped": 6, "failed": 0}
+
+        changed = daily.copy()
+        changed.loc[changed["ticker"] == "BBB", "close"] += 1
+        assert matrix.build(changed)["computed"] == {"sma_5": 1, "bands": 1}
+        bbb = matrix.read(names=["sma_5"], tickers=["BBB"])
+        expected = changed[changed["ticker"] == "BBB"]["close"].rolling(5).mean().to_numpy()
+        np.testing.assert_allclose(bbb["SMA_5"].to_numpy(), expected)
+        assert len(matrix.read(names=["sma_5"])) == 60 + 45 + 35  # 다른 티커 행 유지
+
+        extended = IndicatorMatrix(tmp_path / "m", {**INDICATORS, "vol_z": vol_z}, max_workers=1)
+        stats = extended.build(changed)
+        assert stats["computed"] == {"vol_z": 3}
+        assert "VOL_Z" in extended.read().columns
+
+    def test_failed_indicator_is_not_recorded(self, daily, tmp_path):
+        """샤드 안에서 예외가 난 (지표, 티커)는 해시를 남기지 않고 다음 실행에 재시도"""
+        matrix = IndicatorMatrix(tmp_path / "m", {"diff": fails_on_bbb}, max_workers=1)
+        stats = matrix.build(daily)
+        assert stats["computed"] == {"diff": 2} and stats["failed"] == 1
+        assert set(matrix._load_manifest()["diff"]) == {"AAA", "DDD"}
+
+        stats = matrix.build(daily)
+        assert stats["skipped"] == 2 and stats["failed"] == 1  # BBB만 다시 시도
+
+    def test_attach_as_of_uses_previous_trading_day(self, daily, tmp_path):
+        """target_date 직전 거래일 행의 지표 부착, 이력 없으면 NaN"""
+        matrix = IndicatorMatrix(tmp_path / "m", INDICATORS, max_workers=1)
+        matrix.build(daily)
+
+        targets = pd.DataFrame({
+            "ticker": ["AAA", "BBB", "CCC", "AAA"],
+            "target_date": ["2024-01-15", "2024-01-02", "2024-01-15", "2024-03-01"],
+            "label": ["a", "b", "c", "d"],
+        })
+        result = matrix.attach_as_of(targets)
+
+        assert list(result["label"]) == ["a", "b", "c", "d"]
+        wide = matrix.read().set_index(["ticker", "date"])
+        assert result.loc[0, "SMA_5"] == wide.loc[("AAA", pd.Timestamp("2024-01-12")), "SMA_5"]
+        assert result.loc[[1, 2], ["SMA_5", "BBU"]].isna().all().all()
+        assert result.loc[3, "BBL"] == wide.loc[("AAA", pd.Timestamp("2024-02-29")), "BBL"]
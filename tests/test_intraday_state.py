@@ -0,0 +1,192 @@
+# ============================================================================
+# Intraday State Engine Tests
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - intraday_state.py 모듈의 단위 테스트
+#   - VWAP / HOD / LOD / ATR / RVOL 증분 계산 검증
+#   - 세션 리셋, 슬롯 확장, TickDispatcher 연동, DoubleTap 연동 검증
+#
+# 📖 실행 방법:
+#   pytest tests/test_intraday_state.py -v
+# ============================================================================
+
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.core.double_tap import DoubleTapManager, DoubleTapState
+from backend.core.intraday_state import IntradayStateEngine
+from backend.core.tick_dispatcher import TickDispatcher
+
+
+# 2024-12-17 10:00 ET (정규장 30분 경과)
+T0 = datetime(2024, 12, 17, 10, 0, tzinfo=ZoneInfo("America/New_York")).timestamp()
+
+
+@pytest.fixture
+def engine():
+    return IntradayStateEngine(atr_period=3, initial_capacity=2)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 상태 계산 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestIntradayState:
+    """틱 누적 상태 검증"""
+
+    def test_vwap_hod_lod(self, engine):
+        """VWAP은 Σpv/Σv, HOD/LOD는 세션 고가/저가"""
+        for price, size in [(10.0, 100), (12.0, 300), (9.0, 100)]:
+            engine.update("AAPL", price, size, T0)
+
+        snap = engine.snapshot("AAPL")
+        assert snap.vwap == pytest.approx((1000 + 3600 + 900) / 500)
+        assert (snap.open, snap.hod, snap.lod, snap.last) == (10.0, 12.0, 9.0, 9.0)
+        assert snap.volume == 500
+
+    def test_atr_from_minute_bars(self, engine):
+        """1분봉 True Range의 Wilder 평균 (period개까지는 단순 평균)"""
+        # 봉1: 10~11 (TR 1), 봉2: 11~13 (TR 2), 봉3: 진행 중
+        engine.update("AAPL", 10.0, 1, T0)
+        engine.update("AAPL", 11.0, 1, T0 + 30)
+        engine.update("AAPL", 13.0, 1, T0 + 60)
+        engine.update("AAPL", 11.0, 1, T0 + 90)
+        engine.update("AAPL", 12.0, 1, T0 + 120)
+
+        # 기본 min_atr_bars = atr_period(3) → 완성 봉 2개는 미공개
+        assert engine.snapshot("AAPL").atr == 0.0
+        engine.min_atr_bars = 2
+        assert engine.snapshot("AAPL").atr == pytest.approx(1.5)
+
+    def test_trailing_uses_proxy_until_atr_ready(self, engine):
+        """ATR 봉 수가 부족하면 1% 프록시, 충분하면 장중 ATR"""
+        from backend.core.trailing_stop import TrailingStopManager
+
+        manager = TrailingStopManager(state_engine=engine)
+        manager._place_trailing_order = lambda order: 1
+        for i, price in enumerate([10.0, 11.0, 13.0, 11.0, 12.0]):
+            engine.update("AAPL", price, 1, T0 + i * 30)
+
+        manager.create_trailing("AAPL", qty=10, entry_price=20.0)
+        assert manager._trailing_orders["AAPL"].trail_amount == pytest.approx(20.0 * 0.01 * 1.5)
+
+        engine.update("AAPL", 12.0, 1, T0 + 180)  # 봉3 완성
+        manager.create_trailing("AAPL", qty=10, entry_price=20.0)
+        assert manager._trailing_orders["AAPL"].trail_amount == pytest.approx(
+            engine.snapshot("AAPL").atr * 1.5
+        )
+
+    def test_seed_day_volume(self, engine):
+        """REST 당일 거래량 시드는 구독 이전분만 더하고 VWAP에는 영향 없음"""
+        engine.set_reference("AAPL", avg_volume=39_000)
+        engine.update("AAPL", 10.0, 1_000, T0)
+        engine.seed_day_volume("AAPL", 3_000)
+        engine.update("AAPL", 12.0, 1_000, T0 + 1)
+
+        snap = engine.snapshot("AAPL")
+        assert snap.volume == 4_000
+        assert snap.vwap == pytest.approx(11.0)
+        assert snap.rvol == pytest.approx(4_000 / 3_000, rel=1e-3)
+        assert snap.volume_seeded
+
+    def test_seed_before_first_tick_survives(self, engine):
+        """틱 전에 시드해도 첫 틱의 세션 시작이 시드를 지우지 않음"""
+        now = datetime.now().timestamp()
+        engine.seed_day_volume("MSFT", 5_000)
+        engine.update("MSFT", 10.0, 100, now)
+
+        snap = engine.snapshot("MSFT")
+        assert snap.volume == 5_100 and snap.volume_seeded
+
+        engine.update("AAPL", 10.0, 100, now)
+        assert not engine.snapshot("AAPL").volume_seeded
+
+    def test_rvol_and_change_pct(self, engine):
+        """RVOL은 경과 시간 비율로 보정, 변동률은 전일 종가 대비"""
+        engine.set_reference("AAPL", prev_close=10.0, avg_volume=39_000)
+        engine.update("AAPL", 11.0, 3_000, T0)
+
+        snap = engine.snapshot("AAPL")
+        # 30분 경과 → 기대 거래량 39,000 × 30/390 = 3,000
+        assert snap.rvol == pytest.approx(1.0)
+        assert snap.change_pct == pytest.approx(10.0)
+
+    def test_session_reset_carries_prev_close(self, engine):
+        """ET 자정이 지나면 누적값 리셋, 마지막 가격을 전일 종가로 이월"""
+        engine.update("AAPL", 10.0, 100, T0)
+        engine.update("AAPL", 20.0, 100, T0 + 3600)
+
+        next_day = T0 + timedelta(days=1).total_seconds()
+        engine.update("AAPL", 22.0, 50, next_day)
+
+        snap = engine.snapshot("AAPL")
+        assert (snap.hod, snap.lod, snap.volume, snap.ticks) == (22.0, 22.0, 50, 1)
+        assert snap.change_pct == pytest.approx(10.0)
+
+    def test_slots_grow_and_unknown_ticker(self, engine):
+        """초기 용량을 넘으면 배열 확장, 미수신 종목은 None"""
+        for i in range(5):
+            engine.update(f"T{i}", 1.0 + i, 1, T0)
+
+        assert engine.get_stats()["capacity"] >= 5
+        data, version = engine._store
+        assert len(data) == len(version)
+        assert engine.snapshot("T4").last == 5.0
+        assert len(engine.snapshot_all()) == 5
+        assert engine.snapshot("NOPE") is None
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 연동 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestIntegration:
+    """TickDispatcher / DoubleTap 연동 검증"""
+
+    def test_dispatcher_feeds_engine_before_other_subscribers(self, engine):
+        """먼저 attach된 엔진의 상태를 같은 틱의 다른 구독자가 읽음"""
+        dispatcher = TickDispatcher()
+        engine.attach(dispatcher)
+        seen = []
+        dispatcher.register("reader", lambda t: seen.append(engine.snapshot(t["ticker"]).last))
+
+        dispatcher.dispatch({"ticker": "AAPL", "price": 5.0, "size": 10, "time": T0})
+        dispatcher.dispatch_bar({"ticker": "AAPL", "close": 99.0, "time": T0})
+
+        assert seen == [5.0, 5.0]
+
+    def test_double_tap_reads_vwap_hod_from_engine(self, engine):
+        """update_market_data 없이 스냅샷 VWAP/HOD로 재진입 판단"""
+        manager = DoubleTapManager(state_engine=engine)
+        entry = manager.on_first_exit("AAPL", exit_price=10.0, qty=100, reason="test")
+        entry.cooldown_minutes = 0
+        entry.first_exit_time = datetime.now() - timedelta(minutes=5)
+
+        engine.update("AAPL", 10.0, 100, T0)
+        engine.update("AAPL", 11.0, 100, T0 + 1)
+
+        assert manager.check_reentry("AAPL", 10.9) is False
+        assert entry.hod == 11.0
+        assert entry.state == DoubleTapState.WATCHING
+        assert manager.check_reentry("AAPL", 11.05) is True
+
+    async def test_ignition_seeds_volume_before_using_ticks(self, engine):
+        """IgnitionMonitor는 REST 당일 거래량을 1회 시드한 뒤 틱 상태를 사용"""
+        from backend.core.ignition_monitor import IgnitionMonitor
+
+        monitor = IgnitionMonitor(strategy=None, ws_manager=None, state_engine=engine)
+        monitor.watchlist_tickers = ["AAPL"]
+        engine.update("AAPL", 10.0, 100, datetime.now().timestamp())
+        assert monitor._quotes_from_state() == {}
+
+        monitor._seed_day_volume({"AAPL": {"price": 10.0, "volume": 50_000}})
+        assert monitor._quotes_from_state()["AAPL"]["volume"] == 50_000
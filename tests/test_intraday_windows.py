@@ -0,0 +1,97 @@
+# ============================================================================
+# IntradayWindowExtractor Tests
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - intraday_windows.py 모듈의 단위 테스트 ([user-043])
+#   - 날짜 구간 추출 == 전체 읽기 후 날짜 필터, 병렬 map 순서/결과 검증
+#
+# 📖 실행 방법:
+#   pytest tests/test_intraday_windows.py -v
+# ============================================================================
+
+import os
+import sys
+from datetime import date
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.data.intraday_windows import IntradayWindowExtractor, read_day_windows
+
+
+def write_minutes(path, days: list[str], with_premarket: bool = True) -> pd.DataFrame:
+    """하루 04:00~15:59 분봉을 여러 날짜로 생성 (작은 row group)"""
+    frames = []
+    for d in days:
+        start = pd.Timestamp(f"{d} 04:00" if with_premarket else f"{d} 09:30")
+        ts = pd.date_range(start, pd.Timestamp(f"{d} 15:59"), freq="1min")
+        frames.append(pd.DataFrame({
+            "timestamp": ts.astype("int64") // 10**6,
+            "open": 1.0, "high": 1.1, "low": 0.9, "close": 1.0,
+            "volume": range(len(ts)),
+        }))
+    df = pd.concat(frames, ignore_index=True)
+    df.to_parquet(path, index=False, row_group_size=500)
+    return df
+
+
+def count_rows(row: dict, day_data: pd.DataFrame) -> tuple:
+    """테스트용 콜백 (병렬 실행을 위해 모듈 레벨)"""
+    first = day_data["_ts"].min().strftime("%H:%M") if len(day_data) else None
+    return row["ticker"], row["target_date"], len(day_data), first
+
+
+@pytest.fixture
+def intraday_dir(tmp_path):
+    write_minutes(tmp_path / "AAA.parquet", ["2026-01-07", "2026-01-08", "2026-01-09"])
+    write_minutes(tmp_path / "BBB.parquet", ["2026-01-08"], with_premarket=False)
+    return tmp_path
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 추출 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestIntradayWindows:
+    """분봉 날짜 구간 일괄 추출 검증"""
+
+    def test_read_day_windows_matches_full_filter(self, intraday_dir):
+        """필터로 읽은 날짜별 구간 == 전체 읽기 후 날짜 필터"""
+        path = intraday_dir / "AAA.parquet"
+        wanted = [date(2026, 1, 9), date(2026, 1, 7), date(2026, 1, 10)]
+        days = read_day_windows(path, wanted)
+
+        full = pd.read_parquet(path)
+        full["_ts"] = pd.to_datetime(full["timestamp"], unit="ms")
+        for d in wanted:
+            expected = full[full["_ts"].dt.date == d].reset_index(drop=True)
+            assert len(days[d]) == len(expected)
+            if len(expected):
+                pd.testing.assert_frame_equal(days[d], expected)
+        assert days[date(2026, 1, 10)].empty
+
+    def test_missing_file_gives_empty_days(self, tmp_path):
+        """파일이 없으면 모든 날짜가 빈 DataFrame"""
+        days = read_day_windows(tmp_path / "NONE.parquet", [date(2026, 1, 8)])
+        assert list(days) == [date(2026, 1, 8)] and days[date(2026, 1, 8)].empty
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_map_preserves_target_order(self, intraday_dir, workers):
+        """티커별로 묶어 처리해도 결과는 타겟 순서대로"""
+        targets = pd.DataFrame({
+            "ticker": ["BBB", "AAA", "ZZZ", "AAA", "BBB"],
+            "target_date": [date(2026, 1, 8), date(2026, 1, 9), date(2026, 1, 8),
+                            date(2026, 1, 7), date(2026, 1, 9)],
+        })
+        results = IntradayWindowExtractor(intraday_dir, max_workers=workers).map(targets, count_rows)
+
+        assert results == [
+            ("BBB", date(2026, 1, 8), 390, "09:30"),
+            ("AAA", date(2026, 1, 9), 720, "04:00"),
+            ("ZZZ", date(2026, 1, 8), 0, None),
+            ("AAA", date(2026, 1, 7), 720, "04:00"),
+            ("BBB", date(2026, 1, 9), 0, None),
+        ]
@@ -10,9 +10,11 @@
 #   pytest tests/test_massive_loader.py -v
 # ============================================================================
 
+import json
+
 import pytest
 from datetime import datetime
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 # 테스트 대상 모듈 임포트를 위한 경로 설정
 import os
@@ -20,6 +22,7 @@ import sys
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
+from backend.data.massive_client import MassiveAPIError
 from backend.data.massive_loader import MassiveLoader, US_HOLIDAYS
 
 
@@ -202,6 +205,113 @@ class TestIncrementalUpdate:
             mock_initial.assert_called_once_with(days=30)
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# 파이프라인 로드 테스트 [user-029]
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _bars_for(date: str) -> list[dict]:
+    return [{"ticker": "AAPL", "date": date, "open": 1, "high": 1, "low": 1, "close": 1, "volume": 1}]
+
+
+class TestPipelineLoad:
+    """동시 Fetch + 배치 Writer + 체크포인트 테스트"""
+
+    DAYS = [f"2024-12-{d:02d}" for d in (2, 3, 4, 5, 6, 9, 10, 11, 12, 13)]
+
+    @pytest.mark.asyncio
+    async def test_writer_batches_multiple_days_per_commit(self):
+        """write_batch_days일치를 모아 한 번에 저장"""
+        mock_db = AsyncMock()
+        mock_db.upsert_bulk.side_effect = lambda bars: len(bars)
+        mock_client = AsyncMock()
+        mock_client.fetch_grouped_daily.side_effect = _bars_for
+
+        loader = MassiveLoader(mock_db, mock_client, fetch_concurrency=4, write_batch_days=4)
+        records, success, errors = await loader._load_days(self.DAYS)
+
+        assert (records, success, errors) == (10, 10, 0)
+        assert mock_client.fetch_grouped_daily.call_count == 10
+        # 10일 / 4일 배치 = 3회 커밋
+        assert mock_db.upsert_bulk.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_resumes_failed_days(self, tmp_path):
+        """실패한 날짜는 체크포인트에 남고 다음 실행에서 재시도"""
+        checkpoint = tmp_path / "load.json"
+
+        async def flaky(date):
+            if date == "2024-12-05":
+                raise MassiveAPIError("boom")
+            return _bars_for(date)
+
+        mock_db = AsyncMock()
+        mock_db.upsert_bulk.side_effect = lambda bars: len(bars)
+        mock_client = AsyncMock()
+        mock_client.fetch_grouped_daily.side_effect = flaky
+
+        loader = MassiveLoader(mock_db, mock_client, checkpoint_path=checkpoint)
+        _, success, errors = await loader._load_days(self.DAYS)
+
+        assert (success, errors) == (9, 1)
+        saved = json.loads(checkpoint.read_text())
+        assert set(saved["targets"]) - set(saved["completed"]) == {"2024-12-05"}
+
+        # 재실행: 새 날짜가 없어도 남은 날짜만 로드 후 체크포인트 삭제
+        mock_client.fetch_grouped_daily.reset_mock()
+        mock_client.fetch_grouped_daily.side_effect = _bars_for
+        _, success, _ = await loader._load_days([])
+
+        assert success == 1
+        mock_client.fetch_grouped_daily.assert_called_once_with("2024-12-05")
+        assert not checkpoint.exists()
+
+    @pytest.mark.asyncio
+    async def test_failed_write_is_not_checkpointed(self, tmp_path):
+        """Parquet 저장이 실패한 배치는 completed에 남기지 않음 (스레드에서 저장)"""
+        import threading
+
+        checkpoint = tmp_path / "load.json"
+        write_threads = []
+
+        def append_daily(df):
+            write_threads.append(threading.current_thread())
+            if "2024-12-02" in set(df["date"]):
+                raise OSError("disk full")
+
+        mock_db = AsyncMock()
+        mock_db.upsert_bulk.side_effect = lambda bars: len(bars)
+        mock_client = AsyncMock()
+        mock_client.fetch_grouped_daily.side_effect = _bars_for
+        pm = MagicMock()
+        pm.append_daily.side_effect = append_daily
+
+        loader = MassiveLoader(
+            mock_db, mock_client, parquet_manager=pm, checkpoint_path=checkpoint,
+            fetch_concurrency=1, write_batch_days=5,
+        )
+        _, success, errors = await loader._load_days(self.DAYS)
+
+        assert (success, errors) == (5, 5)
+        saved = json.loads(checkpoint.read_text())
+        assert set(saved["targets"]) - set(saved["completed"]) == set(self.DAYS[:5])
+        assert write_threads and threading.main_thread() not in write_threads
+
+    @pytest.mark.asyncio
+    async def test_abort_after_max_errors(self):
+        """에러 수가 max_errors를 초과하면 나머지 날짜는 호출하지 않음"""
+        mock_db = AsyncMock()
+        mock_client = AsyncMock()
+        mock_client.fetch_grouped_daily.side_effect = MassiveAPIError("down")
+
+        loader = MassiveLoader(mock_db, mock_client, fetch_concurrency=1)
+        _, success, errors = await loader._load_days(self.DAYS, max_errors=2)
+
+        assert success == 0
+        assert errors == 3
+        mock_db.upsert_bulk.assert_not_called()
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # 동기화 상태 테스트
 # ═══════════════════════════════════════════════════════════════════════════
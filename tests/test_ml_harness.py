@@ -0,0 +1,196 @@
+# ============================================================================
+# ML Harness Tests
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - scripts/ml_harness.py 단위 테스트 ([user-050])
+#   - 학습 행렬 캐시 (재사용/무효화), 날짜 기준 walk-forward fold,
+#     탐색 조합 추출, AUC, 병렬 실행 == 직렬 실행 + 실험 로그
+#
+# 📖 실행 방법:
+#   pytest tests/test_ml_harness.py -v
+# ============================================================================
+
+import json
+import os
+import sys
+from itertools import product
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from scripts.ml_harness import (
+    load_training_matrix,
+    roc_auc,
+    run_search,
+    sample_params,
+    walk_forward_folds,
+    xgb_factory,
+)
+
+
+class ThresholdModel:
+    """XGBClassifier 대역 (첫 피처를 학습 구간 평균 기준으로 시그모이드)"""
+
+    def __init__(self, params: dict, n_jobs: int):
+        self.scale = params.get("scale", 1.0)
+
+    def fit(self, X, y):
+        self.center = float(np.mean(X[:, 0]))
+        return self
+
+    def predict_proba(self, X):
+        p = 0.5 * (1 + np.tanh((np.asarray(X[:, 0]) - self.center) * self.scale / 2))
+        return np.column_stack([1 - p, p])
+
+
+def threshold_factory(params: dict, n_jobs: int) -> ThresholdModel:
+    return ThresholdModel(params, n_jobs)
+
+
+def _training_data(n: int = 600, seed: int = 3):
+    """날짜가 섞인 순서의 (X, y, dates), 첫 피처가 라벨과 상관"""
+    rng = np.random.default_rng(seed)
+    dates = pd.Series(rng.choice(pd.bdate_range("2024-01-01", periods=60), n))
+    y = pd.Series((rng.random(n) < 0.3).astype(int))
+    X = pd.DataFrame({
+        "signal": y * 1.5 + rng.normal(0, 1, n),
+        "noise": rng.normal(0, 1, n),
+    })
+    return X, y, dates
+
+
+@pytest.fixture
+def matrix(tmp_path):
+    source = tmp_path / "features.parquet"
+    source.write_bytes(b"v1")
+    return load_training_matrix(_training_data, sources=[source], cache_dir=tmp_path / "cache")
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 학습 행렬 캐시 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestTrainingMatrix:
+    """캐시 재사용 / 무효화 / 날짜 정렬"""
+
+    def test_cache_reuse_and_invalidation(self, tmp_path):
+        source = tmp_path / "features.parquet"
+        source.write_bytes(b"v1")
+        calls = []
+
+        def build():
+            calls.append(1)
+            return _training_data()
+
+        def load(**kwargs):
+            return load_training_matrix(build, sources=[source], cache_dir=tmp_path / "cache", **kwargs)
+
+        first = load()
+        second = load()
+        assert len(calls) == 1
+        np.testing.assert_array_equal(first.X, second.X)
+        assert second.feature_names == ["signal", "noise"]
+        assert (np.diff(second.dates.astype("int64")) >= 0).all()
+
+        source.write_bytes(b"v2-changed")
+        load()
+        load(extra={"exclude_cols": ["noise"]})
+        load(extra={"exclude_cols": ["noise"]}, rebuild=True)
+        assert len(calls) == 4
+
+    def test_rows_follow_date_sort(self, matrix):
+        X, y, dates = _training_data()
+        order = np.argsort(pd.to_datetime(dates).to_numpy(), kind="stable")
+        np.testing.assert_allclose(matrix.X[:, 0], X["signal"].to_numpy()[order], rtol=1e-6)
+        np.testing.assert_array_equal(matrix.y, y.to_numpy()[order])
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Fold / 탐색 공간 / 지표 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestFoldsAndSearchSpace:
+    """walk-forward fold, 조합 추출, AUC"""
+
+    def test_walk_forward_folds(self, matrix):
+        folds = walk_forward_folds(matrix.dates, n_splits=4)
+        assert len(folds) == 4
+        for prev, fold in zip(folds, folds[1:]):
+            assert fold.train_end == prev.test_end  # 확장형: 직전 test가 다음 train에 포함
+        for fold in folds:
+            train_dates = set(matrix.dates[: fold.train_end])
+            test_dates = set(matrix.dates[fold.train_end : fold.test_end])
+            assert train_dates and test_dates and not (train_dates & test_dates)
+            assert max(train_dates) < min(test_dates)
+        assert folds[-1].test_end == len(matrix)
+
+    def test_too_few_dates(self):
+        with pytest.raises(ValueError):
+            walk_forward_folds(np.array(["2024-01-02", "2024-01-03"], dtype="datetime64[D]"), 5)
+
+    def test_sample_params_bounded_and_unique(self):
+        base = {"max_depth": 6, "random_state": 42}
+        space = {"max_depth": [3, 4], "learning_rate": [0.05, 0.1]}
+        trials = sample_params(base, space, n_trials=3)
+        assert trials[0] == base and len(trials) == 3
+        assert all(t["random_state"] == 42 for t in trials)
+        assert len({tuple(sorted(t.items())) for t in trials[1:]}) == 2
+
+        # 격자 크기(4) + 기본 1개로 상한
+        assert len(sample_params(base, space, n_trials=100)) == 5
+
+    def test_roc_auc_matches_pairwise(self):
+        rng = np.random.default_rng(0)
+        y = rng.integers(0, 2, 200)
+        p = np.round(rng.random(200), 1)  # 동점 포함
+        pairs = [(a, b) for a, b in product(p[y == 1], p[y == 0])]
+        expected = np.mean([1.0 if a > b else 0.5 if a == b else 0.0 for a, b in pairs])
+        assert roc_auc(y, p) == pytest.approx(expected)
+        assert roc_auc(np.ones(5), np.random.random(5)) is None
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 병렬 탐색 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestRunSearch:
+    """병렬 == 직렬, 실험 로그"""
+
+    def test_parallel_matches_serial_and_logs(self, matrix, tmp_path):
+        folds = walk_forward_folds(matrix.dates, n_splits=3)
+        trials = [{"scale": 0.0}, {"scale": 2.0}]
+        log = tmp_path / "experiments.jsonl"
+
+        parallel = run_search(matrix, trials, folds, workers=2, factory=threshold_factory, log_path=log)
+        serial = run_search(matrix, trials, folds, workers=1, factory=threshold_factory, log_path=log, tag="serial")
+
+        def fold_metrics(record):
+            return [[(f["fold"], f["auc"], f["logloss"]) for f in t["folds"]] for t in record["trials"]]
+
+        assert fold_metrics(parallel) == fold_metrics(serial)
+        assert parallel["workers"] == 2 and serial["workers"] == 1
+
+        # scale=0 → 상수 예측 (AUC 0.5), scale=2 → 신호 반영
+        assert parallel["trials"][0]["auc_mean"] == pytest.approx(0.5)
+        assert parallel["best"]["trial"] == 1 and parallel["best"]["params"] == {"scale": 2.0}
+
+        lines = [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines()]
+        assert [r["tag"] for r in lines] == ["", "serial"]
+        fold = lines[0]["trials"][1]["folds"][0]
+        assert {"n_train", "n_test", "auc", "logloss", "fit_s", "predict_s", "pid"} <= set(fold)
+        assert lines[0]["matrix"]["signature"] == matrix.signature
+
+    def test_xgboost_end_to_end(self, matrix):
+        pytest.importorskip("xgboost")
+        folds = walk_forward_folds(matrix.dates, n_splits=2)
+        record = run_search(
+            matrix, [{"n_estimators": 10, "max_depth": 2}], folds,
+            workers=2, factory=xgb_factory, log_path=None,
+        )
+        assert record["best"]["auc_mean"] > 0.6
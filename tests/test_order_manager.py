@@ -28,11 +28,13 @@ if str(backend_path) not in sys.path:
     sys.path.insert(0, str(backend_path))
 
 from core.order_manager import (
+    OrderBook,
     OrderManager,
     OrderRecord,
     OrderStatus,
     OrderType,
     Position,
+    TradeLog,
 )
 
 
@@ -294,6 +296,82 @@ class TestOrderManager:
         assert manager._trade_log[0]["fill_price"] == 155.50
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# [user-034] OrderBook / TradeLog 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _record(order_id: int, symbol: str = "AAPL", oca_group=None) -> OrderRecord:
+    return OrderRecord(
+        order_id=order_id,
+        symbol=symbol,
+        action="SELL",
+        qty=10,
+        order_type=OrderType.STOP,
+        status=OrderStatus.PENDING,
+        oca_group=oca_group,
+    )
+
+
+class TestOrderBook:
+    """인덱스 주문 장부 테스트"""
+
+    def test_symbol_and_oca_indexes(self):
+        """심볼별 미체결 / OCA 그룹 조회"""
+        book = OrderBook()
+        book.add(_record(1, "AAPL", "OCA_A"))
+        book.add(_record(2, "AAPL", "OCA_A"))
+        book.add(_record(3, "TSLA"))
+
+        assert {r.order_id for r in book.open_orders("AAPL")} == {1, 2}
+        assert {r.order_id for r in book.oca_orders("OCA_A")} == {1, 2}
+
+        book.close(1, OrderStatus.FILLED)
+
+        assert [r.order_id for r in book.open_orders("AAPL")] == [2]
+        assert len(book.open_orders()) == 2
+        assert book.get(1).status == OrderStatus.FILLED
+
+    def test_closed_orders_are_bounded(self):
+        """종료 주문은 max_closed개만 유지 (미체결은 유지)"""
+        book = OrderBook(max_closed=2)
+        for i in range(5):
+            book.add(_record(i, oca_group=f"G{i}"))
+        for i in range(4):
+            book.close(i, OrderStatus.CANCELLED)
+
+        assert sorted(book.orders) == [2, 3, 4]
+        assert book.oca_groups == ["G2", "G3", "G4"]
+
+    def test_trade_log_ring_and_since(self):
+        """거래 로그 링: 오래된 항목 밀림 + seq 이후 증분 조회"""
+        log = TradeLog(maxlen=3)
+        for i in range(5):
+            log.append({"order_id": i})
+
+        assert [e["order_id"] for e in log] == [2, 3, 4]
+        assert log.dropped == 2
+        assert [e["seq"] for e in log.get_since(3)] == [4, 5]
+        assert log.get_since(5) == []
+        assert len(log.get_since(0)) == 3
+
+    def test_manager_fill_closes_order_and_logs(self):
+        """체결 콜백 → 미체결 인덱스 제거 + 증분 거래 로그"""
+        connector = MagicMock()
+        connector.place_market_order.side_effect = [1, 2]
+        manager = OrderManager(connector, trade_log_size=100)
+        manager.execute_entry("AAPL", 10)
+        manager.execute_entry("AAPL", 5)
+
+        manager._on_order_filled({"order_id": 1, "fill_price": 10.0})
+        manager._on_order_filled({"order_id": 999, "fill_price": 1.0})  # 모르는 주문
+
+        assert [o.order_id for o in manager.get_pending_orders("AAPL")] == [2]
+        log = manager.get_trade_log()
+        assert len(log) == 1
+        assert manager.get_trade_log(since_seq=log[-1]["seq"]) == []
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # IBKRConnector 주문 메서드 Mock 테스트
 # ═══════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,197 @@
+# ============================================================================
+# Parquet Quality Engine Tests
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - parquet_quality.py 모듈의 단위 테스트
+#   - 파일 검사 결과(중복/누락 컬럼/OHLC), Row Group 통계 생략, 결과 캐시 검증
+#   - validate_parquet_quality / repair_parquet_data 연동 검증
+#
+# 📖 실행 방법:
+#   pytest tests/test_parquet_quality.py -v
+# ============================================================================
+
+import os
+import sys
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.data.parquet_quality import (
+    ParquetQualityEngine,
+    find_intraday_files,
+    validate_intraday_file,
+)
+from backend.data.validators import validate_ohlc_relationship
+
+
+def _bars(n: int, start: int = 0) -> pd.DataFrame:
+    ts = [1_700_000_000_000 + (start + i) * 60_000 for i in range(n)]
+    return pd.DataFrame({
+        "timestamp": ts,
+        "open": 10.0, "high": 11.0, "low": 9.0, "close": 10.5, "volume": 100,
+    })
+
+
+@pytest.fixture
+def store(tmp_path):
+    """1m: 정상 / 중복 / OHLC 위반 / 컬럼 누락 파일"""
+    tf_dir = tmp_path / "1m"
+    tf_dir.mkdir()
+    _bars(50).to_parquet(tf_dir / "GOOD.parquet", index=False)
+    pd.concat([_bars(30), _bars(5, start=10)]).to_parquet(tf_dir / "DUPS.parquet", index=False)
+    bad = _bars(20)
+    bad.loc[3, "high"] = 8.0
+    bad.loc[7, "low"] = 10.8
+    bad.to_parquet(tf_dir / "OHLC.parquet", index=False)
+    _bars(5).drop(columns=["volume"]).to_parquet(tf_dir / "NOVOL.parquet", index=False)
+    return tmp_path
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 파일 검사 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestValidateIntradayFile:
+    """단일 파일 검사 결과"""
+
+    def test_quick_checks(self, store):
+        """중복 수 / 누락 컬럼 / 정상 판정"""
+        good = validate_intraday_file(store / "1m" / "GOOD.parquet", "1m")
+        assert good["valid"] and good["warning"] is None and good["records"] == 50
+
+        dups = validate_intraday_file(store / "1m" / "DUPS.parquet", "1m")
+        assert dups["duplicates"] == 5 and dups["warning"] == "중복 5건"
+
+        novol = validate_intraday_file(store / "1m" / "NOVOL.parquet", "1m")
+        assert not novol["valid"] and "누락 컬럼" in novol["error"]
+
+    def test_full_ohlc_matches_validator(self, store):
+        """full 모드 위반 수 == validate_ohlc_relationship (전체 로드)"""
+        path = store / "1m" / "OHLC.parquet"
+        expected = len(validate_ohlc_relationship(pd.read_parquet(path)))
+        result = validate_intraday_file(path, "1m", full_ohlc=True)
+        assert expected > 0
+        assert result["ohlc_violations"] == expected
+
+    def test_clean_row_groups_skipped(self, tmp_path, monkeypatch):
+        """통계상 위반 불가한 Row Group은 읽지 않음"""
+        path = tmp_path / "RG.parquet"
+        df = _bars(40)
+        df.loc[35, "high"] = 1.0  # 마지막 Row Group만 위반
+        pq.write_table(pa.Table.from_pandas(df), path, row_group_size=10)
+
+        read_groups = []
+        original = pq.ParquetFile.read_row_groups
+
+        def spy(self, row_groups, *args, **kwargs):
+            read_groups.extend(row_groups)
+            return original(self, row_groups, *args, **kwargs)
+
+        monkeypatch.setattr(pq.ParquetFile, "read_row_groups", spy)
+        result = validate_intraday_file(path, "1m", full_ohlc=True)
+        assert read_groups == [3]
+        assert result["ohlc_violations"] == 2  # high < low, high < max(open, close)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 엔진 / 캐시 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestParquetQualityEngine:
+    """병렬 검사 + 결과 캐시"""
+
+    def test_rerun_only_checks_changed_files(self, store):
+        """재실행 시 캐시 재사용, 변경 파일만 재검사 (touch만 된 파일은 캐시 유지)"""
+        files = find_intraday_files(store)
+        first = ParquetQualityEngine(store, max_workers=2).validate_intraday_files(files)
+        assert [r["file"] for r in first] == [str(f) for f, _ in files]
+
+        engine = ParquetQualityEngine(store, max_workers=1)
+        assert engine.validate_intraday_files(files) == first
+        assert engine.last_run == {"checked": 0, "cached": 4}
+
+        # 내용 변경 1개 + mtime만 변경 1개
+        _bars(60).to_parquet(store / "1m" / "DUPS.parquet", index=False)
+        good = store / "1m" / "GOOD.parquet"
+        os.utime(good, ns=(good.stat().st_atime_ns, good.stat().st_mtime_ns + 10**9))
+
+        results = engine.validate_intraday_files(files)
+        assert engine.last_run == {"checked": 1, "cached": 3}
+        dups = next(r for r in results if r["file"].endswith("DUPS.parquet"))
+        assert dups["duplicates"] == 0 and dups["records"] == 60
+
+        # quick 결과는 full 모드에 재사용하지 않음
+        engine.validate_intraday_files(files, full_ohlc=True)
+        assert engine.last_run["checked"] == 4
+
+    def test_validate_intraday_report_shape(self, store):
+        """validate_intraday 집계 형식 유지"""
+        from backend.scripts.validate_parquet_quality import validate_intraday
+
+        report = validate_intraday(store, full_ohlc=True, max_workers=1)
+        assert report["files"] == 4 and report["valid"] == 3
+        assert report["by_tf"]["1m"] == {"files": 4, "valid": 3, "errors": 1, "ohlc_violations": 3}
+        assert report["ohlc_violations_total"] == 3
+        assert any("NOVOL.parquet" in e for e in report["errors"])
+
+    def test_repair_rewrites_only_duplicate_files(self, store):
+        """DataRepairer: 중복 있는 파일만 다시 씀"""
+        from backend.scripts.repair_parquet_data import DataRepairer
+
+        mtimes = {f.name: f.stat().st_mtime_ns for f in (store / "1m").glob("*.parquet")}
+        repairer = DataRepairer(
+            store,
+            backup_dir=store / "backup",
+            dry_run=False,
+            engine=ParquetQualityEngine(store, max_workers=1),
+        )
+        assert repairer.remove_duplicates_intraday() == 5
+
+        assert len(pd.read_parquet(store / "1m" / "DUPS.parquet")) == 30
+        changed = {
+            f.name for f in (store / "1m").glob("*.parquet")
+            if f.stat().st_mtime_ns != mtimes[f.name]
+        }
+        assert changed == {"DUPS.parquet"}
+
+    def test_repair_keeps_catalog_in_sync(self, store):
+        """DataRepairer 쓰기는 ParquetManager 경유 → 카탈로그가 복구 결과와 일치"""
+        from backend.data.parquet_manager import ParquetManager
+        from backend.data.storage_catalog import file_state
+        from backend.scripts.repair_parquet_data import DataRepairer
+
+        daily = pd.DataFrame({
+            "ticker": ["AAA", "AAA", "AAA"],
+            "date": ["2024-01-02", "2024-01-03", "2024-01-03"],
+            "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 10,
+        })
+        (store / "daily").mkdir()
+        daily.to_parquet(store / "daily" / "all_daily.parquet", index=False)
+
+        pm = ParquetManager(str(store))
+        pm.rebuild_catalog()
+        assert pm.catalog.series("DUPS", "1m")["rows"] == 35
+
+        repairer = DataRepairer(
+            store,
+            backup_dir=store / "backup",
+            dry_run=False,
+            engine=ParquetQualityEngine(store, max_workers=1),
+            parquet_manager=pm,
+        )
+        assert repairer.remove_duplicates_intraday() == 5
+        assert repairer.remove_duplicates_daily() == 1
+
+        dups = store / "1m" / "DUPS.parquet"
+        series = pm.catalog.series("DUPS", "1m")
+        assert series["rows"] == 30
+        assert (series["mtime_ns"], series["size_bytes"]) == file_state(dups)
+        assert pm.catalog.is_dir_fresh(store / "1m", "1m")
+        assert pm.catalog.is_file_fresh(store / "daily" / "all_daily.parquet")
+        assert pm.catalog.stats()["daily_rows"] == 2
@@ -0,0 +1,164 @@
+# ============================================================================
+# RiskLedger Tests
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - risk_manager.py의 증분 리스크 장부 단위 테스트
+#   - 일/주 손익 누계, Kelly 통계, 포지션 노출, 스냅샷 복원 검증
+#
+# 📖 실행 방법:
+#   pytest tests/test_risk_ledger.py -v
+# ============================================================================
+
+import os
+import sys
+from datetime import date, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.core.risk_manager import RiskLedger, RiskManager
+from backend.models import RiskConfig
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Fixtures
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+@pytest.fixture
+def manager():
+    """잔고 $10,000, Kelly 최소 5건"""
+    rm = RiskManager(config=RiskConfig(kelly_min_trades=5))
+    rm.set_starting_balance(10_000)
+    return rm
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 장부 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestRiskLedger:
+    """RiskLedger 증분 집계 검증"""
+
+    def test_daily_and_weekly_totals(self, manager):
+        """record_trade → 일/주 손익 누계 (주간 손실 한도 반영)"""
+        manager.record_trade("AAPL", 100.0, 2.0)
+        manager.record_trade("TSLA", -600.0, -6.0)
+
+        today = date.today().strftime("%Y-%m-%d")
+        assert manager._daily_pnl[today].trade_count == 2
+        assert manager._daily_pnl[today].realized_pnl == pytest.approx(-500.0)
+        assert manager._calculate_weekly_pnl() == pytest.approx(-5.0)
+
+    def test_week_rollover_excludes_last_week(self):
+        """지난주 실현 손익은 새 주의 누계에 포함되지 않음"""
+        ledger = RiskLedger()
+        today = date.today()
+        last_week = today - timedelta(days=7)
+        ledger._roll(last_week)
+        ledger.daily[ledger.day].realized_pnl = -500.0
+        ledger.weekly_realized = -500.0
+
+        ledger.record_trade(50.0, 1.0)
+
+        assert ledger.weekly_realized == pytest.approx(50.0)
+        assert last_week.strftime("%Y-%m-%d") in ledger.daily
+
+    def test_kelly_matches_full_scan(self, manager):
+        """증분 Kelly == 전체 기록 재계산 (직접 추가한 기록 포함)"""
+        samples = [5.0, -2.0, 3.0, -1.0, 4.0, 6.0, -3.0]
+        for pct in samples[:4]:
+            manager.record_trade("AAPL", pct * 10, pct)
+        for pct in samples[4:]:
+            manager._trade_history.append({"pnl_pct": pct})
+
+        wins = [p for p in samples if p > 0]
+        losses = [p for p in samples if p <= 0]
+        b = (sum(wins) / len(wins)) / abs(sum(losses) / len(losses))
+        p = len(wins) / len(samples)
+        expected = max(0.0, min((b * p - (1 - p)) / b * manager.config.kelly_fraction, 0.25))
+
+        assert manager._calculate_kelly_fraction() == pytest.approx(expected)
+
+    def test_positions_and_marks(self, manager):
+        """포지션 반영 + 틱 마킹 → 미실현 손익/노출, 포지션 수는 브로커 왕복 없이"""
+        manager.on_positions_update(
+            [
+                {"symbol": "AAPL", "qty": 10, "avg_price": 100.0},
+                {"symbol": "TSLA", "qty": 5, "avg_price": 200.0},
+            ]
+        )
+        manager.on_tick({"ticker": "AAPL", "price": 110.0})
+        manager.on_tick({"ticker": "MSFT", "price": 50.0})  # 미보유 무시
+
+        exposure = manager.get_exposure()
+        assert exposure["unrealized_pnl"] == pytest.approx(100.0)
+        assert exposure["gross_exposure"] == pytest.approx(1100.0 + 1000.0)
+        assert manager.get_position_count() == 2
+
+        manager.on_positions_update([{"symbol": "TSLA", "qty": 5, "avg_price": 200.0}])
+        assert manager.get_exposure()["gross_exposure"] == pytest.approx(1000.0)
+        assert manager.get_position_count() == 1
+
+    def test_snapshot_restores_ledger_and_kill_state(self, tmp_path):
+        """스냅샷 → 새 인스턴스에서 손익, Kelly 통계, Kill 상태 복원"""
+        path = tmp_path / "risk_ledger.json"
+        rm = RiskManager(snapshot_path=str(path))
+        rm.set_starting_balance(10_000)
+        rm.on_positions_update([{"symbol": "AAPL", "qty": 10, "avg_price": 100.0}])
+        rm.record_trade("AAPL", -300.0, -3.0)
+        rm.kill_switch("test")
+        rm.save_snapshot()
+
+        restored = RiskManager(snapshot_path=str(path))
+
+        assert restored._ledger.weekly_realized == pytest.approx(-300.0)
+        assert restored._ledger.trade_count == 1
+        assert restored._starting_balance == 10_000
+        assert restored._is_killed
+        assert not restored.is_trading_allowed()
+
+        # 스냅샷 포지션은 브로커 갱신 전까지 포지션 수로 쓰지 않음
+        assert not restored._ledger.positions_known
+        assert restored.get_position_count() == 0  # 커넥터 없음 → 0
+        restored.on_positions_update([])
+        assert restored.get_position_count() == 0
+        assert restored.get_exposure()["gross_exposure"] == 0.0
+
+    def test_trades_after_restore_reach_restored_ledger(self, tmp_path):
+        """복원 후 record_trade → 복원된 장부의 거래 수/Kelly 통계 갱신"""
+        path = tmp_path / "risk_ledger.json"
+        rm = RiskManager(snapshot_path=str(path))
+        rm.set_starting_balance(10_000)
+        rm.record_trade("AAPL", 200.0, 2.0)
+        rm.save_snapshot()
+
+        restored = RiskManager(snapshot_path=str(path))
+        assert restored._ledger.trade_count == 1
+        restored.record_trade("TSLA", -100.0, -1.0)
+
+        assert restored._ledger.trade_count == 2
+        assert restored._trade_history._ledger is restored._ledger
+
+    def test_broker_positions_reach_ledger(self, tmp_path, monkeypatch):
+        """실제 배선: SimulatedBroker → OrderManager → RiskManager (Container 팩토리)"""
+        from backend.broker.simulated_broker import SimBrokerConfig, SimulatedBroker
+        from backend.container import Container
+        from backend.core.order_manager import OrderManager
+
+        monkeypatch.chdir(tmp_path)  # 팩토리의 data/risk_ledger.json 격리
+        broker = SimulatedBroker(SimBrokerConfig(ack_latency_ms=0, fill_latency_ms=0))
+        broker.process_tick("AAPL", 100.0, 1000, ts=0.0)
+        order_manager = OrderManager(broker)
+        risk = Container._create_risk_manager(broker, order_manager)
+
+        order_manager.execute_entry("AAPL", 10)
+        broker.advance(0.1)
+
+        assert risk._ledger.positions_known
+        assert risk.get_position_count() == 1
+        risk.on_tick({"ticker": "AAPL", "price": 105.0})
+        assert risk.get_exposure()["unrealized_pnl"] == pytest.approx(50.0)
+        assert order_manager.get_position("AAPL").qty == 10
@@ -0,0 +1,161 @@
+# ============================================================================
+# Score Journal Tests
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - score_journal.py 모듈의 단위 테스트
+#   - 변경분만 기록 / 세그먼트 Flush / Compaction / 궤적 조회 검증
+#
+# 📖 실행 방법:
+#   pytest tests/test_score_journal.py -v
+# ============================================================================
+
+import shutil
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.data.score_journal import ScoreJournal
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Fixtures
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+@pytest.fixture
+def scores_dir():
+    """임시 scores 디렉터리"""
+    tmpdir = tempfile.mkdtemp()
+    yield Path(tmpdir)
+    shutil.rmtree(tmpdir)
+
+
+# 2024-12-17 10:00 (로컬 시각) 기준 Unix ms
+BASE_TS = int(datetime(2024, 12, 17, 10, 0).timestamp() * 1000)
+DAY = "2024-12-17"
+
+
+def _score(value: float, tr: float = 0.5) -> dict:
+    return {"score_v3": value, "intensities_v3": {"tight_range": tr, "volume_dryout": 0.1}}
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 기록 / 조회 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestScoreJournal:
+    """ScoreJournal 동작 검증"""
+
+    def test_unchanged_score_is_not_recorded(self, scores_dir):
+        """같은 값 반복 업데이트는 1행만 기록"""
+        journal = ScoreJournal(scores_dir)
+
+        assert journal.record("AAPL", "v3", _score(70), ts=BASE_TS) is True
+        assert journal.record("AAPL", "v3", _score(70), ts=BASE_TS + 1000) is False
+        assert journal.record("AAPL", "v3", _score(71), ts=BASE_TS + 2000) is True
+
+        assert journal.flush() == 2
+
+    def test_flush_writes_only_changes(self, scores_dir):
+        """Flush마다 변경분만 새 세그먼트로 기록"""
+        journal = ScoreJournal(scores_dir)
+        for i, ticker in enumerate(["AAA", "BBB", "CCC"]):
+            journal.record(ticker, "v3", _score(50 + i), ts=BASE_TS)
+        journal.flush()
+
+        journal.record("BBB", "v3", _score(90), ts=BASE_TS + 5000)
+        assert journal.flush() == 1
+
+        segments = sorted((scores_dir / "journal" / DAY).glob("seg_*.parquet"))
+        assert len(segments) == 2
+
+    def test_trajectory_includes_pending_rows(self, scores_dir):
+        """궤적 조회는 디스크 + 대기 행을 시간순으로 반환"""
+        journal = ScoreJournal(scores_dir)
+        journal.record("AAPL", "v3", _score(60), ts=BASE_TS)
+        journal.record("MSFT", "v3", _score(10), ts=BASE_TS)
+        journal.flush()
+        journal.record("AAPL", "v3", _score(75, tr=0.9), ts=BASE_TS + 60_000)
+
+        df = journal.get_trajectory("AAPL", date=DAY)
+
+        assert df["score"].tolist() == [60.0, 75.0]
+        assert df["i_tight_range"].tolist() == [0.5, 0.9]
+        assert df["i_obv_divergence"].isna().all()
+
+    def test_compact_merges_segments(self, scores_dir):
+        """Compaction은 세그먼트를 병합 (스냅샷은 전후 동일)"""
+        journal = ScoreJournal(scores_dir)
+        for step in range(3):
+            journal.record("AAPL", "v3", _score(60 + step), ts=BASE_TS + step * 1000)
+            journal.record("MSFT", "v3", _score(30 + step), ts=BASE_TS + step * 1000)
+            journal.flush()
+
+        before = journal.get_snapshot("v3")
+        journal.compact()
+
+        day_dir = scores_dir / "journal" / DAY
+        assert not list(day_dir.glob("seg_*.parquet"))
+        assert (day_dir / "compacted.parquet").exists()
+        assert len(journal.get_trajectory("AAPL", date=DAY)) == 3
+
+        snapshot = journal.get_snapshot("v3").set_index("ticker")
+        assert snapshot.loc["AAPL", "score"] == 62.0
+        assert snapshot.loc["MSFT", "score"] == 32.0
+        assert snapshot.reset_index().equals(before)
+
+    def test_auto_compaction_after_n_segments(self, scores_dir):
+        """compact_every 세그먼트마다 자동 Compaction"""
+        journal = ScoreJournal(scores_dir, compact_every=2)
+        journal.record("AAPL", "v3", _score(1), ts=BASE_TS)
+        journal.flush()
+        journal.record("AAPL", "v3", _score(2), ts=BASE_TS + 1)
+        journal.flush()
+
+        assert not list((scores_dir / "journal" / DAY).glob("seg_*.parquet"))
+        assert journal.get_stats()["segments_since_compaction"] == 0
+
+    def test_sequence_resumes_after_restart(self, scores_dir):
+        """재시작 후에도 기존 세그먼트를 덮어쓰지 않음"""
+        journal = ScoreJournal(scores_dir)
+        journal.record("AAPL", "v3", _score(1), ts=BASE_TS)
+        journal.flush()
+
+        restarted = ScoreJournal(scores_dir)
+        restarted.record("AAPL", "v3", _score(2), ts=BASE_TS + 1)
+        restarted.flush()
+
+        assert len(restarted.get_trajectory("AAPL", date=DAY)) == 2
+
+    def test_snapshot_is_fresh_between_compactions(self, scores_dir):
+        """스냅샷은 Compaction 없이도 Flush/대기 행까지 반영"""
+        journal = ScoreJournal(scores_dir)
+        journal.record("AAPL", "v3", _score(60), ts=BASE_TS)
+        journal.flush()
+        journal.record("AAPL", "v3", _score(65), ts=BASE_TS + 1000)
+        journal.record("MSFT", "v3", _score(20), ts=BASE_TS + 1000)
+
+        snapshot = journal.get_snapshot("v3").set_index("ticker")
+        assert snapshot["score"].to_dict() == {"AAPL": 65.0, "MSFT": 20.0}
+        assert journal.get_snapshot("v4").empty
+        assert not list(scores_dir.glob("current_*.parquet"))
+
+    def test_segment_split_by_day(self, scores_dir):
+        """자정을 걸친 배치는 날짜별 세그먼트로 나눠 기록"""
+        journal = ScoreJournal(scores_dir)
+        next_day_ts = int(datetime(2024, 12, 18, 0, 0, 5).timestamp() * 1000)
+        journal.record("AAPL", "v3", _score(60), ts=BASE_TS)
+        journal.record("AAPL", "v3", _score(61), ts=next_day_ts)
+
+        assert journal.flush() == 2
+        assert journal.get_trajectory("AAPL", date=DAY)["score"].tolist() == [60.0]
+        assert journal.get_trajectory("AAPL", date="2024-12-18")["score"].tolist() == [61.0]
+        assert journal.get_snapshot("v3")["score"].tolist() == [61.0]
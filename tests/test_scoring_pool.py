@@ -0,0 +1,150 @@
+# ============================================================================
+# Scoring Pool Tests
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - scoring_pool.py 단위 테스트 (지연 시작, 재사용, 청크, 재시작, 종료)
+#   - Scanner가 주입된 풀을 스캔 간 재사용하는지 검증
+#
+# 📖 실행 방법:
+#   pytest tests/test_scoring_pool.py -v
+# ============================================================================
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.core.scanner import Scanner, _init_scoring_worker
+from backend.core.scoring_pool import ScoringPool
+from backend.data.data_repository import DataRepository
+from backend.data.parquet_manager import ParquetManager
+
+
+def _square(x: int) -> int:
+    return x * x
+
+
+def _pid(_: int) -> int:
+    return os.getpid()
+
+
+def _die_once(path: str) -> int:
+    """첫 호출에서 워커 프로세스를 강제 종료 (BrokenProcessPool 유발)"""
+    if not os.path.exists(path):
+        open(path, "w").close()
+        os._exit(1)
+    return 1
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# ScoringPool 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestScoringPool:
+    """풀 생명주기"""
+
+    def test_lazy_start_and_reuse(self):
+        pool = ScoringPool(max_workers=2)
+        assert not pool.started
+        try:
+            assert pool.map(_square, range(50)) == [x * x for x in range(50)]
+            executor = pool._executor
+            assert pool.map(_square, []) == []
+            # 워커는 필요할 때 생성되므로 pid 집합 대신 같은 풀의 프로세스인지 확인
+            assert pool._executor is executor
+            assert set(pool.map(_pid, range(20))) <= set(executor._processes)
+            assert pool.starts == 1 and pool.batches == 2 and pool.items == 70
+        finally:
+            pool.shutdown()
+
+    def test_chunksize(self):
+        assert ScoringPool(max_workers=4).chunksize_for(1600) == 100
+        assert ScoringPool(max_workers=4).chunksize_for(3) == 1
+        assert ScoringPool(max_workers=4, chunksize=25).chunksize_for(1600) == 25
+
+    def test_restarts_after_broken_worker(self, tmp_path):
+        pool = ScoringPool(max_workers=1)
+        try:
+            assert pool.map(_die_once, [str(tmp_path / "marker")]) == [1]
+            assert pool.starts == 2
+        finally:
+            pool.shutdown()
+
+    def test_shutdown(self):
+        pool = ScoringPool(max_workers=1, use_threads=True)
+        pool.warm()
+        pool.shutdown()
+        assert not pool.started
+        with pytest.raises(RuntimeError):
+            pool.map(_square, [1])
+
+    def test_startup_warms_container_pool(self):
+        """서버 시작 시 Container 풀 예열 (initializer까지 실행)"""
+        from dependency_injector import providers
+
+        from backend.container import container
+        from backend.startup.realtime import warm_scoring_pool
+
+        pool = ScoringPool(max_workers=1, use_threads=True)
+        try:
+            with container.scoring_pool.override(providers.Object(pool)):
+                asyncio.run(warm_scoring_pool())
+            assert pool.started and pool.starts == 1
+        finally:
+            pool.shutdown()
+
+    def test_shutdown_all_stops_pool(self):
+        from backend.startup.shutdown import shutdown_all
+
+        pool = ScoringPool(max_workers=1, use_threads=True)
+        pool.warm()
+        asyncio.run(shutdown_all(scoring_pool=pool))
+        assert not pool.started
+
+    def test_shutdown_all_settles_warmup_task(self):
+        """진행 중인 예열 태스크는 풀 종료 전에 취소 후 대기"""
+        from backend.startup.shutdown import shutdown_all
+
+        pool = ScoringPool(max_workers=1, use_threads=True)
+        pool.warm()
+
+        async def run():
+            task = asyncio.create_task(asyncio.sleep(3600))
+            await asyncio.sleep(0)
+            await shutdown_all(scoring_pool=pool, warmup_task=task)
+            return task
+
+        task = asyncio.run(run())
+        assert task.cancelled()
+        assert not pool.started
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Scanner 연동 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestScannerWithPool:
+    """주입된 풀 재사용 == 임시 풀 결과"""
+
+    def test_pool_reused_across_scans(self, tmp_path, monkeypatch, make_universe, scan_kwargs):
+        monkeypatch.delenv("AWS_LAMBDA_FUNCTION_NAME", raising=False)
+        pm = ParquetManager(str(tmp_path))
+        pm.write_daily(make_universe(n_tickers=60))
+        repo = DataRepository(pm)
+
+        pool = ScoringPool(max_workers=2, initializer=_init_scoring_worker)
+        try:
+            pooled = Scanner(repo, watchlist_size=1_000, scoring_pool=pool)
+            first = asyncio.run(pooled.run_daily_scan(**scan_kwargs))
+            second = asyncio.run(pooled.run_daily_scan(**scan_kwargs))
+            assert pool.starts == 1 and pool.batches == 2
+
+            standalone = Scanner(repo, watchlist_size=1_000)
+            assert first == second == asyncio.run(standalone.run_daily_scan(**scan_kwargs))
+        finally:
+            pool.shutdown()
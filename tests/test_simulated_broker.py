@@ -0,0 +1,173 @@
+# ============================================================================
+# SimulatedBroker Tests
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - simulated_broker.py 모듈의 단위 테스트
+#   - ack/fill 지연, Stop/Trailing 트리거, OCA/Bracket, 부분 체결,
+#     OrderManager 연동 검증 (가상 시간 모드 → 결정적)
+#
+# 📖 실행 방법:
+#   pytest tests/test_simulated_broker.py -v
+# ============================================================================
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.broker.simulated_broker import SimBrokerConfig, SimulatedBroker
+from backend.core.mock_data import MockPriceFeed
+from backend.core.order_manager import OrderManager, OrderStatus
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Fixtures
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+@pytest.fixture
+def broker():
+    """ack 5ms / fill 20ms, 시각 0에서 AAPL $100"""
+    sim = SimulatedBroker(SimBrokerConfig(ack_latency_ms=5, fill_latency_ms=20))
+    sim.process_tick("AAPL", 100.0, 1000, ts=0.0)
+    return sim
+
+
+@pytest.fixture
+def fills(broker):
+    """체결 callback 수집"""
+    collected = []
+    broker.set_on_order_filled(collected.append)
+    return collected
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 주문 매칭 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestSimulatedBroker:
+    """SimulatedBroker 매칭 / 지연 검증"""
+
+    def test_market_order_fills_after_latency(self, broker, fills):
+        """시장가: ack + fill 지연이 지나야 체결, 동기 체결 없음"""
+        order_id = broker.place_market_order("AAPL", 10)
+        assert fills == []
+
+        broker.advance(0.020)
+        assert fills == []
+        broker.advance(0.025)
+
+        assert fills[0]["order_id"] == order_id
+        assert fills[0]["fill_price"] == 100.0
+        stats = broker.get_stats()["latency"]
+        assert stats["submit_to_ack"]["p50_ms"] == pytest.approx(5, abs=0.5)
+        assert stats["submit_to_fill"]["max_ms"] == pytest.approx(25)
+
+    def test_stop_triggers_and_records_reaction_time(self, broker, fills):
+        """Stop: 가격 하향 돌파 → fill 지연 후 그 시점 가격으로 체결"""
+        broker.place_stop_order("AAPL", 10, 99.0)
+        broker.process_tick("AAPL", 99.5, 100, ts=0.010)
+        broker.process_tick("AAPL", 98.9, 100, ts=0.050)
+        broker.process_tick("AAPL", 98.5, 100, ts=0.060)
+        broker.advance(0.080)
+
+        assert fills[0]["fill_price"] == 98.5
+        trigger = broker.get_stats()["latency"]["trigger_to_fill"]
+        assert trigger["count"] == 1
+        assert trigger["max_ms"] == pytest.approx(20)
+
+    def test_trailing_stop_follows_high(self, broker, fills):
+        """Trailing: 고점 - trail 아래로 내려오면 트리거"""
+        broker.place_trailing_stop_order("AAPL", 10, trail_amount=1.0)
+        for i, price in enumerate([101.0, 103.0, 102.5, 102.1]):
+            broker.process_tick("AAPL", price, 100, ts=0.01 * (i + 1))
+        assert fills == []
+
+        broker.process_tick("AAPL", 101.9, 100, ts=0.1)
+        broker.advance(0.2)
+
+        assert fills[0]["fill_price"] == 101.9
+
+    def test_oca_fill_cancels_sibling(self, broker, fills):
+        """OCA: Profit Target 체결 시 Stop 자동 취소"""
+        cancelled = []
+        broker.set_on_order_cancelled(cancelled.append)
+        broker.place_oca_group("AAPL", 10, entry_price=100.0)
+
+        broker.process_tick("AAPL", 108.5, 100, ts=0.01)
+        broker.advance(0.1)
+
+        assert len(fills) == 1
+        assert len(cancelled) == 1
+        assert broker.get_open_orders() == []
+
+    def test_bracket_children_wait_for_parent(self, broker, fills):
+        """Bracket: 부모 체결 전 자식은 트리거되지 않음"""
+        parent, tp, sl = broker.place_bracket_order("AAPL", 10, 99.0, 105.0, 97.0)
+        broker.process_tick("AAPL", 96.0, 100, ts=0.01)  # 부모 지정가 충족
+        assert broker.get_order(sl).status == "PreSubmitted"
+
+        broker.process_tick("AAPL", 96.0, 100, ts=0.05)  # 부모 체결 → SL 활성화
+        broker.advance(0.1)
+
+        assert [f["order_id"] for f in fills] == [parent, sl]
+        assert broker.get_order(tp).status == "Cancelled"
+        assert broker.get_positions() == []
+
+    def test_partial_fills_by_participation(self):
+        """participation: 틱 거래량의 일부만 체결 → 여러 번에 나눠 체결"""
+        fills = []
+        sim = SimulatedBroker(SimBrokerConfig(ack_latency_ms=0, fill_latency_ms=0, participation=0.5))
+        sim.set_on_order_filled(fills.append)
+        sim.process_tick("AAPL", 10.0, 100, ts=0.0)
+        sim.place_market_order("AAPL", 120)
+
+        # 첫 50주는 접수 시점의 직전 틱($10.0), 이후 틱마다 50주씩
+        for i, price in enumerate([10.2, 10.4, 10.6]):
+            sim.process_tick("AAPL", price, 100, ts=0.01 * (i + 1))
+
+        assert sim.get_stats()["partial_fills"] == 2
+        assert len(fills) == 1
+        assert fills[0]["qty"] == 120
+        assert fills[0]["fill_price"] == pytest.approx((50 * 10.0 + 50 * 10.2 + 20 * 10.4) / 120)
+
+    def test_orders_before_first_tick_are_rebased(self):
+        """녹화 틱(Unix 시각) 재생 전에 낸 주문도 지연 통계가 정상"""
+        sim = SimulatedBroker()
+        sim.place_market_order("MOCK", 5)
+        feed = MockPriceFeed(initial_price=10.0, seed=1)
+        sim.replay(feed.generate_tick() for _ in range(5))
+
+        stats = sim.get_stats()
+        assert stats["fills"] == 1
+        assert stats["latency"]["submit_to_fill"]["max_ms"] < 1000
+
+    def test_order_manager_drop_in(self, broker):
+        """OrderManager가 callback API로 연결되어 체결/포지션을 추적"""
+        manager = OrderManager(broker)
+        order_id = manager.execute_entry("AAPL", 10)
+        broker.advance(0.1)
+
+        assert manager.get_order(order_id).status == OrderStatus.FILLED
+        assert manager.get_position("AAPL").qty == 10
+
+    def test_container_sim_broker_fills_on_dispatched_tick(self, monkeypatch):
+        """BROKER_MODE=sim: Container가 만든 브로커가 TickDispatcher 틱으로 체결"""
+        from backend.container import Container
+
+        monkeypatch.setenv("BROKER_MODE", "sim")
+        container = Container()
+        broker = container.ibkr_connector()
+        assert isinstance(broker, SimulatedBroker)
+
+        manager = container.order_manager()
+        order_id = manager.execute_entry("AAPL", 10)
+        dispatcher = container.tick_dispatcher()
+        dispatcher.dispatch({"ticker": "AAPL", "price": 50.0, "size": 100, "time": 1_000.0})
+        dispatcher.dispatch({"ticker": "AAPL", "price": 50.5, "size": 100, "time": 1_001.0})
+
+        assert manager.get_order(order_id).status == OrderStatus.FILLED
+        assert manager.get_position("AAPL").qty == 10
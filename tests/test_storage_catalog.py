@@ -0,0 +1,224 @@
+# ============================================================================
+# Storage Catalog Tests
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - storage_catalog.py + ParquetManager 카탈로그 연동 단위 테스트
+#   - 쓰기/추가/삭제 시 카탈로그 갱신, 통계/커버리지 조회, 기존 파일 재구축 검증
+#   - 외부에서 바뀐 파일 감지 (mtime/크기), 구축 완료 전 파일 스캔 fallback
+#
+# 📖 실행 방법:
+#   pytest tests/test_storage_catalog.py -v
+# ============================================================================
+
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.data.parquet_manager import ParquetManager
+
+
+DAY1_MS = int(pd.Timestamp("2026-01-08 08:00").value // 10**6)  # 프리마켓 시작
+DAY2_MS = int(pd.Timestamp("2026-01-09 09:30").value // 10**6)  # 정규장 시작
+
+
+def _bars(start_ms: int, n: int) -> pd.DataFrame:
+    ts = [start_ms + i * 60_000 for i in range(n)]
+    return pd.DataFrame({
+        "timestamp": ts,
+        "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 100,
+    })
+
+
+@pytest.fixture
+def pm(tmp_path):
+    manager = ParquetManager(str(tmp_path))
+    manager.rebuild_catalog()
+    return manager
+
+
+@pytest.fixture
+def daily_df():
+    return pd.DataFrame({
+        "ticker": ["AAPL", "AAPL", "MSFT"],
+        "date": ["2026-01-08", "2026-01-09", "2026-01-09"],
+        "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 100,
+    })
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 카탈로그 갱신 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestStorageCatalog:
+    """쓰기 경로에서 유지되는 카탈로그 검증"""
+
+    def test_write_records_series_and_days(self, pm):
+        """write_intraday → 시리즈 요약 + 일자별 봉 수 기록"""
+        df = pd.concat([_bars(DAY1_MS, 30), _bars(DAY2_MS, 10)], ignore_index=True)
+        pm.write_intraday("AAPL", "1m", df)
+
+        series = pm.catalog.series("AAPL", "1m")
+        assert series["rows"] == 40
+        assert series["min_ts"] == DAY1_MS
+        assert series["max_ts"] == DAY2_MS + 9 * 60_000
+
+        days = pm.catalog.day_bars("AAPL", "1m")
+        assert days["day"].tolist() == ["2026-01-08", "2026-01-09"]
+        assert days["bars"].tolist() == [30, 10]
+        assert pm.get_intraday_tickers("1m") == ["AAPL"]
+
+    def test_append_updates_day_counts(self, pm):
+        """append_intraday (중복 포함) 후 일자별 봉 수 = 저장된 파일과 일치"""
+        pm.write_intraday("AAPL", "1m", _bars(DAY1_MS, 30))
+        pm.append_intraday("AAPL", "1m", _bars(DAY1_MS + 20 * 60_000, 20))
+
+        stored = pm.read_intraday("AAPL", "1m", start_timestamp=DAY1_MS)
+        days = pm.catalog.day_bars("AAPL", "1m")
+        assert days["bars"].tolist() == [len(stored)] == [40]
+        assert pm.catalog.series("AAPL", "1m")["rows"] == 40
+
+    def test_delete_removes_entries(self, pm, daily_df):
+        """delete_ticker_intraday → 분봉 기록만 삭제, 일봉 유지"""
+        pm.write_daily(daily_df)
+        pm.write_intraday("AAPL", "1m", _bars(DAY1_MS, 5))
+        pm.write_intraday("AAPL", "5m", _bars(DAY1_MS, 5))
+
+        assert pm.delete_ticker_intraday("AAPL")
+        assert pm.get_intraday_tickers("1m") == []
+        assert pm.catalog.day_bars("AAPL", "5m").empty
+        assert pm.get_available_tickers() == ["AAPL", "MSFT"]
+
+    def test_stats_without_reading_files(self, pm, daily_df, monkeypatch):
+        """get_stats는 카탈로그만 조회 (봉 파일 읽기 없음)"""
+        pm.write_daily(daily_df)
+        pm.write_intraday("AAPL", "1m", _bars(DAY1_MS, 5))
+        pm.write_intraday("MSFT", "1m", _bars(DAY1_MS, 5))
+
+        import backend.data.parquet_manager as module
+
+        def fail(*args, **kwargs):
+            raise AssertionError("봉 파일을 읽으면 안 됨")
+
+        monkeypatch.setattr(module.pq, "read_table", fail)
+        stats = pm.get_stats()
+        assert stats["daily_rows"] == 3
+        assert stats["daily_tickers"] == 2
+        assert stats["daily_file_size_mb"] > 0
+        assert stats["intraday_by_tf"]["1m"] == 2
+        assert stats["intraday_files"] == 2
+
+    def test_coverage_and_gap_count(self, pm):
+        """(ticker, day) 커버리지 조회 + 최근 N일 봉 수"""
+        df = pd.concat([_bars(DAY1_MS, 30), _bars(DAY2_MS, 10)], ignore_index=True)
+        pm.write_intraday("AAPL", "1m", df)
+
+        found = pm.get_intraday_coverage(
+            [("AAPL", "2026-01-08"), ("AAPL", "2026-01-10"), ("MSFT", "2026-01-08")]
+        )
+        assert list(found) == [("AAPL", "2026-01-08")]
+        bars, first_ts, last_ts = found[("AAPL", "2026-01-08")]
+        assert (bars, first_ts, last_ts) == (30, DAY1_MS, DAY1_MS + 29 * 60_000)
+
+        assert pm.catalog.count_bars("AAPL", "1m", DAY2_MS) == 10
+        assert pm.catalog.count_bars("AAPL", "1m", DAY1_MS) == 40
+
+    def test_rebuild_from_existing_files(self, tmp_path, daily_df, monkeypatch):
+        """카탈로그 없이 쓴 저장소 → 생성자는 스캔하지 않고, rebuild_catalog() 완료 후 사용"""
+        plain = ParquetManager(str(tmp_path), catalog=False)
+        plain.write_daily(daily_df)
+        plain.write_intraday("AAPL", "1m", _bars(DAY1_MS, 7))
+        legacy_dir = tmp_path / "intraday"
+        legacy_dir.mkdir()
+        _bars(DAY1_MS, 3).to_parquet(legacy_dir / "TSLA_5m.parquet", index=False)
+
+        expected = plain.get_stats()
+
+        import backend.data.parquet_manager as module
+
+        read_table = module.pq.read_table
+        monkeypatch.setattr(module.pq, "read_table", lambda *a, **k: pytest.fail("생성자에서 스캔"))
+        pm = ParquetManager(str(tmp_path))
+        monkeypatch.setattr(module.pq, "read_table", read_table)
+
+        # 구축 전: 카탈로그는 비어 있지만 조회는 파일 스캔으로 정확
+        assert not pm.catalog.complete
+        assert pm.get_available_tickers() == ["AAPL", "MSFT"]
+        assert pm.get_intraday_tickers("5m") == ["TSLA"]
+        assert pm.count_intraday_bars("AAPL", "1m", 3650) is None
+
+        assert pm.rebuild_catalog() == 3
+        assert pm.catalog.complete
+        assert pm.get_available_tickers() == ["AAPL", "MSFT"]
+        assert pm.catalog.series("AAPL", "1m")["rows"] == 7
+        assert pm.catalog.series("TSLA", "5m")["legacy"] is True
+        assert pm.get_intraday_tickers("5m") == ["TSLA"]
+
+        stats = pm.get_stats()
+        for key in ("daily_rows", "daily_tickers", "intraday_files", "intraday_by_tf"):
+            assert stats[key] == expected[key], key
+
+    def test_failed_rebuild_stays_incomplete(self, pm, daily_df, monkeypatch):
+        """재구축이 도중에 실패하면 complete 표시 없음 → 파일 스캔 경로 유지"""
+        pm.write_daily(daily_df)
+
+        import backend.data.parquet_manager as module
+
+        def fail(*args, **kwargs):
+            raise OSError("disk")
+
+        monkeypatch.setattr(module.pq, "read_table", fail)
+        with pytest.raises(OSError):
+            pm.rebuild_catalog()
+        assert not pm.catalog.complete
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 외부 변경 감지 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestCatalogFreshness:
+    """ParquetManager를 거치지 않은 파일 변경 → 해당 항목만 다시 읽음"""
+
+    def test_external_intraday_changes(self, pm, tmp_path):
+        pm.write_intraday("AAPL", "1m", _bars(DAY1_MS, 5))
+        pm.write_intraday("MSFT", "1m", _bars(DAY1_MS, 5))
+
+        # 덮어쓰기 (크기 변경), 새 파일 추가, 파일 삭제 - 모두 직접 to_parquet / unlink
+        _bars(DAY1_MS, 50).to_parquet(tmp_path / "1m" / "AAPL.parquet", index=False)
+        _bars(DAY1_MS, 3).to_parquet(tmp_path / "1m" / "NVDA.parquet", index=False)
+        (tmp_path / "1m" / "MSFT.parquet").unlink()
+
+        assert pm.count_intraday_bars("AAPL", "1m", 3650) == 50
+        assert pm.get_intraday_tickers("1m") == ["AAPL", "NVDA"]
+        assert pm.get_stats()["intraday_by_tf"]["1m"] == 2
+        assert pm.get_intraday_coverage([("NVDA", "2026-01-08")]) == {
+            ("NVDA", "2026-01-08"): (3, DAY1_MS, DAY1_MS + 2 * 60_000)
+        }
+
+    def test_external_daily_rewrite(self, pm, daily_df):
+        pm.write_daily(daily_df)
+        extra = pd.concat([daily_df, daily_df.assign(ticker="TSLA")], ignore_index=True)
+        extra.to_parquet(pm.daily_path, index=False)
+
+        assert pm.get_available_tickers() == ["AAPL", "MSFT", "TSLA"]
+        assert pm.get_stats()["daily_rows"] == 6
+
+        pm.daily_path.unlink()
+        assert pm.get_available_tickers() == []
+
+    def test_unchanged_files_are_not_read(self, pm, daily_df, monkeypatch):
+        pm.write_daily(daily_df)
+        pm.write_intraday("AAPL", "1m", _bars(DAY1_MS, 5))
+
+        import backend.data.parquet_manager as module
+
+        monkeypatch.setattr(module.pq, "read_table", lambda *a, **k: pytest.fail("읽기 발생"))
+        assert pm.count_intraday_bars("AAPL", "1m", 3650) == 5
+        assert pm.get_intraday_tickers("1m") == ["AAPL"]
+        assert pm.get_available_tickers() == ["AAPL", "MSFT"]
@@ -0,0 +1,117 @@
+# ============================================================================
+# TickerFilter Tests
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - ticker_filter.py 모듈의 단위 테스트
+#   - 컴파일된 매처 == 규칙별 매칭 결과, 판정 캐시, Arrow/NumPy filter_array 검증
+#
+# 📖 실행 방법:
+#   pytest tests/test_ticker_filter.py -v
+# ============================================================================
+
+import os
+import sys
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.core.ticker_filter import TickerFilter
+
+
+CONFIG = {
+    "patterns": [
+        {"type": "suffix", "value": "W"},
+        {"type": "suffix", "value": "WS"},
+        {"type": "suffix", "value": "+"},
+        {"type": "prefix", "value": "ZZ"},
+        {"type": "contains", "value": "UNIT"},
+        {"type": "exact", "value": "BAD"},
+    ],
+    "manual_exclusions": ["SKIP"],
+    "whitelist": ["SNOW"],
+}
+
+TICKERS = ["AAPL", "AAPLW", "ABCWS", "MSFT+", "ZZTOP", "XUNITX", "BAD", "SKIP", "SNOW", "W", "TSLA"]
+EXPECTED = ["AAPL", "SNOW", "TSLA"]
+
+
+@pytest.fixture
+def tf():
+    return TickerFilter.from_dict(CONFIG)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 판정 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestTickerFilter:
+    """TickerFilter 컴파일 매처 검증"""
+
+    def test_compiled_matches_rule_by_rule(self, tf):
+        """컴파일된 판정 == whitelist → manual → 규칙별 _match_pattern"""
+        for ticker in TICKERS:
+            expected = ticker not in tf.whitelist and (
+                ticker in tf.manual_exclusions
+                or any(tf._match_pattern(ticker, p) for p in tf.patterns)
+            )
+            assert tf.is_excluded(ticker) is expected, ticker
+            assert tf.is_allowed(ticker) is not expected
+
+        assert tf.filter(TICKERS) == EXPECTED
+
+    def test_regex_pattern_and_recompile(self):
+        """regex 타입 지원, 패턴 변경 후 recompile()로 캐시 무효화"""
+        tf = TickerFilter(patterns=[{"type": "regex", "value": r"^[A-Z]{4}R$"}])
+        assert tf.is_excluded("ABCDR") is True
+        assert tf.is_excluded("ABCR") is False
+
+        tf.patterns.append({"type": "suffix", "value": "R"})
+        tf.recompile()
+        assert tf.is_excluded("ABCR") is True
+
+    def test_invalid_regex_fails_at_load(self):
+        """잘못된 정규식은 로드 시점에 에러"""
+        import re
+
+        with pytest.raises(re.error):
+            TickerFilter(patterns=[{"type": "regex", "value": "("}])
+
+    def test_filter_array_arrow_and_numpy(self, tf):
+        """filter_array: Arrow / NumPy / 리스트 입력 모두 같은 결과 (입력 타입 유지)"""
+        arrow = tf.filter_array(pa.array(TICKERS + [None]))
+        chunked = tf.filter_array(pa.chunked_array([TICKERS[:5], TICKERS[5:]]))
+        numpy = tf.filter_array(np.array(TICKERS))
+        plain = tf.filter_array(TICKERS)
+
+        assert isinstance(arrow, pa.Array)
+        assert arrow.to_pylist() == EXPECTED + [None]
+        assert chunked.to_pylist() == EXPECTED
+        assert numpy.tolist() == EXPECTED
+        assert plain == EXPECTED
+
+    def test_excluded_mask_regex_fallback(self):
+        """NumPy 경로에 정규식이 있으면 캐시 순회로 같은 결과"""
+        tf = TickerFilter(patterns=[{"type": "regex", "value": r"\d"}])
+        mask = tf.excluded_mask(np.array(["AB1", "ABC", "9X"]))
+        assert mask.tolist() == [True, False, True]
+
+    async def test_scanner_universe_uses_filter_array(self, tf, monkeypatch):
+        """Scanner 유니버스 후보 = filter_array 결과 (리스트로 반환)"""
+        from unittest.mock import MagicMock
+
+        from backend.core.scanner import Scanner
+
+        repo = MagicMock()
+        repo.get_all_tickers.return_value = TICKERS
+        scanner = Scanner(repo, ticker_filter=tf)
+        calls = []
+        original = tf.filter_array
+        monkeypatch.setattr(tf, "filter_array", lambda values: calls.append(values) or original(values))
+
+        candidates = await scanner._get_universe_candidates(0, 0, 0)
+        assert candidates == EXPECTED
+        assert isinstance(calls[0], np.ndarray)
@@ -0,0 +1,142 @@
+# ============================================================================
+# TickerInfoService Cache Tests
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - ticker_info_service.py 2단 캐시 단위 테스트 ([user-040])
+#   - 메모리/SQLite 적중, single-flight, stale-while-revalidate 검증
+#
+# 📖 실행 방법:
+#   pytest tests/test_ticker_info_service.py -v
+# ============================================================================
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.data.ticker_info_service import TickerInfoService
+
+
+@pytest.fixture
+def service(tmp_path):
+    return TickerInfoService(api_key="test", db_path=str(tmp_path / "cache.db"))
+
+
+def counting_fetch(result, delay: float = 0.0):
+    """호출 횟수를 세는 가짜 API 호출"""
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        if delay:
+            await asyncio.sleep(delay)
+        return result
+
+    return fetch, calls
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 캐시 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestTickerInfoCache:
+    """메모리 LRU → SQLite → API 조회 검증"""
+
+    def test_memory_then_sqlite_hit(self, service, tmp_path):
+        """두 번째 조회는 메모리, 새 인스턴스는 SQLite에서 읽음"""
+        fetch, calls = counting_fetch({"cik": "123"})
+
+        assert asyncio.run(service._get_category("AAPL", "profile", fetch)) == {"cik": "123"}
+        assert asyncio.run(service._get_category("AAPL", "profile", fetch)) == {"cik": "123"}
+        assert len(calls) == 1
+        assert service.cache_stats["memory_hits"] == 1
+
+        fresh = TickerInfoService(api_key="test", db_path=str(tmp_path / "cache.db"))
+        assert asyncio.run(fresh._get_category("AAPL", "profile", fetch)) == {"cik": "123"}
+        assert len(calls) == 1
+        assert fresh.cache_stats["db_hits"] == 1
+
+    def test_single_flight_across_loops(self, service):
+        """서로 다른 스레드/루프의 동시 요청 → API 1회"""
+        fetch, calls = counting_fetch({"price": 1.0}, delay=0.1)
+        results = []
+
+        def worker():
+            results.append(asyncio.run(service._get_category("AAPL", "snapshot", fetch, True)))
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results == [{"price": 1.0}] * 5
+        assert len(calls) == 1
+        assert service.cache_stats["coalesced"] == 4
+
+    def test_stale_served_then_revalidated(self, service):
+        """만료 직후엔 이전 값 즉시 반환, 백그라운드에서 갱신"""
+        service._memory_put(("AAPL", "news"), ["old"], time.time() - 90)  # TTL 60 초과
+        fetch, calls = counting_fetch(["new"])
+
+        assert asyncio.run(service._get_category("AAPL", "news", fetch)) == ["old"]
+
+        deadline = time.time() + 2
+        while service._memory_get(("AAPL", "news"))[0] != ["new"] and time.time() < deadline:
+            time.sleep(0.01)
+        assert service._memory_get(("AAPL", "news"))[0] == ["new"]
+        assert len(calls) == 1
+        assert service.cache_stats["stale_served"] == 1
+
+    def test_too_stale_fetches_and_force_refresh(self, service):
+        """유예 시간도 지나면 동기 조회, force_refresh는 캐시 무시"""
+        service._memory_put(("AAPL", "news"), ["old"], time.time() - 3600)
+        fetch, calls = counting_fetch(["new"])
+
+        assert asyncio.run(service._get_category("AAPL", "news", fetch)) == ["new"]
+        assert asyncio.run(service._get_category("AAPL", "news", fetch, True)) == ["new"]
+        assert len(calls) == 2
+
+    def test_failed_fetch_is_not_cached(self, service):
+        """API 예외는 캐시에 남지 않고 다음 요청에서 재시도"""
+
+        async def broken():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(service._get_category("AAPL", "float", broken))
+        assert service._memory_get(("AAPL", "float")) is None
+        assert service._inflight == {}
+
+    def test_snapshot_grace_matches_ttl(self, service):
+        """1초 snapshot은 1초 유예까지만 이전 값 반환 (수십 초 지난 시세 반환 없음)"""
+        service._memory_put(("AAPL", "snapshot"), {"p": "old"}, time.time() - 5)
+        fetch, calls = counting_fetch({"p": "new"})
+
+        assert asyncio.run(service._get_category("AAPL", "snapshot", fetch)) == {"p": "new"}
+        assert len(calls) == 1 and service.cache_stats["stale_served"] == 0
+
+    def test_shutdown_closes_background_client(self, service):
+        """백그라운드 갱신 루프의 HTTP 클라이언트도 종료 시 닫힘"""
+        loop = service._background_loop()
+        client = asyncio.run_coroutine_threadsafe(service._ensure_client(), loop).result(2)
+
+        service.shutdown()
+        assert client.is_closed
+        assert service._bg_loop is None and not service._clients
+        deadline = time.time() + 2
+        while loop.is_running() and time.time() < deadline:
+            time.sleep(0.01)
+        assert not loop.is_running()
+
+    def test_shutdown_is_idempotent(self, service):
+        """두 번째 shutdown()은 종료된 DB executor에 submit하지 않음"""
+        service.shutdown()
+        service.shutdown()
+        assert service._db_conn is None
@@ -124,6 +124,59 @@ class TestEventDeduplicator:
         event_id = EventDeduplicator.make_event_id("AAPL", "tick", 1736330000000)
         assert event_id == "AAPL_tick_1736330000000"
 
+    def test_wheel_expires_old_buckets(self):
+        """[user-037] 윈도우 지난 버킷만 정리, 재등록된 이벤트는 유지"""
+        from backend.core.deduplicator import EventDeduplicator
+
+        dedup = EventDeduplicator(window_seconds=10, wheel_slots=10)
+        for i in range(100):
+            dedup.is_duplicate(f"e{i}", event_time=1000.0 + i * 0.01)
+        dedup.is_duplicate("e0", event_time=1009.0)  # 윈도우 안 → 중복
+
+        dedup.is_duplicate("late", event_time=1012.0)
+
+        assert dedup.size == 1  # e0은 중복 판정이라 갱신되지 않음 → 함께 만료
+        assert dedup.is_duplicate("e50", event_time=1012.5) is False
+        assert dedup.get_stats()["expired"] == 100
+
+    def test_memory_cap_spills_to_bloom(self):
+        """[user-037] 상한 초과분은 Bloom 계층에서 계속 중복 판정, 2윈도우 후 소멸"""
+        from backend.core.deduplicator import EventDeduplicator
+
+        dedup = EventDeduplicator(window_seconds=60, wheel_slots=60, max_entries=100)
+        for i in range(1000):
+            dedup.is_duplicate(f"e{i}", event_time=1000.0 + i * 0.05)
+
+        stats = dedup.get_stats()
+        assert stats["size"] <= 100
+        assert stats["spilled"] + stats["size"] == 1000
+        assert stats["approx_hits"] == 0  # 신규 이벤트 오탐 없음
+        assert dedup.is_duplicate("e0", event_time=1050.0) is True
+        assert dedup.get_stats()["approx_hits"] == 1
+
+        assert dedup.is_duplicate("e0", event_time=1300.0) is False
+
+    def test_container_wires_max_entries_from_config(self):
+        """[user-037] config.dedup.max_entries → Container 팩토리"""
+        from backend.container import Container
+
+        container = Container()
+        container.config.from_dict({"dedup": {"window_seconds": 30, "max_entries": 500}})
+        dedup = container.event_deduplicator()
+        assert dedup.window_seconds == 30 and dedup.max_entries == 500
+
+        container.config.from_dict({"dedup": {"window_seconds": 30, "max_entries": 0}})
+        assert container.event_deduplicator().max_entries is None  # 0 = 무제한
+
+    def test_dedup_section_loaded_from_yaml(self, tmp_path):
+        """[user-037] server_config.yaml의 dedup 섹션 → ServerConfig.dedup"""
+        from backend.core.config_loader import load_server_config
+
+        path = tmp_path / "server_config.yaml"
+        path.write_text("dedup:\n  window_seconds: 15\n  max_entries: 1234\n", encoding="utf-8")
+        config = load_server_config(str(path))
+        assert (config.dedup.window_seconds, config.dedup.max_entries) == (15, 1234)
+
 
 class TestEventSequencer:
     """EventSequencer 테스트"""
@@ -187,6 +240,143 @@ class TestEventSequencer:
         assert len(events) == 2
         assert sequencer.pending_count == 0
 
+    def test_batch_poll_and_stats(self):
+        """[user-038] 배치 입력 → push 없이 poll로 방출, 재정렬/지각 통계"""
+        from backend.core.event_sequencer import EventSequencer
+
+        sequencer = EventSequencer(buffer_ms=100)
+        frame = [("C", 1300), ("A", 1100), ("B", 1200)]
+
+        assert sequencer.push_batch(frame, receive_time_ms=10_000) == []
+        assert sequencer.poll(now_ms=10_050) == []
+        assert [e.data for e in sequencer.poll(now_ms=10_101)] == ["A", "B", "C"]
+
+        # 이미 1300까지 방출된 뒤 1250 도착 → 지각
+        sequencer.push_batch([("late", 1250)], receive_time_ms=10_200)
+        late = sequencer.poll(now_ms=10_400)
+        assert late[0].late is True
+
+        stats = sequencer.get_stats()
+        assert stats["reorder_ms"]["count"] == 3  # A, B, late
+        assert stats["lateness_ms"]["max_ms"] == 50
+        assert stats["watermark_ms"] == 1300
+
+    def test_max_pending_forces_emission(self):
+        """[user-038] 대기열 상한 초과 → 가장 이른 이벤트부터 강제 방출"""
+        from backend.core.event_sequencer import EventSequencer
+
+        sequencer = EventSequencer(buffer_ms=1000, max_pending=2)
+        out = sequencer.push_batch([(i, i) for i in range(5)], receive_time_ms=0)
+
+        assert [e.data for e in out] == [0, 1, 2]
+        assert sequencer.get_stats()["forced"] == 3
+
+    def test_timer_emits_tail_without_push(self):
+        """[user-038] 타이머 모드: 추가 입력 없이 buffer_ms 뒤에 방출"""
+        import threading
+
+        from backend.core.event_sequencer import EventSequencer
+
+        sequencer = EventSequencer(buffer_ms=20)
+        got = []
+        done = threading.Event()
+
+        def on_emit(batch):
+            got.extend(e.data for e in batch)
+            if len(got) == 2:
+                done.set()
+
+        sequencer.start(on_emit, interval_ms=5)
+        try:
+            now_ms = int(time.time() * 1000)
+            sequencer.push_batch([("B", now_ms + 2), ("A", now_ms + 1)])
+            assert done.wait(1.0)
+        finally:
+            sequencer.stop()
+
+        assert got == ["A", "B"]
+
+
+class TestTickBroadcasterSequencer:
+    """[user-038] 시퀀서 경로: 루프 스레드 배포 / 종료 시 정리 / Container 연동"""
+
+    class _Dispatcher:
+        def __init__(self):
+            self.ticks = []
+            self.threads = set()
+
+        def dispatch(self, tick):
+            import threading
+
+            self.ticks.append(tick["ticker"])
+            self.threads.add(threading.get_ident())
+
+    class _Manager:
+        connection_count = 0
+
+        async def broadcast_tick(self, **kwargs):
+            pass
+
+    def _broadcaster(self, sequencer):
+        from types import SimpleNamespace
+
+        from backend.core.tick_broadcaster import TickBroadcaster
+
+        massive_ws = SimpleNamespace(on_bar=None, on_tick=None, on_ticks=None)
+        dispatcher = self._Dispatcher()
+        broadcaster = TickBroadcaster(
+            massive_ws, self._Manager(), tick_dispatcher=dispatcher, sequencer=sequencer
+        )
+        return broadcaster, massive_ws, dispatcher
+
+    async def test_tail_dispatched_on_loop_thread(self):
+        import asyncio
+        import threading
+
+        from backend.core.event_sequencer import EventSequencer
+
+        broadcaster, massive_ws, dispatcher = self._broadcaster(EventSequencer(buffer_ms=10))
+        broadcaster.set_event_loop(asyncio.get_running_loop())
+
+        now = time.time()
+        massive_ws.on_ticks([
+            {"ticker": "B", "price": 1.0, "time": now + 0.002},
+            {"ticker": "A", "price": 1.0, "time": now + 0.001},
+        ])
+        for _ in range(100):
+            if len(dispatcher.ticks) == 2:
+                break
+            await asyncio.sleep(0.01)
+
+        assert dispatcher.ticks == ["A", "B"]
+        assert dispatcher.threads == {threading.get_ident()}  # 별도 타이머 스레드 없음
+
+        massive_ws.on_ticks([{"ticker": "C", "price": 1.0, "time": now + 0.003}])
+        broadcaster.stop()  # 남은 틱 배포 + 태스크 취소
+        assert dispatcher.ticks == ["A", "B", "C"]
+        assert broadcaster._sequencer_task is None
+
+    def test_container_reuses_event_sequencer_provider(self):
+        from types import SimpleNamespace
+
+        from backend.container import Container
+
+        container = Container()
+        container.ws_manager.override(self._Manager())
+        container.tick_dispatcher.override(self._Dispatcher())
+        container.config.from_dict({"sequencer": {"buffer_ms": 25, "max_pending": 500}})
+
+        broadcaster = container.tick_broadcaster(
+            massive_ws=SimpleNamespace(on_bar=None, on_tick=None, on_ticks=None)
+        )
+        assert broadcaster.sequencer.buffer_ms == 25
+        assert broadcaster.sequencer.max_pending == 500
+
+        container.config.from_dict({"sequencer": {"buffer_ms": 0, "max_pending": 500}})
+        assert container.tick_broadcaster(
+            massive_ws=SimpleNamespace(on_bar=None, on_tick=None, on_ticks=None)
+        ).sequencer is None
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
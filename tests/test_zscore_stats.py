@@ -0,0 +1,200 @@
+# ============================================================================
+# Z-Score Stats Tests
+# ============================================================================
+# 📌 이 파일의 역할:
+#   - compute_daily_stats() 벡터 계산 vs ZScoreCalculator 종목별 계산 일치 검증
+#   - ZScoreStatsStore 저장/재로드/staleness, 장중 Time-Projection 검증
+#
+# 📖 실행 방법:
+#   pytest tests/test_zscore_stats.py -v
+# ============================================================================
+
+import asyncio
+import os
+import sys
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from backend.core.intraday_state import IntradaySnapshot
+from backend.core.zscore_calculator import (
+    MARKET_TZ,
+    ZScoreCalculator,
+    compute_daily_stats,
+    session_elapsed_ratio,
+)
+from backend.data.zscore_stats import ZScoreStatsStore
+
+
+def _daily(n_tickers: int = 40, seed: int = 7) -> pd.DataFrame:
+    """종목마다 길이가 다른 일봉 (같은 날 끝남, 일부 종목은 종가 0 포함)"""
+    rng = np.random.default_rng(seed)
+    frames = []
+    for i in range(n_tickers):
+        n = int(rng.integers(12, 35))
+        close = rng.uniform(1, 50, n)
+        if i % 5 == 0:
+            close[rng.integers(0, n)] = 0.0
+        frames.append(pd.DataFrame({
+            "ticker": f"T{i:02d}",
+            "date": pd.bdate_range(end="2026-02-20", periods=n).strftime("%Y-%m-%d"),
+            "close": close,
+            "volume": rng.integers(1_000, 1_000_000, n).astype(float),
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def _snapshot(
+    ticker: str, last: float, volume: float, when: str, seeded: bool = True
+) -> IntradaySnapshot:
+    ts = datetime.fromisoformat(when).replace(tzinfo=MARKET_TZ).timestamp()
+    return IntradaySnapshot(
+        ticker=ticker, last=last, last_ts=ts, open=last, hod=last, lod=last,
+        vwap=last, volume=volume, atr=0.0, rvol=0.0, change_pct=0.0, ticks=1,
+        volume_seeded=seeded,
+    )
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 벡터 계산 일치 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestComputeDailyStats:
+    """compute_daily_stats == 종목별 calculate / build_cache"""
+
+    def test_matches_per_ticker_calculator(self):
+        daily = _daily()
+        stats = compute_daily_stats(daily).set_index("ticker")
+        calc = ZScoreCalculator()
+
+        for ticker, group in daily.groupby("ticker"):
+            bars = group.to_dict("records")
+            if len(bars) < 20:
+                assert ticker not in stats.index
+                continue
+            row = stats.loc[ticker]
+            result = calc.calculate(ticker, bars)
+            cached = calc.build_cache(ticker, bars)
+            assert (row["zenV"], row["zenP"]) == pytest.approx((result.zenV, result.zenP))
+            assert row["avg_volume"] == pytest.approx(cached.avg_volume)
+            assert row["std_volume"] == pytest.approx(cached.std_volume)
+            assert row["avg_change"] == pytest.approx(cached.avg_change)
+            assert row["std_change"] == pytest.approx(cached.std_change)
+            assert row["date"] == bars[-1]["date"]
+
+    def test_calculate_batch_matches_calculate(self):
+        daily = _daily(n_tickers=15, seed=3)
+        data = {t: g.to_dict("records") for t, g in daily.groupby("ticker")}
+        calc = ZScoreCalculator()
+        batch = calc.calculate_batch(data)
+        assert batch == {t: calc.calculate(t, bars) for t, bars in data.items()}
+
+    def test_session_elapsed_ratio(self):
+        at = lambda s: datetime.fromisoformat(s).replace(tzinfo=MARKET_TZ).timestamp()
+        assert session_elapsed_ratio(at("2026-01-08 08:00")) == 0.0
+        assert session_elapsed_ratio(at("2026-01-08 12:45")) == pytest.approx(0.5)
+        assert session_elapsed_ratio(at("2026-01-08 17:00")) == 1.0
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 통계 테이블 테스트
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestZScoreStatsStore:
+    """저장 / 재로드 / staleness / 장중 Projection"""
+
+    @pytest.fixture
+    def source(self, tmp_path):
+        path = tmp_path / "daily" / "all_daily.parquet"
+        path.parent.mkdir()
+        _daily().to_parquet(path, index=False)
+        return path
+
+    def test_build_persist_reload(self, tmp_path, source):
+        store = ZScoreStatsStore(path=tmp_path / "zscore" / "stats.parquet", source=source)
+        assert store.is_stale()
+        count = store.ensure()
+        assert count == len(store) > 0
+        assert not store.is_stale()
+
+        reopened = ZScoreStatsStore(path=store.path, source=source)
+        assert reopened.get("T01") == store.get("T01")
+        assert reopened.daily_stats("T01") == store.daily_stats("T01")
+        assert reopened.get("NOPE") is None
+
+        # 원본 일봉 변경 → stale
+        _daily(seed=8).to_parquet(source, index=False)
+        assert reopened.is_stale()
+        reopened.ensure()
+        assert not reopened.is_stale()
+
+    def test_recent_window_matches_full_read(self, tmp_path, source):
+        """최근 구간만 읽어도 전체 로드와 같은 결과"""
+        store = ZScoreStatsStore(path=tmp_path / "stats.parquet", source=source)
+        store.build()
+        expected = compute_daily_stats(pd.read_parquet(source))
+        got = pd.read_parquet(store.path)
+        pd.testing.assert_frame_equal(got, expected, check_dtype=False)
+
+    def test_live_projection(self, tmp_path, source):
+        """스냅샷 → calculate_projected_zenV/zenP와 동일 값, 통계 없는 종목 제외"""
+        store = ZScoreStatsStore(path=tmp_path / "stats.parquet", source=source)
+        store.ensure()
+        row = store.get("T01")
+
+        snap = _snapshot("T01", last=row["last_close"] * 1.1, volume=500_000, when="2026-01-08 12:45")
+        live = store.live({"T01": snap, "ZZZ": _snapshot("ZZZ", 1.0, 10, "2026-01-08 12:45")})
+        assert list(live) == ["T01"]
+
+        calc = ZScoreCalculator()
+        calc.build_cache("T01", pd.read_parquet(source).query("ticker == 'T01'").to_dict("records"))
+        assert live["T01"]["zenV"] == calc.calculate_projected_zenV("T01", 500_000, 0.5)
+        assert live["T01"]["zenP"] == calc.calculate_projected_zenP("T01", 10.0)
+        assert live["T01"]["change_pct"] == pytest.approx(10.0)
+
+    def test_unseeded_volume_has_no_zenV(self, tmp_path, source):
+        """당일 거래량 미시드 스냅샷 (구독 이후 거래량뿐) → zenV 없음, zenP는 계산"""
+        store = ZScoreStatsStore(path=tmp_path / "stats.parquet", source=source)
+        store.ensure()
+        row = store.get("T01")
+
+        snap = _snapshot("T01", row["last_close"] * 1.1, 500, "2026-01-08 12:45", seeded=False)
+        projected = store.project(snap)
+        assert projected["zenV"] is None
+        assert projected["zenP"] == store.project(snap._replace(volume_seeded=True))["zenP"]
+
+    def test_freshness_is_per_ticker(self, tmp_path, source, monkeypatch):
+        """원본 일봉 파일이 바뀌어도 기준 거래일 행은 그대로 테이블에서 응답"""
+        from dependency_injector import providers
+
+        from backend.api.routes.zscore import get_zscore
+        from backend.container import container
+        from backend.data.massive_loader import MassiveLoader
+
+        store = ZScoreStatsStore(path=tmp_path / "stats.parquet", source=source)
+        store.ensure()
+        assert store.get("T01", as_of="2026-02-20") is not None
+        assert store.get("T01", as_of="2026-02-23") is None
+
+        # 장중 gap-fill로 한 종목에 봉 추가 → 파일 전체는 stale, 종목 행은 유효
+        daily = pd.read_parquet(source)
+        extra = daily[daily["ticker"] == "T02"].tail(1).assign(date="2026-02-23")
+        pd.concat([daily, extra]).to_parquet(source, index=False)
+        assert store.is_stale()
+
+        class NoRepo:
+            async def get_daily_bars(self, *args, **kwargs):
+                raise AssertionError("일봉 재조회 경로 사용")
+
+        monkeypatch.setattr(MassiveLoader, "get_last_trading_day", staticmethod(lambda: "2026-02-20"))
+        with container.zscore_stats.override(providers.Object(store)), \
+                container.data_repository.override(providers.Object(NoRepo())):
+            result = asyncio.run(get_zscore("t01"))
+        assert result["stats_date"] == "2026-02-20"
+        assert result["zenV"] == store.get("T01")["zenV"]